@@ -0,0 +1,6 @@
+"""
+Offline benchmarks of the ingest, retrieval and query paths of embedchain.
+
+The benchmarks use deterministic fake embedders and LLMs, so they measure embedchain and the local vector databases
+without any network calls. See `README.md` for usage.
+"""
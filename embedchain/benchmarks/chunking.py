@@ -0,0 +1,91 @@
+"""
+Compare the throughput of the text splitters on large documents.
+
+    python -m benchmarks.chunking --characters 10000000 --chunk-size 256
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Optional
+
+from benchmarks.corpus import SyntheticCorpus
+from embedchain.chunkers.text_splitter import get_text_splitter
+from embedchain.config.add_config import ChunkerConfig
+from embedchain.utils.tokens import CHARS_PER_TOKEN, count_tokens
+
+
+def benchmark_splitter(config: ChunkerConfig, text: str, repeat: int = 3) -> dict[str, Any]:
+    """
+    Split `text` with the splitter of `config` and report the best of `repeat` runs.
+
+    :param config: Chunker config of the splitter
+    :type config: ChunkerConfig
+    :param text: Document to split
+    :type text: str
+    :param repeat: Number of runs, defaults to 3
+    :type repeat: int, optional
+    :return: Throughput and the sizes of the chunks
+    :rtype: dict[str, Any]
+    """
+    splitter = get_text_splitter(config)
+    seconds = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        chunks = splitter.split_text(text)
+        seconds = min(seconds, time.perf_counter() - started_at)
+    tokens = [count_tokens(chunk, config.tokenizer_model) for chunk in chunks]
+    return {
+        "splitter": config.splitter,
+        "chunk_size": config.chunk_size,
+        "seconds": round(seconds, 4),
+        "mb_per_second": round(len(text) / seconds / 1_000_000, 2),
+        "chunks": len(chunks),
+        "mean_tokens": round(sum(tokens) / len(tokens), 1),
+        "max_tokens": max(tokens),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the throughput of the text splitters on large documents")
+    parser.add_argument("--characters", type=int, default=10_000_000, help="size of the document")
+    parser.add_argument("--chunk-size", type=int, default=256, help="chunk size in tokens")
+    parser.add_argument("--chunk-overlap", type=int, default=0, help="chunk overlap in tokens")
+    parser.add_argument("--tokenizer-model", help="model whose tokenizer sizes the chunks")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # Paragraphs of the corpus are at most 512 characters long and separated by blank lines. Without the blank
+    # lines, the recursive splitter splits the whole document into words and merges them again.
+    paragraphs = args.characters // 300 + 1
+    text = next(SyntheticCorpus(paragraphs, chunks_per_document=paragraphs).documents())[: args.characters]
+    documents = {"paragraphs": text, "single_paragraph": text.replace("\n\n", " ")}
+    configs = [
+        # The recursive splitter measures characters, sized to the same number of estimated tokens
+        ChunkerConfig(
+            chunk_size=args.chunk_size * CHARS_PER_TOKEN,
+            chunk_overlap=args.chunk_overlap * CHARS_PER_TOKEN,
+            tokenizer_model=args.tokenizer_model,
+        ),
+        ChunkerConfig(
+            chunk_size=args.chunk_size,
+            chunk_overlap=args.chunk_overlap,
+            splitter="token",
+            tokenizer_model=args.tokenizer_model,
+        ),
+    ]
+    results = {
+        "characters": len(text),
+        "results": [
+            {"document": name, **benchmark_splitter(config, document, repeat=args.repeat)}
+            for name, document in documents.items()
+            for config in configs
+        ],
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Compare the results of two benchmark runs.
+
+    python -m benchmarks.compare results.json baseline.json --threshold 0.1
+
+Exits with status 1 if a metric got worse by more than the threshold.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, NamedTuple, Optional
+
+# Metrics where a higher value is better, all other compared metrics are better when lower
+HIGHER_IS_BETTER = ("operations_per_second", "units_per_second")
+LOWER_IS_BETTER = ("p50_ms", "p99_ms", "peak_rss_mb")
+
+
+class Regression(NamedTuple):
+    vectordb: str
+    chunks: int
+    phase: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
+
+
+def _index(report: dict[str, Any]) -> dict[tuple[str, int], dict[str, Any]]:
+    return {(result["vectordb"], result["chunks"]): result for result in report.get("results", [])}
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.1) -> list[Regression]:
+    """
+    Find the metrics that got worse by more than `threshold`, relative to the baseline.
+
+    Only the runs with the same vector database and corpus size, and the phases that are part of both reports, are
+    compared.
+
+    :param current: Report of the current run
+    :type current: dict[str, Any]
+    :param baseline: Report of the baseline run
+    :type baseline: dict[str, Any]
+    :param threshold: Relative change that counts as a regression, defaults to 0.1
+    :type threshold: float, optional
+    :return: The regressions
+    :rtype: list[Regression]
+    """
+    regressions = []
+    baseline_results = _index(baseline)
+    for key, result in _index(current).items():
+        baseline_result = baseline_results.get(key)
+        if baseline_result is None:
+            continue
+        for phase, metrics in result["phases"].items():
+            baseline_metrics = baseline_result["phases"].get(phase)
+            if baseline_metrics is None:
+                continue
+            for metric in HIGHER_IS_BETTER + LOWER_IS_BETTER:
+                old, new = baseline_metrics.get(metric), metrics.get(metric)
+                if not old or new is None:
+                    continue
+                change = (new - old) / old
+                worse = -change if metric in HIGHER_IS_BETTER else change
+                if worse > threshold:
+                    regressions.append(Regression(*key, phase, metric, old, new, round(change, 4)))
+    return regressions
+
+
+def format_regressions(regressions: list[Regression]) -> str:
+    if not regressions:
+        return "No regressions."
+    lines = [f"{len(regressions)} regressions:"]
+    for r in regressions:
+        lines.append(
+            f"  {r.vectordb} {r.chunks} chunks {r.phase} {r.metric}: {r.baseline} -> {r.current} ({r.change:+.1%})"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the results of two benchmark runs")
+    parser.add_argument("current", help="path of the JSON results of the current run")
+    parser.add_argument("baseline", help="path of the JSON results of the baseline run")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change that counts as a regression")
+    args = parser.parse_args(argv)
+
+    with open(args.current) as f:
+        current = json.load(f)
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(current, baseline, threshold=args.threshold)
+    print(format_regressions(regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+import itertools
+import random
+from collections.abc import Iterator
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "pa", "do", "gi", "hu", "be", "fy", "qu"]
+
+
+class SyntheticCorpus:
+    """
+    Deterministic synthetic corpus of documents and queries.
+
+    Words are drawn from a generated vocabulary with a Zipf distribution, like words of natural text. Every paragraph
+    is between half and the full `chunk_size` characters long and paragraphs are separated by blank lines, so the
+    default text chunker turns every paragraph into exactly one chunk.
+    """
+
+    def __init__(
+        self,
+        chunks: int,
+        chunks_per_document: int = 100,
+        chunk_size: int = 512,
+        vocabulary_size: int = 5000,
+        seed: int = 0,
+    ):
+        """
+        :param chunks: Number of chunks of the corpus
+        :type chunks: int
+        :param chunks_per_document: Number of chunks of every document, defaults to 100
+        :type chunks_per_document: int, optional
+        :param chunk_size: Chunk size of the chunker, defaults to 512
+        :type chunk_size: int, optional
+        :param vocabulary_size: Number of distinct words, defaults to 5000
+        :type vocabulary_size: int, optional
+        :param seed: Seed of the generator, defaults to 0
+        :type seed: int, optional
+        """
+        self.chunks = chunks
+        self.chunks_per_document = chunks_per_document
+        self.chunk_size = chunk_size
+        self.seed = seed
+
+        rng = random.Random(seed)
+        words = set()
+        while len(words) < vocabulary_size:
+            words.add("".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+        self.vocabulary = sorted(words)
+        rng.shuffle(self.vocabulary)
+        self.cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, vocabulary_size + 1)))
+
+    def _paragraph(self, rng: random.Random) -> str:
+        target = rng.randint(self.chunk_size // 2 + 1, self.chunk_size - 16)
+        words = []
+        length = -1
+        while True:
+            # Words are drawn in batches, drawing them one by one dominates the time of large corpora
+            for word in rng.choices(self.vocabulary, cum_weights=self.cum_weights, k=64):
+                if length + len(word) + 1 > target:
+                    return " ".join(words)
+                words.append(word)
+                length += len(word) + 1
+
+    def documents(self) -> Iterator[str]:
+        """Generate the documents, the last one is shorter if `chunks` isn't a multiple of `chunks_per_document`."""
+        rng = random.Random(self.seed + 1)
+        remaining = self.chunks
+        while remaining > 0:
+            count = min(self.chunks_per_document, remaining)
+            yield "\n\n".join(self._paragraph(rng) for _ in range(count))
+            remaining -= count
+
+    def queries(self, count: int, words: int = 8) -> list[str]:
+        """Generate queries, every query consists of words of one paragraph, like a question about a chunk."""
+        rng = random.Random(self.seed + 2)
+        queries = []
+        for _ in range(count):
+            paragraph = self._paragraph(rng).split()
+            queries.append(" ".join(rng.sample(paragraph, min(words, len(paragraph)))))
+        return queries
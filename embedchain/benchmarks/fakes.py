@@ -0,0 +1,66 @@
+import time
+import zlib
+from typing import Optional, Union
+
+import numpy as np
+
+from embedchain.config import BaseEmbedderConfig, BaseLlmConfig
+from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc
+from embedchain.llm.base import BaseLlm
+
+
+class FakeEmbedder(BaseEmbedder):
+    """
+    Deterministic embedder without network calls.
+
+    Every word of a text is hashed into one dimension of the vector (feature hashing), so texts that share words have
+    similar vectors, and retrieval returns meaningful results for the synthetic corpora.
+    """
+
+    def __init__(self, vector_dimension: int = 384, latency: float = 0.0):
+        """
+        :param vector_dimension: Dimension of the vectors, defaults to 384
+        :type vector_dimension: int, optional
+        :param latency: Seconds every embedding call takes in addition, to simulate a remote model, defaults to 0.0
+        :type latency: float, optional
+        """
+        super().__init__(config=BaseEmbedderConfig(model="fake", vector_dimension=vector_dimension))
+        self.latency = latency
+        self.calls = 0
+        self.set_embedding_fn(EmbeddingFunc(self._embed))
+        self.set_vector_dimension(vector_dimension)
+
+    def _embed(self, input: Union[str, list[str]]) -> list[list[float]]:
+        texts = [input] if isinstance(input, str) else list(input)
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        vectors = np.zeros((len(texts), self.vector_dimension), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for word in text.lower().split():
+                h = zlib.crc32(word.encode())
+                vectors[i, h % self.vector_dimension] += 1.0 if h & 1 else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return (vectors / np.where(norms == 0, 1, norms)).tolist()
+
+
+class FakeLlm(BaseLlm):
+    """Deterministic LLM without network calls, which answers with the size of the prompt."""
+
+    def __init__(self, config: Optional[BaseLlmConfig] = None, latency: float = 0.0):
+        """
+        :param config: LLM config, defaults to None
+        :type config: Optional[BaseLlmConfig], optional
+        :param latency: Seconds every answer takes, to simulate a remote model, defaults to 0.0
+        :type latency: float, optional
+        """
+        super().__init__(config=config or BaseLlmConfig(model="fake"))
+        self.latency = latency
+        self.calls = 0
+
+    def get_llm_model_answer(self, prompt: str) -> str:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return f"Answer from a prompt of {len(prompt)} characters."
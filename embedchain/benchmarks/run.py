@@ -0,0 +1,249 @@
+"""
+Run the benchmarks and write the results as JSON.
+
+    python -m benchmarks.run --vectordb chroma lancedb --chunks 1000 100000 --output results.json
+    python -m benchmarks.run --chunks 10000 --baseline baseline.json
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Optional
+
+from benchmarks.compare import compare, format_regressions
+
+logger = logging.getLogger(__name__)
+
+VECTOR_DATABASES = ("chroma", "lancedb")
+PHASES = ("ingest", "search", "query", "chat")
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of the process in megabytes, None if the platform doesn't report it."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Get the `q`-th percentile of values, by linear interpolation between the closest ranks."""
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def measure(operation: Callable[[Any], Any], inputs: list[Any], units: Optional[list[int]] = None) -> dict[str, Any]:
+    """
+    Call `operation` on every input and summarize the latencies.
+
+    :param units: Units of work per input, e.g. the chunks of a document, throughput is reported per unit if set
+    :type units: Optional[list[int]]
+    """
+    latencies = []
+    started_at = time.perf_counter()
+    for item in inputs:
+        call_started_at = time.perf_counter()
+        operation(item)
+        latencies.append(time.perf_counter() - call_started_at)
+    seconds = time.perf_counter() - started_at
+
+    result = {
+        "operations": len(inputs),
+        "seconds": round(seconds, 4),
+        "operations_per_second": round(len(inputs) / seconds, 2) if seconds else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+    if units is not None:
+        result["units"] = sum(units)
+        result["units_per_second"] = round(sum(units) / seconds, 2) if seconds else None
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def _create_db(vectordb: str, directory: str):
+    if vectordb == "chroma":
+        from embedchain.config import ChromaDbConfig
+        from embedchain.vectordb.chroma import ChromaDB
+
+        return ChromaDB(config=ChromaDbConfig(collection_name="benchmark", dir=directory, allow_reset=True))
+    if vectordb == "lancedb":
+        from embedchain.config.vector_db.lancedb import LanceDBConfig
+        from embedchain.vectordb.lancedb import LanceDB
+
+        return LanceDB(config=LanceDBConfig(collection_name="benchmark", dir=directory, allow_reset=True))
+    raise ValueError(f"Unknown vector database {vectordb}, should be one of {', '.join(VECTOR_DATABASES)}")
+
+
+def run_benchmark(
+    vectordb: str,
+    chunks: int,
+    queries: int = 200,
+    phases: tuple[str, ...] = PHASES,
+    embedder_latency: float = 0.0,
+    llm_latency: float = 0.0,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    Benchmark `App.add`, `App.search`, `App.query` and `App.chat` on a synthetic corpus, in a temporary directory.
+
+    :param vectordb: Vector database, `chroma` or `lancedb`
+    :type vectordb: str
+    :param chunks: Number of chunks of the corpus
+    :type chunks: int
+    :param queries: Number of operations of the search, query and chat phases, defaults to 200
+    :type queries: int, optional
+    :return: The results of every phase
+    :rtype: dict[str, Any]
+    """
+    with tempfile.TemporaryDirectory(prefix="embedchain-benchmark-") as directory:
+        # The chat history is written to a database of the benchmark, the environment is read on first import
+        os.environ["EMBEDCHAIN_DB_URI"] = f"sqlite:///{os.path.join(directory, 'embedchain.db')}"
+
+        from benchmarks.corpus import SyntheticCorpus
+        from benchmarks.fakes import FakeEmbedder, FakeLlm
+        from embedchain import App
+        from embedchain.config import AppConfig
+
+        # Prompts and answers are logged at info level, formatting them would be part of the measurements
+        logging.getLogger("embedchain").setLevel(logging.ERROR)
+        corpus = SyntheticCorpus(chunks, seed=seed)
+        app = App(
+            config=AppConfig(collect_metrics=False),
+            db=_create_db(vectordb, os.path.join(directory, vectordb)),
+            embedding_model=FakeEmbedder(latency=embedder_latency),
+            llm=FakeLlm(latency=llm_latency),
+            chunker={"chunk_size": corpus.chunk_size, "chunk_overlap": 0, "min_chunk_size": 0},
+        )
+
+        results = {"vectordb": vectordb, "chunks": chunks, "phases": {}}
+        if "ingest" in phases:
+            documents = list(corpus.documents())
+            units = [document.count("\n\n") + 1 for document in documents]
+            results["phases"]["ingest"] = measure(
+                lambda document: app.add(document, data_type="text"), documents, units
+            )
+            results["stored_chunks"] = app.db.count()
+
+        query_inputs = corpus.queries(queries)
+        operations = {
+            "search": lambda query: app.search(query, num_documents=3),
+            "query": lambda query: app.query(query),
+            "chat": lambda query: app.chat(query, session_id="benchmark"),
+        }
+        for phase, operation in operations.items():
+            if phase not in phases:
+                continue
+            # Warm up the caches of the database before measuring
+            for query in query_inputs[:5]:
+                operation(query)
+            results["phases"][phase] = measure(operation, query_inputs)
+
+        # Write the queued chat history before the database is deleted
+        from embedchain.memory.base import history_writer
+
+        history_writer.flush()
+        return results
+
+
+def _run_isolated(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Run a benchmark in a new process, so that the peak memory of one run doesn't leak into the next one."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(run_benchmark, **kwargs).result()
+
+
+def _metadata() -> dict[str, Any]:
+    try:
+        from importlib.metadata import version
+
+        embedchain_version = version("embedchain")
+    except Exception:
+        embedchain_version = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=10
+        ).stdout.strip()
+    except Exception:
+        commit = None
+    return {
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "embedchain_version": embedchain_version,
+        "git_commit": commit,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmarks of embedchain's ingest, retrieval and query paths")
+    parser.add_argument("--vectordb", nargs="+", choices=VECTOR_DATABASES, default=list(VECTOR_DATABASES))
+    parser.add_argument("--chunks", nargs="+", type=int, default=[1000], help="corpus sizes, from 1000 to 1000000")
+    parser.add_argument("--queries", type=int, default=200, help="operations of the search, query and chat phases")
+    parser.add_argument("--phases", nargs="+", choices=PHASES, default=list(PHASES))
+    parser.add_argument("--embedder-latency", type=float, default=0.0, help="seconds added to every embedding call")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="seconds added to every llm call")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="path of the JSON results, printed to stdout if not set")
+    parser.add_argument("--baseline", help="path of the JSON results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change that counts as a regression")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.INFO)
+    report = {"metadata": _metadata(), "parameters": vars(args).copy(), "results": []}
+    failed = False
+    for chunks in args.chunks:
+        for vectordb in args.vectordb:
+            logger.info(f"Benchmarking {vectordb} with {chunks} chunks")
+            kwargs = {
+                "vectordb": vectordb,
+                "chunks": chunks,
+                "queries": args.queries,
+                "phases": tuple(args.phases),
+                "embedder_latency": args.embedder_latency,
+                "llm_latency": args.llm_latency,
+                "seed": args.seed,
+            }
+            try:
+                report["results"].append(_run_isolated(kwargs))
+            except Exception as e:
+                # e.g. the optional dependencies of a vector database aren't installed
+                logger.error(f"Benchmark of {vectordb} with {chunks} chunks failed: {e}")
+                report["results"].append({"vectordb": vectordb, "chunks": chunks, "phases": {}, "error": str(e)})
+                failed = True
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, threshold=args.threshold)
+        logger.info(format_regressions(regressions))
+        return 1 if regressions or failed else 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
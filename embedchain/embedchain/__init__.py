@@ -1,10 +1,33 @@
+import importlib
 import importlib.metadata
+from typing import TYPE_CHECKING, Any
 
 __version__ = importlib.metadata.version(__package__ or __name__)
 
-from embedchain.app import App  # noqa: F401
-from embedchain.client import Client  # noqa: F401
-from embedchain.pipeline import Pipeline  # noqa: F401
+if TYPE_CHECKING:
+    from embedchain.app import App  # noqa: F401
+    from embedchain.client import Client  # noqa: F401
+    from embedchain.pipeline import Pipeline  # noqa: F401
 
-# Setup the user directory if doesn't exist already
-Client.setup()
+# The public classes are imported on first access, so that `import embedchain` doesn't load the vector databases,
+# LLM clients and other heavy dependencies that an application may never use.
+_LAZY_ATTRIBUTES = {
+    "App": "embedchain.app",
+    "Client": "embedchain.client",
+    "Pipeline": "embedchain.pipeline",
+}
+
+__all__ = ["App", "Client", "Pipeline", "__version__"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    # Cache the attribute on the module, so that `__getattr__` is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
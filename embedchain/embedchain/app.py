@@ -9,36 +9,43 @@ import requests
 import yaml
 from tqdm import tqdm
 
-from mem0 import Memory
-from embedchain.cache import (
-    Config,
-    ExactMatchEvaluation,
-    SearchDistanceEvaluation,
-    cache,
-    gptcache_data_manager,
-    gptcache_pre_function,
-)
+from embedchain.cache import AnswerCache
 from embedchain.client import Client
-from embedchain.config import AppConfig, CacheConfig, ChunkerConfig, Mem0Config
+from embedchain.compression import ContextCompressor
+from embedchain.config import (
+    AppConfig,
+    CacheConfig,
+    ChunkerConfig,
+    ContextCompressionConfig,
+    EmbeddingCacheConfig,
+    HistorySummaryConfig,
+    HybridSearchConfig,
+    Mem0Config,
+    QnaFastPathConfig,
+)
 from embedchain.core.db.database import get_session
 from embedchain.core.db.models import DataSource
 from embedchain.embedchain import EmbedChain
 from embedchain.embedder.base import BaseEmbedder
-from embedchain.embedder.openai import OpenAIEmbedder
+from embedchain.embedder.cache import EmbeddingCache
 from embedchain.evaluation.base import BaseMetric
-from embedchain.evaluation.metrics import AnswerRelevance, ContextRelevance, Groundedness
 from embedchain.factory import EmbedderFactory, LlmFactory, VectorDBFactory
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.llm.base import BaseLlm
-from embedchain.llm.openai import OpenAILlm
+from embedchain.memory.summary import HistorySummarizer
+from embedchain.qna_index import QnaIndex
 from embedchain.telemetry.posthog import AnonymousTelemetry
 from embedchain.utils.evaluation import EvalData, EvalMetric
 from embedchain.utils.misc import validate_config
 from embedchain.vectordb.base import BaseVectorDB
 from embedchain.vectordb.chroma import ChromaDB
+from embedchain.vectordb.keyword_index import KeywordIndex
 
 logger = logging.getLogger(__name__)
 
+# Setup the user directory if doesn't exist already
+Client.setup()
+
 
 @register_deserializable
 class App(EmbedChain):
@@ -61,6 +68,11 @@ class App(EmbedChain):
         chunker: ChunkerConfig = None,
         cache_config: CacheConfig = None,
         memory_config: Mem0Config = None,
+        embedding_cache_config: EmbeddingCacheConfig = None,
+        hybrid_search_config: HybridSearchConfig = None,
+        history_summary_config: HistorySummaryConfig = None,
+        context_compression_config: ContextCompressionConfig = None,
+        qna_fast_path_config: QnaFastPathConfig = None,
         log_level: int = logging.WARN,
     ):
         """
@@ -78,6 +90,19 @@ class App(EmbedChain):
         :type config_data: dict, optional
         :param auto_deploy: Whether to deploy the pipeline automatically, defaults to False
         :type auto_deploy: bool, optional
+        :param embedding_cache_config: Config of the persistent embedding cache, disabled if None, defaults to None
+        :type embedding_cache_config: EmbeddingCacheConfig, optional
+        :param hybrid_search_config: Config of hybrid keyword and vector retrieval, disabled if None, defaults to None
+        :type hybrid_search_config: HybridSearchConfig, optional
+        :param history_summary_config: Config of the rolling summary of chat history, disabled if None,
+        defaults to None
+        :type history_summary_config: HistorySummaryConfig, optional
+        :param context_compression_config: Config of the extractive compression of retrieved contexts, disabled if
+        None, defaults to None
+        :type context_compression_config: ContextCompressionConfig, optional
+        :param qna_fast_path_config: Config of the QnA fast path, which answers queries that match a stored QnA pair
+        without the LLM, disabled if None, defaults to None
+        :type qna_fast_path_config: QnaFastPathConfig, optional
         :raises Exception: If an error occurs while creating the pipeline
         """
         if id and config_data:
@@ -98,6 +123,11 @@ class App(EmbedChain):
         self.chunker = ChunkerConfig(**chunker) if chunker else None
         self.cache_config = cache_config
         self.memory_config = memory_config
+        self.embedding_cache_config = embedding_cache_config
+        self.hybrid_search_config = hybrid_search_config
+        self.history_summary_config = history_summary_config
+        self.context_compression_config = context_compression_config
+        self.qna_fast_path_config = qna_fast_path_config
 
         self.config = config or AppConfig()
         self.name = self.config.name
@@ -114,21 +144,70 @@ class App(EmbedChain):
         if name is not None:
             self.name = name
 
-        self.embedding_model = embedding_model or OpenAIEmbedder()
+        # The OpenAI defaults are imported only when they are used, apps with other providers don't load the client
+        if embedding_model is None:
+            from embedchain.embedder.openai import OpenAIEmbedder
+
+            embedding_model = OpenAIEmbedder()
+        self.embedding_model = embedding_model
+        # The cache has to be set before the database is initialized, since databases like chroma
+        # keep a reference to the embedding function.
+        if self.embedding_cache_config is not None:
+            self.embedding_model.set_cache(EmbeddingCache(**self.embedding_cache_config.as_dict()))
         self.db = db or ChromaDB()
-        self.llm = llm or OpenAILlm()
+        if llm is None:
+            from embedchain.llm.openai import OpenAILlm
+
+            llm = OpenAILlm()
+        self.llm = llm
         self._init_db()
 
+        # If hybrid_search_config is provided, initializing the keyword index ...
+        self.keyword_index = None
+        if self.hybrid_search_config is not None:
+            self._init_keyword_index()
+
+        # If qna_fast_path_config is provided, queries that match a stored QnA pair are answered without the llm
+        self.qna_index = None
+        if self.qna_fast_path_config is not None:
+            self.qna_index = QnaIndex(
+                self._load_qna_pairs,
+                embedding_fn=(
+                    (lambda texts: self.embedding_model.embedding_fn(texts))
+                    if self.qna_fast_path_config.semantic
+                    else None
+                ),
+                similarity_threshold=self.qna_fast_path_config.similarity_threshold,
+            )
+
+        # If context_compression_config is provided, only the relevant sentences of the contexts are passed to the llm
+        self.context_compressor = None
+        if self.context_compression_config is not None:
+            self.context_compressor = ContextCompressor(
+                lambda texts: self.embedding_model.embedding_fn(texts), **self.context_compression_config.as_dict()
+            )
+
+        # If history_summary_config is provided, older chat rounds are summarized ...
+        self.history_summarizer = None
+        if self.history_summary_config is not None:
+            self.history_summarizer = HistorySummarizer(
+                self.history_summary_config, self.llm.get_llm_model_answer, model=self.llm.config.model
+            )
+
         # Session for the metadata db
         self.db_session = get_session()
 
         # If cache_config is provided, initializing the cache ...
+        self.answer_cache = None
         if self.cache_config is not None:
             self._init_cache()
 
         # If memory_config is provided, initializing the memory ...
         self.mem0_memory = None
         if self.memory_config is not None:
+            # mem0 is imported on first use, importing it builds its vector store clients and telemetry
+            from mem0 import Memory
+
             self.mem0_memory = Memory()
 
         # Send anonymous telemetry
@@ -148,21 +227,27 @@ class App(EmbedChain):
         self.db._initialize()
         self.db.set_collection_name(self.db.config.collection_name)
 
-    def _init_cache(self):
-        if self.cache_config.similarity_eval_config.strategy == "exact":
-            similarity_eval_func = ExactMatchEvaluation()
-        else:
-            similarity_eval_func = SearchDistanceEvaluation(
-                max_distance=self.cache_config.similarity_eval_config.max_distance,
-                positive=self.cache_config.similarity_eval_config.positive,
-            )
+    def _init_keyword_index(self):
+        path = self.hybrid_search_config.path
+        db_dir = getattr(self.db.config, "dir", None)
+        if path is None and db_dir and getattr(self.db.config, "host", None) is None:
+            # Keep the index next to the local database, so that both are moved and deleted together
+            path = os.path.join(os.path.expanduser(db_dir), "keyword_index.db")
+        self.keyword_index = KeywordIndex(path=path)
 
-        cache.init(
-            pre_embedding_func=gptcache_pre_function,
-            embedding_func=self.embedding_model.to_embeddings,
-            data_manager=gptcache_data_manager(vector_dimension=self.embedding_model.vector_dimension),
-            similarity_evaluation=similarity_eval_func,
-            config=Config(**self.cache_config.init_config.as_dict()),
+    def _init_cache(self):
+        similarity_eval_config = self.cache_config.similarity_eval_config
+        init_config = self.cache_config.init_config
+        self.answer_cache = AnswerCache(
+            embedding_fn=self.embedding_model.embedding_fn,
+            vector_dimension=self.embedding_model.vector_dimension,
+            strategy=similarity_eval_config.strategy,
+            max_distance=similarity_eval_config.max_distance,
+            positive=similarity_eval_config.positive,
+            similarity_threshold=init_config.similarity_threshold,
+            max_size=init_config.max_size,
+            ttl=init_config.ttl,
+            eviction=init_config.eviction,
         )
 
     def _init_client(self):
@@ -377,6 +462,11 @@ class App(EmbedChain):
         llm_config_data = config_data.get("llm", {})
         chunker_config_data = config_data.get("chunker", {})
         cache_config_data = config_data.get("cache", None)
+        embedding_cache_config_data = config_data.get("embedding_cache", None)
+        hybrid_search_config_data = config_data.get("hybrid_search", None)
+        history_summary_config_data = config_data.get("history_summary", None)
+        context_compression_config_data = config_data.get("context_compression", None)
+        qna_fast_path_config_data = config_data.get("qna_fast_path", None)
 
         app_config = AppConfig(**app_config_data)
         memory_config = Mem0Config(**memory_config_data) if memory_config_data else None
@@ -400,6 +490,31 @@ class App(EmbedChain):
         else:
             cache_config = None
 
+        if embedding_cache_config_data is not None:
+            embedding_cache_config = EmbeddingCacheConfig.from_config(embedding_cache_config_data)
+        else:
+            embedding_cache_config = None
+
+        if hybrid_search_config_data is not None:
+            hybrid_search_config = HybridSearchConfig.from_config(hybrid_search_config_data)
+        else:
+            hybrid_search_config = None
+
+        if history_summary_config_data is not None:
+            history_summary_config = HistorySummaryConfig.from_config(history_summary_config_data)
+        else:
+            history_summary_config = None
+
+        if context_compression_config_data is not None:
+            context_compression_config = ContextCompressionConfig.from_config(context_compression_config_data)
+        else:
+            context_compression_config = None
+
+        if qna_fast_path_config_data is not None:
+            qna_fast_path_config = QnaFastPathConfig.from_config(qna_fast_path_config_data)
+        else:
+            qna_fast_path_config = None
+
         return cls(
             config=app_config,
             llm=llm,
@@ -410,12 +525,20 @@ class App(EmbedChain):
             chunker=chunker_config_data,
             cache_config=cache_config,
             memory_config=memory_config,
+            embedding_cache_config=embedding_cache_config,
+            hybrid_search_config=hybrid_search_config,
+            history_summary_config=history_summary_config,
+            context_compression_config=context_compression_config,
+            qna_fast_path_config=qna_fast_path_config,
         )
 
     def _eval(self, dataset: list[EvalData], metric: Union[BaseMetric, str]):
         """
         Evaluate the app on a dataset for a given metric.
         """
+        # The metrics pull in the OpenAI client and pysbd, so they are only imported for evaluations
+        from embedchain.evaluation.metrics import AnswerRelevance, ContextRelevance, Groundedness
+
         metric_str = metric.name if isinstance(metric, BaseMetric) else metric
         eval_class_map = {
             EvalMetric.CONTEXT_RELEVANCY.value: ContextRelevance,
@@ -453,25 +576,13 @@ class App(EmbedChain):
         if "OPENAI_API_KEY" not in os.environ:
             raise ValueError("Please set the OPENAI_API_KEY environment variable with permission to use `gpt4` model.")
 
-        queries, answers, contexts = [], [], []
-        if isinstance(questions, list):
-            with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
-                future_to_data = {executor.submit(self.query, q, citations=True): q for q in questions}
-                for future in tqdm(
-                    concurrent.futures.as_completed(future_to_data),
-                    total=len(future_to_data),
-                    desc="Getting answer and contexts for questions",
-                ):
-                    question = future_to_data[future]
-                    queries.append(question)
-                    answer, context = future.result()
-                    answers.append(answer)
-                    contexts.append(list(map(lambda x: x[0], context)))
-        else:
-            answer, context = self.query(questions, citations=True)
-            queries = [questions]
-            answers = [answer]
-            contexts = [list(map(lambda x: x[0], context))]
+        queries = questions if isinstance(questions, list) else [questions]
+        answers, contexts = [], []
+        for result in self._query_batch(queries, citations=True, num_workers=num_workers):
+            # `token_usage` makes the query return a dict with the answer, contexts and token usage
+            answer, context = (result["answer"], result["contexts"]) if isinstance(result, dict) else result
+            answers.append(answer)
+            contexts.append(list(map(lambda x: x[0], context)))
 
         metrics = metrics or [
             EvalMetric.CONTEXT_RELEVANCY.value,
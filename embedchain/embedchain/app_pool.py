@@ -0,0 +1,183 @@
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, Optional
+
+from embedchain.app import App
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledApp:
+    __slots__ = ("app", "lock")
+
+    def __init__(self, app: App):
+        self.app = app
+        self.lock = threading.Lock()
+
+
+class AppPool:
+    """
+    Process-wide pool of warm `App` instances, keyed by a hash of their configuration.
+
+    Building an `App` parses the config, connects to the vector database, sets up the metadata database and the
+    telemetry client, so servers that serve many apps should build each one once and reuse it. The pool keeps at most
+    `max_size` apps and evicts the least recently used one when it is full. Every app has its own lock, which
+    `acquire`/`aacquire` hold for operations that must not run concurrently on the same app, like adding data.
+    """
+
+    def __init__(self, max_size: int = 32, factory: Callable[..., App] = App.from_config):
+        """
+        Initialize the app pool.
+
+        :param max_size: Maximum number of apps kept in the pool, defaults to 32
+        :type max_size: int, optional
+        :param factory: Function that builds an app from `config_path` or `config`, defaults to `App.from_config`
+        :type factory: Callable[..., App], optional
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size {max_size} should be a positive integer")
+
+        self.max_size = max_size
+        self.factory = factory
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _PooledApp] = OrderedDict()
+        # One lock per app that is being built, so that concurrent requests for the same app build it only once
+        self._building: dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def config_key(config_path: Optional[str] = None, config: Optional[dict[str, Any]] = None) -> str:
+        """
+        Get the pool key of a configuration: the hash of the path and content of the config file, or of the config.
+        """
+        if (config_path is None) == (config is None):
+            raise ValueError("Please provide exactly one of config_path or config.")
+
+        digest = hashlib.sha256()
+        if config_path is not None:
+            digest.update(os.path.abspath(config_path).encode("utf-8"))
+            with open(config_path, "rb") as file:
+                digest.update(file.read())
+        else:
+            digest.update(json.dumps(config, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _get_entry(self, config_path: Optional[str], config: Optional[dict[str, Any]]) -> _PooledApp:
+        key = self.config_key(config_path=config_path, config=config)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            building = self._building.setdefault(key, threading.Lock())
+
+        with building:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    # Built by a concurrent request while this one was waiting
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+                self.misses += 1
+
+            app = self.factory(config_path=config_path, config=config)
+            entry = _PooledApp(app)
+            with self._lock:
+                self._entries[key] = entry
+                self._building.pop(key, None)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+            logger.debug(f"Added app {key} to the app pool")
+        return entry
+
+    def get(self, config_path: Optional[str] = None, config: Optional[dict[str, Any]] = None) -> App:
+        """
+        Get the app of a configuration, building it if it is not in the pool.
+
+        :param config_path: Path to the YAML or JSON configuration file, defaults to None
+        :type config_path: Optional[str], optional
+        :param config: A dictionary containing the configuration, defaults to None
+        :type config: Optional[dict[str, Any]], optional
+        :return: The app
+        :rtype: App
+        """
+        return self._get_entry(config_path, config).app
+
+    async def aget(self, config_path: Optional[str] = None, config: Optional[dict[str, Any]] = None) -> App:
+        """
+        Async version of `get`, apps are built in a worker thread.
+        """
+        return await asyncio.to_thread(self.get, config_path, config)
+
+    @contextlib.contextmanager
+    def acquire(self, config_path: Optional[str] = None, config: Optional[dict[str, Any]] = None) -> Iterator[App]:
+        """
+        Get the app of a configuration and hold its lock until the block exits.
+        """
+        entry = self._get_entry(config_path, config)
+        with entry.lock:
+            yield entry.app
+
+    @contextlib.asynccontextmanager
+    async def aacquire(
+        self, config_path: Optional[str] = None, config: Optional[dict[str, Any]] = None
+    ) -> AsyncIterator[App]:
+        """
+        Async version of `acquire`, waiting for the lock doesn't block the event loop.
+        """
+        entry = await asyncio.to_thread(self._get_entry, config_path, config)
+        acquiring = asyncio.ensure_future(asyncio.to_thread(entry.lock.acquire))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The thread acquires the lock even if this task is cancelled, release it as soon as it does
+            acquiring.add_done_callback(
+                lambda future: entry.lock.release() if not future.cancelled() and future.exception() is None else None
+            )
+            raise
+        try:
+            yield entry.app
+        finally:
+            entry.lock.release()
+
+    def evict(self, config_path: Optional[str] = None, config: Optional[dict[str, Any]] = None):
+        """Remove the app of a configuration from the pool, e.g. because it was deleted."""
+        key = self.config_key(config_path=config_path, config=config)
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all apps from the pool."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the hit/miss counters and the current size of the pool.
+
+        :return: Pool statistics
+        :rtype: dict[str, Any]
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
@@ -1,44 +1,273 @@
+import hashlib
 import logging
-import os  # noqa: F401
-from typing import Any
-
-from gptcache import cache  # noqa: F401
-from gptcache.adapter.adapter import adapt  # noqa: F401
-from gptcache.config import Config  # noqa: F401
-from gptcache.manager import get_data_manager
-from gptcache.manager.scalar_data.base import Answer
-from gptcache.manager.scalar_data.base import DataType as CacheDataType
-from gptcache.session import Session
-from gptcache.similarity_evaluation.distance import \
-    SearchDistanceEvaluation  # noqa: F401
-from gptcache.similarity_evaluation.exact_match import \
-    ExactMatchEvaluation  # noqa: F401
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+EVICTION_POLICIES = ("LRU", "LFU", "FIFO")
+
+
+class CacheKey(NamedTuple):
+    """Lookup key of an answer: the namespace (app and session), the query and the contexts it was answered with."""
+
+    namespace: str
+    query: str
+    contexts_hash: str
+    vector: Optional[np.ndarray]
+
+
+class _CacheEntry:
+    __slots__ = ("key", "answer", "slot", "created_at", "hits")
+
+    def __init__(self, key: CacheKey, answer: str, slot: Optional[int]):
+        self.key = key
+        self.answer = answer
+        self.slot = slot
+        self.created_at = time.monotonic()
+        self.hits = 0
+
+
+class AnswerCache:
+    """
+    In-process semantic cache of LLM answers.
+
+    Answers are keyed by the retrieved contexts as well as the query, so that a cached answer is only returned for a
+    query that is answered from the same contexts. With the `distance` strategy, a query also hits the cache if it is
+    similar enough to a cached query, which is found by a cosine search over a vector index that has the dimension of
+    the embedder. With the `exact` strategy, queries are compared as text and never embedded.
+
+    Once the cache holds `max_size` answers, entries are evicted by the eviction policy: least recently used (`LRU`),
+    least frequently used (`LFU`) or oldest first (`FIFO`). Entries older than `ttl` seconds are never returned.
+    """
+
+    def __init__(
+        self,
+        embedding_fn: Optional[Callable[[list[str]], list[list[float]]]] = None,
+        vector_dimension: Optional[int] = None,
+        strategy: str = "distance",
+        max_distance: float = 1.0,
+        positive: bool = False,
+        similarity_threshold: float = 0.8,
+        max_size: int = 10_000,
+        ttl: Optional[float] = None,
+        eviction: str = "LRU",
+    ):
+        """
+        Initialize the answer cache.
+
+        :param embedding_fn: Function that embeds queries, required for the `distance` strategy, defaults to None
+        :type embedding_fn: Optional[Callable[[list[str]], list[list[float]]]], optional
+        :param vector_dimension: Dimension of the query vectors, taken from the first vector if None, defaults to None
+        :type vector_dimension: Optional[int], optional
+        :param strategy: `distance` to match similar queries, `exact` to match equal queries, defaults to "distance"
+        :type strategy: str, optional
+        :param max_distance: Bound of the distance between two queries, defaults to 1.0
+        :type max_distance: float, optional
+        :param positive: Whether a larger distance means more similar queries, defaults to False
+        :type positive: bool, optional
+        :param similarity_threshold: Minimum similarity, between 0 and 1, of a cache hit, defaults to 0.8
+        :type similarity_threshold: float, optional
+        :param max_size: Maximum number of cached answers, defaults to 10000
+        :type max_size: int, optional
+        :param ttl: Time to live of an answer in seconds, `None` for no expiry, defaults to None
+        :type ttl: Optional[float], optional
+        :param eviction: Eviction policy, one of `LRU`, `LFU` and `FIFO`, defaults to "LRU"
+        :type eviction: str, optional
+        """
+        if strategy not in ("distance", "exact"):
+            raise ValueError(f"Unknown cache strategy {strategy}, should be distance or exact")
+        if strategy == "distance" and embedding_fn is None:
+            raise ValueError("The distance strategy requires an embedding function")
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy {eviction}, should be one of {', '.join(EVICTION_POLICIES)}")
+
+        self.embedding_fn = embedding_fn
+        self.vector_dimension = vector_dimension
+        self.strategy = strategy
+        self.max_distance = max_distance
+        self.positive = positive
+        self.similarity_threshold = similarity_threshold
+        self.max_size = max_size
+        self.ttl = ttl
+        self.eviction = eviction
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+        self._lock = threading.Lock()
+        # Entries in the order of the eviction policy (LRU and FIFO), the first entry is evicted first
+        self._entries: OrderedDict[tuple[str, str, str], _CacheEntry] = OrderedDict()
+        # Entries that share namespace and contexts, the only candidates of a similarity search
+        self._groups: dict[tuple[str, str], set[tuple[str, str, str]]] = {}
+        # Vector index, rows are allocated on demand and reused after eviction
+        self._vectors: Optional[np.ndarray] = None
+        self._free_slots: list[int] = []
+        self._used_slots = 0
+
+    @staticmethod
+    def hash_contexts(contexts: list[str]) -> str:
+        digest = hashlib.sha256()
+        for context in contexts:
+            digest.update(hashlib.sha256(str(context).encode("utf-8")).digest())
+        return digest.hexdigest()
+
+    def key(self, namespace: str, query: str, contexts: list[str]) -> CacheKey:
+        """
+        Build the cache key of a query. Embeds the query with the `distance` strategy.
+        """
+        vector = None
+        if self.strategy == "distance":
+            vector = np.asarray(self.embedding_fn([query])[0], dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            if norm > 0:
+                vector = vector / norm
+        return CacheKey(namespace, query, self.hash_contexts(contexts), vector)
+
+    def _similarity(self, distances: np.ndarray) -> np.ndarray:
+        """Map distances to a similarity between 0 and 1, like `SearchDistanceEvaluation` of gptcache."""
+        distances = np.clip(distances, 0, self.max_distance)
+        if self.positive:
+            return distances / self.max_distance
+        return (self.max_distance - distances) / self.max_distance
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return self.ttl is not None and time.monotonic() - entry.created_at > self.ttl
+
+    def _find(self, key: CacheKey) -> Optional[_CacheEntry]:
+        """Find the best cached entry for the key. Expects the lock to be held."""
+        entry = self._entries.get((key.namespace, key.contexts_hash, key.query))
+        if entry is not None or key.vector is None:
+            return entry
+
+        candidates = [self._entries[k] for k in self._groups.get((key.namespace, key.contexts_hash), ())]
+        if not candidates:
+            return None
+        vectors = self._vectors[[candidate.slot for candidate in candidates]]
+        # Squared euclidean distance of unit vectors, 0 for equal and 4 for opposite directions
+        distances = 2.0 - 2.0 * (vectors @ key.vector)
+        similarities = self._similarity(distances)
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        return candidates[best]
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        """
+        Get the cached answer of a query.
 
-def gptcache_pre_function(data: dict[str, Any], **params: dict[str, Any]):
-    return data["input_query"]
+        :return: The answer, `None` on a cache miss
+        :rtype: Optional[str]
+        """
+        with self._lock:
+            entry = self._find(key)
+            if entry is not None and self._is_expired(entry):
+                self._remove(entry)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
 
+            self.hits += 1
+            entry.hits += 1
+            if self.eviction == "LRU":
+                self._entries.move_to_end((entry.key.namespace, entry.key.contexts_hash, entry.key.query))
+            return entry.answer
 
-def gptcache_data_manager(vector_dimension):
-    return get_data_manager(cache_base="sqlite", vector_base="chromadb", max_size=1000, eviction="LRU")
+    def set(self, key: CacheKey, answer: str):
+        """
+        Cache the answer of a query, and evict entries if the cache is full.
+        """
+        entry_id = (key.namespace, key.contexts_hash, key.query)
+        with self._lock:
+            if entry_id in self._entries:
+                self._remove(self._entries[entry_id])
+            while len(self._entries) >= self.max_size:
+                self._evict()
 
+            slot = self._store_vector(key.vector) if key.vector is not None else None
+            self._entries[entry_id] = _CacheEntry(key, answer, slot)
+            self._groups.setdefault((key.namespace, key.contexts_hash), set()).add(entry_id)
 
-def gptcache_data_convert(cache_data):
-    logger.info("[Cache] Cache hit, returning cache data...")
-    return cache_data
+    def _store_vector(self, vector: np.ndarray) -> int:
+        """Store a vector in a free row of the index, grow the index if it is full. Expects the lock to be held."""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            if self._vectors is None:
+                dimension = self.vector_dimension or len(vector)
+                self._vectors = np.zeros((min(64, self.max_size), dimension), dtype=np.float32)
+            elif self._used_slots == len(self._vectors):
+                rows = min(2 * len(self._vectors), self.max_size)
+                self._vectors = np.concatenate([self._vectors, np.zeros_like(self._vectors[: rows - self._used_slots])])
+            slot = self._used_slots
+            self._used_slots += 1
+        self._vectors[slot] = vector
+        return slot
 
+    def _remove(self, entry: _CacheEntry):
+        """Remove an entry. Expects the lock to be held."""
+        entry_id = (entry.key.namespace, entry.key.contexts_hash, entry.key.query)
+        del self._entries[entry_id]
+        group = self._groups[(entry.key.namespace, entry.key.contexts_hash)]
+        group.discard(entry_id)
+        if not group:
+            del self._groups[(entry.key.namespace, entry.key.contexts_hash)]
+        if entry.slot is not None:
+            self._free_slots.append(entry.slot)
 
-def gptcache_update_cache_callback(llm_data, update_cache_func, *args, **kwargs):
-    logger.info("[Cache] Cache missed, updating cache...")
-    update_cache_func(Answer(llm_data, CacheDataType.STR))
-    return llm_data
+    def _evict(self):
+        """Evict one entry by the eviction policy, expired entries first. Expects the lock to be held."""
+        if self.ttl is not None:
+            expired = [entry for entry in self._entries.values() if self._is_expired(entry)]
+            if expired:
+                for entry in expired:
+                    self._remove(entry)
+                self.expirations += len(expired)
+                return
 
+        if self.eviction == "LFU":
+            entry = min(self._entries.values(), key=lambda entry: entry.hits)
+        else:
+            entry = next(iter(self._entries.values()))
+        self._remove(entry)
+        self.evictions += 1
 
-def _gptcache_session_hit_func(cur_session_id: str, cache_session_ids: list, cache_questions: list, cache_answer: str):
-    return cur_session_id in cache_session_ids
+    def invalidate(self):
+        """Delete all cached answers, e.g. because the data they were answered from changed."""
+        with self._lock:
+            if self._entries:
+                logger.debug(f"Invalidated {len(self._entries)} cached answers")
+                self.invalidations += 1
+            self._entries.clear()
+            self._groups.clear()
+            self._free_slots = list(range(self._used_slots))
 
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the hit/miss counters and the current size of the cache.
 
-def get_gptcache_session(session_id: str):
-    return Session(name=session_id, check_hit_func=_gptcache_session_hit_func)
+        :return: Cache statistics
+        :rtype: dict[str, Any]
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "max_size": self.max_size,
+            }
@@ -2,6 +2,7 @@ import hashlib
 import logging
 from typing import Optional
 
+from embedchain.chunkers.text_splitter import TokenTextSplitter
 from embedchain.config.add_config import ChunkerConfig
 from embedchain.helpers.json_serializable import JSONSerializable
 from embedchain.models.data_type import DataType
@@ -29,7 +30,10 @@ class BaseChunker(JSONSerializable):
         chunk_ids = []
         id_map = {}
         min_chunk_size = config.min_chunk_size if config is not None else 1
-        logger.info(f"Skipping chunks smaller than {min_chunk_size} characters")
+        # The sizes of the token splitter are in tokens
+        in_tokens = isinstance(self.text_splitter, TokenTextSplitter)
+        chunk_length = self.text_splitter.count_tokens if in_tokens and min_chunk_size > 0 else len
+        logger.info(f"Skipping chunks smaller than {min_chunk_size} {'tokens' if in_tokens else 'characters'}")
         data_result = loader.load_data(src)
         data_records = data_result["data"]
         doc_id = data_result["doc_id"]
@@ -54,17 +58,21 @@ class BaseChunker(JSONSerializable):
             for chunk in chunks:
                 chunk_id = hashlib.sha256((chunk + url).encode()).hexdigest()
                 chunk_id = f"{app_id}--{chunk_id}" if app_id is not None else chunk_id
-                if id_map.get(chunk_id) is None and len(chunk) >= min_chunk_size:
+                if id_map.get(chunk_id) is None and chunk_length(chunk) >= min_chunk_size:
                     id_map[chunk_id] = True
                     chunk_ids.append(chunk_id)
                     documents.append(chunk)
                     metadatas.append(metadata)
-        return {
+        result = {
             "documents": documents,
             "ids": chunk_ids,
             "metadatas": metadatas,
             "doc_id": doc_id,
         }
+        # Loaders of many files, like the directory loader, report the content hash of every file of the source
+        if "files" in data_result:
+            result["files"] = data_result["files"]
+        return result
 
     def get_chunks(self, content):
         """
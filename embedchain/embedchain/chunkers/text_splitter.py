@@ -0,0 +1,120 @@
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from typing import Optional
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from embedchain.config.add_config import ChunkerConfig
+from embedchain.utils.tokens import CHARS_PER_TOKEN, count_tokens, get_encoding
+
+# Places to end a chunk at, from the most to the least preferred. A chunk ends after the text of a separator without
+# its trailing whitespace, e.g. after the period of a sentence.
+SEPARATORS = (("\n\n",), ("\n",), (". ", "! ", "? "), ("; ", ", "), (" ",))
+WHITESPACE = re.compile(r"\s")
+
+
+class TokenTextSplitter:
+    """
+    Split text into chunks of at most `chunk_size` tokens of a model's tokenizer.
+
+    The text is tokenized once, and chunks are cut in a single pass over the character offsets of the tokens. A chunk
+    ends at the last paragraph, line, sentence or word boundary of its second half, or after `chunk_size` tokens if
+    there is none. Without a tiktoken encoding, tokens are estimated as `CHARS_PER_TOKEN` characters, like
+    `embedchain.utils.tokens.count_tokens` does.
+    """
+
+    def __init__(self, chunk_size: int, chunk_overlap: int = 0, model: Optional[str] = None):
+        """
+        :param chunk_size: Maximum number of tokens of a chunk
+        :type chunk_size: int
+        :param chunk_overlap: Number of tokens at the end of a chunk that are repeated at the start of the next one,
+        defaults to 0
+        :type chunk_overlap: int, optional
+        :param model: Name of the model whose tokenizer is used, defaults to None
+        :type model: Optional[str], optional
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size {chunk_size} should be a positive integer")
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError(
+                f"chunk_overlap {chunk_overlap} should be at least 0 and less than chunk_size {chunk_size}"
+            )
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.model = model
+
+    def count_tokens(self, text: str) -> int:
+        return count_tokens(text, self.model)
+
+    def _token_offsets(self, text: str) -> tuple[Sequence[int], int]:
+        """
+        Get the character offset where every token of the text starts, and the number of offsets per token.
+
+        Without an encoding every character is an offset and a token is `CHARS_PER_TOKEN` characters.
+        """
+        encoding = get_encoding(self.model)
+        if encoding is None:
+            return range(len(text)), CHARS_PER_TOKEN
+        _, offsets = encoding.decode_with_offsets(encoding.encode(text, disallowed_special=()))
+        return offsets, 1
+
+    def _find_end(self, text: str, offsets: Sequence[int], start: int, end: int) -> int:
+        """Get the token to end the chunk `[start, end)` at, so that the chunk ends at a separator if possible."""
+        low = start + max(1, (end - start) // 2)
+        for separators in SEPARATORS:
+            position = max(text.rfind(separator, offsets[low], offsets[end]) for separator in separators)
+            if position == -1:
+                continue
+            # The separator ends the chunk, the whitespace after it starts the next one. If a token spans the
+            # position, the chunk ends before that token.
+            position += len(separators[0].rstrip())
+            return bisect_right(offsets, position, low, end) - 1
+        return end
+
+    @staticmethod
+    def _find_overlap_start(text: str, offsets: Sequence[int], start: int, end: int) -> int:
+        """Get the token to start the overlap `[start, end)` with the next chunk at, so that it starts with a word."""
+        match = WHITESPACE.search(text, offsets[start], offsets[end])
+        if match is None:
+            return start
+        return bisect_left(offsets, match.start(), start, end)
+
+    def split_text(self, text: str) -> list[str]:
+        offsets, scale = self._token_offsets(text)
+        count = len(offsets)
+        chunks = []
+        start = 0
+        while start < count:
+            end = min(start + self.chunk_size * scale, count)
+            if end < count:
+                end = self._find_end(text, offsets, start, end)
+            chunk = text[offsets[start] : offsets[end] if end < count else len(text)].strip()
+            if chunk:
+                chunks.append(chunk)
+            if end == count:
+                break
+            if self.chunk_overlap:
+                start = max(self._find_overlap_start(text, offsets, end - self.chunk_overlap * scale, end), start + 1)
+            else:
+                start = end
+        return chunks
+
+
+def get_text_splitter(config: ChunkerConfig):
+    """
+    Create the text splitter of a chunker config.
+
+    :param config: Chunker config
+    :type config: ChunkerConfig
+    :return: A splitter with a `split_text` method, the `TokenTextSplitter` if `config.splitter` is `token`
+    """
+    if config.splitter == "token":
+        return TokenTextSplitter(
+            chunk_size=config.chunk_size, chunk_overlap=config.chunk_overlap, model=config.tokenizer_model
+        )
+    return RecursiveCharacterTextSplitter(
+        chunk_size=config.chunk_size,
+        chunk_overlap=config.chunk_overlap,
+        length_function=config.length_function,
+    )
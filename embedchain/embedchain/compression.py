@@ -0,0 +1,127 @@
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class ContextCompressor:
+    """
+    Query-aware extractive compression of retrieved contexts.
+
+    The contexts are split into sentences, and every sentence is scored by the cosine similarity of its embedding to
+    the embedding of the query in a single matrix product. Only the best `max_sentences` sentences are kept, in their
+    original order, so the prompt gets shorter without any extra LLM call. Sentence splits and embeddings are kept in
+    LRU caches, since the same chunks are retrieved again and again.
+    """
+
+    def __init__(
+        self,
+        embedding_fn: Callable[[list[str]], list[list[float]]],
+        max_sentences: int = 10,
+        min_similarity: Optional[float] = None,
+        language: str = "en",
+        cache_size: int = 10_000,
+    ):
+        """
+        Initialize the compressor.
+
+        :param embedding_fn: Function that embeds a list of texts, usually the embedding function of the app
+        :type embedding_fn: Callable[[list[str]], list[list[float]]]
+        :param max_sentences: Number of sentences that are kept of all contexts, defaults to 10
+        :type max_sentences: int, optional
+        :param min_similarity: Similarity to the query below which sentences are dropped, defaults to None
+        :type min_similarity: Optional[float], optional
+        :param language: Language of the contexts, defaults to "en"
+        :type language: str, optional
+        :param cache_size: Number of sentence embeddings and context splits that are cached, defaults to 10000
+        :type cache_size: int, optional
+        """
+        # pysbd compiles its rules on import, it is only loaded by apps that compress contexts
+        import pysbd
+
+        self.embedding_fn = embedding_fn
+        self.max_sentences = max_sentences
+        self.min_similarity = min_similarity
+        self.cache_size = cache_size
+
+        self._segmenter = pysbd.Segmenter(language=language, clean=False)
+        self._lock = threading.Lock()
+        self._sentences: OrderedDict[str, list[str]] = OrderedDict()
+        self._embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    def _get_cached(self, cache: OrderedDict, key: str):
+        with self._lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+
+    def _set_cached(self, cache: OrderedDict, items: dict):
+        with self._lock:
+            cache.update(items)
+            for key in items:
+                cache.move_to_end(key)
+            while len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+    def _split(self, context: str) -> list[str]:
+        sentences = self._get_cached(self._sentences, context)
+        if sentences is None:
+            sentences = [sentence.strip() for sentence in self._segmenter.segment(context) if sentence.strip()]
+            self._set_cached(self._sentences, {context: sentences})
+        return sentences
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        """Get the normalized embeddings of texts, only the texts that aren't cached are embedded, in one call."""
+        embeddings = {text: self._get_cached(self._embeddings, text) for text in dict.fromkeys(texts)}
+        missing = [text for text, embedding in embeddings.items() if embedding is None]
+        if missing:
+            vectors = np.asarray(self.embedding_fn(missing), dtype=np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+            computed = dict(zip(missing, vectors))
+            self._set_cached(self._embeddings, computed)
+            embeddings.update(computed)
+        return np.stack([embeddings[text] for text in texts])
+
+    def compress(self, query: str, contexts: list[str]) -> list[str]:
+        """
+        Keep the sentences of the contexts that are most similar to the query.
+
+        :param query: The query
+        :type query: str
+        :param contexts: Retrieved contexts
+        :type contexts: list[str]
+        :return: The compressed contexts, contexts without any kept sentence are dropped
+        :rtype: list[str]
+        """
+        splits = [self._split(context) for context in contexts]
+        sentences = [sentence for split in splits for sentence in split]
+        if not sentences or len(sentences) <= self.max_sentences and self.min_similarity is None:
+            return contexts
+
+        embeddings = self._embed([query] + sentences)
+        scores = embeddings[1:] @ embeddings[0]
+
+        keep = np.zeros(len(sentences), dtype=bool)
+        if len(sentences) > self.max_sentences:
+            keep[np.argpartition(-scores, self.max_sentences - 1)[: self.max_sentences]] = True
+        else:
+            keep[:] = True
+        if self.min_similarity is not None:
+            keep &= scores >= self.min_similarity
+
+        compressed = []
+        start = 0
+        for split in splits:
+            kept = [sentence for sentence, k in zip(split, keep[start : start + len(split)]) if k]
+            start += len(split)
+            if kept:
+                compressed.append(" ".join(kept))
+        logger.debug(f"Compressed {len(sentences)} sentences of {len(contexts)} contexts to {int(keep.sum())}")
+        return compressed
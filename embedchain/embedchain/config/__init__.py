@@ -3,13 +3,17 @@
 from .add_config import AddConfig, ChunkerConfig
 from .app_config import AppConfig
 from .base_config import BaseConfig
-from .cache_config import CacheConfig
+from .cache_config import CacheConfig, EmbeddingCacheConfig
+from .context_compression_config import ContextCompressionConfig
 from .embedder.base import BaseEmbedderConfig
 from .embedder.base import BaseEmbedderConfig as EmbedderConfig
 from .embedder.ollama import OllamaEmbedderConfig
+from .history_summary_config import HistorySummaryConfig
+from .hybrid_search_config import HybridSearchConfig
 from .llm.base import BaseLlmConfig
 from .vector_db.chroma import ChromaDbConfig
 from .vector_db.elasticsearch import ElasticsearchDBConfig
 from .vector_db.opensearch import OpenSearchDBConfig
 from .vector_db.zilliz import ZillizDBConfig
 from .mem0_config import Mem0Config
+from .qna_fast_path_config import QnaFastPathConfig
@@ -20,7 +20,33 @@ class ChunkerConfig(BaseConfig):
         chunk_overlap: Optional[int] = 0,
         length_function: Optional[Callable[[str], int]] = None,
         min_chunk_size: Optional[int] = 0,
+        splitter: str = "recursive",
+        tokenizer_model: Optional[str] = None,
     ):
+        """
+        Initializes a configuration class instance for the chunker.
+
+        :param chunk_size: Maximum size of a chunk, defaults to 2000
+        :type chunk_size: Optional[int], optional
+        :param chunk_overlap: Size of the overlap of consecutive chunks, defaults to 0
+        :type chunk_overlap: Optional[int], optional
+        :param length_function: Function that measures the size of a text for the `recursive` splitter, or the dotted
+        path of one, defaults to `len`
+        :type length_function: Optional[Callable[[str], int]], optional
+        :param min_chunk_size: Chunks smaller than this are skipped, defaults to 0
+        :type min_chunk_size: Optional[int], optional
+        :param splitter: `recursive` splits text with LangChain's `RecursiveCharacterTextSplitter` and sizes are in
+        characters. `token` splits text in a single pass and the sizes are in tokens of the tokenizer of
+        `tokenizer_model`, defaults to `recursive`
+        :type splitter: str, optional
+        :param tokenizer_model: Model whose tokenizer measures the `token` splitter's chunks, defaults to the
+        embedding model of the app
+        :type tokenizer_model: Optional[str], optional
+        """
+        if splitter not in ("recursive", "token"):
+            raise ValueError(f"splitter {splitter} should be one of recursive, token")
+        self.splitter = splitter
+        self.tokenizer_model = tokenizer_model
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
@@ -66,6 +92,7 @@ class AddConfig(BaseConfig):
         self,
         chunker: Optional[ChunkerConfig] = None,
         loader: Optional[LoaderConfig] = None,
+        batch_size: Optional[int] = 2048,
     ):
         """
         Initializes a configuration class instance for the `add` method.
@@ -74,6 +101,11 @@ class AddConfig(BaseConfig):
         :type chunker: Optional[ChunkerConfig], optional
         :param loader: Loader config, defaults to None
         :type loader: Optional[LoaderConfig], optional
+        :param batch_size: Number of chunks sent to the vector database in one `add` call, defaults to 2048
+        :type batch_size: Optional[int], optional
         """
         self.loader = loader
         self.chunker = chunker
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size {batch_size} should be a positive integer")
+        self.batch_size = batch_size or 2048
@@ -49,20 +49,38 @@ class CacheInitConfig(BaseConfig):
     :param similarity_threshold: a threshold ranged from 0 to 1 to filter search results with similarity score higher \
      than the threshold. When it is 0, there is no hits. When it is 1, all search results will be returned as hits.
     :type similarity_threshold: float
-    :param auto_flush: it will be automatically flushed every time xx pieces of data are added, default to 20
+    :param auto_flush: Not used by the built-in answer cache, kept for backwards compatibility, default to 20
     :type auto_flush: int
+    :param max_size: the maximum number of cached answers, default to 10000
+    :type max_size: int
+    :param ttl: the time to live of a cached answer in seconds, `None` for no expiry, default to None
+    :type ttl: Optional[float]
+    :param eviction: the eviction policy of a full cache, one of `LRU`, `LFU` and `FIFO`, default to `LRU`
+    :type eviction: str
     """
 
     def __init__(
         self,
         similarity_threshold: Optional[float] = 0.8,
         auto_flush: Optional[int] = 20,
+        max_size: Optional[int] = 10_000,
+        ttl: Optional[float] = None,
+        eviction: Optional[str] = "LRU",
     ):
         if similarity_threshold < 0 or similarity_threshold > 1:
             raise ValueError(f"similarity_threshold {similarity_threshold} should be between 0 and 1")
+        if max_size < 1:
+            raise ValueError(f"max_size {max_size} should be a positive integer")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl {ttl} should be positive")
+        if eviction not in ("LRU", "LFU", "FIFO"):
+            raise ValueError(f"eviction {eviction} should be one of LRU, LFU and FIFO")
 
         self.similarity_threshold = similarity_threshold
         self.auto_flush = auto_flush
+        self.max_size = max_size
+        self.ttl = ttl
+        self.eviction = eviction
 
     @staticmethod
     def from_config(config: Optional[dict[str, Any]]):
@@ -72,6 +90,9 @@ class CacheInitConfig(BaseConfig):
             return CacheInitConfig(
                 similarity_threshold=config.get("similarity_threshold", 0.8),
                 auto_flush=config.get("auto_flush", 20),
+                max_size=config.get("max_size", 10_000),
+                ttl=config.get("ttl"),
+                eviction=config.get("eviction", "LRU"),
             )
 
 
@@ -92,5 +113,45 @@ class CacheConfig(BaseConfig):
         else:
             return CacheConfig(
                 similarity_eval_config=CacheSimilarityEvalConfig.from_config(config.get("similarity_evaluation", {})),
-                init_config=CacheInitConfig.from_config(config.get("init_config", {})),
+                init_config=CacheInitConfig.from_config(config.get("config", config.get("init_config", {}))),
+            )
+
+
+@register_deserializable
+class EmbeddingCacheConfig(BaseConfig):
+    """
+    Config for the persistent embedding cache, which is shared by all embedders.
+
+    :param path: Path to the sqlite file of the cache, defaults to `~/.embedchain/embedding_cache.db`
+    :type path: Optional[str]
+    :param max_entries: Maximum number of cached vectors, `None` for no limit, defaults to 1000000
+    :type max_entries: Optional[int]
+    :param max_size_mb: Maximum size of the cached vectors in megabytes, `None` for no limit, defaults to 1024
+    :type max_size_mb: Optional[float]
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = 1_000_000,
+        max_size_mb: Optional[float] = 1024,
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(f"max_entries {max_entries} should be a positive integer")
+        if max_size_mb is not None and max_size_mb <= 0:
+            raise ValueError(f"max_size_mb {max_size_mb} should be positive")
+
+        self.path = path
+        self.max_entries = max_entries
+        self.max_size_mb = max_size_mb
+
+    @staticmethod
+    def from_config(config: Optional[dict[str, Any]]):
+        if config is None:
+            return EmbeddingCacheConfig()
+        else:
+            return EmbeddingCacheConfig(
+                path=config.get("path"),
+                max_entries=config.get("max_entries", 1_000_000),
+                max_size_mb=config.get("max_size_mb", 1024),
             )
@@ -0,0 +1,53 @@
+from typing import Any, Optional
+
+from embedchain.config.base_config import BaseConfig
+from embedchain.helpers.json_serializable import register_deserializable
+
+
+@register_deserializable
+class ContextCompressionConfig(BaseConfig):
+    """
+    Config for extractive compression of the retrieved contexts, which keeps only the sentences of the contexts that
+    are most similar to the query before they are passed to the LLM.
+
+    :param max_sentences: Number of sentences that are kept of all retrieved contexts, defaults to 10
+    :type max_sentences: int
+    :param min_similarity: Cosine similarity to the query below which sentences are dropped, even if fewer than
+        `max_sentences` are kept, defaults to None
+    :type min_similarity: Optional[float]
+    :param language: Language of the contexts, used to split them into sentences, defaults to "en"
+    :type language: str
+    :param cache_size: Number of sentence embeddings that are kept in memory, defaults to 10000
+    :type cache_size: int
+    """
+
+    def __init__(
+        self,
+        max_sentences: int = 10,
+        min_similarity: Optional[float] = None,
+        language: str = "en",
+        cache_size: int = 10_000,
+    ):
+        if max_sentences < 1:
+            raise ValueError(f"max_sentences {max_sentences} should be a positive integer")
+        if min_similarity is not None and not -1 <= min_similarity <= 1:
+            raise ValueError(f"min_similarity {min_similarity} should be between -1 and 1")
+        if cache_size < 0:
+            raise ValueError(f"cache_size {cache_size} should not be negative")
+
+        self.max_sentences = max_sentences
+        self.min_similarity = min_similarity
+        self.language = language
+        self.cache_size = cache_size
+
+    @staticmethod
+    def from_config(config: Optional[dict[str, Any]]):
+        if config is None:
+            return ContextCompressionConfig()
+        else:
+            return ContextCompressionConfig(
+                max_sentences=config.get("max_sentences", 10),
+                min_similarity=config.get("min_similarity"),
+                language=config.get("language", "en"),
+                cache_size=config.get("cache_size", 10_000),
+            )
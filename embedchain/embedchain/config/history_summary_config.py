@@ -0,0 +1,54 @@
+from typing import Any, Optional
+
+from embedchain.config.base_config import BaseConfig
+from embedchain.helpers.json_serializable import register_deserializable
+
+
+@register_deserializable
+class HistorySummaryConfig(BaseConfig):
+    """
+    Config for the rolling summary of chat history, which keeps the history in chat prompts within a token budget.
+
+    The latest rounds of a session are passed to the prompt verbatim, older rounds are summarized by the LLM of the app
+    in the background.
+
+    :param recent_rounds: Number of latest rounds that are kept verbatim, defaults to 4
+    :type recent_rounds: int
+    :param token_budget: Maximum number of tokens of the summary and the verbatim rounds in a prompt, defaults to 1024
+    :type token_budget: int
+    :param summary_tokens: Target length of the summary in tokens, defaults to 256
+    :type summary_tokens: int
+    :param max_sessions: Maximum number of sessions whose summary is kept in memory, defaults to 10000
+    :type max_sessions: int
+    """
+
+    def __init__(
+        self,
+        recent_rounds: int = 4,
+        token_budget: int = 1024,
+        summary_tokens: int = 256,
+        max_sessions: int = 10_000,
+    ):
+        if recent_rounds < 1:
+            raise ValueError(f"recent_rounds {recent_rounds} should be a positive integer")
+        if summary_tokens < 1 or token_budget <= summary_tokens:
+            raise ValueError("summary_tokens should be positive and smaller than token_budget")
+        if max_sessions < 1:
+            raise ValueError(f"max_sessions {max_sessions} should be a positive integer")
+
+        self.recent_rounds = recent_rounds
+        self.token_budget = token_budget
+        self.summary_tokens = summary_tokens
+        self.max_sessions = max_sessions
+
+    @staticmethod
+    def from_config(config: Optional[dict[str, Any]]):
+        if config is None:
+            return HistorySummaryConfig()
+        else:
+            return HistorySummaryConfig(
+                recent_rounds=config.get("recent_rounds", 4),
+                token_budget=config.get("token_budget", 1024),
+                summary_tokens=config.get("summary_tokens", 256),
+                max_sessions=config.get("max_sessions", 10_000),
+            )
@@ -0,0 +1,59 @@
+from typing import Any, Optional
+
+from embedchain.config.base_config import BaseConfig
+from embedchain.helpers.json_serializable import register_deserializable
+
+
+@register_deserializable
+class HybridSearchConfig(BaseConfig):
+    """
+    Config for hybrid retrieval, which fuses the results of the vector database with the results of a local BM25
+    keyword index using reciprocal rank fusion (RRF).
+
+    :param path: Path to the sqlite file of the keyword index, defaults to `keyword_index.db` in the directory of the
+        vector database, or `~/.embedchain/keyword_index.db` for databases without a local directory
+    :type path: Optional[str]
+    :param fetch_k: Number of candidates fetched from each retriever before fusion, defaults to 20
+    :type fetch_k: int
+    :param rrf_k: Rank constant of reciprocal rank fusion, higher values flatten the differences between ranks,
+        defaults to 60
+    :type rrf_k: int
+    :param vector_weight: Weight of the vector search ranks in the fused score, defaults to 1.0
+    :type vector_weight: float
+    :param keyword_weight: Weight of the keyword search ranks in the fused score, defaults to 1.0
+    :type keyword_weight: float
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        fetch_k: int = 20,
+        rrf_k: int = 60,
+        vector_weight: float = 1.0,
+        keyword_weight: float = 1.0,
+    ):
+        if fetch_k < 1:
+            raise ValueError(f"fetch_k {fetch_k} should be a positive integer")
+        if rrf_k < 0:
+            raise ValueError(f"rrf_k {rrf_k} should not be negative")
+        if vector_weight < 0 or keyword_weight < 0:
+            raise ValueError("vector_weight and keyword_weight should not be negative")
+
+        self.path = path
+        self.fetch_k = fetch_k
+        self.rrf_k = rrf_k
+        self.vector_weight = vector_weight
+        self.keyword_weight = keyword_weight
+
+    @staticmethod
+    def from_config(config: Optional[dict[str, Any]]):
+        if config is None:
+            return HybridSearchConfig()
+        else:
+            return HybridSearchConfig(
+                path=config.get("path"),
+                fetch_k=config.get("fetch_k", 20),
+                rrf_k=config.get("rrf_k", 60),
+                vector_weight=config.get("vector_weight", 1.0),
+                keyword_weight=config.get("keyword_weight", 1.0),
+            )
@@ -139,6 +139,8 @@ class BaseLlmConfig(BaseConfig):
         local: Optional[bool] = False,
         default_headers: Optional[Mapping[str, str]] = None,
         api_version: Optional[str] = None,
+        max_context_tokens: Optional[int] = None,
+        context_similarity_threshold: Optional[float] = 0.9,
     ):
         """
         Initializes a configuration class instance for the LLM.
@@ -195,6 +197,12 @@ class BaseLlmConfig(BaseConfig):
         :type local: Optional[bool], optional
         :param default_headers: Set additional HTTP headers to be sent with requests to OpenAI
         :type default_headers: Optional[Mapping[str, str]], optional
+        :param max_context_tokens: Token budget of the retrieved contexts in the prompt, defaults to None, which
+        uses the context window of the model that is left by the rest of the prompt and the answer
+        :type max_context_tokens: Optional[int], optional
+        :param context_similarity_threshold: Similarity above which a retrieved context is dropped as a near
+        duplicate of a better one, None keeps duplicates, defaults to 0.9
+        :type context_similarity_threshold: Optional[float], optional
         :raises ValueError: If the template is not valid as template should
         contain $context and $query (and optionally $history)
         :raises ValueError: Stream is not boolean
@@ -233,6 +241,8 @@ class BaseLlmConfig(BaseConfig):
         self.default_headers = default_headers
         self.online = online
         self.api_version = api_version
+        self.max_context_tokens = max_context_tokens
+        self.context_similarity_threshold = context_similarity_threshold
 
         if token_usage:
             f = Path(__file__).resolve().parent.parent / "model_prices_and_context_window.json"
@@ -0,0 +1,36 @@
+from typing import Any, Optional
+
+from embedchain.config.base_config import BaseConfig
+from embedchain.helpers.json_serializable import register_deserializable
+
+
+@register_deserializable
+class QnaFastPathConfig(BaseConfig):
+    """
+    Config for the QnA fast path, which answers queries that match the question of a `qna_pair` source with the
+    stored answer, without calling the LLM.
+
+    :param similarity_threshold: Minimum cosine similarity of the embeddings of a query and a stored question,
+        defaults to 0.9
+    :type similarity_threshold: float
+    :param semantic: Whether similar questions match, otherwise only questions with the same text (ignoring case,
+        whitespace and trailing punctuation) match, defaults to True
+    :type semantic: bool
+    """
+
+    def __init__(self, similarity_threshold: float = 0.9, semantic: bool = True):
+        if not 0 < similarity_threshold <= 1:
+            raise ValueError(f"similarity_threshold {similarity_threshold} should be between 0 and 1")
+
+        self.similarity_threshold = similarity_threshold
+        self.semantic = semantic
+
+    @staticmethod
+    def from_config(config: Optional[dict[str, Any]]):
+        if config is None:
+            return QnaFastPathConfig()
+        else:
+            return QnaFastPathConfig(
+                similarity_threshold=config.get("similarity_threshold", 0.9),
+                semantic=config.get("semantic", True),
+            )
@@ -13,6 +13,7 @@ class LanceDBConfig(BaseVectorDbConfig):
         host: Optional[str] = None,
         port: Optional[str] = None,
         allow_reset=True,
+        batch_size: Optional[int] = 100,
     ):
         """
         Initializes a configuration class instance for LanceDB.
@@ -27,7 +28,10 @@ class LanceDBConfig(BaseVectorDbConfig):
         :type port: Optional[str], optional
         :param allow_reset: Resets the database. defaults to False
         :type allow_reset: bool
+        :param batch_size: Number of documents to embed in one call, defaults to 100
+        :type batch_size: Optional[int], optional
         """
 
         self.allow_reset = allow_reset
+        self.batch_size = batch_size
         super().__init__(collection_name=collection_name, dir=dir, host=host, port=port)
@@ -1,7 +1,7 @@
 import os
+import threading
+from typing import Optional
 
-from alembic import command
-from alembic.config import Config
 from sqlalchemy import create_engine
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Session as SQLAlchemySession
@@ -62,22 +62,71 @@ class DatabaseManager:
 database_manager = DatabaseManager()
 
 
+# Databases that were migrated to the latest schema in this process
+_migrated_uris: set[str] = set()
+_lock = threading.Lock()
+
+
 # Convenience functions for backward compatibility and ease of use
 def setup_engine(database_uri: str, echo: bool = False) -> None:
-    database_manager.database_uri = database_uri
-    database_manager.echo = echo
-    database_manager.setup_engine()
-
+    """Initializes the database engine, or keeps the current engine if it is set up for the same database."""
+    with _lock:
+        if (
+            database_manager.engine is not None
+            and database_manager.database_uri == database_uri
+            and database_manager.echo == echo
+        ):
+            return
+        database_manager.database_uri = database_uri
+        database_manager.echo = echo
+        database_manager.setup_engine()
+
+
+def _get_alembic_config(database_uri: str):
+    from alembic.config import Config
 
-def alembic_upgrade() -> None:
-    """Upgrades the database to the latest version."""
     alembic_config_path = os.path.join(os.path.dirname(__file__), "..", "..", "alembic.ini")
     alembic_cfg = Config(alembic_config_path)
-    command.upgrade(alembic_cfg, "head")
+    # Read by `migrations/env.py`, so that the migrations run on the database of the engine
+    alembic_cfg.attributes["database_uri"] = database_uri
+    return alembic_cfg
+
+
+def alembic_upgrade(database_uri: Optional[str] = None) -> None:
+    """Upgrades the database to the latest version."""
+    # alembic is only needed to run the migrations, so it isn't imported with the module
+    from alembic import command
+
+    database_uri = database_uri or database_manager.database_uri or os.environ.get("EMBEDCHAIN_DB_URI")
+    command.upgrade(_get_alembic_config(database_uri), "head")
+
+
+def is_db_up_to_date() -> bool:
+    """Whether the database of the engine is stamped with the latest schema version."""
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+
+    if not database_manager.engine:
+        raise RuntimeError("Database engine is not initialized. Call setup_engine() first.")
+    head = ScriptDirectory.from_config(_get_alembic_config(database_manager.database_uri)).get_current_head()
+    with database_manager.engine.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision() == head
 
 
 def init_db() -> None:
-    alembic_upgrade()
+    """
+    Migrates the database of the engine to the latest schema.
+
+    The schema version is checked once per database and process, and the migrations only run if the database isn't
+    stamped with the latest version, so building more apps or LLMs doesn't go through alembic again.
+    """
+    with _lock:
+        database_uri = database_manager.database_uri
+        if database_uri in _migrated_uris:
+            return
+        if not is_db_up_to_date():
+            alembic_upgrade(database_uri)
+        _migrated_uris.add(database_uri)
 
 
 def get_session() -> SQLAlchemySession:
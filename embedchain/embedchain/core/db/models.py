@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import TIMESTAMP, Column, Integer, String, Text, func
+from sqlalchemy import TIMESTAMP, Column, Index, Integer, String, Text, func
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -29,3 +29,6 @@ class ChatHistory(Base):
     answer = Column(Text)
     meta_data = Column(Text, name="metadata")
     created_at = Column(TIMESTAMP, default=func.current_timestamp(), index=True)
+
+    # Latest rounds of a session
+    __table_args__ = (Index("ix_ec_chat_history_session_created_at", "app_id", "session_id", "created_at"),)
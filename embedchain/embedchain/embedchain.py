@@ -1,14 +1,22 @@
+import asyncio
+import concurrent.futures
+import copy
 import hashlib
 import json
 import logging
+import queue
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Generator, Iterator
 from typing import Any, Optional, Union
 
 from dotenv import load_dotenv
 from langchain.docstore.document import Document
+from tqdm import tqdm
 
-from embedchain.cache import adapt, get_gptcache_session, gptcache_data_convert, gptcache_update_cache_callback
+from embedchain.cache import AnswerCache, CacheKey
 from embedchain.chunkers.base_chunker import BaseChunker
-from embedchain.config import AddConfig, BaseLlmConfig, ChunkerConfig
+from embedchain.compression import ContextCompressor
+from embedchain.config import AddConfig, BaseLlmConfig, ChunkerConfig, HybridSearchConfig
 from embedchain.config.base_app_config import BaseAppConfig
 from embedchain.core.db.models import ChatHistory, DataSource
 from embedchain.data_formatter import DataFormatter
@@ -16,9 +24,13 @@ from embedchain.embedder.base import BaseEmbedder
 from embedchain.helpers.json_serializable import JSONSerializable
 from embedchain.llm.base import BaseLlm
 from embedchain.loaders.base_loader import BaseLoader
+from embedchain.memory.message import ChatMessage
+from embedchain.memory.summary import HistorySummarizer
 from embedchain.models.data_type import DataType, DirectDataType, IndirectDataType, SpecialDataType
+from embedchain.qna_index import QnaIndex, QnaMatch
 from embedchain.utils.misc import detect_datatype, is_valid_json_string
-from embedchain.vectordb.base import BaseVectorDB
+from embedchain.vectordb.base import BaseVectorDB, InsertResult
+from embedchain.vectordb.keyword_index import KeywordIndex
 
 load_dotenv()
 
@@ -52,8 +64,18 @@ class EmbedChain(JSONSerializable):
         """
         self.config = config
         self.cache_config = None
+        self.answer_cache: Optional[AnswerCache] = None
         self.memory_config = None
         self.mem0_memory = None
+        # Local keyword index for hybrid retrieval, disabled unless a `HybridSearchConfig` is set
+        self.hybrid_search_config: Optional[HybridSearchConfig] = None
+        self.keyword_index: Optional[KeywordIndex] = None
+        # Index of the questions of the QnA pairs, disabled unless a `QnaFastPathConfig` is set
+        self.qna_index: Optional[QnaIndex] = None
+        # Extractive compression of the retrieved contexts, disabled unless a `ContextCompressionConfig` is set
+        self.context_compressor: Optional[ContextCompressor] = None
+        # Rolling summary of chat history, disabled unless a `HistorySummaryConfig` is set
+        self.history_summarizer: Optional[HistorySummarizer] = None
         # Llm
         self.llm = llm
         # Database has support for config assignment for backwards compatibility
@@ -142,36 +164,8 @@ class EmbedChain(JSONSerializable):
         :return: source_hash, a md5-hash of the source, in hexadecimal representation.
         :rtype: str
         """
-        if config is not None:
-            pass
-        elif self.chunker is not None:
-            config = AddConfig(chunker=self.chunker)
-        else:
-            config = AddConfig()
-
-        try:
-            DataType(source)
-            logger.warning(
-                f"""Starting from version v0.0.40, Embedchain can automatically detect the data type. So, in the `add` method, the argument order has changed. You no longer need to specify '{source}' for the `source` argument. So the code snippet will be `.add("{data_type}", "{source}")`"""  # noqa #E501
-            )
-            logger.warning(
-                "Embedchain is swapping the arguments for you. This functionality might be deprecated in the future, so please adjust your code."  # noqa #E501
-            )
-            source, data_type = data_type, source
-        except ValueError:
-            pass
-
-        if data_type:
-            try:
-                data_type = DataType(data_type)
-            except ValueError:
-                logger.info(
-                    f"Invalid data_type: '{data_type}', using `custom` instead.\n Check docs to pass the valid data type: `https://docs.embedchain.ai/data-sources/overview`"  # noqa: E501
-                )
-                data_type = DataType.CUSTOM
-
-        if not data_type:
-            data_type = detect_datatype(source)
+        config = self._get_add_config(config)
+        source, data_type = self._resolve_data_type(source, data_type)
 
         # `source_hash` is the md5 hash of the source argument
         source_hash = hashlib.md5(str(source).encode("utf-8")).hexdigest()
@@ -226,6 +220,244 @@ class EmbedChain(JSONSerializable):
 
         return source_hash
 
+    async def aadd(
+        self,
+        source: Any,
+        data_type: Optional[DataType] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        config: Optional[AddConfig] = None,
+        dry_run=False,
+        loader: Optional[BaseLoader] = None,
+        chunker: Optional[BaseChunker] = None,
+        **kwargs: Optional[dict[str, Any]],
+    ):
+        """
+        Async version of `add`. Takes the same arguments and returns the same result.
+
+        Loaders and chunkers are synchronous, so the whole ingestion runs in a worker thread to keep the event loop
+        free while the source is loaded, embedded and stored.
+        """
+        return await asyncio.to_thread(
+            self.add,
+            source,
+            data_type=data_type,
+            metadata=metadata,
+            config=config,
+            dry_run=dry_run,
+            loader=loader,
+            chunker=chunker,
+            **kwargs,
+        )
+
+    def add_many(
+        self,
+        sources: list[Any],
+        data_type: Optional[DataType] = None,
+        metadata: Optional[dict[str, Any]] = None,
+        config: Optional[AddConfig] = None,
+        loader: Optional[BaseLoader] = None,
+        chunker: Optional[BaseChunker] = None,
+        num_workers: int = 4,
+        queue_size: int = 16,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> list[Optional[str]]:
+        """
+        Adds many data sources to the vector db at once.
+
+        Loading, chunking and the lookup of existing chunks run concurrently in a pool of `num_workers` threads.
+        The prepared chunks are handed over through a bounded queue to the calling thread, which embeds and
+        inserts them in batches of `config.batch_size` chunks, so that network I/O of the loaders overlaps with
+        the embedding and insertion of the chunks of the sources that are already loaded.
+
+        :param sources: The data to embed. Every item is either a source (see `add`), or a dict with a `source`
+        key and optional `data_type` and `metadata` keys that override the arguments of this method.
+        :type sources: list[Any]
+        :param data_type: The type of the data to add, detected for every source if not provided, defaults to None
+        :type data_type: Optional[DataType], optional
+        :param metadata: Metadata associated with every data source, defaults to None
+        :type metadata: Optional[dict[str, Any]], optional
+        :param config: The `AddConfig` instance to use as configuration options, defaults to None
+        :type config: Optional[AddConfig], optional
+        :param loader: The loader to use to load the data, defaults to None
+        :type loader: BaseLoader, optional
+        :param chunker: The chunker to use to chunk the data, defaults to None
+        :type chunker: BaseChunker, optional
+        :param num_workers: Number of threads used to load and chunk the sources, defaults to 4
+        :type num_workers: int, optional
+        :param queue_size: Maximum number of loaded sources waiting to be inserted, defaults to 16
+        :type queue_size: int, optional
+        :param kwargs: Additional keyword arguments passed to the `add` method of the vector database
+        :type kwargs: dict[str, Any]
+        :return: The md5-hash of every source, in the order of `sources`. `None` for sources that failed to load.
+        :rtype: list[Optional[str]]
+        """
+        if num_workers < 1:
+            raise ValueError(f"num_workers {num_workers} should be a positive integer")
+
+        config = self._get_add_config(config)
+        items = []
+        for item in sources:
+            if isinstance(item, dict) and "source" in item:
+                item_source = item["source"]
+                item_data_type = item.get("data_type", data_type)
+                item_metadata = item.get("metadata", metadata)
+            else:
+                item_source, item_data_type, item_metadata = item, data_type, metadata
+            item_source, item_data_type = self._resolve_data_type(item_source, item_data_type)
+            items.append((item_source, item_data_type, item_metadata))
+
+        prepared = queue.Queue(maxsize=max(queue_size, 1))
+        stopped = threading.Event()
+
+        def _put(result: tuple):
+            # Block while the queue is full, unless the consumer has stopped.
+            while not stopped.is_set():
+                try:
+                    prepared.put(result, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def _prepare(index: int, source: Any, source_data_type: DataType, source_metadata: Optional[dict]):
+            if stopped.is_set():
+                return
+            try:
+                source_hash = hashlib.md5(str(source).encode("utf-8")).hexdigest()
+                data_formatter = DataFormatter(source_data_type, config, loader, chunker)
+                chunks = self._prepare_chunks(
+                    data_formatter.loader, data_formatter.chunker, source, source_metadata, source_hash, config
+                )
+                _put((index, source_hash, data_formatter.chunker, chunks, None))
+            except Exception as e:
+                _put((index, None, None, None, e))
+
+        source_hashes: list[Optional[str]] = [None] * len(items)
+        pending_documents, pending_metadatas, pending_ids = [], [], []
+        seen_ids = set()
+        count_new_chunks = 0
+
+        def _flush():
+            nonlocal pending_documents, pending_metadatas, pending_ids, count_new_chunks
+            if pending_documents:
+                result = self._insert_chunks(
+                    pending_documents, pending_metadatas, pending_ids, batch_size=config.batch_size, **kwargs
+                )
+                count_new_chunks += len(result.inserted_ids)
+            pending_documents, pending_metadatas, pending_ids = [], [], []
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_workers)
+        try:
+            for index, (item_source, item_data_type, item_metadata) in enumerate(items):
+                executor.submit(_prepare, index, item_source, item_data_type, item_metadata)
+
+            for _ in tqdm(range(len(items)), desc="Adding sources"):
+                index, source_hash, source_chunker, chunks, error = prepared.get()
+                item_source, item_data_type, item_metadata = items[index]
+                if error is not None:
+                    logger.error(f"Failed to add {str(item_source)[:100]} ({item_data_type}): {error}")
+                    continue
+
+                documents, metadatas, ids = chunks
+                for document, chunk_metadata, chunk_id in zip(documents, metadatas, ids):
+                    # The same chunk can be produced by two sources of the same batch
+                    if chunk_id in seen_ids:
+                        continue
+                    seen_ids.add(chunk_id)
+                    pending_documents.append(document)
+                    pending_metadatas.append(chunk_metadata)
+                    pending_ids.append(chunk_id)
+                if len(pending_documents) >= config.batch_size:
+                    _flush()
+
+                source_hashes[index] = source_hash
+                self.user_asks.append([item_source, item_data_type.value, item_metadata])
+                if item_data_type in {DataType.DOCS_SITE}:
+                    self.is_docs_site_instance = True
+
+                self.db_session.add(
+                    DataSource(
+                        hash=source_hash,
+                        app_id=self.config.id,
+                        type=item_data_type.value,
+                        value=item_source if isinstance(item_source, str) else str(item_source),
+                        metadata=json.dumps(item_metadata),
+                    )
+                )
+
+                # Send anonymous telemetry
+                if self.config.collect_metrics:
+                    event_properties = {
+                        **self._telemetry_props,
+                        "data_type": item_data_type.value,
+                        "word_count": source_chunker.get_word_count(documents),
+                        "chunks_count": len(documents),
+                    }
+                    self.telemetry.capture(event_name="add", properties=event_properties)
+
+            _flush()
+        finally:
+            stopped.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        try:
+            self.db_session.commit()
+        except Exception as e:
+            logger.error(f"Error adding data sources: {e}")
+            self.db_session.rollback()
+
+        logger.info(f"Successfully saved {len(items)} sources. New chunks count: {count_new_chunks}")
+        return source_hashes
+
+    def _get_add_config(self, config: Optional[AddConfig] = None) -> AddConfig:
+        """
+        Get the `AddConfig` to use for an `add` call, falling back to the app's chunker config. The token splitter
+        measures chunks with the tokenizer of the embedding model, unless the config sets another model.
+        """
+        if config is None:
+            config = AddConfig(chunker=self.chunker) if self.chunker is not None else AddConfig()
+        chunker = config.chunker
+        if chunker is not None and chunker.splitter == "token" and chunker.tokenizer_model is None:
+            # Size the chunks by the tokens of the embedding model, without changing the config of the caller
+            chunker = copy.copy(chunker)
+            chunker.tokenizer_model = self.db.embedder.config.model
+            config = copy.copy(config)
+            config.chunker = chunker
+        return config
+
+    @staticmethod
+    def _resolve_data_type(source: Any, data_type: Optional[DataType] = None) -> tuple[Any, DataType]:
+        """
+        Validate the data type of a source, or detect it if it's not provided.
+
+        :return: The (possibly swapped) source and the data type to use for it.
+        :rtype: tuple[Any, DataType]
+        """
+        try:
+            DataType(source)
+            logger.warning(
+                f"""Starting from version v0.0.40, Embedchain can automatically detect the data type. So, in the `add` method, the argument order has changed. You no longer need to specify '{source}' for the `source` argument. So the code snippet will be `.add("{data_type}", "{source}")`"""  # noqa #E501
+            )
+            logger.warning(
+                "Embedchain is swapping the arguments for you. This functionality might be deprecated in the future, so please adjust your code."  # noqa #E501
+            )
+            source, data_type = data_type, source
+        except ValueError:
+            pass
+
+        if data_type:
+            try:
+                data_type = DataType(data_type)
+            except ValueError:
+                logger.info(
+                    f"Invalid data_type: '{data_type}', using `custom` instead.\n Check docs to pass the valid data type: `https://docs.embedchain.ai/data-sources/overview`"  # noqa: E501
+                )
+                data_type = DataType.CUSTOM
+
+        if not data_type:
+            data_type = detect_datatype(source)
+
+        return source, data_type
+
     def _get_existing_doc_id(self, chunker: BaseChunker, src: Any):
         """
         Get id of existing document for a given source, based on the data type
@@ -315,11 +547,80 @@ class EmbedChain(JSONSerializable):
         :type dry_run: bool, defaults to False
         :return: (list) documents (embedded text), (list) metadata, (list) ids, (int) number of chunks
         """
-        existing_doc_id = self._get_existing_doc_id(chunker=chunker, src=src)
+        add_config = add_config or AddConfig()
+        documents, metadatas, ids = self._prepare_chunks(loader, chunker, src, metadata, source_hash, add_config)
+        if not documents:
+            return [], [], [], 0
+
+        if dry_run:
+            return documents, metadatas, ids, 0
+
+        result = self._insert_chunks(documents, metadatas, ids, batch_size=add_config.batch_size, **kwargs)
+
+        inserted_ids = set(result.inserted_ids)
+        inserted = [(doc, meta, id) for doc, meta, id in zip(documents, metadatas, ids) if id in inserted_ids]
+        documents, metadatas, ids = (list(values) for values in zip(*inserted)) if inserted else ([], [], [])
+
+        count_new_chunks = len(result.inserted_ids)
+        logger.info(f"Successfully saved {str(src)[:100]} ({chunker.data_type}). New chunks count: {count_new_chunks}")
+        if result.failed_ids:
+            logger.warning(f"Failed to save {len(result.failed_ids)} chunks of {str(src)[:100]}.")
+
+        return documents, metadatas, ids, count_new_chunks
+
+    def _is_source_unmodified(
+        self, loader: BaseLoader, src: Any, source_hash: Optional[str], app_id: Optional[str]
+    ) -> bool:
+        """
+        Check with the loader whether a source is unchanged since it was loaded, without loading it, e.g. with a
+        conditional request that is answered 304 Not Modified, and whether its chunks are still stored.
+        """
+        if source_hash is None:
+            return False
+        get_unmodified_doc_id = getattr(loader, "get_unmodified_doc_id", None)
+        if get_unmodified_doc_id is None:
+            return False
+        try:
+            doc_id = get_unmodified_doc_id(src)
+        except Exception as e:
+            logger.debug(f"Could not check whether {str(src)[:100]} has been modified: {e}")
+            return False
+        if not isinstance(doc_id, str):
+            return False
+
+        where = {"hash": source_hash, "doc_id": f"{app_id}--{doc_id}" if app_id is not None else doc_id}
+        if app_id is not None:
+            where["app_id"] = app_id
+        return len(self.db.get(where=where, limit=1)["ids"]) > 0
+
+    def _prepare_chunks(
+        self,
+        loader: BaseLoader,
+        chunker: BaseChunker,
+        src: Any,
+        metadata: Optional[dict[str, Any]] = None,
+        source_hash: Optional[str] = None,
+        add_config: Optional[AddConfig] = None,
+    ) -> tuple[list[str], list[dict[str, Any]], list[str]]:
+        """
+        Loads and chunks the data from the given source, and filters out the chunks that are already stored.
+
+        This does everything `_load_and_embed` does except writing to the vector database, so that the
+        (network bound) loading and the (embedding bound) insertion can be run by separate workers.
+
+        :return: (list) documents, (list) metadatas and (list) ids of the chunks that have to be inserted
+        :rtype: tuple[list[str], list[dict[str, Any]], list[str]]
+        """
         app_id = self.config.id if self.config is not None else None
+        if self._is_source_unmodified(loader, src, source_hash, app_id):
+            logger.info(f"{str(src)[:100]} has not been modified. Skipping loading, chunks and embeddings")
+            return [], [], []
+
+        existing_doc_id = self._get_existing_doc_id(chunker=chunker, src=src)
+        chunker_config = add_config.chunker if add_config is not None else None
 
         # Create chunks
-        embeddings_data = chunker.create_chunks(loader, src, app_id=app_id, config=add_config.chunker)
+        embeddings_data = chunker.create_chunks(loader, src, app_id=app_id, config=chunker_config)
         # spread chunking results
         documents = embeddings_data["documents"]
         metadatas = embeddings_data["metadatas"]
@@ -328,12 +629,7 @@ class EmbedChain(JSONSerializable):
 
         if existing_doc_id and existing_doc_id == new_doc_id:
             logger.info("Doc content has not changed. Skipping creating chunks and embeddings")
-            return [], [], [], 0
-
-        # this means that doc content has changed.
-        if existing_doc_id and existing_doc_id != new_doc_id:
-            logger.info("Doc content has changed. Recomputing chunks and embeddings intelligently.")
-            self.db.delete({"doc_id": existing_doc_id})
+            return [], [], []
 
         # get existing ids, and discard doc if any common id exist.
         where = {"url": src}
@@ -345,9 +641,25 @@ class EmbedChain(JSONSerializable):
         if chunker.data_type == DataType.QNA_PAIR:
             where = {"question": src[0]}
 
+        # the chunks of a directory have the url of their file, so they are found by the hash of the source
+        if chunker.data_type == DataType.DIRECTORY:
+            where = {"hash": source_hash}
+
         if self.config.id is not None:
             where["app_id"] = self.config.id
 
+        if chunker.data_type == DataType.DIRECTORY and "files" in embeddings_data:
+            embeddings_data = self._sync_directory_files(loader, chunker, src, where, embeddings_data, chunker_config)
+            documents = embeddings_data["documents"]
+            metadatas = embeddings_data["metadatas"]
+            ids = embeddings_data["ids"]
+            if not ids:
+                return [], [], []
+        # this means that doc content has changed.
+        elif existing_doc_id and existing_doc_id != new_doc_id:
+            logger.info("Doc content has changed. Recomputing chunks and embeddings intelligently.")
+            self._delete_stale_chunks(existing_doc_id, new_doc_id, where, ids)
+
         db_result = self.db.get(ids=ids, where=where)  # optional filter
         existing_ids = set(db_result["ids"])
         if len(existing_ids):
@@ -360,7 +672,7 @@ class EmbedChain(JSONSerializable):
                     src_copy = src[:50] + "..."
                 logger.info(f"All data from {src_copy} already exists in the database.")
                 # Make sure to return a matching return type
-                return [], [], [], 0
+                return [], [], []
 
             ids = list(data_dict.keys())
             documents, metadatas = zip(*data_dict.values())
@@ -381,38 +693,184 @@ class EmbedChain(JSONSerializable):
                 m.update(metadata)
 
             new_metadatas.append(m)
-        metadatas = new_metadatas
 
-        if dry_run:
-            return list(documents), metadatas, ids, 0
+        return list(documents), new_metadatas, list(ids)
 
-        # Count before, to calculate a delta in the end.
-        chunks_before_addition = self.db.count()
+    def _sync_directory_files(
+        self,
+        loader: BaseLoader,
+        chunker: BaseChunker,
+        src: Any,
+        where: dict[str, Any],
+        embeddings_data: dict[str, Any],
+        chunker_config: Optional[ChunkerConfig] = None,
+    ) -> dict[str, Any]:
+        """
+        Delete the stored chunks of the removed and changed files of a directory.
+
+        An incremental loader only loads the new and changed files of a directory. The files it reports as unchanged
+        are checked against the content hash stored with their chunks, and the ones that aren't stored, e.g. because
+        the directory was added to another app or the last `add` failed, are loaded again.
+
+        :param where: Filter that matches all stored chunks of the directory
+        :type where: dict[str, Any]
+        :param embeddings_data: Chunks of the loaded files and the content hash of every file of the directory
+        :type embeddings_data: dict[str, Any]
+        :return: The chunks to insert
+        :rtype: dict[str, Any]
+        """
+        stored = self.db.get(where=where)
+        stored_ids, stored_hashes = {}, {}
+        for id, metadata in zip(stored["ids"], stored["metadatas"]):
+            stored_ids.setdefault(metadata.get("url"), []).append(id)
+            stored_hashes.setdefault(metadata.get("url"), set()).add(metadata.get("file_hash"))
+
+        files = embeddings_data["files"]
+        loaded_urls = {metadata.get("url") for metadata in embeddings_data["metadatas"]}
+        missing_urls = [
+            url for url, file_hash in files.items() if url not in loaded_urls and stored_hashes.get(url) != {file_hash}
+        ]
+        if missing_urls and hasattr(loader, "invalidate"):
+            logger.info(f"Loading {len(missing_urls)} unchanged files again, their chunks are not stored.")
+            loader.invalidate(src, missing_urls)
+            app_id = self.config.id if self.config is not None else None
+            embeddings_data = chunker.create_chunks(loader, src, app_id=app_id, config=chunker_config)
+            files = embeddings_data["files"]
+
+        new_ids = set(embeddings_data["ids"])
+        stale_ids = [
+            id
+            for url, ids in stored_ids.items()
+            if stored_hashes[url] != {files.get(url)}
+            for id in ids
+            if id not in new_ids
+        ]
+        if stale_ids:
+            try:
+                self.db.delete_ids(stale_ids)
+            except NotImplementedError:
+                # Delete all chunks of the changed files, the unchanged ones are inserted again
+                for url in {url for url in stored_ids if stored_hashes[url] != {files.get(url)}}:
+                    self.db.delete({**where, "url": url})
+                    if self.keyword_index is not None:
+                        self.keyword_index.delete({**where, "url": url}, collection=self.db.config.collection_name)
+            else:
+                if self.keyword_index is not None:
+                    self.keyword_index.delete_ids(stale_ids, collection=self.db.config.collection_name)
+            self._invalidate_answer_cache()
+        removed = sum(1 for url in stored_ids if url not in files)
+        logger.info(
+            f"Directory {src}: {len(files)} files, {removed} removed, deleted {len(stale_ids)} stale chunks, "
+            f"{len(embeddings_data['ids'])} chunks of new or changed files."
+        )
+        return embeddings_data
 
-        # Filter out empty documents and ensure they meet the API requirements
-        valid_documents = [doc for doc in documents if doc and isinstance(doc, str)]
+    def _delete_stale_chunks(self, existing_doc_id: str, new_doc_id: str, where: dict[str, Any], ids: list[str]):
+        """
+        Delete the stored chunks of a changed document that are not part of its new version.
+
+        Chunk ids are hashes of the chunk content, so the chunks that did not change keep their id. They stay in the
+        database, moved to the new doc_id, and are skipped by the lookup of existing ids afterwards, which means that
+        only the new chunks are embedded. If the database can't delete chunks by id or update their metadata, all
+        chunks of the old document are deleted instead.
+
+        :param existing_doc_id: doc_id of the stored version of the document
+        :type existing_doc_id: str
+        :param new_doc_id: doc_id of the new version of the document
+        :type new_doc_id: str
+        :param where: Filter that matches all stored chunks of the source
+        :type where: dict[str, Any]
+        :param ids: ids of the chunks of the new version of the document
+        :type ids: list[str]
+        """
+        try:
+            stored_ids = set(self.db.get(where=where)["ids"])
+            stale_ids = list(stored_ids.difference(ids))
+            kept_ids = list(stored_ids.intersection(ids))
+            self.db.delete_ids(stale_ids)
+            if kept_ids:
+                self.db.update_metadata(kept_ids, {"doc_id": new_doc_id})
+        except NotImplementedError:
+            self.db.delete({"doc_id": existing_doc_id})
+            if self.keyword_index is not None:
+                self.keyword_index.delete({"doc_id": existing_doc_id}, collection=self.db.config.collection_name)
+            self._invalidate_answer_cache()
+            return
+        if self.keyword_index is not None:
+            self.keyword_index.delete_ids(stale_ids, collection=self.db.config.collection_name)
+            if kept_ids:
+                self.keyword_index.update_metadata(
+                    kept_ids, {"doc_id": new_doc_id}, collection=self.db.config.collection_name
+                )
+        self._invalidate_answer_cache()
+        logger.info(f"Deleted {len(stale_ids)} stale chunks, kept {len(kept_ids)} unchanged chunks.")
 
-        documents = valid_documents
+    def _insert_chunks(
+        self,
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+        ids: list[str],
+        batch_size: int = 2048,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> InsertResult:
+        """
+        Embeds and inserts chunks into the vector database in batches.
 
-        # Chunk documents into batches of 2048 and handle each batch
-        # helps wigth large loads of embeddings  that hit OpenAI limits
-        document_batches = [documents[i : i + 2048] for i in range(0, len(documents), 2048)]
-        metadata_batches = [metadatas[i : i + 2048] for i in range(0, len(metadatas), 2048)]
-        id_batches = [ids[i : i + 2048] for i in range(0, len(ids), 2048)]
-        for batch_docs, batch_meta, batch_ids in zip(document_batches, metadata_batches, id_batches):
+        :param batch_size: Number of chunks sent to the vector database in one call, defaults to 2048
+        :type batch_size: int, optional
+        :return: ids of the chunks that were inserted, skipped because they are empty, or failed to insert
+        :rtype: InsertResult
+        """
+        result = InsertResult()
+        # Filter out empty documents and ensure they meet the API requirements
+        valid = []
+        for doc, meta, id in zip(documents, metadatas, ids):
+            if doc and isinstance(doc, str):
+                valid.append((doc, meta, id))
+            else:
+                result.skipped_ids.append(id)
+        if not valid:
+            return result
+        documents, metadatas, ids = (list(values) for values in zip(*valid))
+
+        # Chunk documents into batches and handle each batch
+        # helps with large loads of embeddings that hit OpenAI limits
+        for i in range(0, len(documents), batch_size):
+            batch_ids = ids[i : i + batch_size]
             try:
-                # Add only valid batches
-                if batch_docs:
-                    self.db.add(documents=batch_docs, metadatas=batch_meta, ids=batch_ids, **kwargs)
+                batch_result = self.db.add(
+                    documents=documents[i : i + batch_size],
+                    metadatas=metadatas[i : i + batch_size],
+                    ids=batch_ids,
+                    **kwargs,
+                )
             except Exception as e:
                 logger.info(f"Failed to add batch due to a bad request: {e}")
-                # Handle the error, e.g., by logging, retrying, or skipping
-                pass
+                result.failed_ids.extend(batch_ids)
+                continue
+            if not isinstance(batch_result, InsertResult):
+                # Vector databases that don't report their inserts
+                batch_result = InsertResult(inserted_ids=batch_ids)
+            result.merge(batch_result)
+            if self.keyword_index is not None and batch_result.inserted_ids:
+                self._index_keywords(
+                    documents[i : i + batch_size], metadatas[i : i + batch_size], batch_ids, batch_result.inserted_ids
+                )
 
-        count_new_chunks = self.db.count() - chunks_before_addition
-        logger.info(f"Successfully saved {str(src)[:100]} ({chunker.data_type}). New chunks count: {count_new_chunks}")
+        if result.inserted_ids:
+            self._invalidate_answer_cache()
+        return result
 
-        return list(documents), metadatas, ids, count_new_chunks
+    def _index_keywords(
+        self, documents: list[str], metadatas: list[dict[str, Any]], ids: list[str], inserted_ids: list[str]
+    ):
+        """Add the chunks that were inserted into the vector database to the keyword index."""
+        inserted = set(inserted_ids)
+        rows = [(doc, meta, id) for doc, meta, id in zip(documents, metadatas, ids) if id in inserted]
+        if not rows:
+            return
+        documents, metadatas, ids = (list(values) for values in zip(*rows))
+        self.keyword_index.add(ids, documents, metadatas, collection=self.db.config.collection_name)
 
     @staticmethod
     def _format_result(results):
@@ -449,15 +907,18 @@ class EmbedChain(JSONSerializable):
         :rtype: list[str]
         """
         query_config = config or self.llm.config
-        if where is not None:
-            where = where
-        else:
-            where = {}
-            if query_config is not None and query_config.where is not None:
-                where = query_config.where
-
-            if self.config.id is not None:
-                where.update({"app_id": self.config.id})
+        where = self._get_where(query_config, where)
+        if self.keyword_index is not None:
+            contexts = self.db.query(
+                input_query=input_query,
+                n_results=max(query_config.number_documents, self.hybrid_search_config.fetch_k),
+                where=where,
+                citations=True,
+                **kwargs,
+            )
+            return self._fuse_with_keyword_search(
+                input_query, contexts, query_config.number_documents, where, citations
+            )
 
         contexts = self.db.query(
             input_query=input_query,
@@ -469,6 +930,348 @@ class EmbedChain(JSONSerializable):
 
         return contexts
 
+    async def _aretrieve_from_database(
+        self,
+        input_query: str,
+        config: Optional[BaseLlmConfig] = None,
+        where=None,
+        citations: bool = False,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> Union[list[tuple[str, str, str]], list[str]]:
+        """
+        Async version of `_retrieve_from_database`.
+        """
+        query_config = config or self.llm.config
+        where = self._get_where(query_config, where)
+        if self.keyword_index is not None:
+            contexts = await self.db.aquery(
+                input_query=input_query,
+                n_results=max(query_config.number_documents, self.hybrid_search_config.fetch_k),
+                where=where,
+                citations=True,
+                **kwargs,
+            )
+            return self._fuse_with_keyword_search(
+                input_query, contexts, query_config.number_documents, where, citations
+            )
+
+        contexts = await self.db.aquery(
+            input_query=input_query,
+            n_results=query_config.number_documents,
+            where=where,
+            citations=citations,
+            **kwargs,
+        )
+
+        return contexts
+
+    def _retrieve_batch_from_database(
+        self,
+        input_queries: list[str],
+        config: Optional[BaseLlmConfig] = None,
+        where=None,
+        citations: bool = False,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> list[Union[list[tuple[str, str, str]], list[str]]]:
+        """
+        Queries the vector database for many queries at once, see `BaseVectorDB.query_batch`.
+
+        :param input_queries: The queries to use.
+        :type input_queries: list[str]
+        :param config: The query configuration, defaults to None
+        :type config: Optional[BaseLlmConfig], optional
+        :param where: A dictionary of key-value pairs to filter the database results, defaults to None
+        :type where: _type_, optional
+        :param citations: A boolean to indicate if db should fetch citation source
+        :type citations: bool
+        :return: Contents of the documents that matched each query, in the order of the queries
+        :rtype: list[list[str]]
+        """
+        query_config = config or self.llm.config
+        where = self._get_where(query_config, where)
+        if self.keyword_index is not None:
+            results = self.db.query_batch(
+                queries=input_queries,
+                n_results=max(query_config.number_documents, self.hybrid_search_config.fetch_k),
+                where=where,
+                citations=True,
+                **kwargs,
+            )
+            return [
+                self._fuse_with_keyword_search(input_query, contexts, query_config.number_documents, where, citations)
+                for input_query, contexts in zip(input_queries, results)
+            ]
+
+        return self.db.query_batch(
+            queries=input_queries,
+            n_results=query_config.number_documents,
+            where=where,
+            citations=citations,
+            **kwargs,
+        )
+
+    def _fuse_with_keyword_search(
+        self,
+        input_query: str,
+        vector_contexts: list[tuple[str, dict[str, Any]]],
+        n_results: int,
+        where: dict[str, Any],
+        citations: bool,
+    ) -> Union[list[tuple[str, dict[str, Any]]], list[str]]:
+        """
+        Fuse the results of the vector database with the results of the keyword index by reciprocal rank fusion.
+
+        Every chunk scores `weight / (rrf_k + rank)` for each result list it appears in, chunks are matched by their
+        text. With citations, the `score` in the metadata of the returned chunks is the fused score.
+
+        :param input_query: The query to use.
+        :type input_query: str
+        :param vector_contexts: Results of the vector database, fetched with citations
+        :type vector_contexts: list[tuple[str, dict[str, Any]]]
+        :param n_results: Number of chunks to return
+        :type n_results: int
+        :param where: Filter of the query, also applied to the keyword search
+        :type where: dict[str, Any]
+        :param citations: Whether to return the metadata of the chunks
+        :type citations: bool
+        :return: The best chunks after fusion, best first, in the format of `BaseVectorDB.query`
+        :rtype: Union[list[tuple[str, dict[str, Any]]], list[str]]
+        """
+        config = self.hybrid_search_config
+        try:
+            keyword_contexts = self.keyword_index.search(
+                input_query, n_results=config.fetch_k, collection=self.db.config.collection_name, where=where
+            )
+        except ValueError as e:
+            logger.debug(f"Skipping keyword search: {e}")
+            keyword_contexts = []
+
+        scores, metadatas = {}, {}
+        for weight, contexts in ((config.vector_weight, vector_contexts), (config.keyword_weight, keyword_contexts)):
+            for rank, (context, metadata, *_) in enumerate(contexts, start=1):
+                scores[context] = scores.get(context, 0.0) + weight / (config.rrf_k + rank)
+                metadatas.setdefault(context, metadata)
+
+        ranked = sorted(scores, key=scores.get, reverse=True)[:n_results]
+        if not citations:
+            return ranked
+        return [(context, {**metadatas[context], "score": scores[context]}) for context in ranked]
+
+    def _get_where(self, query_config: Optional[BaseLlmConfig], where: Optional[dict] = None) -> dict:
+        """Get the filter of a database query, the explicit `where` or the filter of the query config and app id."""
+        if where is not None:
+            return where
+
+        where = {}
+        if query_config is not None and query_config.where is not None:
+            where = query_config.where
+
+        if self.config.id is not None:
+            where.update({"app_id": self.config.id})
+        return where
+
+    @staticmethod
+    def _get_llm_contexts(contexts: list, citations: bool) -> list[str]:
+        """Strip the citation metadata from the retrieved contexts before they are passed to the LLM."""
+        if citations and len(contexts) > 0 and isinstance(contexts[0], tuple):
+            return list(map(lambda x: x[0], contexts))
+        return contexts
+
+    def _load_qna_pairs(self) -> tuple[list[str], list[dict[str, Any]]]:
+        """Get the documents and metadatas of the `qna_pair` chunks of the app from the vector database."""
+        where = {"data_type": DataType.QNA_PAIR.value}
+        if self.config.id is not None:
+            where["app_id"] = self.config.id
+        result = self.db.get(where=where)
+        return result.get("documents") or [], result.get("metadatas") or []
+
+    def _match_qna_pair(
+        self,
+        input_query: str,
+        config: Optional[BaseLlmConfig] = None,
+        where: Optional[dict[str, Any]] = None,
+        dry_run: bool = False,
+    ) -> Optional[QnaMatch]:
+        """Find the QnA pair that answers the query, if the QnA fast path is enabled. Queries with a filter, dry runs
+        and image queries always go through retrieval and the LLM."""
+        query_config = config or self.llm.config
+        if self.qna_index is None or dry_run or where or query_config.where or query_config.query_type == "Images":
+            return None
+        return self.qna_index.match(input_query)
+
+    def _answer_from_qna_pair(self, match: QnaMatch, citations: bool, event_name: str):
+        """Build the result of a query that is answered by a stored QnA pair, without calling the LLM."""
+        logger.info(f"Answered from the QnA pair {match.question!r} (score {match.score:.3f}), skipping the LLM.")
+        context = f"Q: {match.question}\nA: {match.answer}"
+        contexts = [(context, {**match.metadata, "score": match.score})] if citations else [context]
+        # Send anonymous telemetry
+        self.telemetry.capture(event_name=event_name, properties={**self._telemetry_props, "qna_fast_path": True})
+        return self._format_query_result(match.answer, contexts, citations)
+
+    def _compress_contexts(
+        self, input_query: str, contexts: list[str], config: Optional[BaseLlmConfig] = None
+    ) -> list[str]:
+        """Keep only the sentences of the contexts that are relevant to the query, if a `ContextCompressionConfig` is
+        set. The citations that are returned to the user are not compressed."""
+        query_config = config or self.llm.config
+        if self.context_compressor is None or not contexts or query_config.query_type == "Images":
+            return contexts
+        return self.context_compressor.compress(input_query, contexts)
+
+    def _format_query_result(
+        self, answer: Any, contexts: list, citations: bool, token_info: Optional[dict[str, Any]] = None
+    ) -> Union[tuple[str, list[tuple[str, dict]]], str, dict[str, Any]]:
+        """Build the return value of `query` and `chat`."""
+        if citations:
+            if self.llm.config.token_usage:
+                return {"answer": answer, "contexts": contexts, "usage": token_info}
+            return answer, contexts
+        if self.llm.config.token_usage:
+            return {"answer": answer, "usage": token_info}
+
+        logger.warning(
+            "Starting from v0.1.125 the return type of query method will be changed to tuple containing `answer`."
+        )
+        return answer
+
+    def _get_answer(
+        self,
+        cache_namespace: str,
+        input_query: str,
+        contexts: list[str],
+        config: Optional[BaseLlmConfig] = None,
+        dry_run: bool = False,
+        memories: Optional[list[dict]] = None,
+        history: Optional[list[str]] = None,
+        on_answer: Optional[Callable[[Any], None]] = None,
+    ) -> tuple[Any, Optional[dict[str, Any]]]:
+        """
+        Get the answer of the LLM, or the cached answer if the answer cache is enabled and has one.
+
+        :param cache_namespace: Namespace of the answer in the cache, answers are only shared within a namespace
+        :type cache_namespace: str
+        :param history: Chat history of the request, defaults to the history of the LLM
+        :type history: Optional[list[str]], optional
+        :param on_answer: Called with the complete answer, for streamed answers once the stream is exhausted,
+            defaults to None
+        :type on_answer: Optional[Callable[[Any], None]], optional
+        :return: The answer and the token info, which is None for cached answers and if token usage is disabled
+        :rtype: tuple[Any, Optional[dict[str, Any]]]
+        """
+        cache_key = None
+        if self.answer_cache is not None and not dry_run:
+            cache_key = self.answer_cache.key(cache_namespace, input_query, contexts)
+            answer = self.answer_cache.get(cache_key)
+            if answer is not None:
+                logger.debug("Answer cache hit, returning the cached answer.")
+                if on_answer is not None:
+                    on_answer(answer)
+                return answer, None
+
+        answer = self.llm.query(
+            input_query=input_query,
+            contexts=contexts,
+            config=config,
+            dry_run=dry_run,
+            memories=memories,
+            history=history,
+        )
+        answer, token_info = self._split_token_info(answer)
+        complete = self._get_answer_callback(cache_key, on_answer)
+        if isinstance(answer, Iterator):
+            return self._complete_stream(answer, complete), token_info
+        complete(answer)
+        return answer, token_info
+
+    async def _aget_answer(
+        self,
+        cache_namespace: str,
+        input_query: str,
+        contexts: list[str],
+        config: Optional[BaseLlmConfig] = None,
+        dry_run: bool = False,
+        memories: Optional[list[dict]] = None,
+        history: Optional[list[str]] = None,
+        on_answer: Optional[Callable[[Any], None]] = None,
+    ) -> tuple[Any, Optional[dict[str, Any]]]:
+        """
+        Async version of `_get_answer`. `on_answer` is called in a worker thread.
+        """
+        cache_key = None
+        if self.answer_cache is not None and not dry_run:
+            # Building the key embeds the query
+            cache_key = await asyncio.to_thread(self.answer_cache.key, cache_namespace, input_query, contexts)
+            answer = self.answer_cache.get(cache_key)
+            if answer is not None:
+                logger.debug("Answer cache hit, returning the cached answer.")
+                if on_answer is not None:
+                    await asyncio.to_thread(on_answer, answer)
+                return answer, None
+
+        answer = await self.llm.aquery(
+            input_query=input_query,
+            contexts=contexts,
+            config=config,
+            dry_run=dry_run,
+            memories=memories,
+            history=history,
+        )
+        answer, token_info = self._split_token_info(answer)
+        complete = self._get_answer_callback(cache_key, on_answer)
+        if isinstance(answer, AsyncIterator):
+            return self._acomplete_stream(answer, complete), token_info
+        if isinstance(answer, Iterator):
+            return self._complete_stream(answer, complete), token_info
+        await asyncio.to_thread(complete, answer)
+        return answer, token_info
+
+    def _split_token_info(self, answer: Any) -> tuple[Any, Optional[dict[str, Any]]]:
+        """Split the token info from the answer of the LLM. Streamed answers come without token info."""
+        if self.llm.config.token_usage and isinstance(answer, tuple):
+            return answer
+        return answer, None
+
+    def _get_answer_callback(
+        self, cache_key: Optional[CacheKey], on_answer: Optional[Callable[[Any], None]]
+    ) -> Callable[[Any], None]:
+        """Get the function that caches a complete answer and passes it on to `on_answer`."""
+
+        def complete(answer: Any):
+            if cache_key is not None and isinstance(answer, str):
+                self.answer_cache.set(cache_key, answer)
+            if on_answer is not None:
+                on_answer(answer)
+
+        return complete
+
+    @staticmethod
+    def _complete_stream(answer: Iterator[str], complete: Callable[[str], None]) -> Generator[str, None, None]:
+        """Pass the chunks of a streamed answer through, and the assembled answer to `complete` at the end."""
+        chunks = []
+        for chunk in answer:
+            chunks.append(chunk)
+            yield chunk
+        complete("".join(chunks))
+
+    @staticmethod
+    async def _acomplete_stream(
+        answer: AsyncIterator[str], complete: Callable[[str], None]
+    ) -> AsyncGenerator[str, None]:
+        """Async version of `_complete_stream`, `complete` is called in a worker thread."""
+        chunks = []
+        async for chunk in answer:
+            chunks.append(chunk)
+            yield chunk
+        await asyncio.to_thread(complete, "".join(chunks))
+
+    def _invalidate_answer_cache(self):
+        """Drop the cached answers after the data changed, since they may be answered from outdated contexts. The QnA
+        index is reloaded as well, since QnA pairs may have been added or deleted."""
+        if self.answer_cache is not None:
+            self.answer_cache.invalidate()
+        if self.qna_index is not None:
+            self.qna_index.invalidate()
+
     def query(
         self,
         input_query: str,
@@ -504,50 +1307,119 @@ class EmbedChain(JSONSerializable):
         tuple[str, list[tuple[str,str,str]]] and if token_usage is true then
         tuple[str, list[tuple[str,str,str]], dict[str, Any]]
         """
+        match = self._match_qna_pair(input_query, config, where, dry_run)
+        if match is not None:
+            return self._answer_from_qna_pair(match, citations, event_name="query")
+
         contexts = self._retrieve_from_database(
             input_query=input_query, config=config, where=where, citations=citations, **kwargs
         )
-        if citations and len(contexts) > 0 and isinstance(contexts[0], tuple):
-            contexts_data_for_llm_query = list(map(lambda x: x[0], contexts))
-        else:
-            contexts_data_for_llm_query = contexts
-
-        if self.cache_config is not None:
-            logger.info("Cache enabled. Checking cache...")
-            answer = adapt(
-                llm_handler=self.llm.query,
-                cache_data_convert=gptcache_data_convert,
-                update_cache_callback=gptcache_update_cache_callback,
-                session=get_gptcache_session(session_id=self.config.id),
-                input_query=input_query,
-                contexts=contexts_data_for_llm_query,
-                config=config,
-                dry_run=dry_run,
-            )
-        else:
-            if self.llm.config.token_usage:
-                answer, token_info = self.llm.query(
-                    input_query=input_query, contexts=contexts_data_for_llm_query, config=config, dry_run=dry_run
-                )
-            else:
-                answer = self.llm.query(
-                    input_query=input_query, contexts=contexts_data_for_llm_query, config=config, dry_run=dry_run
-                )
+        contexts_data_for_llm_query = self._compress_contexts(
+            input_query, self._get_llm_contexts(contexts, citations), config
+        )
+
+        answer, token_info = self._get_answer(
+            self.config.id, input_query, contexts_data_for_llm_query, config=config, dry_run=dry_run
+        )
 
         # Send anonymous telemetry
         self.telemetry.capture(event_name="query", properties=self._telemetry_props)
 
-        if citations:
-            if self.llm.config.token_usage:
-                return {"answer": answer, "contexts": contexts, "usage": token_info}
-            return answer, contexts
-        if self.llm.config.token_usage:
-            return {"answer": answer, "usage": token_info}
+        return self._format_query_result(answer, contexts, citations, token_info)
 
-        logger.warning(
-            "Starting from v0.1.125 the return type of query method will be changed to tuple containing `answer`."
+    def _query_batch(
+        self,
+        input_queries: list[str],
+        config: BaseLlmConfig = None,
+        where: Optional[dict] = None,
+        citations: bool = False,
+        num_workers: int = 4,
+        **kwargs: dict[str, Any],
+    ) -> list[Union[tuple[str, list[tuple[str, dict]]], str, dict[str, Any]]]:
+        """
+        Answer many queries, like `query`. The contexts of the queries that are not answered by a QnA pair are
+        retrieved with one batched database query, and the answers are fetched in parallel.
+
+        :param input_queries: The queries to answer.
+        :type input_queries: list[str]
+        :param num_workers: Number of queries that are answered at the same time, defaults to 4
+        :type num_workers: int, optional
+        :return: The results of the queries, in the order of the queries, see `query`
+        :rtype: list[Union[tuple[str, list[tuple[str, dict]]], str, dict[str, Any]]]
+        """
+        results = [None] * len(input_queries)
+        retrieved = []
+        for i, input_query in enumerate(input_queries):
+            match = self._match_qna_pair(input_query, config, where)
+            if match is not None:
+                results[i] = self._answer_from_qna_pair(match, citations, event_name="query")
+            else:
+                retrieved.append(i)
+
+        if not retrieved:
+            return results
+
+        batch_contexts = self._retrieve_batch_from_database(
+            input_queries=[input_queries[i] for i in retrieved],
+            config=config,
+            where=where,
+            citations=citations,
+            **kwargs,
         )
-        return answer
+
+        def answer(input_query: str, contexts: list):
+            contexts_data_for_llm_query = self._compress_contexts(
+                input_query, self._get_llm_contexts(contexts, citations), config
+            )
+            answer, token_info = self._get_answer(
+                self.config.id, input_query, contexts_data_for_llm_query, config=config
+            )
+            # Send anonymous telemetry
+            self.telemetry.capture(event_name="query", properties=self._telemetry_props)
+            return self._format_query_result(answer, contexts, citations, token_info)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = {
+                executor.submit(answer, input_queries[i], contexts): i for i, contexts in zip(retrieved, batch_contexts)
+            }
+            for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="Answering queries"):
+                results[futures[future]] = future.result()
+        return results
+
+    async def aquery(
+        self,
+        input_query: str,
+        config: BaseLlmConfig = None,
+        dry_run=False,
+        where: Optional[dict] = None,
+        citations: bool = False,
+        **kwargs: dict[str, Any],
+    ) -> Union[tuple[str, list[tuple[str, dict]]], str, dict[str, Any]]:
+        """
+        Async version of `query`. Takes the same arguments and returns the same result.
+
+        The vector database query and the LLM call are awaited, so that the event loop can serve other requests in
+        the meantime. Providers without an async client are called in a worker thread.
+        """
+        match = await asyncio.to_thread(self._match_qna_pair, input_query, config, where, dry_run)
+        if match is not None:
+            return self._answer_from_qna_pair(match, citations, event_name="query")
+
+        contexts = await self._aretrieve_from_database(
+            input_query=input_query, config=config, where=where, citations=citations, **kwargs
+        )
+        contexts_data_for_llm_query = await asyncio.to_thread(
+            self._compress_contexts, input_query, self._get_llm_contexts(contexts, citations), config
+        )
+
+        answer, token_info = await self._aget_answer(
+            self.config.id, input_query, contexts_data_for_llm_query, config=config, dry_run=dry_run
+        )
+
+        # Send anonymous telemetry
+        self.telemetry.capture(event_name="query", properties=self._telemetry_props)
+
+        return self._format_query_result(answer, contexts, citations, token_info)
 
     def chat(
         self,
@@ -589,13 +1461,17 @@ class EmbedChain(JSONSerializable):
         tuple[str, list[tuple[str,str,str]]] and if token_usage is true then
         tuple[str, list[tuple[str,str,str]], dict[str, Any]]
         """
+        match = self._match_qna_pair(input_query, config, where, dry_run)
+        if match is not None:
+            self._save_chat_answer(input_query, match.answer, session_id)
+            return self._answer_from_qna_pair(match, citations, event_name="chat")
+
         contexts = self._retrieve_from_database(
             input_query=input_query, config=config, where=where, citations=citations, **kwargs
         )
-        if citations and len(contexts) > 0 and isinstance(contexts[0], tuple):
-            contexts_data_for_llm_query = list(map(lambda x: x[0], contexts))
-        else:
-            contexts_data_for_llm_query = contexts
+        contexts_data_for_llm_query = self._compress_contexts(
+            input_query, self._get_llm_contexts(contexts, citations), config
+        )
 
         memories = None
         if self.mem0_memory:
@@ -603,63 +1479,108 @@ class EmbedChain(JSONSerializable):
                 query=input_query, agent_id=self.config.id, user_id=session_id, limit=self.memory_config.top_k
             )
 
-        # Update the history beforehand so that we can handle multiple chat sessions in the same python session
-        self.llm.update_history(app_id=self.config.id, session_id=session_id)
-
-        if self.cache_config is not None:
-            logger.debug("Cache enabled. Checking cache...")
-            cache_id = f"{session_id}--{self.config.id}"
-            answer = adapt(
-                llm_handler=self.llm.chat,
-                cache_data_convert=gptcache_data_convert,
-                update_cache_callback=gptcache_update_cache_callback,
-                session=get_gptcache_session(session_id=cache_id),
-                input_query=input_query,
-                contexts=contexts_data_for_llm_query,
-                config=config,
-                dry_run=dry_run,
+        # The history of the session is passed with the request, so concurrent chats in other sessions don't see it
+        history = self._load_chat_history(session_id)
+
+        # Streamed answers are saved once the stream is exhausted
+        answer, token_info = self._get_answer(
+            f"{session_id}--{self.config.id}",
+            input_query,
+            contexts_data_for_llm_query,
+            config=config,
+            dry_run=dry_run,
+            memories=memories,
+            history=history,
+            on_answer=lambda answer: self._save_chat_answer(input_query, answer, session_id),
+        )
+
+        # Send anonymous telemetry
+        self.telemetry.capture(event_name="chat", properties=self._telemetry_props)
+
+        return self._format_query_result(answer, contexts, citations, token_info)
+
+    async def achat(
+        self,
+        input_query: str,
+        config: Optional[BaseLlmConfig] = None,
+        dry_run=False,
+        session_id: str = "default",
+        where: Optional[dict[str, str]] = None,
+        citations: bool = False,
+        **kwargs: dict[str, Any],
+    ) -> Union[tuple[str, list[tuple[str, dict]]], str, dict[str, Any]]:
+        """
+        Async version of `chat`. Takes the same arguments and returns the same result.
+
+        The vector database query, the LLM call and the memory updates are awaited, so that the event loop can serve
+        other requests in the meantime. Providers without an async client are called in a worker thread.
+        """
+        match = await asyncio.to_thread(self._match_qna_pair, input_query, config, where, dry_run)
+        if match is not None:
+            await asyncio.to_thread(self._save_chat_answer, input_query, match.answer, session_id)
+            return self._answer_from_qna_pair(match, citations, event_name="chat")
+
+        contexts = await self._aretrieve_from_database(
+            input_query=input_query, config=config, where=where, citations=citations, **kwargs
+        )
+        contexts_data_for_llm_query = await asyncio.to_thread(
+            self._compress_contexts, input_query, self._get_llm_contexts(contexts, citations), config
+        )
+
+        memories = None
+        if self.mem0_memory:
+            memories = await asyncio.to_thread(
+                self.mem0_memory.search,
+                query=input_query,
+                agent_id=self.config.id,
+                user_id=session_id,
+                limit=self.memory_config.top_k,
             )
-        else:
-            logger.debug("Cache disabled. Running chat without cache.")
-            if self.llm.config.token_usage:
-                answer, token_info = self.llm.query(
-                    input_query=input_query,
-                    contexts=contexts_data_for_llm_query,
-                    config=config,
-                    dry_run=dry_run,
-                    memories=memories,
-                )
-            else:
-                answer = self.llm.query(
-                    input_query=input_query,
-                    contexts=contexts_data_for_llm_query,
-                    config=config,
-                    dry_run=dry_run,
-                    memories=memories,
-                )
 
-        # Add to Mem0 memory if enabled
+        history = await asyncio.to_thread(self._load_chat_history, session_id)
+
+        answer, token_info = await self._aget_answer(
+            f"{session_id}--{self.config.id}",
+            input_query,
+            contexts_data_for_llm_query,
+            config=config,
+            dry_run=dry_run,
+            memories=memories,
+            history=history,
+            on_answer=lambda answer: self._save_chat_answer(input_query, answer, session_id),
+        )
+
+        # Send anonymous telemetry
+        self.telemetry.capture(event_name="chat", properties=self._telemetry_props)
+
+        return self._format_query_result(answer, contexts, citations, token_info)
+
+    def _save_chat_answer(self, input_query: str, answer: Any, session_id: str):
+        """Add a chat answer to the Mem0 memory, if enabled, and to the chat history."""
         # Adding answer here because it would be much useful than input question itself
         if self.mem0_memory:
             self.mem0_memory.add(data=answer, agent_id=self.config.id, user_id=session_id)
 
-        # add conversation in memory
         self.llm.add_history(self.config.id, input_query, answer, session_id=session_id)
 
-        # Send anonymous telemetry
-        self.telemetry.capture(event_name="chat", properties=self._telemetry_props)
+        if self.history_summarizer is not None:
+            chat_message = ChatMessage()
+            chat_message.add_user_message(input_query)
+            chat_message.add_ai_message(answer)
+            self.history_summarizer.add_round(
+                self.config.id, session_id, str(chat_message), lambda: self._load_stored_history(session_id)
+            )
 
-        if citations:
-            if self.llm.config.token_usage:
-                return {"answer": answer, "contexts": contexts, "usage": token_info}
-            return answer, contexts
-        if self.llm.config.token_usage:
-            return {"answer": answer, "usage": token_info}
+    def _load_stored_history(self, session_id: str) -> list[str]:
+        return self.llm.load_history(app_id=self.config.id, session_id=session_id)
 
-        logger.warning(
-            "Starting from v0.1.125 the return type of query method will be changed to tuple containing `answer`."
+    def _load_chat_history(self, session_id: str) -> list[str]:
+        """Load the history of a chat session for a prompt, summarized if a `HistorySummaryConfig` is set."""
+        if self.history_summarizer is None:
+            return self._load_stored_history(session_id)
+        return self.history_summarizer.get_history(
+            self.config.id, session_id, lambda: self._load_stored_history(session_id)
         )
-        return answer
 
     def search(self, query, num_documents=3, where=None, raw_filter=None, namespace=None):
         """
@@ -681,13 +1602,27 @@ class EmbedChain(JSONSerializable):
         # Send anonymous telemetry
         self.telemetry.capture(event_name="search", properties=self._telemetry_props)
 
+        params = self._get_search_params(query, num_documents, where, raw_filter, namespace)
+        return [{"context": c[0], "metadata": c[1]} for c in self.db.query(**params)]
+
+    async def asearch(self, query, num_documents=3, where=None, raw_filter=None, namespace=None):
+        """
+        Async version of `search`. Takes the same arguments and returns the same result.
+        """
+        # Send anonymous telemetry
+        self.telemetry.capture(event_name="search", properties=self._telemetry_props)
+
+        params = self._get_search_params(query, num_documents, where, raw_filter, namespace)
+        return [{"context": c[0], "metadata": c[1]} for c in await self.db.aquery(**params)]
+
+    def _get_search_params(self, query, num_documents, where, raw_filter, namespace) -> dict[str, Any]:
         if raw_filter and where:
             raise ValueError("You can't use both `raw_filter` and `where` together.")
 
         filter_type = "raw_filter" if raw_filter else "where"
         filter_criteria = raw_filter if raw_filter else where
 
-        params = {
+        return {
             "input_query": query,
             "n_results": num_documents,
             "citations": True,
@@ -696,8 +1631,6 @@ class EmbedChain(JSONSerializable):
             filter_type: filter_criteria,
         }
 
-        return [{"context": c[0], "metadata": c[1]} for c in self.db.query(**params)]
-
     def set_collection_name(self, name: str):
         """
         Set the name of the collection. A collection is an isolated space for vectors.
@@ -710,6 +1643,8 @@ class EmbedChain(JSONSerializable):
         self.db.set_collection_name(name)
         # Create the collection if it does not exist
         self.db._get_or_create_collection(name)
+        if self.qna_index is not None:
+            self.qna_index.invalidate()
         # TODO: Check whether it is necessary to assign to the `self.collection` attribute,
         # since the main purpose is the creation.
 
@@ -727,6 +1662,9 @@ class EmbedChain(JSONSerializable):
             self.db_session.rollback()
             return None
         self.db.reset()
+        if self.keyword_index is not None:
+            self.keyword_index.reset(collection=self.db.config.collection_name)
+        self._invalidate_answer_cache()
         self.delete_all_chat_history(app_id=self.config.id)
         # Send anonymous telemetry
         self.telemetry.capture(event_name="reset", properties=self._telemetry_props)
@@ -750,10 +1688,14 @@ class EmbedChain(JSONSerializable):
     def delete_session_chat_history(self, session_id: str = "default"):
         self.llm.memory.delete(app_id=self.config.id, session_id=session_id)
         self.llm.update_history(app_id=self.config.id)
+        if self.history_summarizer is not None:
+            self.history_summarizer.discard(self.config.id, session_id)
 
     def delete_all_chat_history(self, app_id: str):
         self.llm.memory.delete(app_id=app_id)
         self.llm.update_history(app_id=app_id)
+        if self.history_summarizer is not None:
+            self.history_summarizer.discard(app_id)
 
     def delete(self, source_id: str):
         """
@@ -769,6 +1711,9 @@ class EmbedChain(JSONSerializable):
             self.db_session.rollback()
             return None
         self.db.delete(where={"hash": source_id})
+        if self.keyword_index is not None:
+            self.keyword_index.delete({"hash": source_id}, collection=self.db.config.collection_name)
+        self._invalidate_answer_cache()
         logger.info(f"Successfully deleted {source_id}")
         # Send anonymous telemetry
         if self.config.collect_metrics:
@@ -1,7 +1,9 @@
+import asyncio
 from collections.abc import Callable
 from typing import Any, Optional
 
 from embedchain.config.embedder.base import BaseEmbedderConfig
+from embedchain.embedder.cache import CachedEmbeddingFunc, EmbeddingCache
 
 try:
     from chromadb.api.types import Embeddable, EmbeddingFunction, Embeddings
@@ -40,6 +42,7 @@ class BaseEmbedder:
         else:
             self.config = config
         self.vector_dimension: int
+        self.cache: Optional[EmbeddingCache] = None
 
     def set_embedding_fn(self, embedding_fn: Callable[[list[str]], list[str]]):
         """
@@ -51,7 +54,32 @@ class BaseEmbedder:
         """
         if not hasattr(embedding_fn, "__call__"):
             raise ValueError("Embedding function is not a function")
-        self.embedding_fn = embedding_fn
+        self._uncached_embedding_fn = embedding_fn
+        self.embedding_fn = self._with_cache(embedding_fn)
+
+    def set_cache(self, cache: Optional[EmbeddingCache]):
+        """
+        Set or remove a persistent cache in front of the embedding function.
+
+        Texts that have been embedded before with the same model and vector dimension are served from the cache,
+        only the missing texts are sent to the embedding model.
+
+        :param cache: Cache to use, `None` to disable caching.
+        :type cache: Optional[EmbeddingCache]
+        """
+        self.cache = cache
+        if hasattr(self, "_uncached_embedding_fn"):
+            self.embedding_fn = self._with_cache(self._uncached_embedding_fn)
+
+    def _with_cache(self, embedding_fn: Callable[[list[str]], list[str]]) -> Callable[[list[str]], list[str]]:
+        if self.cache is None:
+            return embedding_fn
+        return CachedEmbeddingFunc(
+            embedding_fn,
+            cache=self.cache,
+            model=lambda: f"{self.__class__.__name__}:{self.config.model}",
+            dimension=lambda: getattr(self, "vector_dimension", None),
+        )
 
     def set_vector_dimension(self, vector_dimension: int):
         """
@@ -88,3 +116,28 @@ class BaseEmbedder:
         """
         embeddings = self.embedding_fn([data])
         return embeddings[0]
+
+    async def aembed(self, texts: list[str]) -> Embeddings:
+        """
+        Async version of `embedding_fn`.
+
+        Runs the embedding function in a worker thread by default, embedders with an async client can override it.
+
+        :param texts: texts to embed
+        :type texts: list[str]
+        :return: embeddings
+        :rtype: Embeddings
+        """
+        return await asyncio.to_thread(self.embedding_fn, texts)
+
+    async def ato_embeddings(self, data: str, **_):
+        """
+        Async version of `to_embeddings`.
+
+        :param data: data to convert to embeddings
+        :type data: str
+        :return: embeddings
+        :rtype: list[float]
+        """
+        embeddings = await self.aembed([data])
+        return embeddings[0]
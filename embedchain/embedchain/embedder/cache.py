@@ -0,0 +1,268 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections.abc import Callable
+from typing import Any, Optional
+
+from embedchain.constants import CONFIG_DIR
+
+try:
+    from chromadb.api.types import Embeddable, EmbeddingFunction, Embeddings
+except RuntimeError:
+    from embedchain.utils.misc import use_pysqlite3
+
+    use_pysqlite3()
+    from chromadb.api.types import Embeddable, EmbeddingFunction, Embeddings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_PATH = os.path.join(CONFIG_DIR, "embedding_cache.db")
+
+
+class EmbeddingCache:
+    """
+    Persistent, content-addressed cache of embeddings.
+
+    Vectors are stored in a sqlite database, keyed by (model, vector dimension, sha256 of the text), so one cache
+    file can be shared by all embedders. The least recently used entries are evicted once the cache holds more than
+    `max_entries` vectors or more than `max_size_mb` megabytes of vector data.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = 1_000_000,
+        max_size_mb: Optional[float] = 1024,
+    ):
+        """
+        Initialize the embedding cache.
+
+        :param path: Path to the sqlite file of the cache, defaults to `~/.embedchain/embedding_cache.db`
+        :type path: Optional[str], optional
+        :param max_entries: Maximum number of cached vectors, `None` for no limit, defaults to 1000000
+        :type max_entries: Optional[int], optional
+        :param max_size_mb: Maximum size of the cached vectors in megabytes, `None` for no limit, defaults to 1024
+        :type max_size_mb: Optional[float], optional
+        """
+        self.path = path or EMBEDDING_CACHE_PATH
+        self.max_entries = max_entries
+        self.max_size = int(max_size_mb * 1024 * 1024) if max_size_mb is not None else None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ec_embeddings (
+                    model TEXT NOT NULL,
+                    dimension INTEGER NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (model, dimension, text_hash)
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS ec_embeddings_last_access ON ec_embeddings (last_access)"
+            )
+        self._create_stats()
+
+    def _create_stats(self):
+        """
+        Create the row that counts the entries and bytes of the cache, so that checking the limits doesn't scan the
+        cache. Triggers keep it up to date, for every connection to the cache file.
+        """
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ec_embeddings_stats (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    entries INTEGER NOT NULL,
+                    size INTEGER NOT NULL
+                )
+                """
+            )
+            if self._connection.execute("SELECT 1 FROM ec_embeddings_stats").fetchone() is None:
+                # A cache created before the stats existed is counted once
+                self._connection.execute(
+                    "INSERT INTO ec_embeddings_stats (id, entries, size) "
+                    "SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM ec_embeddings"
+                )
+            triggers = {
+                "insert": "AFTER INSERT ON ec_embeddings BEGIN UPDATE ec_embeddings_stats "
+                "SET entries = entries + 1, size = size + new.size WHERE id = 0; END",
+                "delete": "AFTER DELETE ON ec_embeddings BEGIN UPDATE ec_embeddings_stats "
+                "SET entries = entries - 1, size = size - old.size WHERE id = 0; END",
+                "update": "AFTER UPDATE OF size ON ec_embeddings BEGIN UPDATE ec_embeddings_stats "
+                "SET size = size - old.size + new.size WHERE id = 0; END",
+            }
+            for name, trigger in triggers.items():
+                self._connection.execute(f"CREATE TRIGGER IF NOT EXISTS ec_embeddings_{name} {trigger}")
+        except BaseException:
+            self._connection.rollback()
+            raise
+        self._connection.commit()
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _serialize(vector: Any) -> bytes:
+        return array("f", vector).tobytes()
+
+    @staticmethod
+    def _deserialize(blob: bytes) -> list[float]:
+        vector = array("f")
+        vector.frombytes(blob)
+        return vector.tolist()
+
+    def get_many(self, model: str, dimension: Optional[int], texts: list[str]) -> list[Optional[list[float]]]:
+        """
+        Get the cached vectors of the given texts.
+
+        :return: The vector of every text, `None` for texts that are not cached.
+        :rtype: list[Optional[list[float]]]
+        """
+        hashes = [self.hash_text(text) for text in texts]
+        found = {}
+        with self._lock:
+            # Stay below the default limit of sqlite host parameters
+            for i in range(0, len(hashes), 500):
+                batch = list(set(hashes[i : i + 500]))
+                placeholders = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT text_hash, vector FROM ec_embeddings "
+                    f"WHERE model = ? AND dimension = ? AND text_hash IN ({placeholders})",
+                    [model, dimension or 0, *batch],
+                ).fetchall()
+                found.update(rows)
+            if found:
+                with self._connection:
+                    self._connection.executemany(
+                        "UPDATE ec_embeddings SET last_access = ? WHERE model = ? AND dimension = ? AND text_hash = ?",
+                        [(time.time(), model, dimension or 0, text_hash) for text_hash in found],
+                    )
+            hits = sum(1 for text_hash in hashes if text_hash in found)
+            self.hits += hits
+            self.misses += len(hashes) - hits
+
+        return [self._deserialize(found[text_hash]) if text_hash in found else None for text_hash in hashes]
+
+    def set_many(self, model: str, dimension: Optional[int], texts: list[str], vectors: list[Any]):
+        """
+        Store the vectors of the given texts, and evict the least recently used entries if the cache is full.
+        """
+        now = time.time()
+        rows = []
+        for text, vector in zip(texts, vectors):
+            blob = self._serialize(vector)
+            rows.append((model, dimension or 0, self.hash_text(text), blob, len(blob), now))
+        with self._lock:
+            with self._connection:
+                # An upsert instead of a replace, so that the triggers of the stats see an update, not a new row
+                self._connection.executemany(
+                    "INSERT INTO ec_embeddings (model, dimension, text_hash, vector, size, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (model, dimension, text_hash) DO UPDATE SET "
+                    "vector = excluded.vector, size = excluded.size, last_access = excluded.last_access",
+                    rows,
+                )
+                self._evict()
+
+    def _evict(self):
+        """Delete the least recently used entries until the cache fits in its limits. Expects the lock to be held."""
+        if self.max_entries is None and self.max_size is None:
+            return
+        entries, size = self._connection.execute("SELECT entries, size FROM ec_embeddings_stats").fetchone()
+        excess_entries = entries - self.max_entries if self.max_entries is not None else 0
+        excess_size = size - self.max_size if self.max_size is not None else 0
+        if excess_entries <= 0 and excess_size <= 0:
+            return
+
+        to_delete = []
+        freed_size = 0
+        cursor = self._connection.execute("SELECT rowid, size FROM ec_embeddings ORDER BY last_access ASC")
+        for rowid, row_size in cursor:
+            if len(to_delete) >= excess_entries and freed_size >= excess_size:
+                break
+            to_delete.append((rowid,))
+            freed_size += row_size
+        cursor.close()
+        self._connection.executemany("DELETE FROM ec_embeddings WHERE rowid = ?", to_delete)
+        self.evictions += len(to_delete)
+        logger.debug(f"Evicted {len(to_delete)} embeddings from the embedding cache")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the hit/miss counters of this cache instance and the current size of the cache.
+
+        :return: Cache statistics
+        :rtype: dict[str, Any]
+        """
+        with self._lock:
+            entries, size = self._connection.execute("SELECT entries, size FROM ec_embeddings_stats").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+    def clear(self):
+        """Delete all cached embeddings."""
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM ec_embeddings")
+
+    def close(self):
+        self._connection.close()
+
+
+class CachedEmbeddingFunc(EmbeddingFunction):
+    """Embedding function that looks up vectors in an `EmbeddingCache` and only embeds the missing texts."""
+
+    def __init__(
+        self,
+        embedding_fn: Callable[[list[str]], list[str]],
+        cache: EmbeddingCache,
+        model: Callable[[], str],
+        dimension: Callable[[], Optional[int]],
+    ):
+        self.embedding_fn = embedding_fn
+        self.cache = cache
+        self.model = model
+        self.dimension = dimension
+
+    def __call__(self, input: Embeddable) -> Embeddings:
+        # Only lists of texts are cached, everything else (e.g. images) is passed through.
+        if isinstance(input, str) or not all(isinstance(text, str) for text in input):
+            return self.embedding_fn(input)
+
+        texts = list(input)
+        model, dimension = self.model(), self.dimension()
+        embeddings = self.cache.get_many(model, dimension, texts)
+
+        missing_texts = list(dict.fromkeys(text for text, embedding in zip(texts, embeddings) if embedding is None))
+        if missing_texts:
+            missing_embeddings = self.embedding_fn(missing_texts)
+            self.cache.set_many(model, dimension, missing_texts, missing_embeddings)
+            computed = dict(zip(missing_texts, missing_embeddings))
+            embeddings = [
+                computed[text] if embedding is None else embedding for text, embedding in zip(texts, embeddings)
+            ]
+        return embeddings
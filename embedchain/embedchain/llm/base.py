@@ -1,9 +1,15 @@
+import asyncio
+import contextlib
+import copy
 import logging
 import os
-from collections.abc import Generator
+import time
+from collections.abc import AsyncGenerator, AsyncIterable, Generator, Iterable, Iterator
+from contextvars import ContextVar
 from typing import Any, Optional
 
 from langchain.schema import BaseMessage as LCBaseMessage
+from pydantic import BaseModel
 
 from embedchain.constants import SQLITE_PATH
 from embedchain.config import BaseLlmConfig
@@ -17,10 +23,59 @@ from embedchain.core.db.database import init_db, setup_engine
 from embedchain.helpers.json_serializable import JSONSerializable
 from embedchain.memory.base import ChatHistory
 from embedchain.memory.message import ChatMessage
+from embedchain.utils.context_packer import CONTEXT_SEPARATOR, pack_contexts
+from embedchain.utils.tokens import count_tokens, get_max_input_tokens
 
 logger = logging.getLogger(__name__)
 
 
+class StreamMetrics(BaseModel):
+    """Latency of a streamed answer, measured from the moment the LLM was called."""
+
+    time_to_first_token: Optional[float] = None
+    duration: float = 0.0
+    chunks: int = 0
+    # Chunks per second after the first chunk, most providers stream one token per chunk
+    tokens_per_second: Optional[float] = None
+
+    @classmethod
+    def measure(cls, started_at: float, first_chunk_at: Optional[float], chunks: int) -> "StreamMetrics":
+        finished_at = time.perf_counter()
+        metrics = cls(duration=finished_at - started_at, chunks=chunks)
+        if first_chunk_at is not None:
+            metrics.time_to_first_token = first_chunk_at - started_at
+            if chunks > 1 and finished_at > first_chunk_at:
+                metrics.tokens_per_second = (chunks - 1) / (finished_at - first_chunk_at)
+        return metrics
+
+
+class RequestContext:
+    """
+    State of one `query` or `chat` call: the config, the chat history and the memories it is answered with.
+
+    While a call runs, its context is the current context of the thread or asyncio task, and `BaseLlm.config` and
+    `BaseLlm.history` resolve to the config and history of the context. Concurrent calls on the same LLM instance
+    therefore never see each other's config or history, and the default config of the instance is never mutated.
+    """
+
+    __slots__ = ("llm", "config", "history", "memories")
+
+    def __init__(
+        self,
+        llm: "BaseLlm",
+        config: BaseLlmConfig,
+        history: Optional[list[str]] = None,
+        memories: Optional[list[dict]] = None,
+    ):
+        self.llm = llm
+        self.config = config
+        self.history = history
+        self.memories = memories
+
+
+_current_request: ContextVar[Optional[RequestContext]] = ContextVar("embedchain_llm_request", default=None)
+
+
 class BaseLlm(JSONSerializable):
     def __init__(self, config: Optional[BaseLlmConfig] = None):
         """Initialize a base LLM class
@@ -35,12 +90,40 @@ class BaseLlm(JSONSerializable):
 
         # Initialize the metadata db for the app here since llmfactory needs it for initialization of
         # the llm memory
+        # The user directory is created with the app, LLMs can be used without one
+        os.makedirs(os.path.dirname(SQLITE_PATH), exist_ok=True)
         setup_engine(database_uri=os.environ.get("EMBEDCHAIN_DB_URI", f"sqlite:///{SQLITE_PATH}"))
         init_db()
 
         self.memory = ChatHistory()
         self.is_docs_site_instance = False
         self.history: Any = None
+        # Time to first token and throughput of the last streamed answer
+        self.last_stream_metrics: Optional[StreamMetrics] = None
+
+    @property
+    def config(self) -> BaseLlmConfig:
+        """The config of the current request, or the default config of the LLM outside of a request."""
+        request = _current_request.get()
+        if request is not None and request.llm is self:
+            return request.config
+        return self._config
+
+    @config.setter
+    def config(self, config: BaseLlmConfig):
+        self._config = config
+
+    @property
+    def history(self) -> Any:
+        """The history of the current request, or the default history of the LLM outside of a request."""
+        request = _current_request.get()
+        if request is not None and request.llm is self:
+            return request.history
+        return self._history
+
+    @history.setter
+    def history(self, history: Any):
+        self._history = history
 
     def get_llm_model_answer(self):
         """
@@ -58,10 +141,64 @@ class BaseLlm(JSONSerializable):
         """
         self.history = history
 
+    def load_history(self, app_id: str, session_id: str = "default") -> list[str]:
+        """
+        Load the last rounds of a chat session from memory, without setting it as the history of the LLM.
+
+        :param app_id: Id of the app
+        :type app_id: str
+        :param session_id: Id of the chat session, defaults to "default"
+        :type session_id: str, optional
+        :return: The formatted messages of the session
+        :rtype: list[str]
+        """
+        chat_history = self.memory.get(app_id=app_id, session_id=session_id, num_rounds=10)
+        return [str(history) for history in chat_history]
+
     def update_history(self, app_id: str, session_id: str = "default"):
         """Update class history attribute with history in memory (for chat method)"""
-        chat_history = self.memory.get(app_id=app_id, session_id=session_id, num_rounds=10)
-        self.set_history([str(history) for history in chat_history])
+        self.set_history(self.load_history(app_id=app_id, session_id=session_id))
+
+    def _get_request_config(self, config: Optional[BaseLlmConfig] = None) -> BaseLlmConfig:
+        """Get the config of a request: the config passed to the call or the default config, with the docs site
+        prompt applied if needed. The config that is passed in is never mutated."""
+        config = config or self._config
+        if self.is_docs_site_instance:
+            config = copy.copy(config)
+            config.prompt = DOCS_SITE_PROMPT_TEMPLATE
+            config.number_documents = 5
+        return config
+
+    @contextlib.contextmanager
+    def request_context(
+        self,
+        config: Optional[BaseLlmConfig] = None,
+        history: Optional[list[str]] = None,
+        memories: Optional[list[dict]] = None,
+    ) -> Iterator[RequestContext]:
+        """
+        Make a request context the current context until the block exits.
+
+        :param config: Config of the request, defaults to the config of the LLM
+        :type config: Optional[BaseLlmConfig], optional
+        :param history: Chat history of the request, defaults to the history of the LLM
+        :type history: Optional[list[str]], optional
+        :param memories: Mem0 memories of the request, defaults to None
+        :type memories: Optional[list[dict]], optional
+        :yield: The request context
+        :rtype: Iterator[RequestContext]
+        """
+        request = RequestContext(
+            self,
+            self._get_request_config(config),
+            history=self._history if history is None else history,
+            memories=memories,
+        )
+        token = _current_request.set(request)
+        try:
+            yield request
+        finally:
+            _current_request.reset(token)
 
     def add_history(
         self,
@@ -107,9 +244,15 @@ class BaseLlm(JSONSerializable):
         :return: The prompt
         :rtype: str
         """
-        context_string = " | ".join(contexts)
         web_search_result = kwargs.get("web_search_result", "")
         memories = kwargs.get("memories", None)
+        contexts = pack_contexts(
+            contexts,
+            max_tokens=self._get_context_budget(input_query, web_search_result, memories),
+            model=self.config.model,
+            similarity_threshold=self.config.context_similarity_threshold,
+        )
+        context_string = CONTEXT_SEPARATOR.join(contexts)
         if web_search_result:
             context_string = self._append_search_and_context(context_string, web_search_result)
 
@@ -149,6 +292,26 @@ class BaseLlm(JSONSerializable):
             prompt = self.config.prompt.substitute(context=context_string, query=input_query)
         return prompt
 
+    def _get_context_budget(
+        self, input_query: str, web_search_result: Optional[str] = None, memories: Optional[list[dict]] = None
+    ) -> Optional[int]:
+        """
+        Get the token budget of the retrieved contexts: `max_context_tokens` if it is set, otherwise the context window
+        of the model minus the answer and an estimate of the rest of the prompt. None if the model is unknown.
+        """
+        if self.config.max_context_tokens is not None:
+            return self.config.max_context_tokens
+        max_input_tokens = get_max_input_tokens(self.config.model)
+        if max_input_tokens is None:
+            return None
+        rest = [self.config.prompt.template, input_query, web_search_result or ""]
+        if self.history:
+            rest.append(self._format_history())
+        if memories:
+            rest.append(self._format_memories(memories))
+        used = sum(count_tokens(text, self.config.model) for text in rest)
+        return max(max_input_tokens - (self.config.max_tokens or 0) - used, 0)
+
     @staticmethod
     def _append_search_and_context(context: str, web_search_result: str) -> str:
         """Append web search context to existing context
@@ -174,6 +337,28 @@ class BaseLlm(JSONSerializable):
         """
         return self.get_llm_model_answer(prompt)
 
+    async def aget_llm_model_answer(self, prompt: str):
+        """
+        Async version of `get_llm_model_answer`.
+
+        Runs `get_llm_model_answer` in a worker thread by default, LLMs with an async client can override it.
+
+        :param prompt: The prompt to pass to the LLM.
+        :type prompt: str
+        """
+        return await asyncio.to_thread(self.get_llm_model_answer, prompt)
+
+    async def aget_answer_from_llm(self, prompt: str):
+        """
+        Async version of `get_answer_from_llm`.
+
+        :param prompt: Gets an answer based on the given query and context by passing it to an LLM.
+        :type prompt: str
+        :return: The answer.
+        :rtype: _type_
+        """
+        return await self.aget_llm_model_answer(prompt)
+
     @staticmethod
     def access_search_and_get_results(input_query: str):
         """
@@ -194,24 +379,72 @@ class BaseLlm(JSONSerializable):
         logger.info(f"Access search to get answers for {input_query}")
         return search.run(input_query)
 
-    @staticmethod
-    def _stream_response(answer: Any, token_info: Optional[dict[str, Any]] = None) -> Generator[Any, Any, None]:
+    def _stream_response(
+        self, answer: Iterable[str], token_info: Optional[dict[str, Any]] = None, started_at: Optional[float] = None
+    ) -> Generator[str, Any, None]:
         """Generator to be used as streaming response
 
+        Yields the chunks as soon as the llm produces them, and logs the assembled answer and the stream metrics once
+        the stream is exhausted. The metrics of the last stream are kept in `last_stream_metrics`.
+
         :param answer: Answer chunk from llm
-        :type answer: Any
+        :type answer: Iterable[str]
+        :param token_info: Token usage of the answer, defaults to None
+        :type token_info: Optional[dict[str, Any]], optional
+        :param started_at: `time.perf_counter()` when the llm was called, defaults to the start of the iteration
+        :type started_at: Optional[float], optional
         :yield: Answer chunk from llm
-        :rtype: Generator[Any, Any, None]
+        :rtype: Generator[str, Any, None]
         """
-        streamed_answer = ""
+        started_at = started_at or time.perf_counter()
+        first_chunk_at = None
+        chunks = []
         for chunk in answer:
-            streamed_answer = streamed_answer + chunk
+            if first_chunk_at is None:
+                first_chunk_at = time.perf_counter()
+            chunks.append(chunk)
+            yield chunk
+        self._finish_stream(chunks, token_info, started_at, first_chunk_at)
+
+    async def _astream_response(
+        self,
+        answer: AsyncIterable[str],
+        token_info: Optional[dict[str, Any]] = None,
+        started_at: Optional[float] = None,
+    ) -> AsyncGenerator[str, None]:
+        """Async version of `_stream_response`."""
+        started_at = started_at or time.perf_counter()
+        first_chunk_at = None
+        chunks = []
+        async for chunk in answer:
+            if first_chunk_at is None:
+                first_chunk_at = time.perf_counter()
+            chunks.append(chunk)
             yield chunk
-        logger.info(f"Answer: {streamed_answer}")
+        self._finish_stream(chunks, token_info, started_at, first_chunk_at)
+
+    def _finish_stream(
+        self,
+        chunks: list[str],
+        token_info: Optional[dict[str, Any]],
+        started_at: float,
+        first_chunk_at: Optional[float],
+    ):
+        self.last_stream_metrics = StreamMetrics.measure(started_at, first_chunk_at, len(chunks))
+        logger.info(f"Answer: {''.join(chunks)}")
+        logger.info(f"Stream metrics: {self.last_stream_metrics}")
         if token_info:
             logger.info(f"Token Info: {token_info}")
 
-    def query(self, input_query: str, contexts: list[str], config: BaseLlmConfig = None, dry_run=False, memories=None):
+    def query(
+        self,
+        input_query: str,
+        contexts: list[str],
+        config: BaseLlmConfig = None,
+        dry_run=False,
+        memories=None,
+        history: Optional[list[str]] = None,
+    ):
         """
         Queries the vector database based on the given input query.
         Gets relevant doc based on the query and then passes it to an
@@ -227,49 +460,107 @@ class BaseLlm(JSONSerializable):
         :param dry_run: A dry run does everything except send the resulting prompt to
         the LLM. The purpose is to test the prompt, not the response., defaults to False
         :type dry_run: bool, optional
+        :param memories: Mem0 memories to include in the prompt, defaults to None
+        :type memories: Optional[list[dict]], optional
+        :param history: Chat history to use for this call instead of the history of the LLM, defaults to None
+        :type history: Optional[list[str]], optional
         :return: The answer to the query or the dry run result
         :rtype: str
         """
-        try:
-            if config:
-                # A config instance passed to this method will only be applied temporarily, for one call.
-                # So we will save the previous config and restore it at the end of the execution.
-                # For this we use the serializer.
-                prev_config = self.config.serialize()
-                self.config = config
-
-            if config is not None and config.query_type == "Images":
-                return contexts
-
-            if self.is_docs_site_instance:
-                self.config.prompt = DOCS_SITE_PROMPT_TEMPLATE
-                self.config.number_documents = 5
-            k = {}
-            if self.config.online:
-                k["web_search_result"] = self.access_search_and_get_results(input_query)
-            k["memories"] = memories
-            prompt = self.generate_prompt(input_query, contexts, **k)
-            logger.info(f"Prompt: {prompt}")
+        if config is not None and config.query_type == "Images":
+            return contexts
+
+        # The config and history only apply to this call, concurrent calls don't see them
+        with self.request_context(config, history=history, memories=memories) as request:
+            web_search_result = self.access_search_and_get_results(input_query) if request.config.online else None
+            prompt = self._build_prompt(input_query, contexts, web_search_result=web_search_result)
             if dry_run:
                 return prompt
 
-            if self.config.token_usage:
+            started_at = time.perf_counter()
+            if request.config.token_usage:
                 answer, token_info = self.get_answer_from_llm(prompt)
             else:
-                answer = self.get_answer_from_llm(prompt)
-            if isinstance(answer, str):
-                logger.info(f"Answer: {answer}")
-                if self.config.token_usage:
-                    return answer, token_info
-                return answer
+                answer, token_info = self.get_answer_from_llm(prompt), None
+            return self._format_answer(answer, token_info, started_at)
+
+    async def aquery(
+        self,
+        input_query: str,
+        contexts: list[str],
+        config: BaseLlmConfig = None,
+        dry_run=False,
+        memories=None,
+        history: Optional[list[str]] = None,
+    ):
+        """
+        Async version of `query`.
+
+        The LLM call goes through `aget_llm_model_answer`, which uses the async client of the provider if there is
+        one and runs the blocking call in a worker thread otherwise.
+
+        :param input_query: The query to use.
+        :type input_query: str
+        :param contexts: Embeddings retrieved from the database to be used as context.
+        :type contexts: list[str]
+        :param config: The `BaseLlmConfig` instance to use as configuration options. This is used for one method call.
+        To persistently use a config, declare it during app init., defaults to None
+        :type config: Optional[BaseLlmConfig], optional
+        :param dry_run: A dry run does everything except send the resulting prompt to
+        the LLM. The purpose is to test the prompt, not the response., defaults to False
+        :type dry_run: bool, optional
+        :param memories: Mem0 memories to include in the prompt, defaults to None
+        :type memories: Optional[list[dict]], optional
+        :param history: Chat history to use for this call instead of the history of the LLM, defaults to None
+        :type history: Optional[list[str]], optional
+        :return: The answer to the query or the dry run result
+        :rtype: str
+        """
+        if config is not None and config.query_type == "Images":
+            return contexts
+
+        # The request context is local to the asyncio task and copied into the worker threads it starts
+        with self.request_context(config, history=history, memories=memories) as request:
+            web_search_result = None
+            if request.config.online:
+                web_search_result = await asyncio.to_thread(self.access_search_and_get_results, input_query)
+            prompt = self._build_prompt(input_query, contexts, web_search_result=web_search_result)
+            if dry_run:
+                return prompt
+
+            started_at = time.perf_counter()
+            if request.config.token_usage:
+                answer, token_info = await self.aget_answer_from_llm(prompt)
             else:
-                if self.config.token_usage:
-                    return self._stream_response(answer, token_info)
-                return self._stream_response(answer)
-        finally:
-            if config:
-                # Restore previous config
-                self.config: BaseLlmConfig = BaseLlmConfig.deserialize(prev_config)
+                answer, token_info = await self.aget_answer_from_llm(prompt), None
+            return self._format_answer(answer, token_info, started_at)
+
+    def _build_prompt(self, input_query: str, contexts: list[str], web_search_result: Optional[str] = None) -> str:
+        """Generate the prompt for the current request."""
+        k = {}
+        if web_search_result is not None:
+            k["web_search_result"] = web_search_result
+        request = _current_request.get()
+        k["memories"] = request.memories if request is not None and request.llm is self else None
+        prompt = self.generate_prompt(input_query, contexts, **k)
+        logger.info(f"Prompt: {prompt}")
+        return prompt
+
+    def _format_answer(
+        self, answer: Any, token_info: Optional[dict[str, Any]] = None, started_at: Optional[float] = None
+    ):
+        """
+        Log a complete answer and attach the token info if token usage is enabled, or wrap a streamed answer.
+        Streamed answers are returned without token info, since it is only known once the stream is exhausted.
+        """
+        if isinstance(answer, str):
+            logger.info(f"Answer: {answer}")
+            if self.config.token_usage:
+                return answer, token_info
+            return answer
+        if isinstance(answer, AsyncIterable):
+            return self._astream_response(answer, token_info, started_at)
+        return self._stream_response(answer, token_info, started_at)
 
     def chat(
         self, input_query: str, contexts: list[str], config: BaseLlmConfig = None, dry_run=False, session_id: str = None
@@ -296,19 +587,9 @@ class BaseLlm(JSONSerializable):
         :return: The answer to the query or the dry run result
         :rtype: str
         """
-        try:
-            if config:
-                # A config instance passed to this method will only be applied temporarily, for one call.
-                # So we will save the previous config and restore it at the end of the execution.
-                # For this we use the serializer.
-                prev_config = self.config.serialize()
-                self.config = config
-
-            if self.is_docs_site_instance:
-                self.config.prompt = DOCS_SITE_PROMPT_TEMPLATE
-                self.config.number_documents = 5
+        with self.request_context(config) as request:
             k = {}
-            if self.config.online:
+            if request.config.online:
                 k["web_search_result"] = self.access_search_and_get_results(input_query)
 
             prompt = self.generate_prompt(input_query, contexts, **k)
@@ -324,10 +605,6 @@ class BaseLlm(JSONSerializable):
             else:
                 # this is a streamed response and needs to be handled differently.
                 return self._stream_response(answer, token_info)
-        finally:
-            if config:
-                # Restore previous config
-                self.config: BaseLlmConfig = BaseLlmConfig.deserialize(prev_config)
 
     @staticmethod
     def _get_messages(prompt: str, system_prompt: Optional[str] = None) -> list[LCBaseMessage]:
@@ -5,11 +5,11 @@ from typing import Optional
 
 from langchain_community.llms.huggingface_endpoint import HuggingFaceEndpoint
 from langchain_community.llms.huggingface_hub import HuggingFaceHub
-from langchain_community.llms.huggingface_pipeline import HuggingFacePipeline
 
 from embedchain.config import BaseLlmConfig
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.llm.base import BaseLlm
+from embedchain.llm.pipeline_registry import pipeline_registry
 
 logger = logging.getLogger(__name__)
 
@@ -91,9 +91,5 @@ class HuggingFaceLlm(BaseLlm):
         else:
             raise ValueError("`top_p` must be > 0.0 and < 1.0")
 
-        llm = HuggingFacePipeline.from_model_id(
-            model_id=config.model,
-            task="text-generation",
-            pipeline_kwargs=model_kwargs,
-        )
-        return llm.invoke(prompt)
+        # The pipeline is loaded once per process and shared by all apps that use the same model and kwargs
+        return pipeline_registry.generate(config.model, prompt, task="text-generation", pipeline_kwargs=model_kwargs)
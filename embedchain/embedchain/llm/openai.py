@@ -1,5 +1,6 @@
 import json
 import os
+from collections.abc import AsyncIterator, Iterator
 from typing import Any, Callable, Dict, Optional, Type, Union
 
 from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
@@ -24,29 +25,78 @@ class OpenAILlm(BaseLlm):
         super().__init__(config=config)
 
     def get_llm_model_answer(self, prompt) -> tuple[str, Optional[dict[str, Any]]]:
+        if self.config.stream and not self.tools:
+            # Token usage is not reported for streamed answers
+            stream = self._stream_answer(prompt, self.config)
+            return (stream, None) if self.config.token_usage else stream
+
         if self.config.token_usage:
             response, token_info = self._get_answer(prompt, self.config)
-            model_name = "openai/" + self.config.model
-            if model_name not in self.config.model_pricing_map:
-                raise ValueError(
-                    f"Model {model_name} not found in `model_prices_and_context_window.json`. \
-                    You can disable token usage by setting `token_usage` to False."
-                )
-            total_cost = (
-                self.config.model_pricing_map[model_name]["input_cost_per_token"] * token_info["prompt_tokens"]
-            ) + self.config.model_pricing_map[model_name]["output_cost_per_token"] * token_info["completion_tokens"]
-            response_token_info = {
-                "prompt_tokens": token_info["prompt_tokens"],
-                "completion_tokens": token_info["completion_tokens"],
-                "total_tokens": token_info["prompt_tokens"] + token_info["completion_tokens"],
-                "total_cost": round(total_cost, 10),
-                "cost_currency": "USD",
-            }
-            return response, response_token_info
+            return response, self._get_token_usage(token_info)
 
         return self._get_answer(prompt, self.config)
 
+    async def aget_llm_model_answer(self, prompt) -> tuple[str, Optional[dict[str, Any]]]:
+        if self.config.stream and not self.tools:
+            stream = self._astream_answer(prompt, self.config)
+            return (stream, None) if self.config.token_usage else stream
+
+        if self.config.token_usage:
+            response, token_info = await self._aget_answer(prompt, self.config)
+            return response, self._get_token_usage(token_info)
+
+        return await self._aget_answer(prompt, self.config)
+
+    def _get_token_usage(self, token_info: dict[str, Any]) -> dict[str, Any]:
+        model_name = "openai/" + self.config.model
+        if model_name not in self.config.model_pricing_map:
+            raise ValueError(
+                f"Model {model_name} not found in `model_prices_and_context_window.json`. \
+                You can disable token usage by setting `token_usage` to False."
+            )
+        total_cost = (
+            self.config.model_pricing_map[model_name]["input_cost_per_token"] * token_info["prompt_tokens"]
+        ) + self.config.model_pricing_map[model_name]["output_cost_per_token"] * token_info["completion_tokens"]
+        return {
+            "prompt_tokens": token_info["prompt_tokens"],
+            "completion_tokens": token_info["completion_tokens"],
+            "total_tokens": token_info["prompt_tokens"] + token_info["completion_tokens"],
+            "total_cost": round(total_cost, 10),
+            "cost_currency": "USD",
+        }
+
     def _get_answer(self, prompt: str, config: BaseLlmConfig) -> str:
+        chat, messages = self._get_chat(prompt, config)
+        if self.tools:
+            return self._query_function_call(chat, self.tools, messages)
+
+        chat_response = chat.invoke(messages)
+        if self.config.token_usage:
+            return chat_response.content, chat_response.response_metadata["token_usage"]
+        return chat_response.content
+
+    async def _aget_answer(self, prompt: str, config: BaseLlmConfig) -> str:
+        chat, messages = self._get_chat(prompt, config)
+        if self.tools:
+            return await self._aquery_function_call(chat, self.tools, messages)
+
+        chat_response = await chat.ainvoke(messages)
+        if self.config.token_usage:
+            return chat_response.content, chat_response.response_metadata["token_usage"]
+        return chat_response.content
+
+    def _stream_answer(self, prompt: str, config: BaseLlmConfig) -> Iterator[str]:
+        chat, messages = self._get_chat(prompt, config)
+        return (chunk.content for chunk in chat.stream(messages) if chunk.content)
+
+    async def _astream_answer(self, prompt: str, config: BaseLlmConfig) -> AsyncIterator[str]:
+        chat, messages = self._get_chat(prompt, config)
+        async for chunk in chat.astream(messages):
+            if chunk.content:
+                yield chunk.content
+
+    @staticmethod
+    def _get_chat(prompt: str, config: BaseLlmConfig) -> tuple[ChatOpenAI, list[BaseMessage]]:
         messages = []
         if config.system_prompt:
             messages.append(SystemMessage(content=config.system_prompt))
@@ -82,13 +132,7 @@ class OpenAILlm(BaseLlm):
                 http_client=config.http_client,
                 http_async_client=config.http_async_client,
             )
-        if self.tools:
-            return self._query_function_call(chat, self.tools, messages)
-
-        chat_response = chat.invoke(messages)
-        if self.config.token_usage:
-            return chat_response.content, chat_response.response_metadata["token_usage"]
-        return chat_response.content
+        return chat, messages
 
     def _query_function_call(
         self,
@@ -105,3 +149,19 @@ class OpenAILlm(BaseLlm):
             return json.dumps(chat.invoke(messages)[0])
         except IndexError:
             return "Input could not be mapped to the function!"
+
+    async def _aquery_function_call(
+        self,
+        chat: ChatOpenAI,
+        tools: Optional[Union[Dict[str, Any], Type[BaseModel], Callable[..., Any], BaseTool]],
+        messages: list[BaseMessage],
+    ) -> str:
+        from langchain.output_parsers.openai_tools import JsonOutputToolsParser
+        from langchain_core.utils.function_calling import convert_to_openai_tool
+
+        openai_tools = [convert_to_openai_tool(tools)]
+        chat = chat.bind(tools=openai_tools).pipe(JsonOutputToolsParser())
+        try:
+            return json.dumps((await chat.ainvoke(messages))[0])
+        except IndexError:
+            return "Input could not be mapped to the function!"
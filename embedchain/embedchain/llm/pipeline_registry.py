@@ -0,0 +1,246 @@
+import gc
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Optional
+
+from langchain_community.llms.huggingface_pipeline import HuggingFacePipeline
+
+logger = logging.getLogger(__name__)
+
+
+class LoadedPipeline:
+    """
+    A local pipeline that stays loaded until it is unloaded from the registry.
+
+    Prompts are queued and a worker thread sends them to the pipeline in micro-batches: it takes all prompts that
+    arrive within `max_wait` seconds of the first one, up to `max_batch_size`, and generates them in one call.
+    """
+
+    def __init__(
+        self,
+        model_id: str,
+        task: str,
+        pipeline_kwargs: dict[str, Any],
+        llm: HuggingFacePipeline,
+        max_batch_size: int,
+        max_wait: float,
+    ):
+        self.model_id = model_id
+        self.task = task
+        self.pipeline_kwargs = pipeline_kwargs
+        self.llm = llm
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.memory_bytes = self._get_memory_bytes(llm)
+        self.loaded_at = time.time()
+        self.requests = 0
+        self.batches = 0
+
+        self._queue: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name=f"pipeline-{model_id}", daemon=True)
+        self._worker.start()
+
+    @staticmethod
+    def _get_memory_bytes(llm: HuggingFacePipeline) -> Optional[int]:
+        """Get the size of the model weights, `None` if the pipeline doesn't expose a torch model."""
+        model = getattr(getattr(llm, "pipeline", None), "model", None)
+        if model is None:
+            return None
+        if hasattr(model, "get_memory_footprint"):
+            return int(model.get_memory_footprint())
+        if hasattr(model, "parameters"):
+            return sum(parameter.numel() * parameter.element_size() for parameter in model.parameters())
+        return None
+
+    def submit(self, prompt: str) -> Future:
+        """
+        Queue a prompt for generation.
+
+        :return: Future of the generated text
+        :rtype: Future
+        """
+        future = Future()
+        self._queue.put((prompt, future))
+        return future
+
+    def generate(self, prompt: str) -> str:
+        """Generate the text of a prompt, waiting for the batch it ends up in."""
+        return self.submit(prompt).result()
+
+    def stop(self):
+        """Stop the worker once the queued prompts are generated."""
+        self._queue.put(None)
+        self._worker.join()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._generate_batch(batch)
+
+    def _generate_batch(self, batch: list[tuple[str, Future]]):
+        batch = [(prompt, future) for prompt, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        self.requests += len(batch)
+        self.batches += 1
+        try:
+            result = self.llm.generate([prompt for prompt, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), generations in zip(batch, result.generations):
+            future.set_result(generations[0].text)
+
+
+class PipelineRegistry:
+    """
+    Process-wide registry of local HuggingFace pipelines.
+
+    Every pipeline is loaded once per (model id, task, pipeline kwargs) and kept in memory until it is unloaded
+    explicitly, so prompts don't reload the model weights. `stats` reports the loaded pipelines and the memory their
+    weights take.
+    """
+
+    def __init__(self, max_batch_size: int = 8, max_wait: float = 0.01):
+        """
+        Initialize the registry.
+
+        :param max_batch_size: Maximum number of prompts generated in one call, defaults to 8
+        :type max_batch_size: int, optional
+        :param max_wait: Seconds a prompt waits for other prompts to batch with, defaults to 0.01
+        :type max_wait: float, optional
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._pipelines: dict[str, LoadedPipeline] = {}
+        # One lock per pipeline that is being loaded, so that concurrent requests load it only once
+        self._loading: dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def _key(model_id: str, task: str, pipeline_kwargs: dict[str, Any]) -> str:
+        return json.dumps([model_id, task, pipeline_kwargs], sort_keys=True, default=str)
+
+    def get(
+        self, model_id: str, task: str = "text-generation", pipeline_kwargs: Optional[dict[str, Any]] = None
+    ) -> LoadedPipeline:
+        """
+        Get a loaded pipeline, loading it if it isn't loaded yet.
+
+        :param model_id: Id of the model on the HuggingFace hub, or path of a local model
+        :type model_id: str
+        :param task: Task of the pipeline, defaults to "text-generation"
+        :type task: str, optional
+        :param pipeline_kwargs: Generation kwargs of the pipeline, defaults to None
+        :type pipeline_kwargs: Optional[dict[str, Any]], optional
+        :return: The loaded pipeline
+        :rtype: LoadedPipeline
+        """
+        pipeline_kwargs = pipeline_kwargs or {}
+        key = self._key(model_id, task, pipeline_kwargs)
+        with self._lock:
+            pipeline = self._pipelines.get(key)
+            if pipeline is not None:
+                return pipeline
+            loading = self._loading.setdefault(key, threading.Lock())
+
+        with loading:
+            with self._lock:
+                pipeline = self._pipelines.get(key)
+                if pipeline is not None:
+                    return pipeline
+
+            logger.info(f"Loading pipeline of {model_id}")
+            llm = HuggingFacePipeline.from_model_id(
+                model_id=model_id,
+                task=task,
+                pipeline_kwargs=pipeline_kwargs,
+                batch_size=self.max_batch_size,
+            )
+            pipeline = LoadedPipeline(model_id, task, pipeline_kwargs, llm, self.max_batch_size, self.max_wait)
+            with self._lock:
+                self._pipelines[key] = pipeline
+                self._loading.pop(key, None)
+        return pipeline
+
+    def generate(
+        self,
+        model_id: str,
+        prompt: str,
+        task: str = "text-generation",
+        pipeline_kwargs: Optional[dict[str, Any]] = None,
+    ) -> str:
+        """Generate the text of a prompt with a loaded pipeline, see `get`."""
+        return self.get(model_id, task=task, pipeline_kwargs=pipeline_kwargs).generate(prompt)
+
+    def unload(self, model_id: Optional[str] = None):
+        """
+        Unload the pipelines of a model, or all pipelines, and free their memory.
+
+        :param model_id: Model to unload, all models if None, defaults to None
+        :type model_id: Optional[str], optional
+        """
+        with self._lock:
+            keys = [key for key, pipeline in self._pipelines.items() if model_id in (None, pipeline.model_id)]
+            pipelines = [self._pipelines.pop(key) for key in keys]
+        for pipeline in pipelines:
+            pipeline.stop()
+            logger.info(f"Unloaded pipeline of {pipeline.model_id}")
+        del pipelines
+        gc.collect()
+        # Only touch torch if a model was loaded with it
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the loaded pipelines and the memory of their weights.
+
+        :return: Registry statistics
+        :rtype: dict[str, Any]
+        """
+        with self._lock:
+            pipelines = list(self._pipelines.values())
+        return {
+            "pipelines": [
+                {
+                    "model_id": pipeline.model_id,
+                    "task": pipeline.task,
+                    "pipeline_kwargs": pipeline.pipeline_kwargs,
+                    "memory_bytes": pipeline.memory_bytes,
+                    "loaded_at": pipeline.loaded_at,
+                    "requests": pipeline.requests,
+                    "batches": pipeline.batches,
+                }
+                for pipeline in pipelines
+            ],
+            "memory_bytes": sum(pipeline.memory_bytes or 0 for pipeline in pipelines),
+        }
+
+
+# Shared by all `HuggingFaceLlm` instances of the process
+pipeline_registry = PipelineRegistry()
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from embedchain.helpers.json_serializable import JSONSerializable
 
 
@@ -10,3 +12,11 @@ class BaseLoader(JSONSerializable):
         Implemented by child classes
         """
         pass
+
+    def get_unmodified_doc_id(self, url) -> Optional[str]:
+        """
+        Get the doc_id of the last load of a source if the source didn't change since, without loading it.
+
+        Implemented by child classes that can tell cheaply, e.g. with conditional HTTP requests.
+        """
+        return None
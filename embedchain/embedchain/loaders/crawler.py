@@ -0,0 +1,361 @@
+import asyncio
+import concurrent.futures
+import email.utils
+import logging
+import queue
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import Any, NamedTuple, Optional
+from urllib.parse import urldefrag, urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from embedchain.loaders.http_cache import HttpCache, HttpResponse, get_http_cache
+
+logger = logging.getLogger(__name__)
+
+# Responses that are worth retrying, after a backoff
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_BACKOFF = 60.0
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36"  # noqa:E501
+
+_DONE = object()
+
+
+class CrawlResult(NamedTuple):
+    """A fetched url, at `depth` links from the start urls. `response` is None if it couldn't be fetched."""
+
+    url: str
+    depth: int
+    response: Optional[HttpResponse]
+    error: Optional[str] = None
+
+
+def normalize_url(url: str, base_url: Optional[str] = None) -> str:
+    """Resolve a url against the page it was linked from, without its fragment and with a path."""
+    url = urldefrag(urljoin(base_url, url) if base_url else url)[0]
+    parsed_url = urlparse(url)
+    if not parsed_url.path:
+        url = parsed_url._replace(path="/").geturl()
+    return url
+
+
+class _Host:
+    """State of the requests to a host during a crawl."""
+
+    def __init__(self, max_concurrency: int, delay: float):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.lock = asyncio.Lock()
+        self.delay = delay
+        self.next_request_at = 0.0
+        self.robots: Optional[RobotFileParser] = None
+        self.robots_fetched = False
+
+
+class Crawler:
+    """
+    Crawler of web pages with bounded concurrency.
+
+    Pages are fetched by an asyncio pool of workers through a pooled `requests` session and the HTTP cache of the
+    web loaders, so that unchanged pages are revalidated with conditional requests. To be polite to the servers, at
+    most `max_concurrency_per_host` requests are sent to a host at a time, requests to a host are at least `delay`
+    seconds (or the `Crawl-delay` of its robots.txt) apart, urls disallowed by robots.txt are skipped, and failed
+    requests are retried with exponential backoff, or after the `Retry-After` of the response. If a host answers 429
+    or 503, all requests to it wait for the backoff.
+
+    `crawl` follows links breadth first, each url is fetched once, and the results are streamed as they are fetched.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        max_concurrency_per_host: int = 4,
+        delay: float = 0.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: float = 30,
+        respect_robots_txt: bool = True,
+        headers: Optional[dict[str, str]] = None,
+        http_cache: Optional[HttpCache] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        :param max_concurrency: Maximum number of requests in flight, defaults to 16
+        :type max_concurrency: int, optional
+        :param max_concurrency_per_host: Maximum number of requests in flight to a host, defaults to 4
+        :type max_concurrency_per_host: int, optional
+        :param delay: Minimum number of seconds between the requests to a host, defaults to 0.0
+        :type delay: float, optional
+        :param max_retries: Number of retries of a failed request, defaults to 3
+        :type max_retries: int, optional
+        :param backoff_factor: The n-th retry waits `backoff_factor * 2 ** n` seconds, with jitter, defaults to 0.5
+        :type backoff_factor: float, optional
+        :param timeout: Timeout of a request in seconds, defaults to 30
+        :type timeout: float, optional
+        :param respect_robots_txt: Skip the urls disallowed by the robots.txt of their host, defaults to True
+        :type respect_robots_txt: bool, optional
+        :param headers: Headers of the requests, defaults to a browser user agent
+        :type headers: Optional[dict[str, str]], optional
+        :param http_cache: Cache of the responses, defaults to the cache shared by the web loaders
+        :type http_cache: Optional[HttpCache], optional
+        :param session: Session to send the requests with, defaults to a new session with a connection pool per host
+        :type session: Optional[requests.Session], optional
+        """
+        if max_concurrency < 1 or max_concurrency_per_host < 1:
+            raise ValueError("max_concurrency and max_concurrency_per_host should be positive integers")
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.delay = delay
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.respect_robots_txt = respect_robots_txt
+        self.headers = headers or {"User-Agent": USER_AGENT}
+        self.http_cache = http_cache
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=max_concurrency_per_host)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
+    async def crawl(
+        self,
+        urls: Iterable[str],
+        get_links: Optional[Callable[[str, HttpResponse], Iterable[str]]] = None,
+        max_depth: Optional[int] = None,
+        max_pages: Optional[int] = None,
+    ) -> AsyncIterator[CrawlResult]:
+        """
+        Fetch urls, and the urls they link to, breadth first.
+
+        :param urls: Urls to start from
+        :type urls: Iterable[str]
+        :param get_links: Function that gets the urls to crawl from a fetched page, only `urls` are fetched if not set
+        :type get_links: Optional[Callable[[str, HttpResponse], Iterable[str]]], optional
+        :param max_depth: Maximum number of links from a start url to a crawled url, unlimited if not set
+        :type max_depth: Optional[int], optional
+        :param max_pages: Maximum number of urls to fetch, unlimited if not set
+        :type max_pages: Optional[int], optional
+        :yield: The fetched urls, in the order they are fetched in
+        :rtype: AsyncIterator[CrawlResult]
+        """
+        loop = asyncio.get_running_loop()
+        hosts: dict[str, _Host] = {}
+        frontier: asyncio.Queue = asyncio.Queue()
+        # A slow consumer holds up the workers instead of the results piling up
+        results: asyncio.Queue = asyncio.Queue(maxsize=self.max_concurrency)
+        seen = set()
+
+        def enqueue(url: str, depth: int):
+            key = normalize_url(url)
+            if key in seen or (max_pages is not None and len(seen) >= max_pages):
+                return
+            seen.add(key)
+            frontier.put_nowait((url, depth))
+
+        for url in urls:
+            enqueue(url, 0)
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="embedchain-crawler"
+        )
+
+        async def worker():
+            while True:
+                url, depth = await frontier.get()
+                try:
+                    try:
+                        response, error = await self._fetch(url, hosts, executor)
+                    except Exception as e:
+                        logger.warning(f"Failed to fetch {url}: {e}")
+                        response, error = None, str(e)
+                    if (
+                        response is not None
+                        and response.status_code == 200
+                        and get_links is not None
+                        and (max_depth is None or depth < max_depth)
+                    ):
+                        try:
+                            links = await loop.run_in_executor(executor, lambda: list(get_links(url, response)))
+                        except Exception as e:
+                            logger.warning(f"Failed to get the links of {url}: {e}")
+                            links = []
+                        for link in links:
+                            enqueue(normalize_url(link, url), depth + 1)
+                    await results.put(CrawlResult(url, depth, response, error))
+                finally:
+                    frontier.task_done()
+
+        async def wait_for_workers():
+            await frontier.join()
+            await results.put(_DONE)
+
+        tasks = [asyncio.ensure_future(worker()) for _ in range(self.max_concurrency)]
+        tasks.append(asyncio.ensure_future(wait_for_workers()))
+        try:
+            while True:
+                result = await results.get()
+                if result is _DONE:
+                    break
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            executor.shutdown(wait=False)
+
+    def stream(self, urls: Iterable[str], **kwargs: Any) -> Iterator[CrawlResult]:
+        """
+        Run `crawl` in a background event loop, and get its results as they are fetched.
+
+        Stopping the iteration stops the crawl. Takes the arguments of `crawl`.
+
+        :yield: The fetched urls, in the order they are fetched in
+        :rtype: Iterator[CrawlResult]
+        """
+        items: queue.Queue = queue.Queue(maxsize=self.max_concurrency)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    items.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        async def forward():
+            crawl = self.crawl(urls, **kwargs)
+            try:
+                async for result in crawl:
+                    if not await asyncio.get_running_loop().run_in_executor(None, put, result):
+                        break
+            finally:
+                await crawl.aclose()
+
+        def run():
+            try:
+                asyncio.run(forward())
+            except BaseException as e:
+                put(e)
+            else:
+                put(_DONE)
+
+        thread = threading.Thread(target=run, name="embedchain-crawler-loop", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = items.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            thread.join()
+
+    async def _fetch(
+        self, url: str, hosts: dict[str, _Host], executor: concurrent.futures.Executor
+    ) -> tuple[Optional[HttpResponse], Optional[str]]:
+        """Fetch a url, with retries. Returns the last response, or the error if there was none."""
+        loop = asyncio.get_running_loop()
+        netloc = urlparse(url).netloc
+        host = hosts.get(netloc)
+        if host is None:
+            host = hosts[netloc] = _Host(self.max_concurrency_per_host, self.delay)
+
+        if self.respect_robots_txt:
+            async with host.lock:
+                if not host.robots_fetched:
+                    host.robots = await loop.run_in_executor(executor, self._get_robots, url)
+                    host.robots_fetched = True
+                    crawl_delay = host.robots.crawl_delay(self.headers.get("User-Agent", "*")) if host.robots else None
+                    if crawl_delay:
+                        host.delay = max(host.delay, float(crawl_delay))
+            if host.robots is not None and not host.robots.can_fetch(self.headers.get("User-Agent", "*"), url):
+                logger.info(f"Skipping {url}, it is disallowed by robots.txt")
+                return None, "disallowed by robots.txt"
+
+        http_cache = self.http_cache or get_http_cache()
+        response = None
+        error = None
+        for attempt in range(self.max_retries + 1):
+            async with host.semaphore:
+                await self._wait_for_turn(host)
+                try:
+                    response = await loop.run_in_executor(
+                        executor,
+                        lambda: http_cache.get(url, session=self.session, headers=self.headers, timeout=self.timeout),
+                    )
+                    error = None
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    response = None
+                    error = str(e)
+                except requests.RequestException as e:
+                    return None, str(e)
+
+            if response is not None and response.status_code not in RETRY_STATUS_CODES:
+                return response, None
+            if attempt == self.max_retries:
+                break
+
+            backoff = self.backoff_factor * 2**attempt
+            backoff = min(backoff + random.uniform(0, backoff), MAX_BACKOFF)
+            if response is not None:
+                retry_after = self._get_retry_after(response)
+                if retry_after is not None:
+                    backoff = retry_after
+                if response.status_code in (429, 503):
+                    # The server is overloaded or rate limits us, slow down all requests to it
+                    host.next_request_at = max(host.next_request_at, loop.time() + backoff)
+            logger.debug(f"Retrying {url} in {backoff:.1f} seconds ({response.status_code if response else error})")
+            await asyncio.sleep(backoff)
+
+        logger.warning(f"Failed to fetch {url}: {response.status_code if response is not None else error}")
+        return response, error
+
+    @staticmethod
+    async def _wait_for_turn(host: _Host):
+        async with host.lock:
+            loop = asyncio.get_running_loop()
+            wait = host.next_request_at - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            host.next_request_at = loop.time() + host.delay
+
+    def _get_robots(self, url: str) -> Optional[RobotFileParser]:
+        """Get the robots.txt of the host of a url, None if it can't be fetched, which allows all urls."""
+        parsed_url = urlparse(url)
+        robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
+        try:
+            response = self.session.get(robots_url, headers=self.headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            logger.debug(f"Failed to fetch {robots_url}: {e}")
+            return None
+        if response.status_code != 200 or not isinstance(response.text, str):
+            return None
+        robots = RobotFileParser(robots_url)
+        robots.parse(response.text.splitlines())
+        return robots
+
+    @staticmethod
+    def _get_retry_after(response: HttpResponse) -> Optional[float]:
+        """Get the seconds to wait from the `Retry-After` header of a response, in seconds or as a date."""
+        retry_after = response.headers.get("Retry-After")
+        if not isinstance(retry_after, str):
+            return None
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            try:
+                seconds = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(seconds, 0.0), MAX_BACKOFF)
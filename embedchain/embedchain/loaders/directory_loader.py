@@ -1,9 +1,13 @@
+import concurrent.futures
 import hashlib
+import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Optional
 
 from embedchain.config import AddConfig
+from embedchain.constants import CONFIG_DIR
 from embedchain.data_formatter.data_formatter import DataFormatter
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.loaders.base_loader import BaseLoader
@@ -12,16 +16,34 @@ from embedchain.utils.misc import detect_datatype
 
 logger = logging.getLogger(__name__)
 
+MANIFEST_DIR = os.path.join(CONFIG_DIR, "manifests")
+
 
 @register_deserializable
 class DirectoryLoader(BaseLoader):
-    """Load data from a directory."""
+    """
+    Load data from a directory.
+
+    Files are loaded by a pool of workers. If `incremental` is enabled, the size, modification time and content hash
+    of every file are kept in a manifest, and loading the directory again only loads the new and changed files. The
+    `files` of the result map the path of every file of the directory to its content hash, so that the chunks of
+    removed files can be deleted and the unchanged files can be checked against what's stored.
+    """
 
     def __init__(self, config: Optional[dict[str, Any]] = None):
+        """
+        :param config: `recursive` (default True) and `extensions` select the files, `max_workers` is the number of
+        files loaded in parallel, `incremental` (default True) enables the manifest, which is stored in
+        `manifest_dir` (default `~/.embedchain/manifests`)
+        :type config: Optional[dict[str, Any]], optional
+        """
         super().__init__()
         config = config or {}
         self.recursive = config.get("recursive", True)
         self.extensions = config.get("extensions", None)
+        self.max_workers = config.get("max_workers", None)
+        self.incremental = config.get("incremental", True)
+        self.manifest_dir = config.get("manifest_dir", MANIFEST_DIR)
         self.errors = []
 
     def load_data(self, path: str):
@@ -30,26 +52,101 @@ class DirectoryLoader(BaseLoader):
             raise ValueError(f"Invalid path: {path}")
 
         logger.info(f"Loading data from directory: {path}")
-        data_list = self._process_directory(directory_path)
-        doc_id = hashlib.sha256((str(data_list) + str(directory_path)).encode()).hexdigest()
+        self.errors = []
+        manifest = self._read_manifest(directory_path) if self.incremental else {}
+        data_list, files, new_manifest = self._process_directory(directory_path, manifest)
+        if self.incremental:
+            self._write_manifest(directory_path, new_manifest)
+
+        # The doc_id only changes if a file is added, changed or removed
+        doc_id = hashlib.sha256((json.dumps(files, sort_keys=True) + str(directory_path)).encode()).hexdigest()
 
         for error in self.errors:
             logger.warning(error)
 
-        return {"doc_id": doc_id, "data": data_list}
+        return {"doc_id": doc_id, "data": data_list, "files": files}
 
-    def _process_directory(self, directory_path: Path):
-        data_list = []
+    def _list_files(self, directory_path: Path) -> list[Path]:
+        file_paths = []
         for file_path in directory_path.rglob("*") if self.recursive else directory_path.glob("*"):
             # don't include dotfiles
             if file_path.name.startswith("."):
                 continue
             if file_path.is_file() and (not self.extensions or any(file_path.suffix == ext for ext in self.extensions)):
-                loader = self._predict_loader(file_path)
-                data_list.extend(loader.load_data(str(file_path))["data"])
+                file_paths.append(file_path)
             elif file_path.is_dir():
                 logger.info(f"Loading data from directory: {file_path}")
-        return data_list
+        return sorted(file_paths)
+
+    def _process_directory(
+        self, directory_path: Path, manifest: dict[str, dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], dict[str, str], dict[str, dict[str, Any]]]:
+        """
+        Load the files of a directory that are not in the manifest, or changed since.
+
+        :return: The data of the loaded files, the content hash of every file and the new manifest
+        :rtype: tuple[list[dict[str, Any]], dict[str, str], dict[str, dict[str, Any]]]
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda file_path: self._process_file(file_path, manifest), self._list_files(directory_path)
+                )
+            )
+
+        data_list = []
+        files = {}
+        new_manifest = {}
+        loaded = 0
+        for url, entry, data in results:
+            if entry is None:
+                # Files that failed to load are tried again next time
+                continue
+            files[url] = entry["hash"]
+            new_manifest[url] = entry
+            if data is not None:
+                data_list.extend(data)
+                loaded += 1
+        logger.info(f"Loaded {loaded} new or changed files, {len(files) - loaded} files are unchanged")
+        return data_list, files, new_manifest
+
+    def _process_file(
+        self, file_path: Path, manifest: dict[str, dict[str, Any]]
+    ) -> tuple[str, Optional[dict[str, Any]], Optional[list[dict[str, Any]]]]:
+        """
+        Load a file, unless its size and modification time, or its content, are the same as in the manifest.
+
+        :return: The path of the file, its manifest entry and its data, None if it is unchanged
+        :rtype: tuple[str, Optional[dict[str, Any]], Optional[list[dict[str, Any]]]]
+        """
+        url = str(file_path)
+        try:
+            stat = file_path.stat()
+            previous = manifest.get(url)
+            if previous and previous["size"] == stat.st_size and previous["mtime_ns"] == stat.st_mtime_ns:
+                return url, previous, None
+
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": self._hash_file(file_path)}
+            if previous and previous["hash"] == entry["hash"]:
+                return url, entry, None
+
+            data = self._predict_loader(file_path).load_data(url)["data"]
+        except Exception as e:
+            self.errors.append(f"Error processing {file_path}: {e}")
+            return url, None, None
+
+        for record in data:
+            record["meta_data"].setdefault("url", url)
+            record["meta_data"]["file_hash"] = entry["hash"]
+        return url, entry, data
+
+    @staticmethod
+    def _hash_file(file_path: Path) -> str:
+        sha256 = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                sha256.update(block)
+        return sha256.hexdigest()
 
     def _predict_loader(self, file_path: Path) -> BaseLoader:
         try:
@@ -61,3 +158,44 @@ class DirectoryLoader(BaseLoader):
         except Exception as e:
             self.errors.append(f"Error processing {file_path}: {e}")
             return TextFileLoader()
+
+    def _manifest_path(self, directory_path: Path) -> str:
+        key = hashlib.sha256(str(directory_path.resolve()).encode()).hexdigest()
+        return os.path.join(self.manifest_dir, f"{key}.json")
+
+    def _read_manifest(self, directory_path: Path) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self._manifest_path(directory_path)) as f:
+                return json.load(f)["files"]
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring the unreadable manifest of {directory_path}: {e}")
+            return {}
+
+    def _write_manifest(self, directory_path: Path, files: dict[str, dict[str, Any]]):
+        manifest_path = self._manifest_path(directory_path)
+        os.makedirs(self.manifest_dir, exist_ok=True)
+        # Write to a temporary file first, so that an interrupted write doesn't leave a broken manifest
+        temporary_path = f"{manifest_path}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump({"directory": str(directory_path.resolve()), "files": files}, f)
+        os.replace(temporary_path, manifest_path)
+
+    def invalidate(self, path: str, urls: Optional[list[str]] = None):
+        """
+        Remove files from the manifest of a directory, so that they are loaded again next time.
+
+        :param path: Path of the directory
+        :type path: str
+        :param urls: Paths of the files, all files of the directory if not set
+        :type urls: Optional[list[str]], optional
+        """
+        directory_path = Path(path)
+        if urls is None:
+            manifest = {}
+        else:
+            manifest = self._read_manifest(directory_path)
+            for url in urls:
+                manifest.pop(url, None)
+        self._write_manifest(directory_path, manifest)
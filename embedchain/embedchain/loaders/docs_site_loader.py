@@ -1,11 +1,10 @@
 import hashlib
 import logging
-from urllib.parse import urljoin, urlparse
-
-import requests
+from typing import Any, Optional
+from urllib.parse import urlparse
 
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:
     raise ImportError(
         "DocsSite requires extra dependencies. Install with `pip install beautifulsoup4==4.12.3`"
@@ -14,53 +13,67 @@ except ImportError:
 
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.loaders.base_loader import BaseLoader
+from embedchain.loaders.crawler import Crawler, CrawlResult, normalize_url
+from embedchain.loaders.http_cache import HttpResponse
 
 logger = logging.getLogger(__name__)
 
 
 @register_deserializable
 class DocsSiteLoader(BaseLoader):
-    def __init__(self):
+    """
+    Load the pages of a documentation site.
+
+    The site is crawled breadth first from the given url, following the links to pages of the same host whose path
+    starts with the path of the url. The url itself is only crawled for its links. Pages are loaded as they are
+    fetched, see `Crawler` for the limits of the requests to the site.
+    """
+
+    def __init__(self, config: Optional[dict[str, Any]] = None):
+        """
+        :param config: `max_depth` and `max_pages` limit the crawl, `max_concurrency`, `max_concurrency_per_host`,
+        `delay`, `max_retries`, `timeout` and `respect_robots_txt` are passed to the `Crawler`
+        :type config: Optional[dict[str, Any]], optional
+        """
+        super().__init__()
+        config = dict(config or {})
+        self.max_depth = config.pop("max_depth", None)
+        self.max_pages = config.pop("max_pages", None)
+        self.crawler_config = config
         self.visited_links = set()
 
-    def _get_child_links_recursive(self, url):
-        if url in self.visited_links:
-            return
-
-        parsed_url = urlparse(url)
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-        current_path = parsed_url.path
-
-        response = requests.get(url)
-        if response.status_code != 200:
-            logger.info(f"Failed to fetch the website: {response.status_code}")
-            return
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        all_links = (link.get("href") for link in soup.find_all("a", href=True))
-
-        child_links = (link for link in all_links if link.startswith(current_path) and link != current_path)
-
-        absolute_paths = set(urljoin(base_url, link) for link in child_links)
-
-        self.visited_links.update(absolute_paths)
-
-        [self._get_child_links_recursive(link) for link in absolute_paths if link not in self.visited_links]
+    @staticmethod
+    def _get_child_links(url: str, response: HttpResponse, root_url: str) -> list[str]:
+        """Get the links of a page to pages of the same host, whose path starts with the path of the root url."""
+        parsed_root_url = urlparse(normalize_url(root_url))
+        soup = BeautifulSoup(response.text, "html.parser", parse_only=SoupStrainer("a", href=True))
+        child_links = []
+        for link in soup.find_all("a", href=True):
+            parsed_link = urlparse(normalize_url(link.get("href"), url))
+            if parsed_link.netloc == parsed_root_url.netloc and parsed_link.path.startswith(parsed_root_url.path):
+                child_links.append(parsed_link.geturl())
+        return child_links
+
+    def _crawl(self, url: str):
+        crawler = Crawler(**self.crawler_config)
+        yield from crawler.stream(
+            [url],
+            get_links=lambda page_url, response: self._get_child_links(page_url, response, url),
+            max_depth=self.max_depth,
+            max_pages=self.max_pages,
+        )
 
     def _get_all_urls(self, url):
+        root_url = normalize_url(url)
         self.visited_links = set()
-        self._get_child_links_recursive(url)
-        urls = [link for link in self.visited_links if urlparse(link).netloc == urlparse(url).netloc]
-        return urls
+        for result in self._crawl(url):
+            if normalize_url(result.url) != root_url:
+                self.visited_links.add(result.url)
+        return sorted(self.visited_links)
 
     @staticmethod
-    def _load_data_from_url(url: str) -> list:
-        response = requests.get(url)
-        if response.status_code != 200:
-            logger.info(f"Failed to fetch the website: {response.status_code}")
-            return []
-
-        soup = BeautifulSoup(response.content, "html.parser")
+    def _load_data_from_response(url: str, content: bytes) -> list:
+        soup = BeautifulSoup(content, "html.parser")
         selectors = [
             "article.bd-article",
             'article[role="main"]',
@@ -107,11 +120,26 @@ class DocsSiteLoader(BaseLoader):
 
         return output
 
+    @classmethod
+    def _load_data_from_result(cls, result: CrawlResult) -> list:
+        if result.response is None:
+            return []
+        if result.response.status_code != 200:
+            logger.info(f"Failed to fetch the website: {result.response.status_code}")
+            return []
+        return cls._load_data_from_response(result.url, result.response.content)
+
     def load_data(self, url):
-        all_urls = self._get_all_urls(url)
+        root_url = normalize_url(url)
+        self.visited_links = set()
         output = []
-        for u in all_urls:
-            output.extend(self._load_data_from_url(u))
+        # Pages are parsed while the next ones are fetched
+        for result in self._crawl(url):
+            if normalize_url(result.url) == root_url:
+                continue
+            self.visited_links.add(result.url)
+            output.extend(self._load_data_from_result(result))
+        all_urls = sorted(self.visited_links)
         doc_id = hashlib.sha256((" ".join(all_urls) + url).encode()).hexdigest()
         return {
             "doc_id": doc_id,
@@ -0,0 +1,315 @@
+import functools
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Optional
+
+import requests
+
+from embedchain.constants import CONFIG_DIR
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_PATH = os.path.join(CONFIG_DIR, "http_cache.db")
+
+
+class HttpResponse:
+    """
+    Response of `HttpCache.get`.
+
+    If the server answered 304 Not Modified, `not_modified` is set and the content is the cached body of the earlier
+    response, with its status code. The doc_id and the data a loader stored for the earlier response are set as well.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        content: Any,
+        encoding: Optional[str] = None,
+        not_modified: bool = False,
+        doc_id: Optional[str] = None,
+        response: Optional[requests.Response] = None,
+        data: Optional[list[dict[str, Any]]] = None,
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding
+        self.not_modified = not_modified
+        self.doc_id = doc_id
+        self.data = data
+        self._response = response
+
+    @property
+    def headers(self):
+        return self._response.headers if self._response is not None else {}
+
+    @property
+    def text(self) -> str:
+        if self._response is not None:
+            return self._response.text
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def raise_for_status(self):
+        if self._response is not None:
+            self._response.raise_for_status()
+
+
+class HttpCache:
+    """
+    Persistent cache of HTTP responses, revalidated with conditional requests.
+
+    Responses with an `ETag` or `Last-Modified` header are stored in a sqlite database, compressed. Requests for a
+    cached url send `If-None-Match` and `If-Modified-Since`, and a 304 Not Modified answer is served from the cache.
+    Loaders can store the doc_id and the data they derived from a response with `set_doc_id`, so that an unchanged
+    source can be recognized, and loaded, without parsing it again. The least recently used responses are evicted once
+    the cache holds more than `max_size_mb` megabytes.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_size_mb: Optional[float] = 1024):
+        """
+        Initialize the HTTP cache.
+
+        :param path: Path to the sqlite file of the cache, defaults to `~/.embedchain/http_cache.db`
+        :type path: Optional[str], optional
+        :param max_size_mb: Maximum size of the cached responses in megabytes, `None` for no limit, defaults to 1024
+        :type max_size_mb: Optional[float], optional
+        """
+        self.path = path or HTTP_CACHE_PATH
+        self.max_size = int(max_size_mb * 1024 * 1024) if max_size_mb is not None else None
+        self.hits = 0
+        self.misses = 0
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ec_http_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    status_code INTEGER NOT NULL,
+                    encoding TEXT,
+                    content BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    doc_id TEXT,
+                    last_access REAL NOT NULL,
+                    data BLOB
+                )
+                """
+            )
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(ec_http_cache)")}
+            if "data" not in columns:
+                # Caches created before the loaded data was stored
+                self._connection.execute("ALTER TABLE ec_http_cache ADD COLUMN data BLOB")
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS ec_http_cache_last_access ON ec_http_cache (last_access)"
+            )
+        self._create_stats()
+
+    def _create_stats(self):
+        """
+        Create the row that counts the responses and bytes of the cache, so that checking the limit doesn't scan the
+        cache. Triggers keep it up to date, for every connection to the cache file.
+        """
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ec_http_cache_stats (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    entries INTEGER NOT NULL,
+                    size INTEGER NOT NULL
+                )
+                """
+            )
+            if self._connection.execute("SELECT 1 FROM ec_http_cache_stats").fetchone() is None:
+                # A cache created before the stats existed is counted once
+                self._connection.execute(
+                    "INSERT INTO ec_http_cache_stats (id, entries, size) "
+                    "SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM ec_http_cache"
+                )
+            triggers = {
+                "insert": "AFTER INSERT ON ec_http_cache BEGIN UPDATE ec_http_cache_stats "
+                "SET entries = entries + 1, size = size + new.size WHERE id = 0; END",
+                "delete": "AFTER DELETE ON ec_http_cache BEGIN UPDATE ec_http_cache_stats "
+                "SET entries = entries - 1, size = size - old.size WHERE id = 0; END",
+                "update": "AFTER UPDATE OF size ON ec_http_cache BEGIN UPDATE ec_http_cache_stats "
+                "SET size = size - old.size + new.size WHERE id = 0; END",
+            }
+            for name, trigger in triggers.items():
+                self._connection.execute(f"CREATE TRIGGER IF NOT EXISTS ec_http_cache_{name} {trigger}")
+        except BaseException:
+            self._connection.rollback()
+            raise
+        self._connection.commit()
+
+    def get(
+        self,
+        url: str,
+        session: Optional[requests.Session] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = 30,
+    ) -> HttpResponse:
+        """
+        Get a url, with a conditional request if a response of it is cached.
+
+        :param session: Session to send the request with, defaults to `requests`
+        :type session: Optional[requests.Session], optional
+        :param headers: Headers of the request, defaults to None
+        :type headers: Optional[dict[str, str]], optional
+        :param timeout: Timeout of the request in seconds, defaults to 30
+        :type timeout: Optional[float], optional
+        :return: The response
+        :rtype: HttpResponse
+        """
+        with self._lock:
+            cached = self._connection.execute(
+                "SELECT etag, last_modified, status_code, encoding, content, doc_id, data FROM ec_http_cache "
+                "WHERE url = ?",
+                (url,),
+            ).fetchone()
+
+        headers = dict(headers or {})
+        if cached is not None:
+            etag, last_modified = cached[0], cached[1]
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = (session or requests).get(url, headers=headers, timeout=timeout)
+        if cached is not None and response.status_code == 304:
+            self.hits += 1
+            with self._lock:
+                with self._connection:
+                    self._connection.execute(
+                        "UPDATE ec_http_cache SET last_access = ? WHERE url = ?", (time.time(), url)
+                    )
+            _, _, status_code, encoding, content, doc_id, data = cached
+            data = json.loads(zlib.decompress(data)) if data is not None else None
+            return HttpResponse(
+                url, status_code, zlib.decompress(content), encoding, not_modified=True, doc_id=doc_id, data=data
+            )
+
+        self.misses += 1
+        self._store(url, response)
+        return HttpResponse(url, response.status_code, response.content, response=response)
+
+    def _store(self, url: str, response: requests.Response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        etag = etag if isinstance(etag, str) else None
+        last_modified = last_modified if isinstance(last_modified, str) else None
+        if response.status_code != 200 or not (etag or last_modified) or not isinstance(response.content, bytes):
+            # Without a validator the response can't be revalidated, a stale entry would never be used again
+            with self._lock:
+                with self._connection:
+                    self._connection.execute("DELETE FROM ec_http_cache WHERE url = ?", (url,))
+            return
+
+        content = zlib.compress(response.content)
+        encoding = response.encoding if isinstance(response.encoding, str) else None
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    # An upsert instead of `INSERT OR REPLACE`, whose implicit delete doesn't fire the stats trigger
+                    "INSERT INTO ec_http_cache "
+                    "(url, etag, last_modified, status_code, encoding, content, size, doc_id, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, NULL, ?) "
+                    "ON CONFLICT (url) DO UPDATE SET etag = excluded.etag, last_modified = excluded.last_modified, "
+                    "status_code = excluded.status_code, encoding = excluded.encoding, content = excluded.content, "
+                    "size = excluded.size, doc_id = NULL, data = NULL, last_access = excluded.last_access",
+                    (url, etag, last_modified, response.status_code, encoding, content, len(content), time.time()),
+                )
+                self._evict()
+
+    def set_doc_id(self, url: str, doc_id: str, data: Optional[list[dict[str, Any]]] = None):
+        """
+        Store the doc_id a loader derived from the cached response of a url.
+
+        :param data: The data the loader derived from the response, which is returned with the response while it is
+        not modified, defaults to None
+        :type data: Optional[list[dict[str, Any]]], optional
+        """
+        data = zlib.compress(json.dumps(data).encode()) if data is not None else None
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    "UPDATE ec_http_cache SET doc_id = ?, data = ?, size = length(content) + COALESCE(length(?), 0) "
+                    "WHERE url = ?",
+                    (doc_id, data, data, url),
+                )
+                if data is not None:
+                    self._evict()
+
+    def has_doc_id(self, url: str) -> bool:
+        """Whether a response of the url is cached with a doc_id, without which a conditional request can't tell that
+        the source is unchanged."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM ec_http_cache WHERE url = ? AND doc_id IS NOT NULL", (url,)
+            ).fetchone()
+        return row is not None
+
+    def _evict(self):
+        """Delete the least recently used responses until the cache fits in its limit. Expects the lock to be held."""
+        if self.max_size is None:
+            return
+        (size,) = self._connection.execute("SELECT size FROM ec_http_cache_stats").fetchone()
+        excess_size = size - self.max_size
+        if excess_size <= 0:
+            return
+
+        to_delete = []
+        freed_size = 0
+        cursor = self._connection.execute("SELECT rowid, size FROM ec_http_cache ORDER BY last_access ASC")
+        for rowid, row_size in cursor:
+            if freed_size >= excess_size:
+                break
+            to_delete.append((rowid,))
+            freed_size += row_size
+        cursor.close()
+        self._connection.executemany("DELETE FROM ec_http_cache WHERE rowid = ?", to_delete)
+        logger.debug(f"Evicted {len(to_delete)} responses from the HTTP cache")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get the counters of responses served from this cache instance and the current size of the cache.
+
+        :return: Cache statistics
+        :rtype: dict[str, Any]
+        """
+        with self._lock:
+            entries, size = self._connection.execute("SELECT entries, size FROM ec_http_cache_stats").fetchone()
+        requests_count = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests_count if requests_count else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+    def clear(self):
+        """Delete all cached responses."""
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM ec_http_cache")
+
+    def close(self):
+        self._connection.close()
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_cache() -> HttpCache:
+    """Get the HTTP cache shared by the web loaders, which is stored in `~/.embedchain/http_cache.db`."""
+    return HttpCache()
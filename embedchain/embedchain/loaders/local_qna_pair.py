@@ -11,7 +11,9 @@ class LocalQnaPairLoader(BaseLoader):
         question, answer = content
         content = f"Q: {question}\nA: {answer}"
         url = "local"
-        metadata = {"url": url, "question": question}
+        # The answer is kept in the metadata, so that the QnA fast path can return it even if the pair is split into
+        # several chunks
+        metadata = {"url": url, "question": question, "answer": answer}
         doc_id = hashlib.sha256((content + url).encode()).hexdigest()
         return {
             "doc_id": doc_id,
@@ -1,17 +1,61 @@
 import hashlib
+import logging
+from typing import Optional
+
+import requests
 
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.loaders.base_loader import BaseLoader
+from embedchain.loaders.http_cache import HttpCache, HttpResponse, get_http_cache
+
+logger = logging.getLogger(__name__)
 
 
 @register_deserializable
 class RSSFeedLoader(BaseLoader):
     """Loader for RSS Feed."""
 
+    def __init__(self, http_cache: Optional[HttpCache] = None):
+        """
+        :param http_cache: Cache of the feed, defaults to the cache shared by the web loaders
+        :type http_cache: Optional[HttpCache], optional
+        """
+        super().__init__()
+        self.http_cache = http_cache
+        # Responses of changed feeds fetched by `get_unmodified_doc_id`, which are parsed without fetching them again
+        self._fetched_responses: dict[str, HttpResponse] = {}
+
+    def _get_http_cache(self) -> HttpCache:
+        return getattr(self, "http_cache", None) or get_http_cache()
+
+    def get_unmodified_doc_id(self, url) -> Optional[str]:
+        """Get the doc_id of the last load of the feed if the server answers 304 Not Modified."""
+        if not self._get_http_cache().has_doc_id(url):
+            return None
+        try:
+            response = self._get_http_cache().get(url)
+        except requests.RequestException:
+            return None
+        if response.not_modified:
+            return response.doc_id
+        if not getattr(self, "_fetched_responses", None):
+            self._fetched_responses = {}
+        self._fetched_responses[url] = response
+        return None
+
     def load_data(self, url):
         """Load data from a rss feed."""
-        output = self.get_rss_content(url)
+        response = (getattr(self, "_fetched_responses", None) or {}).pop(url, None)
+        if response is None:
+            try:
+                # Fetched through the cache, so that the next load can revalidate the feed
+                response = self._get_http_cache().get(url)
+            except requests.RequestException as e:
+                logger.warning(f"Failed to fetch the feed {url}, leaving it to the article loader: {e}")
+        content = response.content if response is not None and response.status_code == 200 else None
+        output = self.get_rss_content(url, content=content)
         doc_id = hashlib.sha256((str(output) + url).encode()).hexdigest()
+        self._get_http_cache().set_doc_id(url, doc_id)
         return {
             "doc_id": doc_id,
             "data": output,
@@ -26,7 +70,7 @@ class RSSFeedLoader(BaseLoader):
         return metadata
 
     @staticmethod
-    def get_rss_content(url: str):
+    def get_rss_content(url: str, content: Optional[bytes] = None):
         try:
             from langchain_community.document_loaders import RSSFeedLoader as LangchainRSSFeedLoader
         except ImportError:
@@ -36,12 +80,13 @@ class RSSFeedLoader(BaseLoader):
             ) from None
 
         output = []
-        loader = LangchainRSSFeedLoader(urls=[url])
+        # feedparser parses the content of the feed if it is given instead of its url
+        loader = LangchainRSSFeedLoader(urls=[content if content is not None else url])
         data = loader.load()
 
         for entry in data:
             metadata = RSSFeedLoader.serialize_metadata(entry.metadata)
-            metadata.update({"url": url})
+            metadata.update({"url": url, "feed": url})
             output.append(
                 {
                     "content": entry.page_content,
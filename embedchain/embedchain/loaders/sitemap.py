@@ -1,7 +1,7 @@
-import concurrent.futures
 import hashlib
 import logging
 import os
+from typing import Any, Optional
 from urllib.parse import urlparse
 
 import requests
@@ -17,6 +17,8 @@ except ImportError:
 
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.loaders.base_loader import BaseLoader
+from embedchain.loaders.crawler import Crawler, CrawlResult
+from embedchain.loaders.http_cache import HttpCache, get_http_cache
 from embedchain.loaders.web_page import WebPageLoader
 
 logger = logging.getLogger(__name__)
@@ -30,21 +32,35 @@ class SitemapLoader(BaseLoader):
     of each page.
     """
 
-    def load_data(self, sitemap_source):
-        output = []
-        web_page_loader = WebPageLoader()
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36",  # noqa:E501
-        }
+    def __init__(self, http_cache: Optional[HttpCache] = None, config: Optional[dict[str, Any]] = None):
+        """
+        :param http_cache: Cache of the sitemap and its pages, defaults to the cache shared by the web loaders
+        :type http_cache: Optional[HttpCache], optional
+        :param config: `max_concurrency`, `max_concurrency_per_host`, `delay`, `max_retries`, `timeout` and
+        `respect_robots_txt` of the `Crawler` that fetches the pages
+        :type config: Optional[dict[str, Any]], optional
+        """
+        super().__init__()
+        self.http_cache = http_cache
+        self.crawler_config = config or {}
+        # Links and loaded pages of changed sitemaps crawled by `get_unmodified_doc_id`, which are loaded without
+        # fetching the pages again
+        self._fetched_pages: dict[str, tuple[list[str], dict[str, Optional[dict[str, Any]]]]] = {}
 
+    def _get_crawler(self) -> Crawler:
+        return Crawler(http_cache=getattr(self, "http_cache", None), **getattr(self, "crawler_config", {}))
+
+    def _get_links(self, sitemap_source) -> Optional[list[str]]:
+        """Get the urls of the pages of a sitemap, None if it can't be fetched."""
         if urlparse(sitemap_source).scheme in ("http", "https"):
             try:
-                response = requests.get(sitemap_source, headers=headers)
+                http_cache = getattr(self, "http_cache", None) or get_http_cache()
+                response = http_cache.get(sitemap_source, headers=WebPageLoader.headers, timeout=30)
                 response.raise_for_status()
                 soup = BeautifulSoup(response.text, "xml")
             except requests.RequestException as e:
                 logger.error(f"Error fetching sitemap from URL: {e}")
-                return
+                return None
         elif os.path.isfile(sitemap_source):
             with open(sitemap_source, "r") as file:
                 soup = BeautifulSoup(file, "xml")
@@ -54,26 +70,80 @@ class SitemapLoader(BaseLoader):
         links = [link.text for link in soup.find_all("loc") if link.parent.name == "url"]
         if len(links) == 0:
             links = [link.text for link in soup.find_all("loc")]
+        return links
 
-        doc_id = hashlib.sha256((" ".join(links) + sitemap_source).encode()).hexdigest()
+    @staticmethod
+    def _get_doc_id(sitemap_source: str, links: list[str], page_doc_ids: list[str]) -> str:
+        # The doc_id changes when a page is added, removed or changed
+        return hashlib.sha256((" ".join(links) + sitemap_source + " ".join(page_doc_ids)).encode()).hexdigest()
 
-        def load_web_page(link):
-            try:
-                loader_data = web_page_loader.load_data(link)
-                return loader_data.get("data")
-            except ParserRejectedMarkup as e:
-                logger.error(f"Failed to parse {link}: {e}")
+    @staticmethod
+    def _load_page(web_page_loader: WebPageLoader, result: CrawlResult) -> Optional[dict[str, Any]]:
+        """Load the data of a crawled page, unchanged pages from their stored data. None if the page failed."""
+        if result.response is None:
+            logger.error(f"Error loading page {result.url}: {result.error}")
+            return None
+        try:
+            result.response.raise_for_status()
+            return web_page_loader._load_response(result.url, result.response)
+        except ParserRejectedMarkup as e:
+            logger.error(f"Failed to parse {result.url}: {e}")
+        except Exception as e:
+            logger.error(f"Error loading page {result.url}: {e}")
+        return None
+
+    def get_unmodified_doc_id(self, sitemap_source) -> Optional[str]:
+        """Get the doc_id of the last load of the sitemap if the server answers 304 Not Modified for all pages."""
+        links = self._get_links(sitemap_source)
+        if not links:
+            return None
+        http_cache = getattr(self, "http_cache", None) or get_http_cache()
+        if not any(http_cache.has_doc_id(link) for link in links):
+            # None of the pages has been loaded before, they are only fetched by `load_data`
             return None
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_to_link = {executor.submit(load_web_page, link): link for link in links}
-            for future in tqdm(concurrent.futures.as_completed(future_to_link), total=len(links), desc="Loading pages"):
-                link = future_to_link[future]
-                try:
-                    data = future.result()
-                    if data:
-                        output.extend(data)
-                except Exception as e:
-                    logger.error(f"Error loading page {link}: {e}")
+        web_page_loader = WebPageLoader(http_cache=getattr(self, "http_cache", None))
+        unmodified = True
+        pages = {}
+        for result in self._get_crawler().stream(links):
+            response = result.response
+            if response is None or not response.not_modified or response.doc_id is None:
+                unmodified = False
+            # Only the data of the pages is kept, their responses are dropped as the crawl goes on
+            pages[result.url] = self._load_page(web_page_loader, result)
+
+        if unmodified:
+            page_doc_ids = [pages[link]["doc_id"] for link in links if pages.get(link) is not None]
+            return self._get_doc_id(sitemap_source, links, page_doc_ids)
+        # The sitemap is loaded from these pages, without fetching them again
+        if not getattr(self, "_fetched_pages", None):
+            self._fetched_pages = {}
+        self._fetched_pages[sitemap_source] = (links, pages)
+        return None
+
+    def load_data(self, sitemap_source):
+        fetched_pages = (getattr(self, "_fetched_pages", None) or {}).pop(sitemap_source, None)
+        if fetched_pages is not None:
+            links, pages = fetched_pages
+            pages = pages.items()
+        else:
+            links = self._get_links(sitemap_source)
+            if links is None:
+                return
+            web_page_loader = WebPageLoader(http_cache=getattr(self, "http_cache", None))
+            # Pages are parsed while the next ones are fetched, unchanged pages are not parsed again
+            pages = (
+                (result.url, self._load_page(web_page_loader, result)) for result in self._get_crawler().stream(links)
+            )
+
+        output = []
+        page_doc_ids = {}
+        for url, loader_data in tqdm(pages, total=len(links), desc="Loading pages"):
+            if loader_data is None:
+                continue
+            page_doc_ids[url] = loader_data["doc_id"]
+            if loader_data.get("data"):
+                output.extend(loader_data["data"])
 
+        doc_id = self._get_doc_id(sitemap_source, links, [page_doc_ids[link] for link in links if link in page_doc_ids])
         return {"doc_id": doc_id, "data": output}
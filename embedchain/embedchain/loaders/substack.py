@@ -1,12 +1,14 @@
 import hashlib
 import logging
 import time
+from typing import Optional
 from xml.etree import ElementTree
 
 import requests
 
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.loaders.base_loader import BaseLoader
+from embedchain.loaders.http_cache import HttpCache, HttpResponse, get_http_cache
 from embedchain.utils.misc import is_readable
 
 logger = logging.getLogger(__name__)
@@ -18,6 +20,39 @@ class SubstackLoader(BaseLoader):
     This loader is used to load data from Substack URLs.
     """
 
+    def __init__(self, http_cache: Optional[HttpCache] = None):
+        """
+        :param http_cache: Cache of the sitemap and the posts, defaults to the cache shared by the web loaders
+        :type http_cache: Optional[HttpCache], optional
+        """
+        super().__init__()
+        self.http_cache = http_cache
+        # Responses of changed sitemaps fetched by `get_unmodified_doc_id`, which are loaded without fetching them again
+        self._fetched_responses: dict[str, HttpResponse] = {}
+
+    def _get_http_cache(self) -> HttpCache:
+        return getattr(self, "http_cache", None) or get_http_cache()
+
+    @staticmethod
+    def _get_sitemap_url(url: str) -> str:
+        return url if url.endswith("sitemap.xml") else url + "/sitemap.xml"
+
+    def get_unmodified_doc_id(self, url: str) -> Optional[str]:
+        """Get the doc_id of the last load of the substack if the server answers 304 Not Modified for its sitemap."""
+        sitemap_url = self._get_sitemap_url(url)
+        if not self._get_http_cache().has_doc_id(sitemap_url):
+            return None
+        try:
+            response = self._get_http_cache().get(sitemap_url)
+        except requests.RequestException:
+            return None
+        if response.not_modified:
+            return response.doc_id
+        if not getattr(self, "_fetched_responses", None):
+            self._fetched_responses = {}
+        self._fetched_responses[sitemap_url] = response
+        return None
+
     def load_data(self, url: str):
         try:
             from bs4 import BeautifulSoup
@@ -27,11 +62,12 @@ class SubstackLoader(BaseLoader):
                 "Substack requires extra dependencies. Install with `pip install beautifulsoup4==4.12.3`"
             ) from None
 
-        if not url.endswith("sitemap.xml"):
-            url = url + "/sitemap.xml"
+        url = self._get_sitemap_url(url)
 
         output = []
-        response = requests.get(url)
+        response = (getattr(self, "_fetched_responses", None) or {}).pop(url, None)
+        if response is None:
+            response = self._get_http_cache().get(url)
 
         try:
             response.raise_for_status()
@@ -83,7 +119,7 @@ class SubstackLoader(BaseLoader):
 
         def load_link(link: str):
             try:
-                substack_data = requests.get(link)
+                substack_data = self._get_http_cache().get(link)
                 substack_data.raise_for_status()
 
                 soup = BeautifulSoup(substack_data.text, "html.parser")
@@ -104,4 +140,5 @@ class SubstackLoader(BaseLoader):
             # TODO: allow users to configure this
             time.sleep(1.0)  # added to avoid rate limiting
 
+        self._get_http_cache().set_doc_id(url, doc_id)
         return {"doc_id": doc_id, "data": output}
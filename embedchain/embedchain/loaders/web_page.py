@@ -1,5 +1,6 @@
 import hashlib
 import logging
+from typing import Optional
 
 import requests
 
@@ -12,6 +13,7 @@ except ImportError:
 
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.loaders.base_loader import BaseLoader
+from embedchain.loaders.http_cache import HttpCache, HttpResponse, get_http_cache
 from embedchain.utils.misc import clean_string
 
 logger = logging.getLogger(__name__)
@@ -21,28 +23,70 @@ logger = logging.getLogger(__name__)
 class WebPageLoader(BaseLoader):
     # Shared session for all instances
     _session = requests.Session()
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36",  # noqa:E501
+    }
+
+    def __init__(self, http_cache: Optional[HttpCache] = None):
+        """
+        :param http_cache: Cache of the pages, defaults to the cache shared by the web loaders
+        :type http_cache: Optional[HttpCache], optional
+        """
+        super().__init__()
+        self.http_cache = http_cache
+        # Responses of changed pages fetched by `get_unmodified_doc_id`, which are loaded without fetching them again
+        self._fetched_responses: dict[str, HttpResponse] = {}
+
+    def _get_http_cache(self) -> HttpCache:
+        return getattr(self, "http_cache", None) or get_http_cache()
+
+    def _fetch(self, url: str) -> HttpResponse:
+        return self._get_http_cache().get(url, session=self._session, headers=self.headers, timeout=30)
+
+    def _get(self, url: str) -> HttpResponse:
+        response = (getattr(self, "_fetched_responses", None) or {}).pop(url, None)
+        return response if response is not None else self._fetch(url)
+
+    def get_unmodified_doc_id(self, url) -> Optional[str]:
+        """Get the doc_id of the last load of the page if the server answers 304 Not Modified."""
+        if not self._get_http_cache().has_doc_id(url):
+            return None
+        response = self._fetch(url)
+        if response.not_modified:
+            return response.doc_id
+        if not getattr(self, "_fetched_responses", None):
+            self._fetched_responses = {}
+        self._fetched_responses[url] = response
+        return None
 
     def load_data(self, url):
         """Load data from a web page using a shared requests' session."""
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36",  # noqa:E501
-        }
-        response = self._session.get(url, headers=headers, timeout=30)
+        response = self._get(url)
         response.raise_for_status()
+        return self._load_response(url, response)
+
+    def _load_response(self, url: str, response: HttpResponse):
+        """Load data from the response of a web page."""
+        if response.not_modified and response.doc_id is not None and response.data is not None:
+            # The page didn't change since it was loaded, its data is not parsed again
+            return {"doc_id": response.doc_id, "data": response.data}
+
         data = response.content
         content = self._get_clean_content(data, url)
 
         metadata = {"url": url}
 
         doc_id = hashlib.sha256((content + url).encode()).hexdigest()
+        output = [
+            {
+                "content": content,
+                "meta_data": metadata,
+            }
+        ]
+        self._get_http_cache().set_doc_id(url, doc_id, data=output)
         return {
             "doc_id": doc_id,
-            "data": [
-                {
-                    "content": content,
-                    "meta_data": metadata,
-                }
-            ],
+            "data": output,
         }
 
     @staticmethod
@@ -90,7 +134,7 @@ class WebPageLoader(BaseLoader):
         cleaned_size = len(content)
         if original_size != 0:
             logger.info(
-                f"[{url}] Cleaned page size: {cleaned_size} characters, down from {original_size} (shrunk: {original_size-cleaned_size} chars, {round((1-(cleaned_size/original_size)) * 100, 2)}%)"  # noqa:E501
+                f"[{url}] Cleaned page size: {cleaned_size} characters, down from {original_size} (shrunk: {original_size - cleaned_size} chars, {round((1 - (cleaned_size / original_size)) * 100, 2)}%)"  # noqa:E501
             )
 
         return content
@@ -1,9 +1,14 @@
+import atexit
 import json
 import logging
+import queue
+import threading
 import uuid
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
 from typing import Any, Optional
 
-from embedchain.core.db.database import get_session
+from embedchain.core.db.database import database_manager, get_session
 from embedchain.core.db.models import ChatHistory as ChatHistoryModel
 from embedchain.memory.message import ChatMessage
 from embedchain.memory.utils import merge_metadata_dict
@@ -11,35 +16,194 @@ from embedchain.memory.utils import merge_metadata_dict
 logger = logging.getLogger(__name__)
 
 
+class HistoryWriter:
+    """
+    Writes chat rounds to the database from a background thread.
+
+    Rounds that are queued while a batch is written are written together in the next batch, with one commit. `flush`
+    blocks until all queued rounds are written, it is called before the history is read from the database and at exit.
+    """
+
+    def __init__(self, batch_size: int = 100):
+        self.batch_size = batch_size
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def put(self, row: dict[str, Any]):
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="chat-history-writer", daemon=True)
+                self._worker.start()
+                atexit.register(self.flush)
+        self._queue.put(row)
+
+    def flush(self):
+        """Wait until all queued rounds are written."""
+        if self._worker is not None:
+            self._queue.join()
+
+    def _run(self):
+        while True:
+            rows = [self._queue.get()]
+            while len(rows) < self.batch_size:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(rows)
+            finally:
+                for _ in rows:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write(rows: list[dict[str, Any]]):
+        # Sessions are thread-local, the writer has its own
+        try:
+            session = get_session()
+        except Exception as e:
+            logger.error(f"Error adding {len(rows)} chat memories to db: {e}")
+            return
+        session.add_all([ChatHistoryModel(**row) for row in rows])
+        try:
+            session.commit()
+        except Exception as e:
+            logger.error(f"Error adding {len(rows)} chat memories to db: {e}")
+            session.rollback()
+
+
+class HistoryCache:
+    """
+    Last rounds of the recently used chat sessions, so that chat turns read their history from memory.
+
+    Every session keeps at most `max_rounds` rounds in a ring buffer, and at most `max_sessions` sessions are kept,
+    the least recently used session is dropped first. A session is loaded from the database on its first use.
+    """
+
+    def __init__(self, max_rounds: int = 50, max_sessions: int = 10_000):
+        self.max_rounds = max_rounds
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._sessions: OrderedDict[tuple[str, str, str], deque[ChatMessage]] = OrderedDict()
+
+    @staticmethod
+    def _key(app_id: str, session_id: str) -> tuple[str, str, str]:
+        return database_manager.database_uri, app_id, session_id
+
+    def get(self, app_id: str, session_id: str) -> Optional[list[ChatMessage]]:
+        """Get the cached rounds of a session, oldest first, or None if the session isn't cached."""
+        key = self._key(app_id, session_id)
+        with self._lock:
+            rounds = self._sessions.get(key)
+            if rounds is None:
+                return None
+            self._sessions.move_to_end(key)
+            return list(rounds)
+
+    def set(self, app_id: str, session_id: str, rounds: list[ChatMessage]):
+        """Cache the last rounds of a session, oldest first."""
+        with self._lock:
+            self._sessions[self._key(app_id, session_id)] = deque(rounds, maxlen=self.max_rounds)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def append(self, app_id: str, session_id: str, chat_message: ChatMessage) -> bool:
+        """Append a round to a cached session, returns False if the session isn't cached."""
+        with self._lock:
+            rounds = self._sessions.get(self._key(app_id, session_id))
+            if rounds is None:
+                return False
+            rounds.append(chat_message)
+            return True
+
+    def discard(self, app_id: str, session_id: Optional[str] = None):
+        """Drop a session, or all sessions of an app, from the cache."""
+        with self._lock:
+            for key in list(self._sessions):
+                if key[1] == app_id and session_id in (None, key[2]):
+                    del self._sessions[key]
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+
+
+# Shared by all apps of the process, so that apps with the same id see the same history
+history_writer = HistoryWriter()
+history_cache = HistoryCache()
+
+
 class ChatHistory:
-    def __init__(self) -> None:
+    def __init__(self, write_behind: bool = True) -> None:
+        """
+        Initialize the chat history.
+
+        :param write_behind: Whether rounds are written to the database in the background, defaults to True
+        :type write_behind: bool, optional
+        """
         self.db_session = get_session()
+        self.write_behind = write_behind
 
     def add(self, app_id, session_id, chat_message: ChatMessage) -> Optional[str]:
+        # Load the session first, so that the cache holds the rounds before this one
+        self._get_cached_rounds(app_id, session_id)
+
         memory_id = str(uuid.uuid4())
         metadata_dict = merge_metadata_dict(chat_message.human_message.metadata, chat_message.ai_message.metadata)
-        if metadata_dict:
-            metadata = self._serialize_json(metadata_dict)
-        self.db_session.add(
-            ChatHistoryModel(
-                app_id=app_id,
-                id=memory_id,
-                session_id=session_id,
-                question=chat_message.human_message.content,
-                answer=chat_message.ai_message.content,
-                metadata=metadata if metadata_dict else "{}",
-            )
-        )
-        try:
-            self.db_session.commit()
-        except Exception as e:
-            logger.error(f"Error adding chat memory to db: {e}")
-            self.db_session.rollback()
-            return None
+        row = {
+            "app_id": app_id,
+            "id": memory_id,
+            "session_id": session_id,
+            "question": chat_message.human_message.content,
+            "answer": chat_message.ai_message.content,
+            "meta_data": self._serialize_json(metadata_dict) if metadata_dict else "{}",
+            # Set here rather than by the database, so that rounds keep their order with write-behind
+            "created_at": datetime.now(timezone.utc).replace(tzinfo=None),
+        }
+        if self.write_behind:
+            history_writer.put(row)
+        else:
+            self.db_session.add(ChatHistoryModel(**row))
+            try:
+                self.db_session.commit()
+            except Exception as e:
+                logger.error(f"Error adding chat memory to db: {e}")
+                self.db_session.rollback()
+                return None
 
+        history_cache.append(app_id, session_id, chat_message)
         logger.info(f"Added chat memory to db with id: {memory_id}")
         return memory_id
 
+    def _get_cached_rounds(self, app_id: str, session_id: str) -> list[ChatMessage]:
+        """Get the last rounds of a session from the cache, loading them from the database on a cache miss."""
+        rounds = history_cache.get(app_id, session_id)
+        if rounds is None:
+            results = self._query(app_id, session_id, num_rounds=history_cache.max_rounds, fetch_all=False)
+            rounds = [self._to_chat_message(result) for result in results]
+            history_cache.set(app_id, session_id, rounds)
+        return rounds
+
+    def _query(self, app_id: str, session_id: str, num_rounds: int, fetch_all: bool) -> list[ChatHistoryModel]:
+        """Query the last `num_rounds` rounds of a session, or all rounds of the app with `fetch_all`, oldest first."""
+        history_writer.flush()
+        params = {"app_id": app_id}
+        if not fetch_all:
+            params["session_id"] = session_id
+        results = self.db_session.query(ChatHistoryModel).filter_by(**params)
+        if fetch_all:
+            return results.order_by(ChatHistoryModel.created_at.asc()).all()
+        # The latest rounds, served by the (app_id, session_id, created_at) index
+        return list(reversed(results.order_by(ChatHistoryModel.created_at.desc()).limit(num_rounds).all()))
+
+    def _to_chat_message(self, result: ChatHistoryModel) -> ChatMessage:
+        metadata = self._deserialize_json(metadata=result.meta_data or "{}")
+        memory = ChatMessage()
+        memory.add_user_message(result.question, metadata=metadata)
+        memory.add_ai_message(result.answer, metadata=metadata)
+        return memory
+
     def delete(self, app_id: str, session_id: Optional[str] = None):
         """
         Delete all chat history for a given app_id and session_id.
@@ -50,6 +214,8 @@ class ChatHistory:
 
         :return: None
         """
+        history_writer.flush()
+        history_cache.discard(app_id, session_id)
         params = {"app_id": app_id}
         if session_id:
             params["session_id"] = session_id
@@ -66,22 +232,22 @@ class ChatHistory:
         """
         Get the chat history for a given app_id.
 
+        The last rounds of a session are served from memory, only the display format, `fetch_all` and more rounds
+        than the cache holds are read from the database.
+
         param: app_id - The app_id to get chat history
         param: session_id (optional) - The session_id to get chat history. Defaults to "default"
-        param: num_rounds (optional) - The number of rounds to get chat history. Defaults to 10
+        param: num_rounds (optional) - The number of latest rounds to get chat history. Defaults to 10
         param: fetch_all (optional) - Whether to fetch all chat history or not. Defaults to False
         param: display_format (optional) - Whether to return the chat history in display format. Defaults to False
         """
-        params = {"app_id": app_id}
-        if not fetch_all:
-            params["session_id"] = session_id
-        results = (
-            self.db_session.query(ChatHistoryModel).filter_by(**params).order_by(ChatHistoryModel.created_at.asc())
-        )
-        results = results.limit(num_rounds) if not fetch_all else results
+        if not fetch_all and not display_format and num_rounds <= history_cache.max_rounds:
+            rounds = self._get_cached_rounds(app_id, session_id)
+            return rounds[-num_rounds:] if num_rounds > 0 else []
+
+        results = self._query(app_id, session_id, num_rounds=num_rounds, fetch_all=fetch_all)
         history = []
         for result in results:
-            metadata = self._deserialize_json(metadata=result.meta_data or "{}")
             # Return list of dict if display_format is True
             if display_format:
                 history.append(
@@ -94,10 +260,7 @@ class ChatHistory:
                     }
                 )
             else:
-                memory = ChatMessage()
-                memory.add_user_message(result.question, metadata=metadata)
-                memory.add_ai_message(result.answer, metadata=metadata)
-                history.append(memory)
+                history.append(self._to_chat_message(result))
         return history
 
     def count(self, app_id: str, session_id: Optional[str] = None):
@@ -109,7 +272,7 @@ class ChatHistory:
 
         :return: The number of chat messages for a given app_id and session_id
         """
-        # Rewrite the logic below with sqlalchemy
+        history_writer.flush()
         params = {"app_id": app_id}
         if session_id:
             params["session_id"] = session_id
@@ -0,0 +1,180 @@
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
+from typing import Any, Optional
+
+from embedchain.config.history_summary_config import HistorySummaryConfig
+from embedchain.utils.tokens import count_tokens
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_PROMPT_TEMPLATE = Template(
+    """Progressively summarize the lines of conversation provided, adding onto the previous summary and returning a new summary.
+Keep the facts, names, numbers and open questions that later turns may refer to. Use at most $max_words words.
+
+Current summary:
+$summary
+
+New lines of conversation:
+$rounds
+
+New summary:"""  # noqa: E501
+)
+
+
+class _SessionSummary:
+    __slots__ = ("summary", "recent", "folding")
+
+    def __init__(self, recent: list[str]):
+        self.summary = ""
+        # Rounds that are passed to the prompt verbatim, oldest first
+        self.recent = recent
+        # Rounds that are being folded into the summary, still passed verbatim until the new summary is ready
+        self.folding: list[str] = []
+
+
+class HistorySummarizer:
+    """
+    Rolling summary of the chat sessions of an app.
+
+    Every session keeps its latest `recent_rounds` rounds verbatim. Older rounds are folded into a summary by the LLM,
+    in a background thread, so chat turns never wait for a summary. Rounds that arrive while a summary is being
+    written are folded together in the next call. The history of a prompt is the summary followed by the latest
+    rounds that fit in the token budget.
+    """
+
+    def __init__(self, config: HistorySummaryConfig, summarize_fn: Callable[[str], Any], model: Optional[str] = None):
+        """
+        Initialize the summarizer.
+
+        :param config: Config of the summary
+        :type config: HistorySummaryConfig
+        :param summarize_fn: Function that answers a prompt, usually `get_llm_model_answer` of the app's LLM
+        :type summarize_fn: Callable[[str], Any]
+        :param model: Model whose tokenizer counts the tokens of the history, defaults to None
+        :type model: Optional[str], optional
+        """
+        self.config = config
+        self.summarize_fn = summarize_fn
+        self.model = model
+
+        self._lock = threading.Lock()
+        self._sessions: OrderedDict[tuple[str, str], _SessionSummary] = OrderedDict()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-summarizer")
+        self._running = 0
+
+    def _get_session(self, key: tuple[str, str], load_rounds: Callable[[], list[str]]) -> _SessionSummary:
+        """Get the state of a session, seeded with the stored rounds on first use. Expects the lock to be held."""
+        session = self._sessions.get(key)
+        if session is None:
+            session = _SessionSummary(load_rounds())
+            self._sessions[key] = session
+            while len(self._sessions) > self.config.max_sessions:
+                self._sessions.popitem(last=False)
+        self._sessions.move_to_end(key)
+        return session
+
+    def get_history(self, app_id: str, session_id: str, load_rounds: Callable[[], list[str]]) -> list[str]:
+        """
+        Get the history of a session for a prompt: the summary and the latest rounds that fit in the token budget.
+
+        :param load_rounds: Loads the latest stored rounds of the session, called if the session isn't cached yet
+        :type load_rounds: Callable[[], list[str]]
+        :return: History lines, oldest first
+        :rtype: list[str]
+        """
+        with self._lock:
+            session = self._get_session((app_id, session_id), load_rounds)
+            summary = session.summary
+            rounds = session.folding + session.recent
+
+        history = []
+        budget = self.config.token_budget
+        if summary:
+            line = f"Summary of the earlier conversation: {summary}"
+            budget -= count_tokens(line, self.model)
+            history.append(line)
+        recent = []
+        for round in reversed(rounds):
+            budget -= count_tokens(round, self.model)
+            # The latest round is always kept, so that the LLM knows what the user refers to
+            if budget < 0 and recent:
+                break
+            recent.append(round)
+        return history + recent[::-1]
+
+    def add_round(self, app_id: str, session_id: str, round: str, load_rounds: Callable[[], list[str]]):
+        """
+        Add a round to a session, and fold the rounds that are not recent anymore into the summary in the background.
+
+        :param round: The round, formatted like the rounds of `BaseLlm.load_history`
+        :type round: str
+        """
+        with self._lock:
+            session = self._get_session((app_id, session_id), load_rounds)
+            # Loaded rounds may already contain this round
+            if not session.recent or session.recent[-1] != round:
+                session.recent.append(round)
+            self._schedule((app_id, session_id), session)
+
+    def _schedule(self, key: tuple[str, str], session: _SessionSummary):
+        """Start folding the rounds beyond the recent ones, unless a fold is running. Expects the lock to be held."""
+        overflow = len(session.recent) - self.config.recent_rounds
+        if session.folding or overflow <= 0:
+            return
+        session.folding = session.recent[:overflow]
+        session.recent = session.recent[overflow:]
+        self._running += 1
+        self._executor.submit(self._fold, key, session, session.summary, list(session.folding))
+
+    def _fold(self, key: tuple[str, str], session: _SessionSummary, summary: str, rounds: list[str]):
+        try:
+            prompt = SUMMARY_PROMPT_TEMPLATE.substitute(
+                summary=summary or "(empty)",
+                rounds="\n".join(rounds),
+                # Words are about three quarters of a token
+                max_words=int(self.config.summary_tokens * 0.75),
+            )
+            new_summary = self._answer(prompt)
+        except Exception as e:
+            logger.warning(f"Could not summarize the chat history: {e}")
+            with self._lock:
+                # Pass the rounds verbatim again, they are folded with the next round
+                session.recent = session.folding + session.recent
+                session.folding = []
+                self._running -= 1
+            return
+
+        with self._lock:
+            session.summary = new_summary.strip()
+            session.folding = []
+            self._running -= 1
+            if self._sessions.get(key) is session:
+                self._schedule(key, session)
+
+    def _answer(self, prompt: str) -> str:
+        answer = self.summarize_fn(prompt)
+        # LLMs with token usage return the token info, and streaming LLMs return the chunks
+        if isinstance(answer, tuple):
+            answer = answer[0]
+        if not isinstance(answer, str):
+            answer = "".join(answer)
+        return answer
+
+    def discard(self, app_id: str, session_id: Optional[str] = None):
+        """Drop the summary of a session, or of all sessions of an app, e.g. because their history was deleted."""
+        with self._lock:
+            for key in list(self._sessions):
+                if key[0] == app_id and session_id in (None, key[1]):
+                    del self._sessions[key]
+
+    def wait(self):
+        """Wait until the running summaries are written."""
+        while True:
+            self._executor.submit(lambda: None).result()
+            with self._lock:
+                if not self._running:
+                    return
@@ -15,7 +15,7 @@ target_metadata = Base.metadata
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
-config.set_main_option("sqlalchemy.url", os.environ.get("EMBEDCHAIN_DB_URI"))
+config.set_main_option("sqlalchemy.url", config.attributes.get("database_uri") or os.environ.get("EMBEDCHAIN_DB_URI"))
 
 
 def run_migrations_offline() -> None:
@@ -0,0 +1,30 @@
+"""Add chat history session index
+
+Revision ID: 9f1c2b7d4e6a
+Revises: 40a327b3debd
+Create Date: 2026-10-18 10:12:41.582907
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9f1c2b7d4e6a"
+down_revision: Union[str, None] = "40a327b3debd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_ec_chat_history_session_created_at",
+        "ec_chat_history",
+        ["app_id", "session_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ec_chat_history_session_created_at", table_name="ec_chat_history")
@@ -0,0 +1,160 @@
+import logging
+import re
+import threading
+from collections.abc import Callable
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_whitespace_re = re.compile(r"\s+")
+
+
+class QnaMatch(NamedTuple):
+    """A stored QnA pair that matches a query, with the cosine similarity of the questions (1.0 for exact matches)."""
+
+    question: str
+    answer: str
+    metadata: dict[str, Any]
+    score: float
+
+
+def normalize_question(question: str) -> str:
+    """Normalize a question for exact matching: case, whitespace and trailing punctuation are ignored."""
+    return _whitespace_re.sub(" ", question).strip().rstrip("?!. ").lower()
+
+
+def _answer_from_chunks(documents: list[str]) -> Optional[str]:
+    """Get the answer of a QnA pair that was added before answers were stored in the metadata."""
+    if len(documents) != 1:
+        # The pair was split into several chunks, whose order isn't known
+        return None
+    _, separator, answer = documents[0].partition("\nA: ")
+    return answer if separator else None
+
+
+class QnaIndex:
+    """
+    In-process index of the questions of the `qna_pair` sources of an app.
+
+    A query is first looked up by its normalized text, then by the cosine similarity of its embedding to the
+    embeddings of the stored questions, in one matrix product. The index is loaded from the vector database on first
+    use and after `invalidate`, question embeddings are kept across reloads so that only new questions are embedded.
+    """
+
+    def __init__(
+        self,
+        load_fn: Callable[[], tuple[list[str], list[dict[str, Any]]]],
+        embedding_fn: Optional[Callable[[list[str]], list[list[float]]]] = None,
+        similarity_threshold: float = 0.9,
+    ):
+        """
+        Initialize the index.
+
+        :param load_fn: Function that returns the documents and metadatas of all stored `qna_pair` chunks
+        :type load_fn: Callable[[], tuple[list[str], list[dict[str, Any]]]]
+        :param embedding_fn: Function that embeds questions, only exact matches are found if None, defaults to None
+        :type embedding_fn: Optional[Callable[[list[str]], list[list[float]]]], optional
+        :param similarity_threshold: Minimum cosine similarity of a query to a stored question, defaults to 0.9
+        :type similarity_threshold: float, optional
+        """
+        self.load_fn = load_fn
+        self.embedding_fn = embedding_fn
+        self.similarity_threshold = similarity_threshold
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._pairs: list[QnaMatch] = []
+        self._exact: dict[str, int] = {}
+        self._vectors: Optional[np.ndarray] = None
+        self._embeddings: dict[str, np.ndarray] = {}
+
+    def invalidate(self):
+        """Reload the pairs from the database on the next lookup, e.g. because sources were added or deleted."""
+        with self._lock:
+            self._loaded = False
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        vectors = np.asarray(self.embedding_fn(texts), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def _load(self):
+        """Load the pairs from the database. Expects the lock to be held."""
+        documents, metadatas = self.load_fn()
+        chunks: dict[str, list[str]] = {}
+        pair_metadatas: dict[str, dict[str, Any]] = {}
+        for document, metadata in zip(documents or [None] * len(metadatas), metadatas):
+            question = metadata.get("question")
+            if question is None:
+                continue
+            pair_metadatas.setdefault(question, metadata)
+            if document is not None:
+                chunks.setdefault(question, []).append(document)
+
+        pairs = []
+        for question, metadata in pair_metadatas.items():
+            answer = metadata.get("answer") or _answer_from_chunks(chunks.get(question, []))
+            if answer is None:
+                logger.debug(f"Could not find the answer of the QnA pair {question!r}, it is answered by the LLM.")
+                continue
+            pairs.append(QnaMatch(question, answer, metadata, 1.0))
+
+        vectors = None
+        if self.embedding_fn is not None and pairs:
+            missing = [pair.question for pair in pairs if pair.question not in self._embeddings]
+            if missing:
+                self._embeddings.update(zip(missing, self._embed(missing)))
+            self._embeddings = {pair.question: self._embeddings[pair.question] for pair in pairs}
+            vectors = np.stack([self._embeddings[pair.question] for pair in pairs])
+
+        self._pairs = pairs
+        self._exact = {normalize_question(pair.question): i for i, pair in enumerate(pairs)}
+        self._vectors = vectors
+        self._loaded = True
+
+    def match(self, query: str) -> Optional[QnaMatch]:
+        """
+        Find the stored QnA pair whose question matches a query.
+
+        :param query: The query
+        :type query: str
+        :return: The best matching pair, None if no question is similar enough
+        :rtype: Optional[QnaMatch]
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            pairs, exact, vectors = self._pairs, self._exact, self._vectors
+
+        match = None
+        i = exact.get(normalize_question(query))
+        if i is not None:
+            match = pairs[i]
+        elif vectors is not None:
+            scores = vectors @ self._embed([query])[0]
+            best = int(np.argmax(scores))
+            if scores[best] >= self.similarity_threshold:
+                match = pairs[best]._replace(score=float(scores[best]))
+
+        with self._lock:
+            if match is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return match
+
+    def stats(self) -> dict[str, Any]:
+        """Get the number of indexed pairs, and the hits and misses of the lookups."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "pairs": len(self._pairs),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,75 @@
+import re
+from typing import Optional
+
+from embedchain.utils.tokens import count_tokens, truncate_to_tokens
+
+# Separator of the contexts in the prompt, see `BaseLlm.generate_prompt`
+CONTEXT_SEPARATOR = " | "
+
+_word_re = re.compile(r"\w+")
+
+
+def _shingles(text: str, size: int = 3) -> frozenset:
+    """Word n-grams of a text, or its words if it is shorter than one n-gram."""
+    words = _word_re.findall(text.lower())
+    if len(words) < size:
+        return frozenset(words)
+    return frozenset(tuple(words[i : i + size]) for i in range(len(words) - size + 1))
+
+
+def _similarity(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return float(a == b)
+    return len(a & b) / len(a | b)
+
+
+def pack_contexts(
+    contexts: list[str],
+    max_tokens: Optional[int] = None,
+    model: Optional[str] = None,
+    similarity_threshold: Optional[float] = 0.9,
+) -> list[str]:
+    """
+    Select the contexts that are passed to the LLM.
+
+    The contexts are expected in the order of their score, best first, as returned by the vector database. Contexts
+    that are near duplicates of a better context are dropped. The remaining contexts are added in order as long as
+    they fit in the token budget, and contexts that don't fit are skipped in favor of shorter ones further down.
+    If not even the best context fits, it is truncated to the budget.
+
+    :param contexts: Retrieved contexts, best first
+    :type contexts: list[str]
+    :param max_tokens: Token budget of all contexts, unlimited if None, defaults to None
+    :type max_tokens: Optional[int], optional
+    :param model: Name of the model whose tokenizer is used, defaults to None
+    :type model: Optional[str], optional
+    :param similarity_threshold: Jaccard similarity of the word trigrams above which a context is a near duplicate,
+    duplicates are kept if None, defaults to 0.9
+    :type similarity_threshold: Optional[float], optional
+    :return: The selected contexts, in order
+    :rtype: list[str]
+    """
+    if similarity_threshold is not None:
+        unique, seen = [], []
+        for context in contexts:
+            shingles = _shingles(context)
+            if any(_similarity(shingles, other) >= similarity_threshold for other in seen):
+                continue
+            unique.append(context)
+            seen.append(shingles)
+        contexts = unique
+
+    if max_tokens is None:
+        return contexts
+
+    packed = []
+    budget = max_tokens
+    separator_tokens = count_tokens(CONTEXT_SEPARATOR, model)
+    for context in contexts:
+        tokens = count_tokens(context, model) + (separator_tokens if packed else 0)
+        if tokens <= budget:
+            packed.append(context)
+            budget -= tokens
+    if not packed and contexts and max_tokens > 0:
+        packed.append(truncate_to_tokens(contexts[0], max_tokens, model))
+    return packed
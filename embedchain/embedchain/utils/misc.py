@@ -445,6 +445,8 @@ def validate_config(config_data):
                     Optional("api_version"): Or(str, datetime.date),
                     Optional("http_client_proxies"): Or(str, dict),
                     Optional("http_async_client_proxies"): Or(str, dict),
+                    Optional("max_context_tokens"): int,
+                    Optional("context_similarity_threshold"): Or(float, int, None),
                 },
             },
             Optional("vectordb"): {
@@ -512,6 +514,8 @@ def validate_config(config_data):
                 Optional("chunk_overlap"): int,
                 Optional("length_function"): str,
                 Optional("min_chunk_size"): int,
+                Optional("splitter"): Or("recursive", "token"),
+                Optional("tokenizer_model"): str,
             },
             Optional("cache"): {
                 Optional("similarity_evaluation"): {
@@ -522,11 +526,42 @@ def validate_config(config_data):
                 Optional("config"): {
                     Optional("similarity_threshold"): float,
                     Optional("auto_flush"): int,
+                    Optional("max_size"): int,
+                    Optional("ttl"): Or(float, int, None),
+                    Optional("eviction"): Or("LRU", "LFU", "FIFO"),
                 },
             },
             Optional("memory"): {
                 Optional("top_k"): int,
             },
+            Optional("embedding_cache"): {
+                Optional("path"): str,
+                Optional("max_entries"): Or(int, None),
+                Optional("max_size_mb"): Or(float, int, None),
+            },
+            Optional("hybrid_search"): {
+                Optional("path"): str,
+                Optional("fetch_k"): int,
+                Optional("rrf_k"): int,
+                Optional("vector_weight"): Or(float, int),
+                Optional("keyword_weight"): Or(float, int),
+            },
+            Optional("history_summary"): {
+                Optional("recent_rounds"): int,
+                Optional("token_budget"): int,
+                Optional("summary_tokens"): int,
+                Optional("max_sessions"): int,
+            },
+            Optional("context_compression"): {
+                Optional("max_sentences"): int,
+                Optional("min_similarity"): Or(float, int, None),
+                Optional("language"): str,
+                Optional("cache_size"): int,
+            },
+            Optional("qna_fast_path"): {
+                Optional("similarity_threshold"): Or(float, int),
+                Optional("semantic"): bool,
+            },
         }
     )
 
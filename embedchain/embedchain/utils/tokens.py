@@ -0,0 +1,107 @@
+import functools
+import json
+import logging
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Average number of characters per token of english text with the BPE tokenizers of common LLMs
+CHARS_PER_TOKEN = 4
+
+
+@functools.lru_cache(maxsize=32)
+def get_encoding(model: Optional[str] = None) -> Optional[Any]:
+    """
+    Get the tiktoken encoding of a model, `cl100k_base` for unknown models.
+
+    :param model: Name of the model, defaults to None
+    :type model: Optional[str], optional
+    :return: The encoding, None if tiktoken isn't installed or the encoding can't be loaded
+    :rtype: Optional[tiktoken.Encoding]
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        if model:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                pass
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        # The encodings are downloaded on first use, which fails offline
+        logger.debug(f"Could not load the tiktoken encoding, estimating token counts: {e}")
+        return None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Count the tokens of a text with tiktoken, or estimate them from its length if tiktoken is not available.
+
+    :param text: The text
+    :type text: str
+    :param model: Name of the model whose tokenizer is used, defaults to None
+    :type model: Optional[str], optional
+    :return: Number of tokens
+    :rtype: int
+    """
+    encoding = get_encoding(model)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: Optional[str] = None) -> str:
+    """
+    Cut a text to at most `max_tokens` tokens.
+
+    :param text: The text
+    :type text: str
+    :param max_tokens: Maximum number of tokens
+    :type max_tokens: int
+    :param model: Name of the model whose tokenizer is used, defaults to None
+    :type model: Optional[str], optional
+    :return: The start of the text
+    :rtype: str
+    """
+    if max_tokens <= 0:
+        return ""
+    encoding = get_encoding(model)
+    if encoding is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+@functools.lru_cache(maxsize=1)
+def _load_model_info() -> dict[str, dict[str, Any]]:
+    path = Path(__file__).resolve().parent.parent / "config" / "model_prices_and_context_window.json"
+    with path.open() as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=128)
+def get_max_input_tokens(model: Optional[str]) -> Optional[int]:
+    """
+    Get the size of the context window of a model from `model_prices_and_context_window.json`.
+
+    :param model: Name of the model, with or without the provider prefix, e.g. `gpt-4o` or `openai/gpt-4o`
+    :type model: Optional[str]
+    :return: Maximum number of input tokens, None for unknown models
+    :rtype: Optional[int]
+    """
+    if not model:
+        return None
+    model_info = _load_model_info()
+    info = model_info.get(model)
+    if info is None:
+        info = next((value for key, value in model_info.items() if key.split("/", 1)[-1] == model), None)
+    if info is None:
+        return None
+    return info.get("max_input_tokens") or info.get("max_tokens")
@@ -1,8 +1,35 @@
+import asyncio
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel
+
 from embedchain.config.vector_db.base import BaseVectorDbConfig
 from embedchain.embedder.base import BaseEmbedder
 from embedchain.helpers.json_serializable import JSONSerializable
 
 
+class InsertResult(BaseModel):
+    """Result of adding chunks to a vector database."""
+
+    inserted_ids: list[str] = []
+    skipped_ids: list[str] = []
+    failed_ids: list[str] = []
+
+    def merge(self, other: "InsertResult") -> "InsertResult":
+        """
+        Add the ids of another result to this result.
+
+        :param other: Result to merge into this one
+        :type other: InsertResult
+        :return: This result
+        :rtype: InsertResult
+        """
+        self.inserted_ids.extend(other.inserted_ids)
+        self.skipped_ids.extend(other.skipped_ids)
+        self.failed_ids.extend(other.failed_ids)
+        return self
+
+
 class BaseVectorDB(JSONSerializable):
     """Base class for vector database."""
 
@@ -44,14 +71,49 @@ class BaseVectorDB(JSONSerializable):
         """Get database embeddings by id."""
         raise NotImplementedError
 
-    def add(self):
-        """Add to database"""
+    def add(self) -> InsertResult:
+        """
+        Add to database
+
+        :return: ids of the chunks that were inserted, skipped or failed to insert
+        :rtype: InsertResult
+        """
         raise NotImplementedError
 
     def query(self):
         """Query contents from vector database based on vector similarity"""
         raise NotImplementedError
 
+    def query_batch(
+        self,
+        queries: list[str],
+        n_results: int,
+        where: Optional[dict[str, Any]] = None,
+        citations: bool = False,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> list[Union[list[tuple[str, dict]], list[str]]]:
+        """
+        Query contents for many queries at once.
+
+        Databases that support it embed all queries in one call and run one vectorized search. This default
+        implementation runs one `query` per query.
+
+        :param queries: query strings
+        :type queries: list[str]
+        :param n_results: no of similar documents to fetch from database for each query
+        :type n_results: int
+        :param where: to filter data, applied to every query
+        :type where: dict[str, Any], optional
+        :param citations: we use citations boolean param to return context along with the answer.
+        :type citations: bool, default is False.
+        :return: The result of `query` for every query, in the order of the queries
+        :rtype: list[Union[list[tuple[str, dict]], list[str]]]
+        """
+        return [
+            self.query(input_query=query, n_results=n_results, where=where, citations=citations, **kwargs)
+            for query in queries
+        ]
+
     def count(self) -> int:
         """
         Count number of documents/chunks embedded in the database.
@@ -80,3 +142,61 @@ class BaseVectorDB(JSONSerializable):
         """Delete from database."""
 
         raise NotImplementedError
+
+    def delete_ids(self, ids: list[str]):
+        """
+        Delete chunks from the database by their ids.
+
+        Used to delete only the stale chunks of a changed document. Databases that don't implement it
+        delete and re-embed all chunks of a changed document instead.
+
+        :param ids: ids of the chunks to delete
+        :type ids: list[str]
+        """
+        raise NotImplementedError
+
+    def update_metadata(self, ids: list[str], metadata: dict[str, Any]):
+        """
+        Set metadata fields of chunks, keeping their other fields.
+
+        Used to move the unchanged chunks of a changed document to its new doc_id. Databases that don't implement it
+        delete and re-embed all chunks of a changed document instead.
+
+        :param ids: ids of the chunks to update
+        :type ids: list[str]
+        :param metadata: Metadata fields to set
+        :type metadata: dict[str, Any]
+        """
+        raise NotImplementedError
+
+    async def aget(self, *args, **kwargs):
+        """
+        Async version of `get`.
+
+        Runs `get` in a worker thread by default, databases with an async client can override it.
+        """
+        return await asyncio.to_thread(self.get, *args, **kwargs)
+
+    async def aadd(self, *args, **kwargs):
+        """
+        Async version of `add`.
+
+        Runs `add` in a worker thread by default, databases with an async client can override it.
+        """
+        return await asyncio.to_thread(self.add, *args, **kwargs)
+
+    async def aquery(self, *args, **kwargs):
+        """
+        Async version of `query`.
+
+        Runs `query` in a worker thread by default, databases with an async client can override it.
+        """
+        return await asyncio.to_thread(self.query, *args, **kwargs)
+
+    async def acount(self) -> int:
+        """
+        Async version of `count`.
+
+        Runs `count` in a worker thread by default, databases with an async client can override it.
+        """
+        return await asyncio.to_thread(self.count)
@@ -7,7 +7,7 @@ from tqdm import tqdm
 
 from embedchain.config import ChromaDbConfig
 from embedchain.helpers.json_serializable import register_deserializable
-from embedchain.vectordb.base import BaseVectorDB
+from embedchain.vectordb.base import BaseVectorDB, InsertResult
 
 try:
     import chromadb
@@ -136,7 +136,7 @@ class ChromaDB(BaseVectorDB):
         documents: list[str],
         metadatas: list[object],
         ids: list[str],
-    ) -> Any:
+    ) -> InsertResult:
         """
         Add vectors to chroma database
 
@@ -160,24 +160,26 @@ class ChromaDB(BaseVectorDB):
                 metadatas=metadatas[i : i + self.batch_size],
                 ids=ids[i : i + self.batch_size],
             )
-        self.config
+        return InsertResult(inserted_ids=list(ids))
 
     @staticmethod
-    def _format_result(results: QueryResult) -> list[tuple[Document, float]]:
+    def _format_result(results: QueryResult, index: int = 0) -> list[tuple[Document, float]]:
         """
         Format Chroma results
 
         :param results: ChromaDB query results to format.
         :type results: QueryResult
+        :param index: Index of the query text to format the results of, defaults to 0
+        :type index: int, optional
         :return: Formatted results
         :rtype: list[tuple[Document, float]]
         """
         return [
             (Document(page_content=result[0], metadata=result[1] or {}), result[2])
             for result in zip(
-                results["documents"][0],
-                results["metadatas"][0],
-                results["distances"][0],
+                results["documents"][index],
+                results["metadatas"][index],
+                results["distances"][index],
             )
         ]
 
@@ -208,8 +210,40 @@ class ChromaDB(BaseVectorDB):
         along with url of the source and doc_id (if citations flag is true)
         :rtype: list[str], if citations=False, otherwise list[tuple[str, str, str]]
         """
+        return self.query_batch(
+            [input_query], n_results=n_results, where=where, raw_filter=raw_filter, citations=citations
+        )[0]
+
+    def query_batch(
+        self,
+        queries: list[str],
+        n_results: int,
+        where: Optional[dict[str, any]] = None,
+        raw_filter: Optional[dict[str, any]] = None,
+        citations: bool = False,
+        **kwargs: Optional[dict[str, any]],
+    ) -> list[Union[list[tuple[str, dict]], list[str]]]:
+        """
+        Query contents for many queries at once. All queries are embedded and searched in one collection query.
+
+        :param queries: query strings
+        :type queries: list[str]
+        :param n_results: no of similar documents to fetch from database for each query
+        :type n_results: int
+        :param where: to filter data
+        :type where: dict[str, Any]
+        :param raw_filter: Raw filter to apply
+        :type raw_filter: dict[str, Any]
+        :param citations: we use citations boolean param to return context along with the answer.
+        :type citations: bool, default is False.
+        :raises InvalidDimensionException: Dimensions do not match.
+        :return: The result of `query` for every query, in the order of the queries
+        :rtype: list[Union[list[tuple[str, dict]], list[str]]]
+        """
         if where and raw_filter:
             raise ValueError("Both `where` and `raw_filter` cannot be used together.")
+        if not queries:
+            return []
 
         where_clause = {}
         if raw_filter:
@@ -218,9 +252,7 @@ class ChromaDB(BaseVectorDB):
             where_clause = self._generate_where_clause(where)
         try:
             result = self.collection.query(
-                query_texts=[
-                    input_query,
-                ],
+                query_texts=list(queries),
                 n_results=n_results,
                 where=where_clause,
             )
@@ -230,17 +262,19 @@ class ChromaDB(BaseVectorDB):
                 + ". This is commonly a side-effect when an embedding function, different from the one used to add the"
                 " embeddings, is used to retrieve an embedding from the database."
             ) from None
-        results_formatted = self._format_result(result)
-        contexts = []
-        for result in results_formatted:
-            context = result[0].page_content
-            if citations:
-                metadata = result[0].metadata
-                metadata["score"] = result[1]
-                contexts.append((context, metadata))
-            else:
-                contexts.append(context)
-        return contexts
+
+        batch_contexts = []
+        for index in range(len(queries)):
+            contexts = []
+            for doc, score in self._format_result(result, index):
+                if citations:
+                    metadata = doc.metadata
+                    metadata["score"] = score
+                    contexts.append((doc.page_content, metadata))
+                else:
+                    contexts.append(doc.page_content)
+            batch_contexts.append(contexts)
+        return batch_contexts
 
     def set_collection_name(self, name: str):
         """
@@ -266,6 +300,29 @@ class ChromaDB(BaseVectorDB):
     def delete(self, where):
         return self.collection.delete(where=self._generate_where_clause(where))
 
+    def delete_ids(self, ids: list[str]):
+        """
+        Delete chunks from the database by their ids.
+
+        :param ids: ids of the chunks to delete
+        :type ids: list[str]
+        """
+        for i in range(0, len(ids), self.batch_size):
+            self.collection.delete(ids=ids[i : i + self.batch_size])
+
+    def update_metadata(self, ids: list[str], metadata: dict[str, Any]):
+        """
+        Set metadata fields of chunks, keeping their other fields.
+
+        :param ids: ids of the chunks to update
+        :type ids: list[str]
+        :param metadata: Metadata fields to set
+        :type metadata: dict[str, Any]
+        """
+        for i in range(0, len(ids), self.batch_size):
+            batch = ids[i : i + self.batch_size]
+            self.collection.update(ids=batch, metadatas=[dict(metadata) for _ in batch])
+
     def reset(self):
         """
         Resets the database. Deletes all embeddings irreversibly.
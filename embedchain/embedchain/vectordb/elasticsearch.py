@@ -12,7 +12,7 @@ except ImportError:
 from embedchain.config import ElasticsearchDBConfig
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.utils.misc import chunks
-from embedchain.vectordb.base import BaseVectorDB
+from embedchain.vectordb.base import BaseVectorDB, InsertResult
 
 logger = logging.getLogger(__name__)
 
@@ -125,7 +125,7 @@ class ElasticsearchDB(BaseVectorDB):
         metadatas: list[object],
         ids: list[str],
         **kwargs: Optional[dict[str, any]],
-    ) -> Any:
+    ) -> InsertResult:
         """
         add data in vector database
         :param documents: list of texts to add
@@ -138,6 +138,8 @@ class ElasticsearchDB(BaseVectorDB):
 
         embeddings = self.embedder.embedding_fn(documents)
 
+        all_ids = list(ids)
+        failed_ids = set()
         for chunk in chunks(
             list(zip(ids, documents, metadatas, embeddings)),
             self.batch_size,
@@ -159,8 +161,16 @@ class ElasticsearchDB(BaseVectorDB):
                         "_source": {"text": text, "metadata": metadata, "embeddings": embedding},
                     }
                 )
-            bulk(self.client, batch_docs, **kwargs)
+            response = bulk(self.client, batch_docs, **kwargs)
+            # Errors are only returned instead of raised with `raise_on_error=False`
+            errors = response[1] if isinstance(response, tuple) else []
+            if isinstance(errors, list):
+                failed_ids.update(next(iter(error.values()))["_id"] for error in errors)
         self.client.indices.refresh(index=self._get_index())
+        return InsertResult(
+            inserted_ids=[id for id in all_ids if id not in failed_ids],
+            failed_ids=[id for id in all_ids if id in failed_ids],
+        )
 
     def query(
         self,
@@ -189,6 +199,48 @@ class ElasticsearchDB(BaseVectorDB):
         input_query_vector = self.embedder.embedding_fn([input_query])
         query_vector = input_query_vector[0]
 
+        query = self._build_query(query_vector, where)
+        _source = ["text", "metadata"]
+        response = self.client.search(index=self._get_index(), query=query, _source=_source, size=n_results)
+        return self._format_hits(response["hits"]["hits"], citations)
+
+    def query_batch(
+        self,
+        queries: list[str],
+        n_results: int,
+        where: Optional[dict[str, any]] = None,
+        citations: bool = False,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> list[Union[list[tuple[str, dict]], list[str]]]:
+        """
+        Query contents for many queries at once. All queries are embedded in one call and sent in one
+        multi search request.
+
+        :param queries: query strings
+        :type queries: list[str]
+        :param n_results: no of similar documents to fetch from database for each query
+        :type n_results: int
+        :param where: Optional. to filter data
+        :type where: dict[str, any]
+        :param citations: we use citations boolean param to return context along with the answer.
+        :type citations: bool, default is False.
+        :return: The result of `query` for every query, in the order of the queries
+        :rtype: list[Union[list[tuple[str, dict]], list[str]]]
+        """
+        if not queries:
+            return []
+        query_vectors = self.embedder.embedding_fn(list(queries))
+        searches = []
+        for query_vector in query_vectors:
+            searches.append({"index": self._get_index()})
+            searches.append(
+                {"query": self._build_query(query_vector, where), "_source": ["text", "metadata"], "size": n_results}
+            )
+        response = self.client.msearch(searches=searches)
+        return [self._format_hits(result["hits"]["hits"], citations) for result in response["responses"]]
+
+    @staticmethod
+    def _build_query(query_vector: list[float], where: Optional[dict[str, any]]) -> dict[str, Any]:
         # `https://www.elastic.co/guide/en/elasticsearch/reference/7.17/query-dsl-script-score-query.html`
         query = {
             "script_score": {
@@ -203,10 +255,10 @@ class ElasticsearchDB(BaseVectorDB):
         if where:
             for key, value in where.items():
                 query["script_score"]["query"]["bool"]["must"].append({"term": {f"metadata.{key}.keyword": value}})
+        return query
 
-        _source = ["text", "metadata"]
-        response = self.client.search(index=self._get_index(), query=query, _source=_source, size=n_results)
-        docs = response["hits"]["hits"]
+    @staticmethod
+    def _format_hits(docs: list[dict], citations: bool) -> Union[list[tuple[str, dict]], list[str]]:
         contexts = []
         for doc in docs:
             context = doc["_source"]["text"]
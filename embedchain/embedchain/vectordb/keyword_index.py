@@ -0,0 +1,177 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Optional
+
+from embedchain.constants import CONFIG_DIR
+
+logger = logging.getLogger(__name__)
+
+KEYWORD_INDEX_PATH = os.path.join(CONFIG_DIR, "keyword_index.db")
+
+_TOKEN_RE = re.compile(r"[\w\-]+", re.UNICODE)
+
+
+class KeywordIndex:
+    """
+    Local BM25 index of the chunks stored in the vector database.
+
+    The index is a sqlite FTS5 table that is updated incrementally whenever chunks are inserted or deleted, so that
+    keyword search is available for every vector database, including the ones without full-text search. Chunks are
+    keyed by their id and the name of the collection they belong to, their metadata is stored as JSON to apply the
+    same equality filters as the vector database.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the keyword index.
+
+        :param path: Path to the sqlite file of the index, defaults to `~/.embedchain/keyword_index.db`
+        :type path: Optional[str], optional
+        """
+        self.path = path or KEYWORD_INDEX_PATH
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS ec_keyword_index USING fts5(
+                    text,
+                    chunk_id UNINDEXED,
+                    collection UNINDEXED,
+                    metadata UNINDEXED,
+                    tokenize = "unicode61 tokenchars '-_'"
+                )
+                """
+            )
+
+    @staticmethod
+    def _match_expression(query: str) -> Optional[str]:
+        """Build a FTS5 query that matches any of the terms of the query, `None` if the query has no terms."""
+        terms = list(dict.fromkeys(term.lower() for term in _TOKEN_RE.findall(query)))
+        if not terms:
+            return None
+        # Quoting the terms keeps FTS5 operators (AND, NOT, NEAR, ...) in the query from being interpreted
+        return " OR ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+    @staticmethod
+    def _where_clause(where: Optional[dict[str, Any]]) -> tuple[str, list[Any]]:
+        """
+        Translate an equality filter to sql. Raises `ValueError` for filters that use operators.
+        """
+        clauses, params = [], []
+        for key, value in (where or {}).items():
+            if key.startswith("$") or isinstance(value, (dict, list)):
+                raise ValueError(f"Filter on {key} is not supported by the keyword index")
+            clauses.append("json_extract(metadata, ?) = ?")
+            params.extend([f"$.{key}", value])
+        return "".join(f" AND {clause}" for clause in clauses), params
+
+    def add(self, ids: list[str], documents: list[str], metadatas: list[dict[str, Any]], collection: str):
+        """
+        Add chunks to the index, chunks that are already indexed are replaced.
+        """
+        rows = [
+            (document, id, collection, json.dumps(metadata or {}))
+            for id, document, metadata in zip(ids, documents, metadatas)
+        ]
+        with self._lock:
+            with self._connection:
+                self._delete_ids(ids, collection)
+                self._connection.executemany(
+                    "INSERT INTO ec_keyword_index (text, chunk_id, collection, metadata) VALUES (?, ?, ?, ?)", rows
+                )
+
+    def search(
+        self, query: str, n_results: int, collection: str, where: Optional[dict[str, Any]] = None
+    ) -> list[tuple[str, dict[str, Any], float]]:
+        """
+        Search the index with BM25.
+
+        :param query: Query text, matched against chunks that contain any of its terms
+        :type query: str
+        :param n_results: Number of chunks to return
+        :type n_results: int
+        :param collection: Name of the collection to search in
+        :type collection: str
+        :param where: Equality filter on the metadata of the chunks, defaults to None
+        :type where: Optional[dict[str, Any]], optional
+        :raises ValueError: If the filter uses operators
+        :return: (text, metadata, score) of the best matching chunks, best match first
+        :rtype: list[tuple[str, dict[str, Any], float]]
+        """
+        expression = self._match_expression(query)
+        if expression is None:
+            return []
+        where_clause, where_params = self._where_clause(where)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT text, metadata, bm25(ec_keyword_index) AS score FROM ec_keyword_index "
+                f"WHERE ec_keyword_index MATCH ? AND collection = ?{where_clause} ORDER BY score LIMIT ?",
+                [expression, collection, *where_params, n_results],
+            ).fetchall()
+        # sqlite returns negated BM25 scores, so that the best match has the lowest score
+        return [(text, json.loads(metadata), -score) for text, metadata, score in rows]
+
+    def _delete_ids(self, ids: list[str], collection: str):
+        """Delete chunks by id. Expects the lock to be held."""
+        # Stay below the default limit of sqlite host parameters
+        for i in range(0, len(ids), 500):
+            batch = ids[i : i + 500]
+            placeholders = ",".join("?" * len(batch))
+            self._connection.execute(
+                f"DELETE FROM ec_keyword_index WHERE collection = ? AND chunk_id IN ({placeholders})",
+                [collection, *batch],
+            )
+
+    def delete_ids(self, ids: list[str], collection: str):
+        """Delete chunks by id."""
+        with self._lock:
+            with self._connection:
+                self._delete_ids(ids, collection)
+
+    def update_metadata(self, ids: list[str], metadata: dict[str, Any], collection: str):
+        """Set metadata fields of chunks, keeping their other fields."""
+        patch = json.dumps(metadata)
+        with self._lock:
+            with self._connection:
+                for i in range(0, len(ids), 500):
+                    batch = ids[i : i + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    self._connection.execute(
+                        "UPDATE ec_keyword_index SET metadata = json_patch(metadata, ?) "
+                        f"WHERE collection = ? AND chunk_id IN ({placeholders})",
+                        [patch, collection, *batch],
+                    )
+
+    def delete(self, where: dict[str, Any], collection: str):
+        """Delete all chunks whose metadata matches the equality filter."""
+        if not where:
+            raise ValueError("A filter is required to delete chunks, use `reset` to delete all chunks")
+        where_clause, where_params = self._where_clause(where)
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    f"DELETE FROM ec_keyword_index WHERE collection = ?{where_clause}", [collection, *where_params]
+                )
+
+    def reset(self, collection: str):
+        """Delete all chunks of a collection."""
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM ec_keyword_index WHERE collection = ?", [collection])
+
+    def count(self, collection: str) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM ec_keyword_index WHERE collection = ?", [collection]
+            ).fetchone()[0]
+
+    def close(self):
+        self._connection.close()
@@ -1,5 +1,6 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pyarrow as pa
 
 try:
@@ -9,7 +10,7 @@ except ImportError:
 
 from embedchain.config.vector_db.lancedb import LanceDBConfig
 from embedchain.helpers.json_serializable import register_deserializable
-from embedchain.vectordb.base import BaseVectorDB
+from embedchain.vectordb.base import BaseVectorDB, InsertResult
 
 
 @register_deserializable
@@ -171,7 +172,7 @@ class LanceDB(BaseVectorDB):
         documents: List[str],
         metadatas: List[object],
         ids: List[str],
-    ) -> Any:
+    ) -> InsertResult:
         """
         Add vectors to lancedb database
 
@@ -182,26 +183,34 @@ class LanceDB(BaseVectorDB):
         :param ids: ids
         :type ids: List[str]
         """
-        data = []
-        to_ingest = list(zip(documents, metadatas, ids))
+        columns = {
+            "doc": pa.array(documents, type=pa.string()),
+            "metadata": pa.array([str(meta) for meta in metadatas], type=pa.string()),
+            "id": pa.array(ids, type=pa.string()),
+        }
+        if self.embedder_check:
+            columns["vector"] = self._embed_documents(documents)
+
+        schema = self.collection.schema
+        data = pa.Table.from_arrays([columns[name] for name in schema.names], schema=schema)
+        self.collection.add(data=data)
+        return InsertResult(inserted_ids=list(ids))
 
-        if not self.embedder_check:
-            for doc, meta, id in to_ingest:
-                temp = {}
-                temp["doc"] = doc
-                temp["metadata"] = str(meta)
-                temp["id"] = id
-                data.append(temp)
-        else:
-            for doc, meta, id in to_ingest:
-                temp = {}
-                temp["doc"] = doc
-                temp["vector"] = self.embedder.embedding_fn([doc])[0]
-                temp["metadata"] = str(meta)
-                temp["id"] = id
-                data.append(temp)
+    def _embed_documents(self, documents: List[str]) -> pa.FixedSizeListArray:
+        """
+        Embed documents in batches of `config.batch_size` and return them as a fixed size float32 vector column.
 
-        self.collection.add(data=data)
+        :param documents: Documents to embed
+        :type documents: List[str]
+        :return: Vector column
+        :rtype: pa.FixedSizeListArray
+        """
+        dimension = self.embedder.vector_dimension
+        vectors = np.empty((len(documents), dimension), dtype=np.float32)
+        for i in range(0, len(documents), self.config.batch_size):
+            embeddings = self.embedder.embedding_fn(documents[i : i + self.config.batch_size])
+            vectors[i : i + len(embeddings)] = np.asarray(embeddings, dtype=np.float32)
+        return pa.FixedSizeListArray.from_arrays(pa.array(vectors.reshape(-1), type=pa.float32()), dimension)
 
     def _format_result(self, results) -> list:
         """
@@ -241,24 +250,54 @@ class LanceDB(BaseVectorDB):
         along with url of the source and doc_id (if citations flag is true)
         :rtype: list[str], if citations=False, otherwise list[tuple[str, str, str]]
         """
+        return self.query_batch(
+            [input_query], n_results=n_results, where=where, raw_filter=raw_filter, citations=citations
+        )[0]
+
+    def query_batch(
+        self,
+        queries: list[str],
+        n_results: int = 3,
+        where: Optional[dict[str, any]] = None,
+        raw_filter: Optional[dict[str, any]] = None,
+        citations: bool = False,
+        **kwargs: Optional[dict[str, any]],
+    ) -> list[Union[list[tuple[str, dict]], list[str]]]:
+        """
+        Query contents for many queries at once. All queries are embedded in one call, LanceDB then searches
+        the local table once per query vector.
+
+        :param queries: query strings
+        :type queries: list[str]
+        :param n_results: no of similar documents to fetch from database for each query
+        :type n_results: int
+        :param where: to filter data
+        :type where: dict[str, Any]
+        :param raw_filter: Raw filter to apply
+        :type raw_filter: dict[str, Any]
+        :param citations: we use citations boolean param to return context along with the answer.
+        :type citations: bool, default is False.
+        :return: The result of `query` for every query, in the order of the queries
+        :rtype: list[Union[list[tuple[str, dict]], list[str]]]
+        """
         if where and raw_filter:
             raise ValueError("Both `where` and `raw_filter` cannot be used together.")
-        try:
-            query_embedding = self.embedder.embedding_fn(input_query)[0]
-            result = self.collection.search(query_embedding).limit(n_results).to_list()
-        except Exception as e:
-            e.message()
-
-        results_formatted = result
-
-        contexts = []
-        for result in results_formatted:
-            if citations:
-                metadata = result["metadata"]
-                contexts.append((result["doc"], metadata))
-            else:
-                contexts.append(result["doc"])
-        return contexts
+        if not queries:
+            return []
+
+        query_embeddings = self.embedder.embedding_fn(list(queries))
+        batch_contexts = []
+        for query_embedding in query_embeddings:
+            results = self.collection.search(query_embedding).limit(n_results).to_list()
+            contexts = []
+            for result in results:
+                if citations:
+                    metadata = result["metadata"]
+                    contexts.append((result["doc"], metadata))
+                else:
+                    contexts.append(result["doc"])
+            batch_contexts.append(contexts)
+        return batch_contexts
 
     def set_collection_name(self, name: str):
         """
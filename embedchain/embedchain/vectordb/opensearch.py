@@ -17,7 +17,7 @@ from langchain_community.vectorstores import OpenSearchVectorSearch
 
 from embedchain.config import OpenSearchDBConfig
 from embedchain.helpers.json_serializable import register_deserializable
-from embedchain.vectordb.base import BaseVectorDB
+from embedchain.vectordb.base import BaseVectorDB, InsertResult
 
 logger = logging.getLogger(__name__)
 
@@ -115,10 +115,13 @@ class OpenSearchDB(BaseVectorDB):
             result["metadatas"].append({"doc_id": doc_id})
         return result
 
-    def add(self, documents: list[str], metadatas: list[object], ids: list[str], **kwargs: Optional[dict[str, any]]):
+    def add(
+        self, documents: list[str], metadatas: list[object], ids: list[str], **kwargs: Optional[dict[str, any]]
+    ) -> InsertResult:
         """Adds documents to the opensearch index"""
 
         embeddings = self.embedder.embedding_fn(documents)
+        failed_ids = set()
         for batch_start in tqdm(range(0, len(documents), self.batch_size), desc="Inserting batches in opensearch"):
             batch_end = batch_start + self.batch_size
             batch_documents = documents[batch_start:batch_end]
@@ -137,12 +140,21 @@ class OpenSearchDB(BaseVectorDB):
             ]
 
             # Perform bulk operation
-            bulk(self.client, batch_entries, **kwargs)
+            response = bulk(self.client, batch_entries, **kwargs)
+            # Errors are only returned instead of raised with `raise_on_error=False`
+            errors = response[1] if isinstance(response, tuple) else []
+            if isinstance(errors, list):
+                failed_ids.update(next(iter(error.values()))["_id"] for error in errors)
             self.client.indices.refresh(index=self._get_index())
 
             # Sleep to avoid rate limiting
             time.sleep(0.1)
 
+        return InsertResult(
+            inserted_ids=[id for id in ids if id not in failed_ids],
+            failed_ids=[id for id in ids if id in failed_ids],
+        )
+
     def query(
         self,
         input_query: str,
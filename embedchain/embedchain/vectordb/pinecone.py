@@ -14,7 +14,7 @@ from pinecone_text.sparse import BM25Encoder
 from embedchain.config.vector_db.pinecone import PineconeDBConfig
 from embedchain.helpers.json_serializable import register_deserializable
 from embedchain.utils.misc import chunks
-from embedchain.vectordb.base import BaseVectorDB
+from embedchain.vectordb.base import BaseVectorDB, InsertResult
 
 logger = logging.getLogger(__name__)
 
@@ -117,7 +117,7 @@ class PineconeDB(BaseVectorDB):
         metadatas: list[object],
         ids: list[str],
         **kwargs: Optional[dict[str, any]],
-    ):
+    ) -> InsertResult:
         """add data in vector database
 
         :param documents: list of texts to add
@@ -145,6 +145,7 @@ class PineconeDB(BaseVectorDB):
 
         for chunk in chunks(docs, self.batch_size, desc="Adding chunks in batches"):
             self.pinecone_index.upsert(chunk, **kwargs)
+        return InsertResult(inserted_ids=list(ids))
 
     def query(
         self,
@@ -170,11 +171,77 @@ class PineconeDB(BaseVectorDB):
         Returns:
             Union[list[tuple[str, dict]], list[str]]: List of document contexts, optionally with metadata.
         """
+        query_vector = self.embedder.embedding_fn([input_query])[0]
+        return self._query_vector(
+            input_query,
+            query_vector,
+            n_results,
+            where=where,
+            raw_filter=raw_filter,
+            citations=citations,
+            app_id=app_id,
+            **kwargs,
+        )
+
+    def query_batch(
+        self,
+        queries: list[str],
+        n_results: int,
+        where: Optional[dict[str, any]] = None,
+        raw_filter: Optional[dict[str, any]] = None,
+        citations: bool = False,
+        app_id: Optional[str] = None,
+        **kwargs: Optional[dict[str, any]],
+    ) -> list[Union[list[tuple[str, dict]], list[str]]]:
+        """
+        Query contents for many queries at once.
+
+        All queries are embedded in one call. Pinecone searches one vector per request, so the searches are still
+        sent one by one.
+
+        Args:
+            queries (list[str]): query strings.
+            n_results (int): Number of similar documents to fetch from the database for each query.
+            where (dict[str, any], optional): Filter criteria for the search.
+            raw_filter (dict[str, any], optional): Advanced raw filter criteria for the search.
+            citations (bool, optional): Flag to return context along with metadata. Defaults to False.
+            app_id (str, optional): Application ID to be passed to Pinecone.
+
+        Returns:
+            list[Union[list[tuple[str, dict]], list[str]]]: The result of `query` for every query.
+        """
+        if not queries:
+            return []
+        query_vectors = self.embedder.embedding_fn(list(queries))
+        return [
+            self._query_vector(
+                input_query,
+                query_vector,
+                n_results,
+                where=where,
+                raw_filter=raw_filter,
+                citations=citations,
+                app_id=app_id,
+                **kwargs,
+            )
+            for input_query, query_vector in zip(queries, query_vectors)
+        ]
+
+    def _query_vector(
+        self,
+        input_query: str,
+        query_vector: list[float],
+        n_results: int,
+        where: Optional[dict[str, any]] = None,
+        raw_filter: Optional[dict[str, any]] = None,
+        citations: bool = False,
+        app_id: Optional[str] = None,
+        **kwargs: Optional[dict[str, any]],
+    ) -> Union[list[tuple[str, dict]], list[str]]:
         query_filter = raw_filter if raw_filter is not None else self._generate_filter(where)
         if app_id:
             query_filter["app_id"] = {"$eq": app_id}
 
-        query_vector = self.embedder.embedding_fn([input_query])[0]
         params = {
             "vector": query_vector,
             "filter": query_filter,
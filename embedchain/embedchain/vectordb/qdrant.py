@@ -13,7 +13,7 @@ except ImportError:
 from tqdm import tqdm
 
 from embedchain.config.vector_db.qdrant import QdrantDBConfig
-from embedchain.vectordb.base import BaseVectorDB
+from embedchain.vectordb.base import BaseVectorDB, InsertResult
 
 
 class QdrantDB(BaseVectorDB):
@@ -129,7 +129,7 @@ class QdrantDB(BaseVectorDB):
         metadatas: list[object],
         ids: list[str],
         **kwargs: Optional[dict[str, any]],
-    ):
+    ) -> InsertResult:
         """add data in vector database
         :param documents: list of texts to add
         :type documents: list[str]
@@ -157,6 +157,7 @@ class QdrantDB(BaseVectorDB):
                 ),
                 **kwargs,
             )
+        return InsertResult(inserted_ids=qdrant_ids)
 
     def query(
         self,
@@ -181,6 +182,51 @@ class QdrantDB(BaseVectorDB):
         :rtype: list[str], if citations=False, otherwise list[tuple[str, str, str]]
         """
         query_vector = self.embedder.embedding_fn([input_query])[0]
+        results = self.client.search(
+            collection_name=self.collection_name,
+            query_filter=self._generate_filter(where),
+            query_vector=query_vector,
+            limit=n_results,
+            **kwargs,
+        )
+        return self._format_results(results, citations)
+
+    def query_batch(
+        self,
+        queries: list[str],
+        n_results: int,
+        where: Optional[dict[str, any]] = None,
+        citations: bool = False,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> list[Union[list[tuple[str, dict]], list[str]]]:
+        """
+        Query contents for many queries at once. All queries are embedded in one call and searched in one batch
+        request.
+
+        :param queries: query strings
+        :type queries: list[str]
+        :param n_results: no of similar documents to fetch from database for each query
+        :type n_results: int
+        :param where: Optional. to filter data
+        :type where: dict[str, any]
+        :param citations: we use citations boolean param to return context along with the answer.
+        :type citations: bool, default is False.
+        :return: The result of `query` for every query, in the order of the queries
+        :rtype: list[Union[list[tuple[str, dict]], list[str]]]
+        """
+        if not queries:
+            return []
+        query_vectors = self.embedder.embedding_fn(list(queries))
+        query_filter = self._generate_filter(where)
+        requests = [
+            models.QueryRequest(query=query_vector, filter=query_filter, limit=n_results, with_payload=True, **kwargs)
+            for query_vector in query_vectors
+        ]
+        responses = self.client.query_batch_points(collection_name=self.collection_name, requests=requests)
+        return [self._format_results(response.points, citations) for response in responses]
+
+    @staticmethod
+    def _generate_filter(where: Optional[dict[str, any]]) -> models.Filter:
         keys = set(where.keys() if where is not None else set())
 
         qdrant_must_filters = []
@@ -194,15 +240,10 @@ class QdrantDB(BaseVectorDB):
                         ),
                     )
                 )
+        return models.Filter(must=qdrant_must_filters)
 
-        results = self.client.search(
-            collection_name=self.collection_name,
-            query_filter=models.Filter(must=qdrant_must_filters),
-            query_vector=query_vector,
-            limit=n_results,
-            **kwargs,
-        )
-
+    @staticmethod
+    def _format_results(results: list, citations: bool) -> Union[list[tuple[str, dict]], list[str]]:
         contexts = []
         for result in results:
             context = result.payload["text"]
@@ -251,3 +292,31 @@ class QdrantDB(BaseVectorDB):
     def delete(self, where: dict):
         db_filter = self._generate_query(where)
         self.client.delete(collection_name=self.collection_name, points_selector=db_filter)
+
+    def delete_ids(self, ids: list[str]):
+        """
+        Delete chunks from the database by their ids.
+
+        :param ids: ids of the chunks to delete
+        :type ids: list[str]
+        """
+        if not ids:
+            return
+        db_filter = models.Filter(must=[models.FieldCondition(key="identifier", match=models.MatchAny(any=ids))])
+        self.client.delete(collection_name=self.collection_name, points_selector=db_filter)
+
+    def update_metadata(self, ids: list[str], metadata: dict[str, Any]):
+        """
+        Set metadata fields of chunks, keeping their other fields.
+
+        :param ids: ids of the chunks to update
+        :type ids: list[str]
+        :param metadata: Metadata fields to set
+        :type metadata: dict[str, Any]
+        """
+        if not ids:
+            return
+        db_filter = models.Filter(must=[models.FieldCondition(key="identifier", match=models.MatchAny(any=ids))])
+        self.client.set_payload(
+            collection_name=self.collection_name, payload=metadata, points=db_filter, key="metadata"
+        )
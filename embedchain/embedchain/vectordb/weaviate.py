@@ -11,7 +11,7 @@ except ImportError:
 
 from embedchain.config.vector_db.weaviate import WeaviateDBConfig
 from embedchain.helpers.json_serializable import register_deserializable
-from embedchain.vectordb.base import BaseVectorDB
+from embedchain.vectordb.base import BaseVectorDB, InsertResult
 
 
 @register_deserializable
@@ -187,7 +187,9 @@ class WeaviateDB(BaseVectorDB):
 
         return {"ids": existing_ids, "metadatas": metadatas}
 
-    def add(self, documents: list[str], metadatas: list[object], ids: list[str], **kwargs: Optional[dict[str, any]]):
+    def add(
+        self, documents: list[str], metadatas: list[object], ids: list[str], **kwargs: Optional[dict[str, any]]
+    ) -> InsertResult:
         """add data in vector database
         :param documents: list of texts to add
         :type documents: list[str]
@@ -216,6 +218,7 @@ class WeaviateDB(BaseVectorDB):
                 batch.add_reference(
                     obj_uuid, self.index_name, "metadata", metadata_uuid, self.index_name + "_metadata", **kwargs
                 )
+        return InsertResult(inserted_ids=list(ids))
 
     def query(
         self, input_query: str, n_results: int, where: dict[str, any], citations: bool = False
@@ -235,12 +238,58 @@ class WeaviateDB(BaseVectorDB):
         :rtype: list[str], if citations=False, otherwise list[tuple[str, str, str]]
         """
         query_vector = self.embedder.embedding_fn([input_query])[0]
+        results = self._build_get_query(query_vector, n_results, where, citations).do()
+
+        if results["data"]["Get"].get(self.index_name) is None:
+            return []
+
+        return self._format_docs(results["data"]["Get"].get(self.index_name), citations)
+
+    def query_batch(
+        self,
+        queries: list[str],
+        n_results: int,
+        where: Optional[dict[str, any]] = None,
+        citations: bool = False,
+        **kwargs,
+    ) -> list[Union[list[tuple[str, dict]], list[str]]]:
+        """
+        Query contents for many queries at once. All queries are embedded in one call and sent in one GraphQL
+        request, with one aliased `Get` per query.
+
+        :param queries: query strings
+        :type queries: list[str]
+        :param n_results: no of similar documents to fetch from database for each query
+        :type n_results: int
+        :param where: Optional. to filter data
+        :type where: dict[str, any]
+        :param citations: we use citations boolean param to return context along with the answer.
+        :type citations: bool, default is False.
+        :return: The result of `query` for every query, in the order of the queries
+        :rtype: list[Union[list[tuple[str, dict]], list[str]]]
+        """
+        if not queries:
+            return []
+        query_vectors = self.embedder.embedding_fn(list(queries))
+        aliases = [f"query_{i}" for i in range(len(queries))]
+        get_queries = [
+            self._build_get_query(query_vector, n_results, where, citations).with_alias(alias)
+            for alias, query_vector in zip(aliases, query_vectors)
+        ]
+        results = self.client.query.multi_get(get_queries).do()
+        docs = results["data"]["Get"]
+        return [self._format_docs(docs.get(alias) or [], citations) for alias in aliases]
+
+    def _build_get_query(
+        self, query_vector: list[float], n_results: int, where: Optional[dict[str, any]], citations: bool
+    ):
         keys = set(where.keys() if where is not None else set())
         data_fields = ["text"]
         query_metadata_keys = self.metadata_keys.union(keys)
         if citations:
             data_fields.append(weaviate.LinkTo("metadata", self.index_name + "_metadata", list(query_metadata_keys)))
 
+        get_query = self.client.query.get(self.index_name, data_fields)
         if len(keys) > 0:
             weaviate_where_operands = []
             for key in keys:
@@ -255,28 +304,12 @@ class WeaviateDB(BaseVectorDB):
                 weaviate_where_clause = weaviate_where_operands[0]
             else:
                 weaviate_where_clause = {"operator": "And", "operands": weaviate_where_operands}
+            get_query = get_query.with_where(weaviate_where_clause)
 
-            results = (
-                self.client.query.get(self.index_name, data_fields)
-                .with_where(weaviate_where_clause)
-                .with_near_vector({"vector": query_vector})
-                .with_limit(n_results)
-                .with_additional(["distance"])
-                .do()
-            )
-        else:
-            results = (
-                self.client.query.get(self.index_name, data_fields)
-                .with_near_vector({"vector": query_vector})
-                .with_limit(n_results)
-                .with_additional(["distance"])
-                .do()
-            )
-
-        if results["data"]["Get"].get(self.index_name) is None:
-            return []
+        return get_query.with_near_vector({"vector": query_vector}).with_limit(n_results).with_additional(["distance"])
 
-        docs = results["data"]["Get"].get(self.index_name)
+    @staticmethod
+    def _format_docs(docs: list[dict], citations: bool) -> Union[list[tuple[str, dict]], list[str]]:
         contexts = []
         for doc in docs:
             context = doc["text"]
@@ -3,7 +3,7 @@ from typing import Any, Optional, Union
 
 from embedchain.config import ZillizDBConfig
 from embedchain.helpers.json_serializable import register_deserializable
-from embedchain.vectordb.base import BaseVectorDB
+from embedchain.vectordb.base import BaseVectorDB, InsertResult
 
 try:
     from pymilvus import (Collection, CollectionSchema, DataType, FieldSchema,
@@ -124,7 +124,7 @@ class ZillizVectorDB(BaseVectorDB):
         metadatas: list[object],
         ids: list[str],
         **kwargs: Optional[dict[str, any]],
-    ):
+    ) -> InsertResult:
         """Add to database"""
         embeddings = self.embedder.embedding_fn(documents)
 
@@ -135,6 +135,7 @@ class ZillizVectorDB(BaseVectorDB):
         self.collection.load()
         self.collection.flush()
         self.client.flush(self.config.collection_name)
+        return InsertResult(inserted_ids=list(ids))
 
     def query(
         self,
@@ -164,33 +165,62 @@ class ZillizVectorDB(BaseVectorDB):
         if self.collection.is_empty:
             return []
 
+        return self.query_batch([input_query], n_results=n_results, where=where, citations=citations, **kwargs)[0]
+
+    def query_batch(
+        self,
+        queries: list[str],
+        n_results: int,
+        where: Optional[dict[str, Any]] = None,
+        citations: bool = False,
+        **kwargs: Optional[dict[str, Any]],
+    ) -> list[Union[list[tuple[str, dict]], list[str]]]:
+        """
+        Query contents for many queries at once. All queries are embedded in one call and searched in one
+        vectorized search.
+
+        :param queries: query strings
+        :type queries: list[str]
+        :param n_results: no of similar documents to fetch from database for each query
+        :type n_results: int
+        :param where: to filter data
+        :type where: dict[str, Any]
+        :param citations: we use citations boolean param to return context along with the answer.
+        :type citations: bool, default is False.
+        :return: The result of `query` for every query, in the order of the queries
+        :rtype: list[Union[list[tuple[str, dict]], list[str]]]
+        """
+        if not queries or self.collection.is_empty:
+            return [[] for _ in queries]
+
         output_fields = ["*"]
-        input_query_vector = self.embedder.embedding_fn([input_query])
-        query_vector = input_query_vector[0]
+        query_vectors = self.embedder.embedding_fn(list(queries))
 
         query_filter = self._generate_zilliz_filter(where)
-        query_result = self.client.search(
+        query_results = self.client.search(
             collection_name=self.config.collection_name,
-            data=[query_vector],
+            data=query_vectors,
             filter=query_filter,
             limit=n_results,
             output_fields=output_fields,
             **kwargs,
         )
-        query_result = query_result[0]
-        contexts = []
-        for query in query_result:
-            data = query["entity"]
-            score = query["distance"]
-            context = data["text"]
-
-            if citations:
-                metadata = data.get("metadata", {})
-                metadata["score"] = score
-                contexts.append(tuple((context, metadata)))
-            else:
-                contexts.append(context)
-        return contexts
+        batch_contexts = []
+        for query_result in query_results:
+            contexts = []
+            for query in query_result:
+                data = query["entity"]
+                score = query["distance"]
+                context = data["text"]
+
+                if citations:
+                    metadata = data.get("metadata", {})
+                    metadata["score"] = score
+                    contexts.append(tuple((context, metadata)))
+                else:
+                    contexts.append(context)
+            batch_contexts.append(contexts)
+        return batch_contexts
 
     def count(self) -> int:
         """
@@ -243,3 +273,31 @@ class ZillizVectorDB(BaseVectorDB):
         keys = data.get("ids", [])
         if keys:
             self.client.delete(collection_name=self.config.collection_name, pks=keys)
+
+    def delete_ids(self, ids: list[str]):
+        """
+        Delete chunks from the database by their ids.
+
+        :param ids: ids of the chunks to delete
+        :type ids: list[str]
+        """
+        if ids:
+            self.client.delete(collection_name=self.config.collection_name, pks=ids)
+
+    def update_metadata(self, ids: list[str], metadata: dict[str, Any]):
+        """
+        Set metadata fields of chunks, keeping their other fields.
+
+        :param ids: ids of the chunks to update
+        :type ids: list[str]
+        :param metadata: Metadata fields to set
+        :type metadata: dict[str, Any]
+        """
+        if not ids:
+            return
+        # Entities can only be replaced as a whole, with their embeddings
+        entities = self.client.get(collection_name=self.config.collection_name, ids=ids, output_fields=["*"])
+        for entity in entities:
+            entity["metadata"] = {**entity.get("metadata", {}), **metadata}
+        self.client.upsert(collection_name=self.config.collection_name, data=entities)
+        self.client.flush(self.config.collection_name)
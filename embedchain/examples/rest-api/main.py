@@ -1,3 +1,4 @@
+import inspect
 import logging
 import os
 
@@ -5,18 +6,23 @@ import aiofiles
 import yaml
 from database import Base, SessionLocal, engine
 from fastapi import Depends, FastAPI, HTTPException, UploadFile
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from models import DefaultResponse, DeployAppRequest, QueryApp, SourceApp
 from services import get_app, get_apps, remove_app, save_app
 from sqlalchemy.orm import Session
 from utils import generate_error_message_for_api_keys
 
-from embedchain import App
+from embedchain.app_pool import AppPool
 from embedchain.client import Client
 
 logger = logging.getLogger(__name__)
 
 Base.metadata.create_all(bind=engine)
 
+# Apps are built once per config and reused by all requests
+app_pool = AppPool(max_size=int(os.getenv("APP_POOL_SIZE", "32")))
+
 
 def get_db():
     db = SessionLocal()
@@ -111,7 +117,7 @@ async def get_datasources_associated_with_app_id(app_id: str, db: Session = Depe
         if db_app is None:
             raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        app = await app_pool.aget(config_path=db_app.config)
 
         response = app.get_data_sources()
         return {"results": response}
@@ -150,9 +156,8 @@ async def add_datasource_to_an_app(body: SourceApp, app_id: str, db: Session = D
         if db_app is None:
             raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
-
-        response = app.add(source=body.source, data_type=body.data_type)
+        async with app_pool.aacquire(config_path=db_app.config) as app:
+            response = await app.aadd(source=body.source, data_type=body.data_type)
         return DefaultResponse(response=response)
     except ValueError as ve:
         logger.warning(str(ve))
@@ -175,6 +180,7 @@ async def query_an_app(body: QueryApp, app_id: str, db: Session = Depends(get_db
     Query an existing app.\n
     app_id: The ID of the app. Use "default" for the default app.\n
     query: The query that you want to ask the App.\n
+    If the LLM of the app is configured with `stream: true`, the answer is streamed as plain text.\n
     """
     try:
         if app_id is None:
@@ -188,9 +194,15 @@ async def query_an_app(body: QueryApp, app_id: str, db: Session = Depends(get_db
         if db_app is None:
             raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        app = await app_pool.aget(config_path=db_app.config)
 
-        response = app.query(body.query)
+        response = await app.aquery(body.query)
+        if inspect.isgenerator(response) or hasattr(response, "__aiter__"):
+            # Streamed answer, send the tokens to the client as soon as the LLM produces them
+            return StreamingResponse(response, media_type="text/plain")
+        if isinstance(response, dict):
+            # The answer with its token usage, if `token_usage` is enabled in the LLM config
+            return JSONResponse(content=jsonable_encoder(response))
         return DefaultResponse(response=response)
     except ValueError as ve:
         logger.warning(str(ve))
@@ -230,7 +242,7 @@ async def query_an_app(body: QueryApp, app_id: str, db: Session = Depends(get_db
 #               status_code=400
 #             )
 
-#         app = App.from_config(config_path=db_app.config)
+#         app = await app_pool.aget(config_path=db_app.config)
 
 #         response = app.chat(body.message)
 #         return DefaultResponse(response=response)
@@ -267,7 +279,7 @@ async def deploy_app(body: DeployAppRequest, app_id: str, db: Session = Depends(
         if db_app is None:
             raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        app = await app_pool.aget(config_path=db_app.config)
 
         api_key = body.api_key
         # this will save the api key in the embedchain.db
@@ -308,10 +320,10 @@ async def delete_app(app_id: str, db: Session = Depends(get_db)):
         if db_app is None:
             raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
-
-        # reset app.db
-        app.db.reset()
+        async with app_pool.aacquire(config_path=db_app.config) as app:
+            # reset app.db
+            app.db.reset()
+        app_pool.evict(config_path=db_app.config)
 
         remove_app(db, app_id)
         return DefaultResponse(response=f"App with id {app_id} deleted successfully.")
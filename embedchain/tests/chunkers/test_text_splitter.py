@@ -0,0 +1,102 @@
+import os
+import re
+
+import pytest
+
+from embedchain import App
+from embedchain.chunkers.text import TextChunker
+from embedchain.chunkers.text_splitter import TokenTextSplitter, get_text_splitter
+from embedchain.config import AddConfig, AppConfig, ChunkerConfig
+from embedchain.models.data_type import DataType
+from embedchain.utils import tokens
+
+TEXT = (
+    "The first paragraph has two sentences. It ends here.\n\n"
+    "The second paragraph is a little longer and it has only one sentence in it\n\n"
+    "Third paragraph."
+)
+
+
+class WordEncoding:
+    """Encoding with one token per word and its leading whitespace, like BPE tokenizers."""
+
+    def encode(self, text, disallowed_special=()):
+        self.pieces = re.findall(r"\s*\S+|\s+", text)
+        return list(range(len(self.pieces)))
+
+    def decode_with_offsets(self, tokens):
+        offsets, offset = [], 0
+        for token in tokens:
+            offsets.append(offset)
+            offset += len(self.pieces[token])
+        return "".join(self.pieces[token] for token in tokens), offsets
+
+
+@pytest.fixture(autouse=True)
+def encoding(monkeypatch):
+    encoding = WordEncoding()
+    monkeypatch.setattr("embedchain.chunkers.text_splitter.get_encoding", lambda model=None: encoding)
+    monkeypatch.setattr(tokens, "get_encoding", lambda model=None: encoding)
+    return encoding
+
+
+def test_get_text_splitter():
+    assert not isinstance(get_text_splitter(ChunkerConfig()), TokenTextSplitter)
+    splitter = get_text_splitter(ChunkerConfig(chunk_size=100, splitter="token", tokenizer_model="gpt-4o"))
+    assert (splitter.chunk_size, splitter.model) == (100, "gpt-4o")
+    with pytest.raises(ValueError):
+        ChunkerConfig(splitter="words")
+
+
+def test_chunks_fit_and_end_at_paragraphs():
+    chunks = TokenTextSplitter(chunk_size=16).split_text(TEXT)
+
+    assert chunks == [
+        "The first paragraph has two sentences. It ends here.",
+        "The second paragraph is a little longer and it has only one sentence in it",
+        "Third paragraph.",
+    ]
+
+
+def test_chunks_end_at_sentences_and_words():
+    splitter = TokenTextSplitter(chunk_size=8)
+    chunks = splitter.split_text(TEXT)
+
+    assert chunks[0] == "The first paragraph has two sentences."
+    assert all(splitter.count_tokens(chunk) <= 8 for chunk in chunks)
+    assert " ".join(chunks).split() == TEXT.split()
+
+
+def test_overlap_starts_with_a_word(monkeypatch):
+    # Estimated tokens of 4 characters
+    monkeypatch.setattr("embedchain.chunkers.text_splitter.get_encoding", lambda model=None: None)
+    chunks = TokenTextSplitter(chunk_size=6, chunk_overlap=3).split_text(
+        "alpha beta gamma delta epsilon zeta eta theta"
+    )
+
+    assert chunks == ["alpha beta gamma delta", "gamma delta epsilon", "epsilon zeta eta theta"]
+
+
+def test_min_chunk_size_is_in_tokens():
+    config = ChunkerConfig(chunk_size=16, splitter="token", min_chunk_size=4)
+    chunker = TextChunker(config)
+    chunker.set_data_type(DataType.TEXT)
+    loader = type(
+        "Loader", (), {"load_data": lambda self, src: {"doc_id": "1", "data": [{"content": src, "meta_data": {}}]}}
+    )
+
+    result = chunker.create_chunks(loader(), TEXT, config=config)
+
+    assert len(result["documents"]) == 2
+
+
+def test_tokenizer_defaults_to_embedding_model():
+    os.environ["OPENAI_API_KEY"] = "test_key"
+    app = App(config=AppConfig(collect_metrics=False))
+    app.embedding_model.config.model = "text-embedding-3-small"
+    chunker = ChunkerConfig(chunk_size=100, splitter="token")
+
+    add_config = app._get_add_config(AddConfig(chunker=chunker))
+
+    assert add_config.chunker.tokenizer_model == "text-embedding-3-small"
+    assert chunker.tokenizer_model is None
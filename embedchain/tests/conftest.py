@@ -4,9 +4,13 @@ import pytest
 from sqlalchemy import MetaData, create_engine
 from sqlalchemy.orm import sessionmaker
 
+from embedchain.memory.base import history_cache, history_writer
+
 
 @pytest.fixture(autouse=True)
 def clean_db():
+    # Write the chat rounds of the previous test before the rows are deleted
+    history_writer.flush()
     db_path = os.path.expanduser("~/.embedchain/embedchain.db")
     db_url = f"sqlite:///{db_path}"
     engine = create_engine(db_url)
@@ -26,10 +30,12 @@ def clean_db():
         print(f"Error cleaning database: {e}")
     finally:
         session.close()
+    # The cached chat history is stale once the rows are deleted
+    history_cache.clear()
 
 
 @pytest.fixture(autouse=True)
 def disable_telemetry():
     os.environ["EC_TELEMETRY"] = "false"
     yield
-    del os.environ["EC_TELEMETRY"]
\ No newline at end of file
+    del os.environ["EC_TELEMETRY"]
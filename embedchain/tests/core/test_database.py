@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import inspect
+
+from embedchain.core.db import database
+from embedchain.core.db.database import database_manager, init_db, is_db_up_to_date, setup_engine
+
+
+@pytest.fixture
+def database_uri(tmp_path):
+    previous = (database_manager.database_uri, database_manager.echo, database_manager.engine)
+    previous_session_factory = database_manager._session_factory
+    yield f"sqlite:///{tmp_path / 'embedchain.db'}"
+    database_manager.database_uri, database_manager.echo, database_manager.engine = previous
+    database_manager._session_factory = previous_session_factory
+
+
+def test_setup_engine_reuses_engine_for_same_uri(database_uri):
+    setup_engine(database_uri)
+    engine = database_manager.engine
+
+    setup_engine(database_uri)
+
+    assert database_manager.engine is engine
+
+
+def test_init_db_migrates_once_per_database(mocker, database_uri):
+    upgrade = mocker.spy(database, "alembic_upgrade")
+    setup_engine(database_uri)
+
+    init_db()
+    init_db()
+
+    upgrade.assert_called_once_with(database_uri)
+    assert is_db_up_to_date()
+    assert "ec_chat_history" in inspect(database_manager.engine).get_table_names()
+
+
+def test_init_db_skips_migrations_for_stamped_database(mocker, database_uri):
+    setup_engine(database_uri)
+    init_db()
+    # A new process only checks the schema version of the database
+    database._migrated_uris.discard(database_uri)
+    upgrade = mocker.spy(database, "alembic_upgrade")
+
+    init_db()
+
+    upgrade.assert_not_called()
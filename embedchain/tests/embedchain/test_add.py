@@ -3,8 +3,12 @@ import os
 import pytest
 
 from embedchain import App
-from embedchain.config import AddConfig, AppConfig, ChunkerConfig
+from embedchain.config import AddConfig, AppConfig, ChromaDbConfig, ChunkerConfig
+from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc
+from embedchain.loaders.base_loader import BaseLoader
 from embedchain.models.data_type import DataType
+from embedchain.vectordb.base import InsertResult
+from embedchain.vectordb.chroma import ChromaDB
 
 os.environ["OPENAI_API_KEY"] = "test_key"
 
@@ -50,3 +54,135 @@ def test_dry_run(app):
         assert isinstance(item, dict)
         assert "local" in item["url"]
         assert "text" in item["data_type"]
+
+
+def test_insert_chunks_returns_insert_result(app, mocker):
+    def add(documents, metadatas, ids, **kwargs):
+        if "c" in documents:
+            raise ValueError("Bad request")
+        return InsertResult(inserted_ids=ids[:1], skipped_ids=ids[1:])
+
+    mocker.patch.object(app.db, "add", side_effect=add)
+    result = app._insert_chunks(["a", "", "b", "c"], [{}, {}, {}, {}], ["1", "2", "3", "4"], batch_size=2)
+
+    assert result.inserted_ids == ["1"]
+    assert result.skipped_ids == ["2", "3"]
+    assert result.failed_ids == ["4"]
+
+
+def test_add_does_not_count_collection(app, mocker):
+    mock_count = mocker.patch.object(app.db, "count")
+    app.add("first text source", data_type="text")
+    mock_count.assert_not_called()
+
+
+def test_add_many(app, mocker):
+    mock_add = mocker.patch.object(app.db, "add")
+    sources = ["first text source", {"source": "second text source", "metadata": {"foo": "baz"}}]
+
+    source_hashes = app.add_many(sources, data_type="text", metadata={"foo": "bar"}, num_workers=2)
+
+    assert len(source_hashes) == 2
+    assert all(source_hash is not None for source_hash in source_hashes)
+    assert sorted(app.user_asks) == sorted(
+        [["first text source", "text", {"foo": "bar"}], ["second text source", "text", {"foo": "baz"}]]
+    )
+    # Chunks of both sources are inserted together in one batch
+    mock_add.assert_called_once()
+    _, kwargs = mock_add.call_args
+    assert sorted(kwargs["documents"]) == ["first text source", "second text source"]
+    assert len(kwargs["ids"]) == len(set(kwargs["ids"])) == 2
+
+
+def test_add_many_batches_and_deduplicates(app, mocker):
+    mock_add = mocker.patch.object(app.db, "add")
+    sources = ["same text", "same text", "other text", "another text"]
+
+    app.add_many(sources, data_type="text", config=AddConfig(batch_size=2))
+
+    inserted_ids = [chunk_id for call in mock_add.call_args_list for chunk_id in call.kwargs["ids"]]
+    assert len(inserted_ids) == len(set(inserted_ids)) == 3
+    assert all(len(call.kwargs["ids"]) <= 2 for call in mock_add.call_args_list)
+
+
+def test_add_many_skips_failed_sources(app, mocker):
+    mocker.patch.object(app.db, "add")
+    mocker.patch(
+        "embedchain.loaders.local_text.LocalTextLoader.load_data",
+        side_effect=[Exception("Failed to load"), {"doc_id": "doc", "data": [{"content": "text", "meta_data": {}}]}],
+    )
+
+    source_hashes = app.add_many(["broken", "working"], data_type="text", num_workers=1)
+
+    assert source_hashes[0] is None
+    assert source_hashes[1] is not None
+    assert app.user_asks == [["working", "text", None]]
+
+
+class VersionedLoader(BaseLoader):
+    def __init__(self):
+        self.content = None
+
+    def load_data(self, url):
+        return {"doc_id": self.content, "data": [{"content": self.content, "meta_data": {"url": url}}]}
+
+
+def test_add_changed_doc_only_embeds_new_chunks(tmp_path):
+    embedded_texts = []
+
+    def embedding_fn(texts):
+        embedded_texts.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(EmbeddingFunc(embedding_fn))
+    embedder.set_vector_dimension(2)
+    db = ChromaDB(config=ChromaDbConfig(dir=str(tmp_path), allow_reset=True))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=embedder)
+    loader = VersionedLoader()
+    config = AddConfig(chunker=ChunkerConfig(chunk_size=10, chunk_overlap=0, min_chunk_size=0))
+
+    loader.content = "aaaa bbbb\n\ncccc dddd"
+    app.add("https://example.com", data_type="web_page", loader=loader, config=config)
+    assert sorted(embedded_texts) == ["aaaa bbbb", "cccc dddd"]
+
+    embedded_texts.clear()
+    loader.content = "aaaa bbbb\n\neeee ffff"
+    app.add("https://example.com", data_type="web_page", loader=loader, config=config)
+
+    assert embedded_texts == ["eeee ffff"]
+    assert sorted(app.db.get(where={"url": "https://example.com"})["documents"]) == ["aaaa bbbb", "eeee ffff"]
+
+
+def test_add_changed_doc_moves_unchanged_chunks_to_new_doc_id(tmp_path, mocker):
+    embedded_texts = []
+
+    def embedding_fn(texts):
+        embedded_texts.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(EmbeddingFunc(embedding_fn))
+    embedder.set_vector_dimension(2)
+    db = ChromaDB(config=ChromaDbConfig(dir=str(tmp_path), allow_reset=True))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=embedder)
+    loader = VersionedLoader()
+    config = AddConfig(chunker=ChunkerConfig(chunk_size=10, chunk_overlap=0, min_chunk_size=0))
+
+    loader.content = "aaaa bbbb\n\ncccc dddd"
+    app.add("https://example.com", data_type="web_page", loader=loader, config=config)
+    # The second version only removes a chunk
+    loader.content = "aaaa bbbb"
+    app.add("https://example.com", data_type="web_page", loader=loader, config=config)
+
+    stored = app.db.collection.get(where={"url": "https://example.com"})
+    assert stored["documents"] == ["aaaa bbbb"]
+    assert [metadata["doc_id"] for metadata in stored["metadatas"]] == [f"{app.config.id}--aaaa bbbb"]
+    # The rest of the metadata is kept
+    assert stored["metadatas"][0]["url"] == "https://example.com"
+
+    embedded_texts.clear()
+    delete_stale_chunks = mocker.spy(app, "_delete_stale_chunks")
+    app.add("https://example.com", data_type="web_page", loader=loader, config=config)
+    assert embedded_texts == []
+    delete_stale_chunks.assert_not_called()
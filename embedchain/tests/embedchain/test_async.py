@@ -0,0 +1,122 @@
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from embedchain import App
+from embedchain.config import AppConfig, BaseLlmConfig
+from embedchain.llm.base import BaseLlm
+
+
+class SyncLlm(BaseLlm):
+    """LLM without an async client, so that the thread pool fallback is used."""
+
+    def get_llm_model_answer(self, prompt):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def app():
+    os.environ["OPENAI_API_KEY"] = "test_api_key"
+    return App(config=AppConfig(collect_metrics=False), llm=SyncLlm())
+
+
+@pytest.mark.asyncio
+async def test_aquery(app):
+    with patch.object(app.db, "query", return_value=["Test context"]) as mock_query:
+        with patch.object(app.llm, "get_llm_model_answer", return_value="Test answer") as mock_answer:
+            answer = await app.aquery("Test query", where={"attribute": "value"})
+
+    assert answer == "Test answer"
+    _, kwargs = mock_query.call_args
+    assert kwargs["input_query"] == "Test query"
+    assert kwargs["where"] == {"attribute": "value"}
+    assert "Test context" in mock_answer.call_args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_aquery_with_citations(app):
+    contexts = [("Test context", {"url": "https://example.com"})]
+    with patch.object(app.db, "query", return_value=contexts):
+        with patch.object(app.llm, "get_llm_model_answer", return_value="Test answer") as mock_answer:
+            answer, citations = await app.aquery("Test query", citations=True)
+
+    assert answer == "Test answer"
+    assert citations == contexts
+    assert "Test context" in mock_answer.call_args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_aquery_dry_run_does_not_call_llm(app):
+    with patch.object(app.db, "query", return_value=["Test context"]):
+        with patch.object(app.llm, "get_llm_model_answer") as mock_answer:
+            prompt = await app.aquery("Test query", dry_run=True)
+
+    assert "Test context" in prompt
+    mock_answer.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_aquery_restores_config(app):
+    previous_model = app.llm.config.model
+    with patch.object(app.db, "query", return_value=["Test context"]):
+        with patch.object(app.llm, "get_llm_model_answer", return_value="Test answer"):
+            await app.aquery("Test query", config=BaseLlmConfig(model="per-call-model"))
+
+    assert app.llm.config.model == previous_model
+
+
+@pytest.mark.asyncio
+async def test_concurrent_aquery_does_not_block_event_loop(app):
+    def slow_answer(prompt):
+        time.sleep(0.5)
+        return "Test answer"
+
+    with patch.object(app.db, "query", return_value=["Test context"]):
+        with patch.object(app.llm, "get_llm_model_answer", side_effect=slow_answer):
+            start = time.perf_counter()
+            answers = await asyncio.gather(*(app.aquery(f"Test query {i}") for i in range(4)))
+            elapsed = time.perf_counter() - start
+
+    assert answers == ["Test answer"] * 4
+    assert elapsed < 1.5
+
+
+@pytest.mark.asyncio
+async def test_achat_adds_history(app):
+    with patch.object(app.db, "query", return_value=["Test context"]):
+        with patch.object(app.llm, "get_llm_model_answer", return_value="Test answer"):
+            with patch.object(BaseLlm, "add_history") as mock_history:
+                answer = await app.achat("Test query", session_id="test_session")
+
+    assert answer == "Test answer"
+    mock_history.assert_called_once_with(app.config.id, "Test query", "Test answer", session_id="test_session")
+
+
+@pytest.mark.asyncio
+async def test_asearch(app):
+    contexts = [("Test context", {"url": "https://example.com"})]
+    with patch.object(app.db, "query", return_value=contexts) as mock_query:
+        results = await app.asearch("Test query", num_documents=2)
+
+    assert results == [{"context": "Test context", "metadata": {"url": "https://example.com"}}]
+    _, kwargs = mock_query.call_args
+    assert kwargs["n_results"] == 2
+    assert kwargs["citations"] is True
+
+    with pytest.raises(ValueError):
+        await app.asearch("Test query", where={"a": "b"}, raw_filter={"c": "d"})
+
+
+@pytest.mark.asyncio
+async def test_aadd(app):
+    with patch.object(App, "add", return_value="source_hash") as mock_add:
+        result = await app.aadd("https://example.com", data_type="web_page")
+
+    assert result == "source_hash"
+    mock_add.assert_called_once()
+    args, kwargs = mock_add.call_args
+    assert args == ("https://example.com",)
+    assert kwargs["data_type"] == "web_page"
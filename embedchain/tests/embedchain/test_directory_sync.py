@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from embedchain import App
+from embedchain.config import AddConfig, AppConfig, ChromaDbConfig, ChunkerConfig
+from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc
+from embedchain.loaders.directory_loader import DirectoryLoader
+from embedchain.vectordb.chroma import ChromaDB
+
+os.environ["OPENAI_API_KEY"] = "test_key"
+
+ADD_CONFIG = AddConfig(chunker=ChunkerConfig(chunk_size=100, chunk_overlap=0, min_chunk_size=0))
+
+
+@pytest.fixture
+def directory(tmp_path):
+    directory = tmp_path / "docs"
+    directory.mkdir()
+    for name in ("a", "b", "c"):
+        (directory / f"{name}.txt").write_text(f"content of file {name}")
+    return directory
+
+
+@pytest.fixture
+def app(tmp_path):
+    embedded = []
+
+    def embedding_fn(texts):
+        embedded.extend(texts)
+        return [[1.0, float(len(text))] for text in texts]
+
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(EmbeddingFunc(embedding_fn))
+    embedder.set_vector_dimension(2)
+    db = ChromaDB(config=ChromaDbConfig(dir=str(tmp_path / "db"), allow_reset=True))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=embedder)
+    app.embedded = embedded
+    return app
+
+
+def add(app, directory, tmp_path):
+    loader = DirectoryLoader(config={"manifest_dir": str(tmp_path / "manifests")})
+    app.add(str(directory), data_type="directory", loader=loader, config=ADD_CONFIG)
+
+
+def stored_documents(app):
+    return sorted(app.db.get()["documents"])
+
+
+def test_readd_only_embeds_changed_files(app, directory, tmp_path):
+    add(app, directory, tmp_path)
+    assert stored_documents(app) == ["content of file a", "content of file b", "content of file c"]
+
+    (directory / "b.txt").write_text("new content of file b")
+    (directory / "c.txt").unlink()
+    (directory / "d.txt").write_text("content of file d")
+    app.embedded.clear()
+    add(app, directory, tmp_path)
+
+    assert sorted(app.embedded) == ["content of file d", "new content of file b"]
+    assert stored_documents(app) == ["content of file a", "content of file d", "new content of file b"]
+
+    app.embedded.clear()
+    add(app, directory, tmp_path)
+    assert app.embedded == []
+
+
+def test_unchanged_files_missing_from_database_are_loaded_again(app, directory, tmp_path):
+    add(app, directory, tmp_path)
+    app.db.reset()
+
+    add(app, directory, tmp_path)
+
+    assert stored_documents(app) == ["content of file a", "content of file b", "content of file c"]
@@ -4,7 +4,7 @@ import pytest
 from chromadb.api.models.Collection import Collection
 
 from embedchain import App
-from embedchain.config import AppConfig, ChromaDbConfig
+from embedchain.config import AppConfig, ChromaDbConfig, QnaFastPathConfig
 from embedchain.embedchain import EmbedChain
 from embedchain.llm.base import BaseLlm
 from embedchain.memory.base import ChatHistory
@@ -73,3 +73,34 @@ def test_add_with_incorrect_content(app_instance, mocker):
 
     with pytest.raises(TypeError):
         app_instance.add(content, data_type="json")
+
+
+def test_evaluate_answers_questions_like_query(mocker):
+    app = App(
+        config=AppConfig(collect_metrics=False), llm=BaseLlm(), qna_fast_path_config=QnaFastPathConfig(semantic=False)
+    )
+    pair = {"question": "What is embedchain?", "answer": "A RAG framework.", "data_type": "qna_pair"}
+    mocker.patch.object(
+        app.db, "get", return_value={"ids": ["1"], "documents": ["Q: What is embedchain?"], "metadatas": [pair]}
+    )
+    query_batch = mocker.patch.object(
+        app.db, "query_batch", return_value=[[("context a", {"url": "a"})], [("context b", {"url": "b"})]]
+    )
+    mocker.patch.object(
+        app.llm, "query", side_effect=lambda input_query, contexts, **kwargs: f"{input_query} {contexts}"
+    )
+    get_answer = mocker.spy(app, "_get_answer")
+    mock_eval = mocker.patch.object(App, "_eval", return_value=1.0)
+
+    result = app.evaluate(["Question a?", "What is embedchain?", "Question b?"], metrics=["context_relevancy"])
+
+    assert result == {"context_relevancy": 1.0}
+    dataset = mock_eval.call_args.args[0]
+    assert [(data.answer, data.contexts) for data in dataset] == [
+        ("Question a? ['context a']", ["context a"]),
+        ("A RAG framework.", ["Q: What is embedchain?\nA: A RAG framework."]),
+        ("Question b? ['context b']", ["context b"]),
+    ]
+    # The question with a QnA pair is neither retrieved nor sent to the llm
+    assert query_batch.call_args.kwargs["queries"] == ["Question a?", "Question b?"]
+    assert get_answer.call_count == 2
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from embedchain import App
+from embedchain.config import AddConfig, AppConfig, BaseLlmConfig, ChromaDbConfig, ChunkerConfig, HybridSearchConfig
+from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc
+from embedchain.vectordb.chroma import ChromaDB
+
+os.environ["OPENAI_API_KEY"] = "test_key"
+
+DOCUMENTS = ["apples and pears", "bananas and kiwis", "error code E-1234", "cherries and plums"]
+
+
+@pytest.fixture
+def app(tmp_path):
+    # The vector of every text only depends on its length, so vector search can't find exact terms
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(EmbeddingFunc(lambda texts: [[1.0, float(len(text))] for text in texts]))
+    embedder.set_vector_dimension(2)
+    db = ChromaDB(config=ChromaDbConfig(dir=str(tmp_path), allow_reset=True))
+    app = App(
+        config=AppConfig(collect_metrics=False),
+        db=db,
+        embedding_model=embedder,
+        hybrid_search_config=HybridSearchConfig(fetch_k=4),
+    )
+    config = AddConfig(chunker=ChunkerConfig(chunk_size=100, chunk_overlap=0, min_chunk_size=0))
+    for document in DOCUMENTS:
+        app.add(document, data_type="text", config=config)
+    return app
+
+
+def test_keyword_index_is_stored_next_to_database(app, tmp_path):
+    assert app.keyword_index.path == os.path.join(str(tmp_path), "keyword_index.db")
+    assert app.keyword_index.count(app.db.config.collection_name) == len(DOCUMENTS)
+
+
+def test_exact_term_is_ranked_first(app):
+    config = BaseLlmConfig(number_documents=2)
+    contexts = app._retrieve_from_database("what does E-1234 mean", config=config, citations=True)
+
+    assert len(contexts) == 2
+    assert contexts[0][0] == "error code E-1234"
+    assert contexts[0][1]["score"] > contexts[1][1]["score"]
+    assert app._retrieve_from_database("what does E-1234 mean", config=config)[0] == "error code E-1234"
+    assert app._retrieve_batch_from_database(["E-1234", "bananas"], config=config)[1][0] == "bananas and kiwis"
+
+
+def test_keyword_index_follows_deletes(app):
+    app.delete(app.db.get()["metadatas"][0]["hash"])
+    assert app.keyword_index.count(app.db.config.collection_name) == len(DOCUMENTS) - 1
+
+    app.reset()
+    assert app.keyword_index.count(app.db.config.collection_name) == 0
@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from embedchain import App
+from embedchain.config import AppConfig, BaseLlmConfig
+from embedchain.llm.base import BaseLlm
+
+
+class StreamingLlm(BaseLlm):
+    def get_llm_model_answer(self, prompt):
+        return iter(["Test", " streamed", " answer"])
+
+
+@pytest.fixture
+def app(mocker):
+    os.environ["OPENAI_API_KEY"] = "test_api_key"
+    app = App(config=AppConfig(collect_metrics=False), llm=StreamingLlm(config=BaseLlmConfig(stream=True)))
+    mocker.patch.object(app.db, "query", return_value=["Test context"])
+    return app
+
+
+def test_query_streams_tokens(app):
+    answer = app.query("Test query")
+
+    assert list(answer) == ["Test", " streamed", " answer"]
+    assert app.llm.last_stream_metrics.chunks == 3
+
+
+def test_chat_saves_streamed_answer_once_exhausted(app, mocker):
+    mock_history = mocker.patch.object(BaseLlm, "add_history")
+
+    answer = app.chat("Test query", session_id="test_session")
+    mock_history.assert_not_called()
+
+    assert "".join(answer) == "Test streamed answer"
+    mock_history.assert_called_once_with(app.config.id, "Test query", "Test streamed answer", session_id="test_session")
+
+
+@pytest.mark.asyncio
+async def test_achat_saves_streamed_answer_once_exhausted(app, mocker):
+    mock_history = mocker.patch.object(BaseLlm, "add_history")
+
+    answer = await app.achat("Test query", session_id="test_session")
+    chunks = [chunk for chunk in answer]
+
+    assert chunks == ["Test", " streamed", " answer"]
+    mock_history.assert_called_once_with(app.config.id, "Test query", "Test streamed answer", session_id="test_session")
+
+
+@pytest.mark.asyncio
+async def test_achat_streams_async_tokens(app, mocker):
+    async def stream():
+        for chunk in ["Test", " streamed", " answer"]:
+            yield chunk
+
+    mocker.patch.object(app.llm, "aget_llm_model_answer", return_value=stream())
+    mock_history = mocker.patch.object(BaseLlm, "add_history")
+
+    answer = await app.achat("Test query")
+
+    assert [chunk async for chunk in answer] == ["Test", " streamed", " answer"]
+    assert app.llm.last_stream_metrics.chunks == 3
+    mock_history.assert_called_once_with(app.config.id, "Test query", "Test streamed answer", session_id="default")
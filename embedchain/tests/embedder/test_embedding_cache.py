@@ -0,0 +1,116 @@
+import pytest
+
+from embedchain.config import EmbeddingCacheConfig
+from embedchain.embedder.base import BaseEmbedder
+from embedchain.embedder.cache import EmbeddingCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EmbeddingCache(path=str(tmp_path / "embedding_cache.db"))
+
+
+@pytest.fixture
+def embedder(cache):
+    calls = []
+
+    def embedding_fn(texts):
+        calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(embedding_fn)
+    embedder.set_vector_dimension(2)
+    embedder.set_cache(cache)
+    embedder.calls = calls
+    return embedder
+
+
+def test_cache_only_embeds_missing_texts(embedder, cache):
+    assert embedder.embedding_fn(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+    assert embedder.embedding_fn(["bb", "ccc", "ccc"]) == [[2.0, 1.0], [3.0, 1.0], [3.0, 1.0]]
+
+    assert embedder.calls == [["a", "bb"], ["ccc"]]
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 4
+    assert stats["entries"] == 3
+
+
+def test_cache_is_persistent(embedder, tmp_path):
+    embedder.embedding_fn(["a", "bb"])
+
+    embedder.set_cache(EmbeddingCache(path=str(tmp_path / "embedding_cache.db")))
+    assert embedder.embedding_fn(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+    assert embedder.calls == [["a", "bb"]]
+
+
+def test_cache_is_keyed_by_model_and_dimension(embedder):
+    embedder.embedding_fn(["a"])
+    embedder.config.model = "other-model"
+    embedder.embedding_fn(["a"])
+    embedder.set_vector_dimension(3)
+    embedder.embedding_fn(["a"])
+
+    assert embedder.calls == [["a"], ["a"], ["a"]]
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = EmbeddingCache(path=str(tmp_path / "embedding_cache.db"), max_entries=2)
+    cache.set_many("model", 2, ["a"], [[1.0, 1.0]])
+    cache.set_many("model", 2, ["b"], [[2.0, 1.0]])
+    # Access "a" so that "b" becomes the least recently used entry
+    cache.get_many("model", 2, ["a"])
+    cache.set_many("model", 2, ["c"], [[3.0, 1.0]])
+
+    assert cache.get_many("model", 2, ["a", "b", "c"]) == [[1.0, 1.0], None, [3.0, 1.0]]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_keeps_its_size_without_scanning(tmp_path):
+    path = str(tmp_path / "embedding_cache.db")
+    cache = EmbeddingCache(path=path, max_entries=3)
+    cache.set_many("model", 2, ["a", "b"], [[1.0, 1.0], [2.0, 1.0]])
+    # Replacing a vector doesn't add an entry, only changes the size
+    cache.set_many("model", 2, ["a"], [[1.0, 1.0, 1.0]])
+    cache.set_many("model", 2, ["c", "d"], [[3.0, 1.0], [4.0, 1.0]])
+
+    stats = cache.stats()
+    assert stats["entries"] == 3
+    # "b" is evicted, "a" has 3 floats now
+    assert stats["size_bytes"] == 12 + 8 + 8
+    assert stats["evictions"] == 1
+    assert (stats["entries"], stats["size_bytes"]) == cache._connection.execute(
+        "SELECT COUNT(*), SUM(size) FROM ec_embeddings"
+    ).fetchone()
+
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["size_bytes"] == 0
+
+
+def test_cache_counts_entries_stored_before_the_stats(tmp_path):
+    path = str(tmp_path / "embedding_cache.db")
+    cache = EmbeddingCache(path=path)
+    cache.set_many("model", 2, ["a", "b"], [[1.0, 1.0], [2.0, 1.0]])
+    cache._connection.execute("DROP TABLE ec_embeddings_stats")
+    cache.close()
+
+    cache = EmbeddingCache(path=path)
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["size_bytes"] == 16
+
+
+def test_disable_cache(embedder):
+    embedder.embedding_fn(["a"])
+    embedder.set_cache(None)
+    embedder.embedding_fn(["a"])
+
+    assert embedder.calls == [["a"], ["a"]]
+
+
+def test_embedding_cache_config_validation():
+    with pytest.raises(ValueError):
+        EmbeddingCacheConfig(max_entries=0)
+    with pytest.raises(ValueError):
+        EmbeddingCacheConfig(max_size_mb=-1)
@@ -1,7 +1,10 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from string import Template
 
 import pytest
 
+from embedchain.config.llm.base import DOCS_SITE_PROMPT_TEMPLATE
 from embedchain.llm.base import BaseLlm, BaseLlmConfig
 
 
@@ -59,3 +62,67 @@ def test_access_search_and_get_results(base_llm, mocker):
     input_query = "Test query"
     result = base_llm.access_search_and_get_results(input_query)
     assert result == "Search Results"
+
+
+def test_stream_response_records_metrics(base_llm):
+    answer = ["Chunk1", "Chunk2", "Chunk3"]
+    stream = base_llm._stream_response(answer)
+    assert base_llm.last_stream_metrics is None
+
+    assert "".join(stream) == "Chunk1Chunk2Chunk3"
+    metrics = base_llm.last_stream_metrics
+    assert metrics.chunks == 3
+    assert 0 <= metrics.time_to_first_token <= metrics.duration
+    assert metrics.tokens_per_second > 0
+
+
+def test_query_applies_config_and_history_to_the_request_only():
+    class EchoLlm(BaseLlm):
+        def get_llm_model_answer(self, prompt):
+            # Providers read the config of the current request
+            return f"{self.config.model}|{prompt}"
+
+    default_config = BaseLlmConfig(model="default-model")
+    llm = EchoLlm(config=default_config)
+
+    answer = llm.query(
+        "query",
+        ["context"],
+        config=BaseLlmConfig(model="request-model"),
+        history=["user: earlier question"],
+    )
+
+    assert answer.startswith("request-model|")
+    assert "earlier question" in answer
+    assert llm.config is default_config
+    assert llm.history is None
+
+
+def test_concurrent_queries_do_not_share_config():
+    barrier = threading.Barrier(8)
+
+    class WaitingLlm(BaseLlm):
+        def get_llm_model_answer(self, prompt):
+            # Let all requests enter before any of them reads its config
+            barrier.wait(timeout=5)
+            return self.config.model
+
+    llm = WaitingLlm(config=BaseLlmConfig(model="default-model"))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        answers = list(
+            executor.map(lambda i: llm.query("query", [], config=BaseLlmConfig(model=f"model-{i}")), range(8))
+        )
+
+    assert answers == [f"model-{i}" for i in range(8)]
+    assert llm.config.model == "default-model"
+
+
+def test_docs_site_prompt_does_not_mutate_config(base_llm):
+    base_llm.is_docs_site_instance = True
+
+    prompt = base_llm.query("query", ["context"], dry_run=True)
+
+    assert "query" in prompt
+    assert base_llm.config.prompt.template != DOCS_SITE_PROMPT_TEMPLATE.template
+    assert base_llm.config.number_documents == 3
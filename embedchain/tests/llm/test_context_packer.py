@@ -0,0 +1,58 @@
+import pytest
+
+from embedchain.config import BaseLlmConfig
+from embedchain.llm.base import BaseLlm
+from embedchain.utils import tokens
+from embedchain.utils.context_packer import pack_contexts
+
+
+@pytest.fixture(autouse=True)
+def estimate_tokens(monkeypatch):
+    # Count tokens from the text length, so the tests don't depend on downloading a tiktoken encoding
+    monkeypatch.setattr(tokens, "get_encoding", lambda model=None: None)
+
+
+def test_near_duplicates_are_dropped():
+    contexts = [
+        "Embedchain supports many vector databases like chroma and lancedb.",
+        "Embedchain supports many vector databases like chroma and lancedb!",
+        "Chat history is stored in sqlite.",
+    ]
+
+    assert pack_contexts(contexts) == [contexts[0], contexts[2]]
+    assert pack_contexts(contexts, similarity_threshold=None) == contexts
+
+
+def test_contexts_fill_token_budget_in_order():
+    contexts = ["a" * 40, "b" * 40, "c" * 4]
+
+    # 10 tokens for the first context, 1 for the separator and 1 for the last context
+    assert pack_contexts(contexts, max_tokens=12) == ["a" * 40, "c" * 4]
+
+
+def test_best_context_is_truncated_if_nothing_fits():
+    assert pack_contexts(["a" * 100, "b" * 100], max_tokens=5) == ["a" * 20]
+
+
+def test_model_context_window_from_model_info():
+    assert tokens.get_max_input_tokens("gpt-4") == 8192
+    assert tokens.get_max_input_tokens("openai/gpt-4") == 8192
+    assert tokens.get_max_input_tokens("unknown-model") is None
+
+
+def test_generate_prompt_limits_contexts_to_budget():
+    llm = BaseLlm(config=BaseLlmConfig(max_context_tokens=10))
+
+    prompt = llm.generate_prompt("query", ["a" * 40, "b" * 40])
+
+    assert "a" * 40 in prompt
+    assert "b" * 40 not in prompt
+
+
+def test_context_budget_leaves_room_for_prompt_and_answer():
+    llm = BaseLlm(config=BaseLlmConfig(model="gpt-4", max_tokens=1000))
+
+    budget = llm._get_context_budget("q" * 400)
+
+    assert budget == 8192 - 1000 - 100 - tokens.count_tokens(llm.config.prompt.template)
+    assert BaseLlm(config=BaseLlmConfig(model="unknown-model"))._get_context_budget("query") is None
@@ -2,9 +2,11 @@ import importlib
 import os
 
 import pytest
+from langchain_core.outputs import Generation, LLMResult
 
 from embedchain.config import BaseLlmConfig
 from embedchain.llm.huggingface import HuggingFaceLlm
+from embedchain.llm.pipeline_registry import PipelineRegistry
 
 
 @pytest.fixture
@@ -81,3 +83,85 @@ def test_custom_endpoint(huggingface_endpoint_config, mocker):
 
     assert answer == "Test answer"
     mock_llm_instance.assert_called_once_with("Test query")
+
+
+@pytest.fixture
+def pipeline_registry():
+    registry = PipelineRegistry(max_batch_size=4, max_wait=0.05)
+    yield registry
+    registry.unload()
+
+
+def _fake_pipeline(mocker):
+    pipeline = mocker.Mock()
+    pipeline.pipeline.model.get_memory_footprint.return_value = 1024
+    pipeline.generate.side_effect = lambda prompts: LLMResult(
+        generations=[[Generation(text=f"answer to {prompt}")] for prompt in prompts]
+    )
+    return pipeline
+
+
+def test_pipeline_registry_loads_model_once(mocker, pipeline_registry):
+    from_model_id = mocker.patch(
+        "embedchain.llm.pipeline_registry.HuggingFacePipeline.from_model_id", return_value=_fake_pipeline(mocker)
+    )
+
+    assert pipeline_registry.generate("model", "first", pipeline_kwargs={"top_p": 0.5}) == "answer to first"
+    assert pipeline_registry.generate("model", "second", pipeline_kwargs={"top_p": 0.5}) == "answer to second"
+
+    from_model_id.assert_called_once_with(
+        model_id="model", task="text-generation", pipeline_kwargs={"top_p": 0.5}, batch_size=4
+    )
+    stats = pipeline_registry.stats()
+    assert stats["memory_bytes"] == 1024
+    assert stats["pipelines"][0]["requests"] == 2
+
+
+def test_pipeline_registry_batches_concurrent_prompts(mocker, pipeline_registry):
+    pipeline = _fake_pipeline(mocker)
+    mocker.patch("embedchain.llm.pipeline_registry.HuggingFacePipeline.from_model_id", return_value=pipeline)
+    loaded = pipeline_registry.get("model")
+
+    futures = [loaded.submit(f"prompt {i}") for i in range(4)]
+
+    assert [future.result(timeout=5) for future in futures] == [f"answer to prompt {i}" for i in range(4)]
+    pipeline.generate.assert_called_once_with([f"prompt {i}" for i in range(4)])
+
+
+def test_pipeline_registry_sets_errors_on_batch(mocker, pipeline_registry):
+    pipeline = _fake_pipeline(mocker)
+    pipeline.generate.side_effect = RuntimeError("out of memory")
+    mocker.patch("embedchain.llm.pipeline_registry.HuggingFacePipeline.from_model_id", return_value=pipeline)
+
+    with pytest.raises(RuntimeError, match="out of memory"):
+        pipeline_registry.generate("model", "prompt")
+
+
+def test_pipeline_registry_unload(mocker, pipeline_registry):
+    from_model_id = mocker.patch(
+        "embedchain.llm.pipeline_registry.HuggingFacePipeline.from_model_id",
+        side_effect=lambda **kwargs: _fake_pipeline(mocker),
+    )
+    pipeline_registry.get("model")
+    pipeline_registry.get("other")
+
+    pipeline_registry.unload("model")
+
+    assert [pipeline["model_id"] for pipeline in pipeline_registry.stats()["pipelines"]] == ["other"]
+    pipeline_registry.get("model")
+    assert from_model_id.call_count == 3
+
+
+def test_from_pipeline_uses_registry(mocker, huggingface_llm_config):
+    huggingface_llm_config.local = True
+    generate = mocker.patch("embedchain.llm.huggingface.pipeline_registry.generate", return_value="Test answer")
+
+    llm = HuggingFaceLlm(huggingface_llm_config)
+
+    assert llm.get_llm_model_answer("Test query") == "Test answer"
+    generate.assert_called_once_with(
+        "google/flan-t5-xxl",
+        "Test query",
+        task="text-generation",
+        pipeline_kwargs={"temperature": 0.7, "max_new_tokens": 50, "top_p": 0.8},
+    )
@@ -103,6 +103,18 @@ def test_get_llm_model_answer_with_streaming(config, mocker):
     assert any(isinstance(callback[0], StreamingStdOutCallbackHandler) for callback in callbacks)
 
 
+def test_get_llm_model_answer_with_streaming_yields_tokens(config, mocker):
+    config.stream = True
+    mocked_openai_chat = mocker.patch("embedchain.llm.openai.ChatOpenAI")
+    chunks = [mocker.Mock(content=content) for content in ["Test", "", " answer"]]
+    mocked_openai_chat.return_value.stream.return_value = iter(chunks)
+
+    llm = OpenAILlm(config)
+    answer = llm.get_llm_model_answer("Test query")
+
+    assert list(answer) == ["Test", " answer"]
+
+
 def test_get_llm_model_answer_without_system_prompt(config, mocker):
     config.system_prompt = None
     mocked_openai_chat = mocker.patch("embedchain.llm.openai.ChatOpenAI")
@@ -265,3 +277,16 @@ def test_get_llm_model_answer_with_http_async_client_proxies(env_config, mocker)
         http_async_client=mock_http_async_client_instance,
     )
     mock_http_async_client.assert_called_once_with(proxies={"http://": "http://testproxy.mem0.net:8000"})
+
+
+@pytest.mark.asyncio
+async def test_aget_llm_model_answer_uses_async_client(config, mocker):
+    mocked_openai_chat = mocker.patch("embedchain.llm.openai.ChatOpenAI")
+    mocked_openai_chat.return_value.ainvoke = mocker.AsyncMock(return_value=mocker.Mock(content="Test answer"))
+
+    llm = OpenAILlm(config)
+    answer = await llm.aget_llm_model_answer("Test query")
+
+    assert answer == "Test answer"
+    mocked_openai_chat.return_value.ainvoke.assert_awaited_once()
+    mocked_openai_chat.return_value.invoke.assert_not_called()
@@ -0,0 +1,230 @@
+import threading
+import time
+from collections import Counter, defaultdict
+from urllib.parse import urlparse
+
+import pytest
+import requests
+
+from embedchain.loaders.crawler import Crawler, normalize_url
+from embedchain.loaders.http_cache import HttpCache
+
+
+class FakeSession:
+    """Serves pages from a dict of url to body, or to a list of statuses and bodies that are served in turn."""
+
+    def __init__(self, pages, latency=0.0):
+        self.pages = pages
+        self.latency = latency
+        self.requests = Counter()
+        self.in_flight = Counter()
+        self.max_in_flight = Counter()
+        self.lock = threading.Lock()
+
+    def get(self, url, headers=None, timeout=None):
+        host = urlparse(url).netloc
+        with self.lock:
+            self.requests[url] += 1
+            self.in_flight[host] += 1
+            self.max_in_flight[host] = max(self.max_in_flight[host], self.in_flight[host])
+        try:
+            time.sleep(self.latency)
+            page = self.pages.get(url)
+            if isinstance(page, list):
+                with self.lock:
+                    page = page.pop(0) if len(page) > 1 else page[0]
+            if isinstance(page, Exception):
+                raise page
+            if page is None:
+                page = (404, "", {})
+            status_code, body, response_headers = page if isinstance(page, tuple) else (200, page, {})
+
+            response = requests.Response()
+            response.url = url
+            response.status_code = status_code
+            response.encoding = "utf-8"
+            response._content = body.encode()
+            response.headers.update(response_headers)
+            return response
+        finally:
+            with self.lock:
+                self.in_flight[host] -= 1
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    http_cache = HttpCache(path=str(tmp_path / "http_cache.db"))
+    yield http_cache
+    http_cache.close()
+
+
+def html_links(*paths):
+    return "".join(f'<a href="{path}">{path}</a>' for path in paths)
+
+
+def get_links(url, response):
+    return [part.split('"')[0] for part in response.text.split('href="')[1:]]
+
+
+def test_normalize_url():
+    assert normalize_url("https://example.com") == "https://example.com/"
+    assert normalize_url("/page#section", "https://example.com/docs/") == "https://example.com/page"
+    assert normalize_url("page", "https://example.com/docs/") == "https://example.com/docs/page"
+
+
+def test_crawl_follows_links_and_fetches_every_url_once(http_cache):
+    session = FakeSession(
+        {
+            "https://example.com/": html_links("/a", "/b", "/a#section"),
+            "https://example.com/a": html_links("/", "/b", "/c"),
+            "https://example.com/b": html_links("/a", "/d"),
+            "https://example.com/c": html_links("/e"),
+            "https://example.com/d": "",
+            "https://example.com/e": "",
+        }
+    )
+    crawler = Crawler(http_cache=http_cache, session=session, respect_robots_txt=False)
+
+    results = list(crawler.stream(["https://example.com/"], get_links=get_links))
+
+    depths = {result.url: result.depth for result in results}
+    assert depths == {
+        "https://example.com/": 0,
+        "https://example.com/a": 1,
+        "https://example.com/b": 1,
+        "https://example.com/c": 2,
+        "https://example.com/d": 2,
+        "https://example.com/e": 3,
+    }
+    assert set(session.requests.values()) == {1}
+
+
+def test_crawl_limits_depth_and_pages(http_cache):
+    session = FakeSession(
+        {
+            "https://example.com/": html_links("/a", "/b"),
+            "https://example.com/a": html_links("/c"),
+            "https://example.com/b": html_links("/d"),
+        }
+    )
+    crawler = Crawler(http_cache=http_cache, session=session, respect_robots_txt=False)
+
+    results = list(crawler.stream(["https://example.com/"], get_links=get_links, max_depth=1))
+    assert sorted(result.url for result in results) == [
+        "https://example.com/",
+        "https://example.com/a",
+        "https://example.com/b",
+    ]
+
+    results = list(crawler.stream(["https://example.com/"], get_links=get_links, max_pages=2))
+    assert len(results) == 2
+
+
+def test_concurrency_is_limited_per_host(http_cache):
+    pages = {f"https://{host}/{i}": "" for host in ("a.com", "b.com") for i in range(12)}
+    session = FakeSession(pages, latency=0.05)
+    crawler = Crawler(
+        max_concurrency=8, max_concurrency_per_host=2, http_cache=http_cache, session=session, respect_robots_txt=False
+    )
+
+    results = list(crawler.stream(pages))
+
+    assert len(results) == len(pages)
+    assert session.max_in_flight == {"a.com": 2, "b.com": 2}
+
+
+def test_delay_between_requests_to_a_host(http_cache):
+    pages = {f"https://example.com/{i}": "" for i in range(3)}
+    session = FakeSession(pages)
+    crawler = Crawler(delay=0.1, http_cache=http_cache, session=session, respect_robots_txt=False)
+
+    started_at = time.monotonic()
+    list(crawler.stream(pages))
+    assert time.monotonic() - started_at >= 0.2
+
+
+def test_retries_with_backoff(http_cache):
+    session = FakeSession(
+        {
+            "https://example.com/busy": [(503, "", {"Retry-After": "0"}), (200, "ok", {})],
+            "https://example.com/flaky": [requests.ConnectionError("reset"), "ok"],
+            "https://example.com/unreachable": requests.ConnectionError("refused"),
+            "https://example.com/broken": (500, "", {}),
+        }
+    )
+    crawler = Crawler(max_retries=2, backoff_factor=0, http_cache=http_cache, session=session, respect_robots_txt=False)
+
+    results = {result.url: result for result in crawler.stream(list(session.pages))}
+
+    assert results["https://example.com/busy"].response.status_code == 200
+    assert results["https://example.com/busy"].response.content == b"ok"
+    assert session.requests["https://example.com/busy"] == 2
+    assert results["https://example.com/flaky"].response.content == b"ok"
+    assert session.requests["https://example.com/flaky"] == 2
+    assert results["https://example.com/unreachable"].response is None
+    assert "refused" in results["https://example.com/unreachable"].error
+    assert session.requests["https://example.com/unreachable"] == 3
+    assert results["https://example.com/broken"].response.status_code == 500
+    assert session.requests["https://example.com/broken"] == 3
+
+
+def test_respects_robots_txt(http_cache):
+    session = FakeSession(
+        {
+            "https://example.com/robots.txt": "User-agent: *\nDisallow: /private\n",
+            "https://example.com/": html_links("/public", "/private/page"),
+            "https://example.com/public": "",
+            "https://example.com/private/page": "",
+        }
+    )
+    crawler = Crawler(http_cache=http_cache, session=session)
+
+    results = {result.url: result for result in crawler.stream(["https://example.com/"], get_links=get_links)}
+
+    assert results["https://example.com/private/page"].response is None
+    assert results["https://example.com/private/page"].error == "disallowed by robots.txt"
+    assert "https://example.com/private/page" not in session.requests
+    assert results["https://example.com/public"].response.status_code == 200
+    assert session.requests["https://example.com/robots.txt"] == 1
+
+
+def test_stopping_the_stream_stops_the_crawl(http_cache):
+    pages = {f"https://example.com/{i}": "" for i in range(200)}
+    session = FakeSession(pages, latency=0.01)
+    crawler = Crawler(
+        max_concurrency=2, max_concurrency_per_host=2, http_cache=http_cache, session=session, respect_robots_txt=False
+    )
+
+    for _ in crawler.stream(pages):
+        break
+
+    requests_count = sum(session.requests.values())
+    time.sleep(0.1)
+    assert sum(session.requests.values()) == requests_count < len(pages)
+
+
+def test_errors_of_get_links_are_logged(http_cache, caplog):
+    session = FakeSession({"https://example.com/": "page"})
+    crawler = Crawler(http_cache=http_cache, session=session, respect_robots_txt=False)
+
+    def failing_get_links(url, response):
+        raise ValueError("unparsable")
+
+    results = list(crawler.stream(["https://example.com/"], get_links=failing_get_links))
+
+    assert [result.url for result in results] == ["https://example.com/"]
+    assert "unparsable" in caplog.text
+
+
+def test_results_per_host_are_independent(http_cache):
+    session = FakeSession({"https://a.com/": "a", "https://b.com/": "b"})
+    crawler = Crawler(http_cache=http_cache, session=session)
+
+    contents = defaultdict(bytes)
+    for result in crawler.stream(["https://a.com/", "https://b.com/"]):
+        contents[result.url] = result.response.content
+
+    assert contents == {"https://a.com/": b"a", "https://b.com/": b"b"}
+    # The robots.txt of both hosts are missing, which allows all urls
+    assert session.requests["https://a.com/robots.txt"] == 1
+    assert session.requests["https://b.com/robots.txt"] == 1
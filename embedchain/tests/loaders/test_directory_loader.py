@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from embedchain.loaders.directory_loader import DirectoryLoader
+
+
+@pytest.fixture
+def directory(tmp_path):
+    directory = tmp_path / "docs"
+    (directory / "nested").mkdir(parents=True)
+    (directory / "a.txt").write_text("first file")
+    (directory / "nested" / "b.txt").write_text("second file")
+    (directory / ".hidden").write_text("hidden file")
+    return directory
+
+
+@pytest.fixture
+def loader(tmp_path):
+    return DirectoryLoader(config={"manifest_dir": str(tmp_path / "manifests"), "max_workers": 2})
+
+
+def test_load_data(loader, directory):
+    result = loader.load_data(str(directory))
+
+    assert sorted(record["content"] for record in result["data"]) == ["first file", "second file"]
+    assert sorted(result["files"]) == [str(directory / "a.txt"), str(directory / "nested" / "b.txt")]
+    assert all(
+        record["meta_data"]["file_hash"] == result["files"][record["meta_data"]["url"]] for record in result["data"]
+    )
+
+
+def test_reload_only_loads_changed_files(loader, directory):
+    first = loader.load_data(str(directory))
+    unchanged = loader.load_data(str(directory))
+
+    assert unchanged["data"] == []
+    assert unchanged["doc_id"] == first["doc_id"]
+
+    # A new modification time with the same content doesn't load the file again
+    os.utime(directory / "a.txt", ns=(1, 1))
+    assert loader.load_data(str(directory))["data"] == []
+
+    (directory / "nested" / "b.txt").write_text("second file, changed")
+    (directory / "c.txt").write_text("third file")
+    changed = loader.load_data(str(directory))
+
+    assert sorted(record["content"] for record in changed["data"]) == ["second file, changed", "third file"]
+    assert len(changed["files"]) == 3
+    assert changed["doc_id"] != first["doc_id"]
+
+
+def test_removed_files_are_not_reported(loader, directory):
+    loader.load_data(str(directory))
+    (directory / "a.txt").unlink()
+
+    result = loader.load_data(str(directory))
+
+    assert list(result["files"]) == [str(directory / "nested" / "b.txt")]
+
+
+def test_invalidate(loader, directory):
+    loader.load_data(str(directory))
+
+    loader.invalidate(str(directory), [str(directory / "a.txt")])
+    assert [record["content"] for record in loader.load_data(str(directory))["data"]] == ["first file"]
+
+    loader.invalidate(str(directory))
+    assert len(loader.load_data(str(directory))["data"]) == 2
+
+
+def test_not_incremental(tmp_path, directory):
+    loader = DirectoryLoader(config={"incremental": False, "manifest_dir": str(tmp_path / "manifests")})
+    loader.load_data(str(directory))
+
+    assert len(loader.load_data(str(directory))["data"]) == 2
+    assert not (tmp_path / "manifests").exists()
+
+
+def test_failed_files_are_loaded_again(loader, directory, mocker):
+    mocker.patch(
+        "embedchain.loaders.text_file.TextFileLoader.load_data", side_effect=[OSError("unreadable"), {"data": []}]
+    )
+    (directory / "nested" / "b.txt").unlink()
+
+    result = loader.load_data(str(directory))
+
+    assert result["files"] == {}
+    assert loader.errors == [f"Error processing {directory / 'a.txt'}: unreadable"]
+    assert str(directory / "a.txt") in loader.load_data(str(directory))["files"]
@@ -4,12 +4,14 @@ from unittest.mock import Mock, patch
 import pytest
 from requests import Response
 
+from embedchain.loaders.crawler import CrawlResult
 from embedchain.loaders.docs_site_loader import DocsSiteLoader
+from embedchain.loaders.http_cache import HttpResponse
 
 
 @pytest.fixture
 def mock_requests_get():
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         yield mock_get
 
 
@@ -18,7 +20,7 @@ def docs_site_loader():
     return DocsSiteLoader()
 
 
-def test_get_child_links_recursive(mock_requests_get, docs_site_loader):
+def test_get_all_urls_follows_child_links(mock_requests_get, docs_site_loader):
     mock_response = Mock()
     mock_response.status_code = 200
     mock_response.text = """
@@ -29,19 +31,19 @@ def test_get_child_links_recursive(mock_requests_get, docs_site_loader):
     """
     mock_requests_get.return_value = mock_response
 
-    docs_site_loader._get_child_links_recursive("https://example.com")
+    docs_site_loader._get_all_urls("https://example.com")
 
     assert len(docs_site_loader.visited_links) == 2
     assert "https://example.com/page1" in docs_site_loader.visited_links
     assert "https://example.com/page2" in docs_site_loader.visited_links
 
 
-def test_get_child_links_recursive_status_not_200(mock_requests_get, docs_site_loader):
+def test_get_all_urls_status_not_200(mock_requests_get, docs_site_loader):
     mock_response = Mock()
     mock_response.status_code = 404
     mock_requests_get.return_value = mock_response
 
-    docs_site_loader._get_child_links_recursive("https://example.com")
+    docs_site_loader._get_all_urls("https://example.com")
 
     assert len(docs_site_loader.visited_links) == 0
 
@@ -66,10 +68,8 @@ def test_get_all_urls(mock_requests_get, docs_site_loader):
     assert "https://example.com/external" in all_urls
 
 
-def test_load_data_from_url(mock_requests_get, docs_site_loader):
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.content = """
+def test_load_data_from_response(docs_site_loader):
+    content = """
         <html>
             <nav>
                 <h1>Navigation</h1>
@@ -79,21 +79,19 @@ def test_load_data_from_url(mock_requests_get, docs_site_loader):
             </article>
         </html>
     """.encode()
-    mock_requests_get.return_value = mock_response
 
-    data = docs_site_loader._load_data_from_url("https://example.com/page1")
+    data = docs_site_loader._load_data_from_response("https://example.com/page1", content)
 
     assert len(data) == 1
     assert data[0]["content"] == "Article Content"
     assert data[0]["meta_data"]["url"] == "https://example.com/page1"
 
 
-def test_load_data_from_url_status_not_200(mock_requests_get, docs_site_loader):
-    mock_response = Mock()
-    mock_response.status_code = 404
-    mock_requests_get.return_value = mock_response
+def test_load_data_from_result_status_not_200(docs_site_loader):
+    url = "https://example.com/page1"
+    result = CrawlResult(url, 1, HttpResponse(url, 404, b""))
 
-    data = docs_site_loader._load_data_from_url("https://example.com/page1")
+    data = docs_site_loader._load_data_from_result(result)
 
     assert data == []
     assert len(data) == 0
@@ -111,7 +109,7 @@ def test_load_data(mock_requests_get, docs_site_loader):
 
     url = "https://example.com"
     data = docs_site_loader.load_data(url)
-    expected_doc_id = hashlib.sha256((" ".join(docs_site_loader.visited_links) + url).encode()).hexdigest()
+    expected_doc_id = hashlib.sha256((" ".join(sorted(docs_site_loader.visited_links)) + url).encode()).hexdigest()
 
     assert len(data["data"]) == 2
     assert data["doc_id"] == expected_doc_id
@@ -124,7 +122,7 @@ def test_if_response_status_not_200(mock_requests_get, docs_site_loader):
 
     url = "https://example.com"
     data = docs_site_loader.load_data(url)
-    expected_doc_id = hashlib.sha256((" ".join(docs_site_loader.visited_links) + url).encode()).hexdigest()
+    expected_doc_id = hashlib.sha256((" ".join(sorted(docs_site_loader.visited_links)) + url).encode()).hexdigest()
 
     assert len(data["data"]) == 0
     assert data["doc_id"] == expected_doc_id
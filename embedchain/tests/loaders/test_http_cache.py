@@ -0,0 +1,277 @@
+import hashlib
+import os
+import sqlite3
+
+import pytest
+import requests
+
+from embedchain import App
+from embedchain.config import AddConfig, AppConfig, ChromaDbConfig, ChunkerConfig
+from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc
+from embedchain.loaders.http_cache import HttpCache
+from embedchain.loaders.rss_feed import RSSFeedLoader
+from embedchain.loaders.web_page import WebPageLoader
+from embedchain.vectordb.chroma import ChromaDB
+
+os.environ["OPENAI_API_KEY"] = "test_key"
+
+
+class FakeSession:
+    """Serves pages with an ETag of their content, and answers 304 if the ETag of the request matches."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        headers = headers or {}
+        self.requests.append(headers)
+        content = self.pages[url].encode()
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+
+        response = requests.Response()
+        response.url = url
+        response.encoding = "utf-8"
+        response.headers["ETag"] = etag
+        if headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = content
+        return response
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    http_cache = HttpCache(path=str(tmp_path / "http_cache.db"))
+    yield http_cache
+    http_cache.close()
+
+
+def test_get_revalidates_cached_response(http_cache):
+    session = FakeSession({"https://example.com": "<p>content</p>"})
+
+    response = http_cache.get("https://example.com", session=session)
+    assert response.status_code == 200
+    assert not response.not_modified
+    assert "If-None-Match" not in session.requests[0]
+
+    http_cache.set_doc_id("https://example.com", "doc-id")
+    response = http_cache.get("https://example.com", session=session)
+    assert session.requests[1]["If-None-Match"] == f'"{hashlib.md5(b"<p>content</p>").hexdigest()}"'
+    assert response.not_modified
+    assert response.status_code == 200
+    assert response.content == b"<p>content</p>"
+    assert response.text == "<p>content</p>"
+    assert response.doc_id == "doc-id"
+    assert http_cache.stats()["hits"] == 1
+    assert http_cache.stats()["misses"] == 1
+
+
+def test_get_replaces_changed_response(http_cache):
+    session = FakeSession({"https://example.com": "old"})
+    http_cache.get("https://example.com", session=session)
+    http_cache.set_doc_id("https://example.com", "doc-id")
+
+    session.pages["https://example.com"] = "new"
+    response = http_cache.get("https://example.com", session=session)
+    assert not response.not_modified
+    assert response.content == b"new"
+
+    response = http_cache.get("https://example.com", session=session)
+    assert response.not_modified
+    assert response.content == b"new"
+    # The doc_id belonged to the old content
+    assert response.doc_id is None
+
+
+def test_get_returns_stored_data_of_unmodified_response(http_cache):
+    session = FakeSession({"https://example.com": "content"})
+    http_cache.get("https://example.com", session=session)
+    http_cache.set_doc_id("https://example.com", "doc-id", data=[{"content": "content", "meta_data": {"url": "a"}}])
+
+    response = http_cache.get("https://example.com", session=session)
+    assert response.not_modified
+    assert response.data == [{"content": "content", "meta_data": {"url": "a"}}]
+    assert http_cache.has_doc_id("https://example.com")
+    assert not http_cache.has_doc_id("https://example.com/other")
+
+
+def test_adds_data_column_to_existing_cache(tmp_path):
+    path = str(tmp_path / "http_cache.db")
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE ec_http_cache (url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+        "status_code INTEGER NOT NULL, encoding TEXT, content BLOB NOT NULL, size INTEGER NOT NULL, doc_id TEXT, "
+        "last_access REAL NOT NULL)"
+    )
+    connection.close()
+
+    http_cache = HttpCache(path=path)
+    http_cache.get("https://example.com", session=FakeSession({"https://example.com": "content"}))
+    http_cache.set_doc_id("https://example.com", "doc-id", data=[])
+    assert http_cache.get("https://example.com", session=FakeSession({"https://example.com": "content"})).data == []
+    http_cache.close()
+
+
+def test_responses_without_validator_are_not_cached(http_cache):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"content"
+
+    class Session:
+        def get(self, url, headers=None, timeout=None):
+            return response
+
+    http_cache.get("https://example.com", session=Session())
+    assert http_cache.stats()["entries"] == 0
+
+
+def test_evicts_least_recently_used_responses(http_cache, monkeypatch):
+    clock = iter(range(1000))
+    monkeypatch.setattr("embedchain.loaders.http_cache.time.time", lambda: next(clock))
+    session = FakeSession({f"https://example.com/{name}": name for name in ("a", "b", "c")})
+    http_cache.get("https://example.com/a", session=session)
+    http_cache.get("https://example.com/b", session=session)
+    # Revalidating a makes b the least recently used response
+    assert http_cache.get("https://example.com/a", session=session).not_modified
+
+    http_cache.max_size = http_cache.stats()["size_bytes"]
+    http_cache.get("https://example.com/c", session=session)
+    assert http_cache.stats()["entries"] == 2
+    assert http_cache.get("https://example.com/a", session=session).not_modified
+    assert not http_cache.get("https://example.com/b", session=session).not_modified
+
+
+def test_cache_keeps_its_size_without_scanning(http_cache):
+    session = FakeSession({f"https://example.com/{name}": name * 100 for name in ("a", "b")})
+    http_cache.get("https://example.com/a", session=session)
+    http_cache.get("https://example.com/b", session=session)
+    http_cache.set_doc_id("https://example.com/a", "doc-id", data=[{"content": "a"}])
+    # Replacing a response doesn't add an entry, and drops the stored data
+    session.pages["https://example.com/b"] = "c" * 1000
+    http_cache.get("https://example.com/b", session=session)
+
+    stats = http_cache.stats()
+    assert stats["entries"] == 2
+    assert (stats["entries"], stats["size_bytes"]) == http_cache._connection.execute(
+        "SELECT COUNT(*), SUM(length(content) + COALESCE(length(data), 0)) FROM ec_http_cache"
+    ).fetchone()
+
+    http_cache.clear()
+    assert http_cache.stats()["entries"] == 0
+    assert http_cache.stats()["size_bytes"] == 0
+
+
+def test_cache_counts_responses_stored_before_the_stats(tmp_path):
+    path = str(tmp_path / "http_cache.db")
+    http_cache = HttpCache(path=path)
+    http_cache.get("https://example.com", session=FakeSession({"https://example.com": "content"}))
+    size = http_cache.stats()["size_bytes"]
+    http_cache._connection.execute("DROP TABLE ec_http_cache_stats")
+    http_cache.close()
+
+    http_cache = HttpCache(path=path)
+    assert http_cache.stats()["entries"] == 1
+    assert http_cache.stats()["size_bytes"] == size
+    http_cache.close()
+
+
+def test_web_page_loader_reports_unmodified_page(http_cache, monkeypatch):
+    session = FakeSession({"https://example.com": "<html><body><p>Some content</p></body></html>"})
+    monkeypatch.setattr(WebPageLoader, "_session", session)
+    loader = WebPageLoader(http_cache=http_cache)
+
+    # Without a doc_id of an earlier load, the page is not requested
+    assert loader.get_unmodified_doc_id("https://example.com") is None
+    assert session.requests == []
+    result = loader.load_data("https://example.com")
+    assert loader.get_unmodified_doc_id("https://example.com") == result["doc_id"]
+    assert len(session.requests) == 2
+
+    session.pages["https://example.com"] = "<html><body><p>Other content</p></body></html>"
+    assert loader.get_unmodified_doc_id("https://example.com") is None
+    # The changed page fetched by the check is loaded without requesting it again
+    assert loader.load_data("https://example.com")["data"][0]["content"] == "Other content"
+    assert len(session.requests) == 3
+
+
+def test_add_skips_unmodified_page(http_cache, monkeypatch, tmp_path):
+    session = FakeSession({"https://example.com": "<html><body><p>Some content</p></body></html>"})
+    monkeypatch.setattr(WebPageLoader, "_session", session)
+    loader = WebPageLoader(http_cache=http_cache)
+
+    embedded = []
+
+    def embedding_fn(texts):
+        embedded.extend(texts)
+        return [[1.0, float(len(text))] for text in texts]
+
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(EmbeddingFunc(embedding_fn))
+    embedder.set_vector_dimension(2)
+    db = ChromaDB(config=ChromaDbConfig(dir=str(tmp_path / "db"), allow_reset=True))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=embedder)
+    config = AddConfig(chunker=ChunkerConfig(chunk_size=100, chunk_overlap=0, min_chunk_size=0))
+
+    app.add("https://example.com", data_type="web_page", loader=loader, config=config)
+    assert embedded == ["Some content"]
+    requests_count = len(session.requests)
+    assert requests_count == 1
+
+    app.add("https://example.com", data_type="web_page", loader=loader, config=config)
+    # Only the conditional request was sent, and nothing was embedded
+    assert len(session.requests) == requests_count + 1
+    assert embedded == ["Some content"]
+
+    # Without the chunks, the page is loaded again
+    app.db.delete({"url": "https://example.com"})
+    app.add("https://example.com", data_type="web_page", loader=loader, config=config)
+    assert embedded == ["Some content", "Some content"]
+
+
+def test_page_without_validator_is_requested_once_per_load(http_cache, monkeypatch):
+    requested = []
+
+    class Session:
+        def get(self, url, headers=None, timeout=None):
+            requested.append(url)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b"<html><body><p>Some content</p></body></html>"
+            return response
+
+    monkeypatch.setattr(WebPageLoader, "_session", Session())
+    loader = WebPageLoader(http_cache=http_cache)
+
+    for _ in range(2):
+        assert loader.get_unmodified_doc_id("https://example.com") is None
+        loader.load_data("https://example.com")
+    assert len(requested) == 2
+
+
+def test_rss_feed_loader_revalidates_the_feed_of_the_last_load(http_cache, monkeypatch):
+    session = FakeSession({"https://example.com/feed": "<rss>entry</rss>"})
+    monkeypatch.setattr("embedchain.loaders.http_cache.requests", session)
+    parsed = []
+
+    # Parsing the feed and loading its articles needs feedparser and newspaper3k
+    def get_rss_content(url, content=None):
+        parsed.append(content)
+        return [{"content": content.decode(), "meta_data": {"url": url}}]
+
+    monkeypatch.setattr(RSSFeedLoader, "get_rss_content", staticmethod(get_rss_content))
+    loader = RSSFeedLoader(http_cache=http_cache)
+
+    assert loader.get_unmodified_doc_id("https://example.com/feed") is None
+    doc_id = loader.load_data("https://example.com/feed")["doc_id"]
+    assert loader.get_unmodified_doc_id("https://example.com/feed") == doc_id
+    assert len(session.requests) == 2
+    assert session.requests[1]["If-None-Match"]
+
+    session.pages["https://example.com/feed"] = "<rss>other entry</rss>"
+    assert loader.get_unmodified_doc_id("https://example.com/feed") is None
+    assert loader.load_data("https://example.com/feed")["doc_id"] != doc_id
+    assert len(session.requests) == 3
+    assert parsed == [b"<rss>entry</rss>", b"<rss>other entry</rss>"]
@@ -0,0 +1,114 @@
+import hashlib
+
+import pytest
+import responses
+
+from embedchain.loaders.http_cache import HttpCache
+from embedchain.loaders.sitemap import SitemapLoader
+from embedchain.loaders.web_page import WebPageLoader
+
+PAGES = {
+    "https://example.com/a": "<html><body><p>Page A</p></body></html>",
+    "https://example.com/b": "<html><body><p>Page B</p></body></html>",
+}
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    http_cache = HttpCache(path=str(tmp_path / "http_cache.db"))
+    yield http_cache
+    http_cache.close()
+
+
+@pytest.fixture
+def sitemap(monkeypatch):
+    # The links of the sitemap, parsing it needs lxml
+    monkeypatch.setattr(SitemapLoader, "_get_links", lambda self, sitemap_source: list(PAGES))
+    return "https://example.com/sitemap.xml"
+
+
+@pytest.fixture
+def mocked_pages():
+    def serve(request):
+        body = PAGES[request.url]
+        etag = f'"{hashlib.md5(body.encode()).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, ""
+        return 200, {"ETag": etag, "Content-Type": "text/html"}, body
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(responses.GET, "https://example.com/robots.txt", status=404)
+        for url in PAGES:
+            rsps.add_callback(responses.GET, url, callback=serve)
+        yield rsps
+
+
+def test_load_data(sitemap, http_cache, mocked_pages):
+    loader = SitemapLoader(http_cache=http_cache, config={"max_concurrency_per_host": 2})
+
+    result = loader.load_data(sitemap)
+
+    assert sorted(result["data"], key=lambda item: item["meta_data"]["url"]) == [
+        {"content": "Page A", "meta_data": {"url": "https://example.com/a"}},
+        {"content": "Page B", "meta_data": {"url": "https://example.com/b"}},
+    ]
+
+
+def test_load_data_skips_failed_pages(sitemap, http_cache, mocked_pages):
+    mocked_pages.replace(responses.GET, "https://example.com/b", status=404)
+    loader = SitemapLoader(http_cache=http_cache)
+
+    result = loader.load_data(sitemap)
+
+    assert [item["meta_data"]["url"] for item in result["data"]] == ["https://example.com/a"]
+
+
+def test_get_unmodified_doc_id(sitemap, http_cache, mocked_pages):
+    loader = SitemapLoader(http_cache=http_cache)
+    assert loader.get_unmodified_doc_id(sitemap) is None
+
+    doc_id = loader.load_data(sitemap)["doc_id"]
+    assert loader.get_unmodified_doc_id(sitemap) == doc_id
+
+    PAGES["https://example.com/b"] = "<html><body><p>New page B</p></body></html>"
+    try:
+        assert loader.get_unmodified_doc_id(sitemap) is None
+        assert loader.load_data(sitemap)["doc_id"] != doc_id
+    finally:
+        PAGES["https://example.com/b"] = "<html><body><p>Page B</p></body></html>"
+
+
+def page_requests(mocked_pages):
+    return sorted(call.request.url for call in mocked_pages.calls if not call.request.url.endswith("robots.txt"))
+
+
+def test_changed_page_is_fetched_once_and_unchanged_pages_are_not_parsed(
+    sitemap, http_cache, mocked_pages, monkeypatch
+):
+    loader = SitemapLoader(http_cache=http_cache)
+    # Pages that were never loaded are not requested by the check
+    assert loader.get_unmodified_doc_id(sitemap) is None
+    assert page_requests(mocked_pages) == []
+    loader.load_data(sitemap)
+    mocked_pages.calls.reset()
+
+    parsed = []
+    get_clean_content = WebPageLoader._get_clean_content
+    monkeypatch.setattr(
+        WebPageLoader,
+        "_get_clean_content",
+        staticmethod(lambda html, url: parsed.append(url) or get_clean_content(html, url)),
+    )
+    PAGES["https://example.com/b"] = "<html><body><p>New page B</p></body></html>"
+    try:
+        assert loader.get_unmodified_doc_id(sitemap) is None
+        # Only the loaded data of the pages is kept until `load_data`, not their responses
+        _, pages = loader._fetched_pages[sitemap]
+        assert sorted(page["data"][0]["content"] for page in pages.values()) == ["New page B", "Page A"]
+        result = loader.load_data(sitemap)
+    finally:
+        PAGES["https://example.com/b"] = "<html><body><p>Page B</p></body></html>"
+
+    assert page_requests(mocked_pages) == ["https://example.com/a", "https://example.com/b"]
+    assert parsed == ["https://example.com/b"]
+    assert sorted(item["content"] for item in result["data"]) == ["New page B", "Page A"]
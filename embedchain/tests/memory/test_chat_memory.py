@@ -1,6 +1,9 @@
+import json
+
 import pytest
 
-from embedchain.memory.base import ChatHistory
+from embedchain.core.db.database import database_manager, init_db, setup_engine
+from embedchain.memory.base import ChatHistory, history_cache, history_writer
 from embedchain.memory.message import ChatMessage
 
 
@@ -89,3 +92,61 @@ def test_delete_chat_history(chat_memory_instance):
 def close_connection(chat_memory_instance):
     yield
     chat_memory_instance.close_connection()
+
+
+@pytest.fixture
+def chat_history(tmp_path):
+    previous = (database_manager.database_uri, database_manager.engine, database_manager._session_factory)
+    setup_engine(f"sqlite:///{tmp_path / 'embedchain.db'}")
+    init_db()
+    yield ChatHistory()
+    history_writer.flush()
+    history_cache.clear()
+    database_manager.database_uri, database_manager.engine, database_manager._session_factory = previous
+
+
+def _add_rounds(chat_history, session_id, count, app_id="test_app"):
+    for i in range(1, count + 1):
+        chat_message = ChatMessage()
+        chat_message.add_user_message(f"Question {i}", metadata={"round": i})
+        chat_message.add_ai_message(f"Answer {i}")
+        chat_history.add(app_id, session_id, chat_message)
+
+
+def test_get_returns_latest_rounds(chat_history):
+    _add_rounds(chat_history, "session", 6)
+    history_cache.clear()
+
+    from_db = chat_history.get("test_app", "session", num_rounds=3)
+    from_cache = chat_history.get("test_app", "session", num_rounds=3)
+
+    assert [round.human_message.content for round in from_db] == ["Question 4", "Question 5", "Question 6"]
+    assert [str(round) for round in from_cache] == [str(round) for round in from_db]
+
+
+def test_chat_turns_read_history_from_memory(chat_history, mocker):
+    query = mocker.spy(ChatHistory, "_query")
+
+    _add_rounds(chat_history, "session", 5)
+    history = chat_history.get("test_app", "session", num_rounds=10)
+
+    # Only the first use of the session reads from the database
+    assert query.call_count == 1
+    assert len(history) == 5
+
+
+def test_write_behind_persists_rounds(chat_history):
+    _add_rounds(chat_history, "session", 3)
+
+    assert chat_history.count("test_app", "session") == 3
+    rows = chat_history.get("test_app", "session", display_format=True)
+    assert [row["human"] for row in rows] == ["Question 1", "Question 2", "Question 3"]
+    assert json.loads(rows[0]["metadata"]) == {"round": 1}
+
+
+def test_delete_drops_cached_session(chat_history):
+    _add_rounds(chat_history, "session", 3)
+
+    chat_history.delete("test_app", "session")
+
+    assert chat_history.get("test_app", "session") == []
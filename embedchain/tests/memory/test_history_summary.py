@@ -0,0 +1,111 @@
+import threading
+
+import pytest
+
+from embedchain.config import HistorySummaryConfig
+from embedchain.memory.summary import HistorySummarizer
+from embedchain.utils import tokens
+
+
+@pytest.fixture(autouse=True)
+def estimate_tokens(monkeypatch):
+    # Count tokens from the text length, so the tests don't depend on downloading a tiktoken encoding
+    monkeypatch.setattr(tokens, "get_encoding", lambda model=None: None)
+
+
+def _round(i):
+    return f"human: Question {i}\nai: Answer {i}"
+
+
+def test_count_tokens_estimate():
+    assert tokens.count_tokens("") == 0
+    assert tokens.count_tokens("abcd") == 1
+    assert tokens.count_tokens("abcde") == 2
+
+
+def test_history_summary_config_validation():
+    with pytest.raises(ValueError):
+        HistorySummaryConfig(recent_rounds=0)
+    with pytest.raises(ValueError):
+        HistorySummaryConfig(token_budget=100, summary_tokens=100)
+
+
+def test_older_rounds_are_summarized():
+    prompts = []
+
+    def summarize(prompt):
+        prompts.append(prompt)
+        return f"summary {len(prompts)}"
+
+    summarizer = HistorySummarizer(HistorySummaryConfig(recent_rounds=2), summarize)
+    for i in range(1, 5):
+        summarizer.add_round("app", "session", _round(i), lambda: [])
+    summarizer.wait()
+
+    history = summarizer.get_history("app", "session", lambda: [])
+
+    assert history == [f"Summary of the earlier conversation: summary {len(prompts)}", _round(3), _round(4)]
+    assert "Question 1" in prompts[0]
+    assert "Question 2" in "".join(prompts) and "Question 3" not in "".join(prompts)
+
+
+def test_rounds_arriving_during_summary_are_folded_together():
+    started, release = threading.Event(), threading.Event()
+    prompts = []
+
+    def summarize(prompt):
+        prompts.append(prompt)
+        started.set()
+        release.wait(5)
+        return "summary"
+
+    summarizer = HistorySummarizer(HistorySummaryConfig(recent_rounds=1), summarize)
+    summarizer.add_round("app", "session", _round(1), lambda: [])
+    summarizer.add_round("app", "session", _round(2), lambda: [])
+    started.wait(5)
+    # The rounds being summarized are still passed verbatim
+    assert summarizer.get_history("app", "session", lambda: []) == [_round(1), _round(2)]
+
+    summarizer.add_round("app", "session", _round(3), lambda: [])
+    summarizer.add_round("app", "session", _round(4), lambda: [])
+    release.set()
+    summarizer.wait()
+
+    assert len(prompts) == 2
+    assert "Question 2" in prompts[1] and "Question 3" in prompts[1]
+    assert summarizer.get_history("app", "session", lambda: [])[-1] == _round(4)
+
+
+def test_history_is_kept_within_token_budget():
+    summarizer = HistorySummarizer(
+        HistorySummaryConfig(recent_rounds=10, token_budget=20, summary_tokens=10), lambda prompt: ""
+    )
+    for i in range(1, 6):
+        summarizer.add_round("app", "session", _round(i), lambda: [])
+
+    history = summarizer.get_history("app", "session", lambda: [])
+
+    # Every round is 9 tokens, so only the latest two fit
+    assert history == [_round(4), _round(5)]
+
+
+def test_failed_summary_keeps_rounds_verbatim():
+    def summarize(prompt):
+        raise RuntimeError("rate limited")
+
+    summarizer = HistorySummarizer(HistorySummaryConfig(recent_rounds=1), summarize)
+    summarizer.add_round("app", "session", _round(1), lambda: [])
+    summarizer.add_round("app", "session", _round(2), lambda: [])
+    summarizer.wait()
+
+    assert summarizer.get_history("app", "session", lambda: []) == [_round(1), _round(2)]
+
+
+def test_sessions_are_seeded_from_stored_history_and_discarded():
+    summarizer = HistorySummarizer(HistorySummaryConfig(), lambda prompt: "")
+
+    assert summarizer.get_history("app", "session", lambda: [_round(1)]) == [_round(1)]
+
+    summarizer.discard("app")
+
+    assert summarizer.get_history("app", "session", lambda: []) == []
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from embedchain.app_pool import AppPool
+
+
+class FakeApp:
+    def __init__(self, config_path=None, config=None):
+        self.config_path = config_path
+        self.config = config
+
+
+@pytest.fixture
+def builds():
+    return []
+
+
+@pytest.fixture
+def pool(builds):
+    def factory(config_path=None, config=None):
+        builds.append(config_path or config)
+        return FakeApp(config_path=config_path, config=config)
+
+    return AppPool(max_size=2, factory=factory)
+
+
+def test_get_reuses_app_of_same_config(pool, builds, tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("app:\n  config:\n    id: first\n")
+
+    app = pool.get(config_path=str(config_path))
+    assert pool.get(config_path=str(config_path)) is app
+    assert pool.get(config={"app": {"config": {"id": "first"}}}) is not app
+
+    # The app is rebuilt once its config file changes
+    config_path.write_text("app:\n  config:\n    id: second\n")
+    assert pool.get(config_path=str(config_path)) is not app
+    assert len(builds) == 3
+
+
+def test_pool_evicts_least_recently_used_app(pool, builds):
+    first = pool.get(config={"id": 1})
+    pool.get(config={"id": 2})
+    assert pool.get(config={"id": 1}) is first
+    pool.get(config={"id": 3})
+
+    assert pool.get(config={"id": 1}) is first
+    assert builds == [{"id": 1}, {"id": 2}, {"id": 3}]
+    pool.get(config={"id": 2})
+    assert builds[-1] == {"id": 2}
+    assert pool.stats()["evictions"] == 2
+
+
+def test_concurrent_gets_build_app_once(builds):
+    def slow_factory(config_path=None, config=None):
+        time.sleep(0.1)
+        builds.append(config)
+        return FakeApp(config=config)
+
+    pool = AppPool(factory=slow_factory)
+    apps = []
+    threads = [threading.Thread(target=lambda: apps.append(pool.get(config={"id": 1}))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert all(app is apps[0] for app in apps)
+
+
+@pytest.mark.asyncio
+async def test_aacquire_serializes_access_to_an_app(pool):
+    running = []
+    overlaps = []
+
+    async def use_app():
+        async with pool.aacquire(config={"id": 1}):
+            overlaps.append(len(running))
+            running.append(1)
+            await asyncio.sleep(0.05)
+            running.pop()
+
+    await asyncio.gather(*(use_app() for _ in range(3)))
+    assert overlaps == [0, 0, 0]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_aacquire_releases_the_lock(pool):
+    with pool.acquire(config={"id": 1}):
+        waiting = asyncio.ensure_future(_acquire_and_hold(pool))
+        await asyncio.sleep(0.05)
+        # e.g. the client of a request disconnected while it waited for the app
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+    # The lock the cancelled task acquired after the block exited is released again
+    await asyncio.wait_for(_acquire_and_hold(pool, 0), timeout=1)
+
+
+async def _acquire_and_hold(pool, seconds=10):
+    async with pool.aacquire(config={"id": 1}):
+        await asyncio.sleep(seconds)
+
+
+def test_evict_and_validation(pool, builds):
+    app = pool.get(config={"id": 1})
+    pool.evict(config={"id": 1})
+    assert pool.get(config={"id": 1}) is not app
+
+    with pytest.raises(ValueError):
+        pool.get()
+    with pytest.raises(ValueError):
+        AppPool(max_size=0)
@@ -0,0 +1,68 @@
+import logging
+import os
+
+import pytest
+
+from benchmarks.compare import compare
+from benchmarks.corpus import SyntheticCorpus
+from benchmarks.fakes import FakeEmbedder, FakeLlm
+from benchmarks.run import run_benchmark
+from embedchain.core.db.database import database_manager
+
+
+def report(operations_per_second, p99_ms):
+    phase = {"operations_per_second": operations_per_second, "p50_ms": 1.0, "p99_ms": p99_ms, "peak_rss_mb": 100.0}
+    return {"results": [{"vectordb": "chroma", "chunks": 1000, "phases": {"search": phase}}]}
+
+
+@pytest.fixture
+def restore_database():
+    previous = (database_manager.database_uri, database_manager.echo, database_manager.engine)
+    session_factory = database_manager._session_factory
+    environ = os.environ.get("EMBEDCHAIN_DB_URI")
+    level = logging.getLogger("embedchain").level
+    yield
+    logging.getLogger("embedchain").setLevel(level)
+    database_manager.database_uri, database_manager.echo, database_manager.engine = previous
+    database_manager._session_factory = session_factory
+    if environ is None:
+        os.environ.pop("EMBEDCHAIN_DB_URI", None)
+    else:
+        os.environ["EMBEDCHAIN_DB_URI"] = environ
+
+
+def test_corpus_is_deterministic():
+    corpus = SyntheticCorpus(250, seed=1)
+    documents = list(corpus.documents())
+
+    assert documents == list(SyntheticCorpus(250, seed=1).documents())
+    assert [document.count("\n\n") + 1 for document in documents] == [100, 100, 50]
+    assert all(len(paragraph) < corpus.chunk_size for paragraph in documents[0].split("\n\n"))
+    assert corpus.queries(3) == SyntheticCorpus(250, seed=1).queries(3)
+
+
+def test_fake_embedder_is_deterministic_and_normalized():
+    embedder = FakeEmbedder(vector_dimension=64)
+    first, second = embedder.embedding_fn(["alpha beta", "alpha beta"])
+
+    assert first == second
+    assert sum(value * value for value in first) == pytest.approx(1.0)
+    assert FakeLlm().get_llm_model_answer("prompt") == "Answer from a prompt of 6 characters."
+
+
+def test_compare_detects_regressions():
+    assert compare(report(100.0, 10.0), report(100.0, 10.0)) == []
+    assert compare(report(95.0, 10.5), report(100.0, 10.0), threshold=0.1) == []
+
+    regressions = compare(report(50.0, 20.0), report(100.0, 10.0), threshold=0.1)
+
+    assert [(r.metric, r.change) for r in regressions] == [("operations_per_second", -0.5), ("p99_ms", 1.0)]
+
+
+def test_run_benchmark(restore_database):
+    results = run_benchmark("chroma", 200, queries=10)
+
+    assert results["stored_chunks"] == 200
+    assert set(results["phases"]) == {"ingest", "search", "query", "chat"}
+    assert results["phases"]["ingest"]["units"] == 200
+    assert results["phases"]["query"]["operations"] == 10
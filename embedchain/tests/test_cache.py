@@ -0,0 +1,114 @@
+import os
+import time
+
+import pytest
+
+from embedchain import App
+from embedchain.cache import AnswerCache
+from embedchain.config import AppConfig, CacheConfig
+from embedchain.config.cache_config import CacheInitConfig
+from embedchain.llm.base import BaseLlm
+
+VECTORS = {
+    "what is embedchain": [1.0, 0.0],
+    "what's embedchain": [0.99, 0.1],
+    "who are you": [0.0, 1.0],
+}
+
+
+@pytest.fixture
+def embedding_fn():
+    calls = []
+
+    def embedding_fn(texts):
+        calls.append(list(texts))
+        return [VECTORS.get(text, [0.5, 0.5]) for text in texts]
+
+    embedding_fn.calls = calls
+    return embedding_fn
+
+
+def test_similar_query_with_same_contexts_hits(embedding_fn):
+    cache = AnswerCache(embedding_fn=embedding_fn, vector_dimension=2)
+    cache.set(cache.key("app", "what is embedchain", ["context"]), "a RAG framework")
+
+    assert cache.get(cache.key("app", "what's embedchain", ["context"])) == "a RAG framework"
+    assert cache.get(cache.key("app", "who are you", ["context"])) is None
+    assert cache.get(cache.key("app", "what is embedchain", ["other context"])) is None
+    assert cache.get(cache.key("other-app", "what is embedchain", ["context"])) is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["hit_rate"] == 0.25
+
+
+def test_exact_strategy_does_not_embed(embedding_fn):
+    cache = AnswerCache(embedding_fn=embedding_fn, strategy="exact")
+    cache.set(cache.key("app", "what is embedchain", ["context"]), "a RAG framework")
+
+    assert cache.get(cache.key("app", "what is embedchain", ["context"])) == "a RAG framework"
+    assert cache.get(cache.key("app", "what's embedchain", ["context"])) is None
+    assert embedding_fn.calls == []
+
+
+@pytest.mark.parametrize("eviction, evicted", [("LRU", "b"), ("FIFO", "a"), ("LFU", "b")])
+def test_eviction_policies(embedding_fn, eviction, evicted):
+    cache = AnswerCache(strategy="exact", max_size=2, eviction=eviction)
+    cache.set(cache.key("app", "a", []), "answer a")
+    cache.set(cache.key("app", "b", []), "answer b")
+    cache.get(cache.key("app", "a", []))
+    cache.set(cache.key("app", "c", []), "answer c")
+
+    assert cache.get(cache.key("app", evicted, [])) is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["entries"] == 2
+
+
+def test_vector_index_reuses_rows(embedding_fn):
+    cache = AnswerCache(embedding_fn=embedding_fn, max_size=2)
+    for query in ["what is embedchain", "who are you", "something else", "what is embedchain"]:
+        cache.set(cache.key("app", query, []), query)
+
+    assert cache._vectors.shape == (2, 2)
+    assert cache.get(cache.key("app", "what's embedchain", [])) == "what is embedchain"
+
+
+def test_ttl_and_invalidation(embedding_fn):
+    cache = AnswerCache(strategy="exact", ttl=0.05)
+    cache.set(cache.key("app", "a", []), "answer a")
+    time.sleep(0.1)
+    assert cache.get(cache.key("app", "a", [])) is None
+    assert cache.stats()["expirations"] == 1
+
+    cache.set(cache.key("app", "a", []), "answer a")
+    cache.invalidate()
+    assert cache.get(cache.key("app", "a", [])) is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_cache_init_config_validation():
+    with pytest.raises(ValueError):
+        CacheInitConfig(max_size=0)
+    with pytest.raises(ValueError):
+        CacheInitConfig(ttl=0)
+    with pytest.raises(ValueError):
+        CacheInitConfig(eviction="MRU")
+
+
+def test_app_caches_answers_until_data_changes(mocker):
+    os.environ["OPENAI_API_KEY"] = "test_key"
+    app = App(config=AppConfig(collect_metrics=False), cache_config=CacheConfig(), llm=BaseLlm())
+    mocker.patch.object(app.db, "query", return_value=["context"])
+    mocker.patch.object(app.db, "add")
+    mocker.patch.object(app.answer_cache, "embedding_fn", return_value=[[1.0] * 1536])
+    mock_answer = mocker.patch.object(app.llm, "get_llm_model_answer", return_value="answer")
+
+    assert app.query("what is embedchain") == "answer"
+    assert app.query("what is embedchain") == "answer"
+    assert mock_answer.call_count == 1
+
+    app.add("new text source", data_type="text")
+    app.query("what is embedchain")
+    assert mock_answer.call_count == 2
+    assert app.answer_cache.stats()["hits"] == 1
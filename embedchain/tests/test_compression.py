@@ -0,0 +1,72 @@
+import pytest
+
+from embedchain.compression import ContextCompressor
+from embedchain.config import ContextCompressionConfig
+
+VOCABULARY = ["paris", "france", "capital", "pizza", "italy", "weather", "rain"]
+
+
+class FakeEmbedder:
+    """Bag of words embeddings over a small vocabulary, which records the texts it embeds."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(word in text.lower()) for word in VOCABULARY] + [0.1] for text in texts]
+
+
+CONTEXTS = [
+    "Paris is the capital of France. Pizza comes from Italy. It rains a lot in autumn.",
+    "The weather in Paris is mild. France has many regions.",
+]
+
+
+def test_keeps_most_similar_sentences_in_order():
+    compressor = ContextCompressor(FakeEmbedder(), max_sentences=2)
+
+    compressed = compressor.compress("What is the capital of France?", CONTEXTS)
+
+    assert compressed == ["Paris is the capital of France.", "France has many regions."]
+
+
+def test_contexts_without_kept_sentences_are_dropped():
+    compressor = ContextCompressor(FakeEmbedder(), max_sentences=1)
+
+    assert compressor.compress("pizza italy", CONTEXTS) == ["Pizza comes from Italy."]
+
+
+def test_short_contexts_are_not_embedded():
+    embedder = FakeEmbedder()
+    compressor = ContextCompressor(embedder, max_sentences=10)
+
+    assert compressor.compress("What is the capital of France?", CONTEXTS) == CONTEXTS
+    assert embedder.calls == []
+
+
+def test_min_similarity_drops_unrelated_sentences():
+    compressor = ContextCompressor(FakeEmbedder(), max_sentences=10, min_similarity=0.5)
+
+    compressed = compressor.compress("capital of france", CONTEXTS)
+
+    assert compressed == ["Paris is the capital of France.", "France has many regions."]
+
+
+def test_sentence_embeddings_are_cached():
+    embedder = FakeEmbedder()
+    compressor = ContextCompressor(embedder, max_sentences=2)
+
+    compressor.compress("capital of france", CONTEXTS)
+    compressor.compress("weather in paris", CONTEXTS)
+
+    # The second query only embeds the query, the sentences are cached
+    assert embedder.calls[1] == ["weather in paris"]
+
+
+def test_config_validation():
+    with pytest.raises(ValueError):
+        ContextCompressionConfig(max_sentences=0)
+    with pytest.raises(ValueError):
+        ContextCompressionConfig(min_similarity=2)
+    assert ContextCompressionConfig.from_config({"max_sentences": 5}).max_sentences == 5
@@ -0,0 +1,51 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Modules that should only be imported once a feature that needs them is used
+HEAVY_MODULES = ["alembic", "chromadb", "embedchain.evaluation.metrics", "langchain_openai", "mem0", "openai"]
+
+# Budget of `import embedchain` in milliseconds, generous so that slow CI machines don't fail
+IMPORT_BUDGET_MS = float(os.getenv("EMBEDCHAIN_IMPORT_BUDGET_MS", "1000"))
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+
+
+def _loaded_modules(statement: str) -> list[str]:
+    code = f"import sys, json\n{statement}\nprint(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    return json.loads(_run(code).stdout.strip().splitlines()[-1])
+
+
+def test_import_embedchain_does_not_load_heavy_modules():
+    assert _loaded_modules("import embedchain") == []
+
+
+@pytest.mark.parametrize("module", ["mem0", "embedchain.evaluation.metrics", "langchain_openai", "alembic"])
+def test_import_app_does_not_load_optional_modules(module):
+    assert module not in _loaded_modules("from embedchain import App")
+
+
+def test_import_embedchain_within_budget():
+    stderr = _run("import embedchain").stderr
+    # The last line of `-X importtime` is the top-level package: "import time: self | cumulative | embedchain"
+    cumulative_us = next(
+        int(line.split("|")[1]) for line in reversed(stderr.splitlines()) if line.rstrip().endswith("| embedchain")
+    )
+    assert cumulative_us / 1000 < IMPORT_BUDGET_MS
+
+
+def test_lazy_attributes():
+    import embedchain
+    from embedchain.app import App
+    from embedchain.client import Client
+
+    assert embedchain.App is App
+    assert embedchain.Client is Client
+    assert "Pipeline" in dir(embedchain)
+    with pytest.raises(AttributeError):
+        embedchain.DoesNotExist
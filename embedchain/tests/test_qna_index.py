@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from embedchain import App
+from embedchain.config import AppConfig, QnaFastPathConfig
+from embedchain.llm.base import BaseLlm
+from embedchain.qna_index import QnaIndex, normalize_question
+
+VECTORS = {
+    "What is embedchain?": [1.0, 0.0],
+    "what's embedchain": [0.99, 0.1],
+    "How do I install it?": [0.0, 1.0],
+}
+
+PAIRS = (
+    ["Q: What is embedchain?\nA: A RAG framework.", "Q: How do I install it?\nA: pip install embedchain"],
+    [
+        {"question": "What is embedchain?", "answer": "A RAG framework.", "data_type": "qna_pair"},
+        {"question": "How do I install it?", "data_type": "qna_pair"},
+    ],
+)
+
+
+@pytest.fixture
+def embedding_fn():
+    calls = []
+
+    def embedding_fn(texts):
+        calls.append(list(texts))
+        return [VECTORS.get(text, [0.7, 0.7]) for text in texts]
+
+    embedding_fn.calls = calls
+    return embedding_fn
+
+
+def test_normalize_question():
+    assert normalize_question("  What is\nembedchain ?? ") == "what is embedchain"
+
+
+def test_exact_match_does_not_embed_query(embedding_fn):
+    index = QnaIndex(lambda: PAIRS, embedding_fn=embedding_fn)
+
+    match = index.match("what is embedchain")
+
+    assert (match.answer, match.score) == ("A RAG framework.", 1.0)
+    # Only the stored questions are embedded, once
+    assert embedding_fn.calls == [["What is embedchain?", "How do I install it?"]]
+
+
+def test_similar_question_matches_above_threshold(embedding_fn):
+    index = QnaIndex(lambda: PAIRS, embedding_fn=embedding_fn, similarity_threshold=0.95)
+
+    assert index.match("what's embedchain").question == "What is embedchain?"
+    assert index.match("tell me a joke") is None
+    assert index.stats() == {"pairs": 2, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_answer_is_parsed_from_chunk_without_answer_metadata():
+    index = QnaIndex(lambda: PAIRS)
+
+    assert index.match("How do I install it").answer == "pip install embedchain"
+
+
+def test_invalidate_reloads_pairs_without_embedding_known_questions(embedding_fn):
+    pairs = ([], [])
+    index = QnaIndex(lambda: pairs, embedding_fn=embedding_fn)
+    assert index.match("What is embedchain?") is None
+
+    pairs = PAIRS
+    index.invalidate()
+
+    assert index.match("What is embedchain?") is not None
+    index.invalidate()
+    index.match("What is embedchain?")
+    assert len(embedding_fn.calls) == 1
+
+
+def test_app_answers_qna_pairs_without_llm(mocker):
+    os.environ["OPENAI_API_KEY"] = "test_key"
+    app = App(
+        config=AppConfig(collect_metrics=False), llm=BaseLlm(), qna_fast_path_config=QnaFastPathConfig(semantic=False)
+    )
+    mocker.patch.object(
+        app.db, "get", return_value={"ids": ["1"], "documents": PAIRS[0][:1], "metadatas": PAIRS[1][:1]}
+    )
+    mock_query = mocker.patch.object(app.db, "query", return_value=["context"])
+    mock_answer = mocker.patch.object(app.llm, "get_llm_model_answer", return_value="answer")
+
+    answer, contexts = app.query("What is embedchain?", citations=True)
+
+    assert answer == "A RAG framework."
+    assert contexts[0][1]["score"] == 1.0
+    assert app.qna_index.stats()["hits"] == 1
+    mock_query.assert_not_called()
+    mock_answer.assert_not_called()
+
+    # Filtered queries always go through retrieval and the llm
+    assert app.query("What is embedchain?", where={"url": "local"}) == "answer"
@@ -7,6 +7,7 @@ from chromadb.config import Settings
 
 from embedchain import App
 from embedchain.config import AppConfig, ChromaDbConfig
+from embedchain.embedder.base import BaseEmbedder, EmbeddingFunc
 from embedchain.vectordb.chroma import ChromaDB
 
 os.environ["OPENAI_API_KEY"] = "test-api-key"
@@ -251,3 +252,34 @@ def test_chroma_db_collection_reset():
     app2.db.reset()
     app3.db.reset()
     app4.db.reset()
+
+
+def test_chroma_db_query_batch():
+    calls = []
+
+    def embedding_fn(texts):
+        calls.append(list(texts))
+        return [[1.0, 0.0] if "apple" in text else [0.0, 1.0] for text in texts]
+
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(EmbeddingFunc(embedding_fn))
+    embedder.set_vector_dimension(2)
+    db = ChromaDB(config=ChromaDbConfig(allow_reset=True, dir="test-db"))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=embedder)
+    app.set_collection_name("test_collection_batch")
+    app.db.add(
+        documents=["apple pie", "banana bread"],
+        metadatas=[{"url": "url_1"}, {"url": "url_2"}],
+        ids=["id_1", "id_2"],
+    )
+    calls.clear()
+
+    results = app.db.query_batch(["apple", "banana"], n_results=1)
+    assert results == [["apple pie"], ["banana bread"]]
+    assert calls == [["apple", "banana"]]
+
+    results = app.db.query_batch(["banana"], n_results=1, citations=True)
+    assert results[0][0][0] == "banana bread"
+    assert results[0][0][1]["url"] == "url_2"
+    assert app.db.query_batch([], n_results=1) == []
+    app.db.reset()
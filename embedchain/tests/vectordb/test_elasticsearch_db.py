@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 from embedchain import App
 from embedchain.config import AppConfig, ElasticsearchDBConfig
+from embedchain.embedder.base import BaseEmbedder
 from embedchain.embedder.gpt4all import GPT4AllEmbedder
 from embedchain.vectordb.elasticsearch import ElasticsearchDB
 
@@ -70,6 +71,32 @@ class TestEsDB(unittest.TestCase):
         ]
         self.assertEqual(results_with_citations, expected_results_with_citations)
 
+    @patch("embedchain.vectordb.elasticsearch.Elasticsearch")
+    def test_query_batch(self, mock_client):
+        os.environ["OPENAI_API_KEY"] = "test_api_key"
+        embedder = BaseEmbedder()
+        embedder.set_vector_dimension(3)
+        embedder.set_embedding_fn(lambda texts: [[float(i), 0.0, 1.0] for i, _ in enumerate(texts)])
+        self.db = ElasticsearchDB(config=ElasticsearchDBConfig(es_url="https://localhost:9200"))
+        App(config=AppConfig(collect_metrics=False), db=self.db, embedding_model=embedder)
+
+        def hits(text):
+            return {"hits": {"hits": [{"_source": {"text": text, "metadata": {"url": "url"}}, "_score": 0.9}]}}
+
+        mock_client.return_value.msearch.return_value = {"responses": [hits("doc 1"), hits("doc 2")]}
+
+        results = self.db.query_batch(["query 1", "query 2"], n_results=1, where={"app_id": "app"})
+
+        self.assertEqual(results, [["doc 1"], ["doc 2"]])
+        mock_client.return_value.search.assert_not_called()
+        searches = mock_client.return_value.msearch.call_args.kwargs["searches"]
+        self.assertEqual(len(searches), 4)
+        self.assertEqual(searches[1]["size"], 1)
+        first_query, second_query = searches[1]["query"]["script_score"], searches[3]["query"]["script_score"]
+        self.assertEqual(first_query["script"]["params"]["input_query_vector"], [0.0, 0.0, 1.0])
+        self.assertEqual(second_query["script"]["params"]["input_query_vector"], [1.0, 0.0, 1.0])
+        self.assertIn({"term": {"metadata.app_id.keyword": "app"}}, first_query["query"]["bool"]["must"])
+
     def test_init_without_url(self):
         # Make sure it's not loaded from env
         try:
@@ -0,0 +1,65 @@
+import pytest
+
+from embedchain.config import HybridSearchConfig
+from embedchain.vectordb.keyword_index import KeywordIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = KeywordIndex(path=str(tmp_path / "keyword_index.db"))
+    index.add(
+        ids=["1", "2", "3"],
+        documents=["the error code E-1234 means timeout", "timeout of the request", "unrelated text"],
+        metadatas=[{"app_id": "a", "hash": "h1"}, {"app_id": "a", "hash": "h2"}, {"app_id": "b", "hash": "h3"}],
+        collection="docs",
+    )
+    return index
+
+
+def test_search_ranks_by_bm25(index):
+    results = index.search("E-1234 timeout", n_results=10, collection="docs")
+
+    assert [text for text, _, _ in results] == ["the error code E-1234 means timeout", "timeout of the request"]
+    assert results[0][1] == {"app_id": "a", "hash": "h1"}
+    assert results[0][2] > results[1][2]
+
+
+def test_search_filters_by_metadata_and_collection(index):
+    assert index.search("text", n_results=10, collection="docs", where={"app_id": "a"}) == []
+    assert len(index.search("text", n_results=10, collection="docs", where={"app_id": "b"})) == 1
+    assert index.search("text", n_results=10, collection="other") == []
+    with pytest.raises(ValueError):
+        index.search("text", n_results=10, collection="docs", where={"$or": [{"app_id": "a"}]})
+
+
+def test_search_ignores_query_syntax(index):
+    assert index.search('NOT "timeout" OR (', n_results=10, collection="docs")
+    assert index.search("?!", n_results=10, collection="docs") == []
+
+
+def test_add_replaces_and_delete_removes_chunks(index):
+    index.add(ids=["1"], documents=["new content"], metadatas=[{"app_id": "a", "hash": "h1"}], collection="docs")
+    assert index.count("docs") == 3
+    assert index.search("E-1234", n_results=10, collection="docs") == []
+
+    index.delete_ids(["2"], collection="docs")
+    index.delete({"hash": "h3"}, collection="docs")
+    assert index.count("docs") == 1
+
+    index.reset(collection="docs")
+    assert index.count("docs") == 0
+
+
+def test_update_metadata_keeps_other_fields(index):
+    index.update_metadata(["1", "3"], {"hash": "new"}, collection="docs")
+
+    assert index.search("E-1234", n_results=10, collection="docs")[0][1] == {"app_id": "a", "hash": "new"}
+    assert len(index.search("text", n_results=10, collection="docs", where={"hash": "new"})) == 1
+    assert index.search("request", n_results=10, collection="docs")[0][1] == {"app_id": "a", "hash": "h2"}
+
+
+def test_hybrid_search_config_validation():
+    with pytest.raises(ValueError):
+        HybridSearchConfig(fetch_k=0)
+    with pytest.raises(ValueError):
+        HybridSearchConfig(keyword_weight=-1)
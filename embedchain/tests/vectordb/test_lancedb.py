@@ -1,11 +1,13 @@
 import os
 import shutil
 
+import pyarrow as pa
 import pytest
 
 from embedchain import App
 from embedchain.config import AppConfig
 from embedchain.config.vector_db.lancedb import LanceDBConfig
+from embedchain.embedder.base import BaseEmbedder
 from embedchain.vectordb.lancedb import LanceDB
 
 os.environ["OPENAI_API_KEY"] = "test-api-key"
@@ -207,6 +209,33 @@ def test_lancedb_collection_reset():
     app4.db.reset()
 
 
+def test_lancedb_add_embeds_in_batches():
+    calls = []
+
+    def embedding_fn(texts):
+        if isinstance(texts, str):
+            texts = [texts]
+        calls.append(len(texts))
+        return [[float(len(text)), 1.0, 0.0] for text in texts]
+
+    embedder = BaseEmbedder()
+    embedder.set_embedding_fn(embedding_fn)
+    embedder.set_vector_dimension(3)
+    db = LanceDB(config=LanceDBConfig(allow_reset=True, dir="test-db", batch_size=2))
+    app = App(config=AppConfig(collect_metrics=False), db=db, embedding_model=embedder)
+    app.set_collection_name("test_collection_batches")
+    calls.clear()
+
+    documents = ["a", "bb", "ccc", "dddd", "eeeee"]
+    app.db.add(documents=documents, metadatas=[{"i": i} for i in range(5)], ids=[str(i) for i in range(5)])
+
+    assert calls == [2, 2, 1]
+    assert app.db.count() == 5
+    table = app.db.collection.to_arrow()
+    assert table.schema.field("vector").type == pa.list_(pa.float32(), 3)
+    assert table.column("vector").to_pylist()[table.column("id").to_pylist().index("3")] == [4.0, 1.0, 0.0]
+    app.db.reset()
+
 def generate_embeddings(dummy_embed, embed_size):
     generated_embedding = []
     for i in range(embed_size):
@@ -130,6 +130,43 @@ class TestQdrantDB(unittest.TestCase):
             limit=1,
         )
 
+    @patch("embedchain.vectordb.qdrant.QdrantClient")
+    def test_query_batch(self, qdrant_client_mock):
+        # Set the embedder
+        embedder = BaseEmbedder()
+        embedder.set_vector_dimension(1536)
+        embedder.set_embedding_fn(mock_embedding_fn)
+
+        # Create a Qdrant instance
+        db = QdrantDB()
+        app_config = AppConfig(collect_metrics=False)
+        App(config=app_config, db=db, embedding_model=embedder)
+
+        qdrant_client_mock.return_value.query_batch_points.return_value = [
+            models.QueryResponse(
+                points=[models.ScoredPoint(id="abc", version=0, score=0.9, payload={"text": "doc 1", "metadata": {}})]
+            ),
+            models.QueryResponse(
+                points=[models.ScoredPoint(id="def", version=0, score=0.8, payload={"text": "doc 2", "metadata": {}})]
+            ),
+        ]
+
+        # Query for two documents at once.
+        results = db.query_batch(["query 1", "query 2"], n_results=1, where={"doc_id": "123"})
+
+        self.assertEqual(results, [["doc 1"], ["doc 2"]])
+        query_filter = models.Filter(
+            must=[models.FieldCondition(key="metadata.doc_id", match=models.MatchValue(value="123"))]
+        )
+        qdrant_client_mock.return_value.query_batch_points.assert_called_once_with(
+            collection_name="embedchain-store-1536",
+            requests=[
+                models.QueryRequest(query=[1, 2, 3], filter=query_filter, limit=1, with_payload=True),
+                models.QueryRequest(query=[4, 5, 6], filter=query_filter, limit=1, with_payload=True),
+            ],
+        )
+        qdrant_client_mock.return_value.search.assert_not_called()
+
     @patch("embedchain.vectordb.qdrant.QdrantClient")
     def test_count(self, qdrant_client_mock):
         # Set the embedder